@@ -40,6 +40,10 @@ from lightrag.constants import (
     DEFAULT_OLLAMA_MODEL_TAG,
     DEFAULT_RERANK_BINDING,
     DEFAULT_ENTITY_TYPES,
+    DEFAULT_DOCUMENT_PARSE_WORKERS,
+    DEFAULT_DOCUMENT_PARSE_TIMEOUT,
+    DEFAULT_DOCUMENT_PARSE_MEMORY_LIMIT_MB,
+    DEFAULT_DELETE_BATCH_SIZE,
 )
 
 # use the .env that is inside the current folder
@@ -319,6 +323,11 @@ def parse_args() -> argparse.Namespace:
     # Get MAX_PARALLEL_INSERT from environment
     args.max_parallel_insert = get_env_value("MAX_PARALLEL_INSERT", 2, int)
 
+    # Get DELETE_BATCH_SIZE from environment
+    args.delete_batch_size = get_env_value(
+        "DELETE_BATCH_SIZE", DEFAULT_DELETE_BATCH_SIZE, int
+    )
+
     # Get MAX_GRAPH_NODES from environment
     args.max_graph_nodes = get_env_value("MAX_GRAPH_NODES", 1000, int)
 
@@ -360,6 +369,17 @@ def parse_args() -> argparse.Namespace:
     # PDF decryption password
     args.pdf_decrypt_password = get_env_value("PDF_DECRYPT_PASSWORD", None)
 
+    # Document parsing process pool
+    args.document_parse_workers = get_env_value(
+        "DOCUMENT_PARSE_WORKERS", DEFAULT_DOCUMENT_PARSE_WORKERS, int
+    )
+    args.document_parse_timeout = get_env_value(
+        "DOCUMENT_PARSE_TIMEOUT", DEFAULT_DOCUMENT_PARSE_TIMEOUT, int
+    )
+    args.document_parse_memory_limit_mb = get_env_value(
+        "DOCUMENT_PARSE_MEMORY_LIMIT_MB", DEFAULT_DOCUMENT_PARSE_MEMORY_LIMIT_MB, int
+    )
+
     # Add environment variables that were previously read directly
     args.cors_origins = get_env_value("CORS_ORIGINS", "*")
     args.summary_language = get_env_value("SUMMARY_LANGUAGE", DEFAULT_SUMMARY_LANGUAGE)
@@ -0,0 +1,348 @@
+"""
+Off-loop text extraction for binary document formats (PDF, DOCX, PPTX, XLSX).
+
+Parsing runs in a bounded ProcessPoolExecutor so that large uploads do not block
+the event loop serving queries. Each parse is subject to a per-file timeout and,
+on POSIX systems, an optional address-space cap applied to the worker processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Iterator
+
+import pipmaster as pm
+
+from lightrag.utils import logger
+
+# Human readable labels used in error descriptions
+FORMAT_LABELS = {".pdf": "PDF", ".docx": "DOCX", ".pptx": "PPTX", ".xlsx": "XLSX"}
+
+
+class DocumentParseError(Exception):
+    """Raised when text extraction fails; carries the fields of an error document"""
+
+    def __init__(self, description: str, original_error: str):
+        # Both fields go to args so the exception survives pickling from workers
+        super().__init__(description, original_error)
+        self.description = description
+        self.original_error = original_error
+
+    def __str__(self) -> str:
+        return f"{self.description}: {self.original_error}"
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """Apply the memory cap to a freshly started worker process"""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Unable to apply document parser memory limit: {e}")
+
+
+def _iter_docling(file_path: Path) -> Iterator[str]:
+    if not pm.is_installed("docling"):  # type: ignore
+        pm.install("docling")
+    from docling.document_converter import DocumentConverter  # type: ignore
+
+    converter = DocumentConverter()
+    result = converter.convert(file_path)
+    yield result.document.export_to_markdown()
+
+
+def _iter_pdf_pages(file_path: Path, pdf_password: str | None) -> Iterator[str]:
+    if not pm.is_installed("pypdf2"):  # type: ignore
+        pm.install("pypdf2")
+    if not pm.is_installed("pycryptodome"):  # type: ignore
+        pm.install("pycryptodome")
+    from PyPDF2 import PdfReader  # type: ignore
+
+    with open(file_path, "rb") as f:
+        reader = PdfReader(f)
+
+        if reader.is_encrypted:
+            if not pdf_password:
+                raise DocumentParseError(
+                    "[File Extraction]PDF is encrypted but no password provided",
+                    "Please set PDF_DECRYPT_PASSWORD environment variable to decrypt this PDF file",
+                )
+            try:
+                decrypt_result = reader.decrypt(pdf_password)
+            except Exception as decrypt_error:
+                raise DocumentParseError(
+                    "[File Extraction]PDF decryption failed",
+                    f"Error during PDF decryption: {str(decrypt_error)}",
+                )
+            if decrypt_result == 0:
+                raise DocumentParseError(
+                    "[File Extraction]Failed to decrypt PDF - incorrect password",
+                    "The provided PDF_DECRYPT_PASSWORD is incorrect for this file",
+                )
+
+        # Pages are decoded lazily by PyPDF2, one at a time
+        for page in reader.pages:
+            yield page.extract_text() + "\n"
+
+
+def _iter_docx_paragraphs(file_path: Path) -> Iterator[str]:
+    if not pm.is_installed("python-docx"):  # type: ignore
+        try:
+            pm.install("python-docx")
+        except Exception:
+            pm.install("docx")
+    from docx import Document  # type: ignore
+
+    doc = Document(str(file_path))
+    for i, paragraph in enumerate(doc.paragraphs):
+        yield paragraph.text if i == 0 else "\n" + paragraph.text
+
+
+def _iter_pptx_shapes(file_path: Path) -> Iterator[str]:
+    if not pm.is_installed("python-pptx"):  # type: ignore
+        pm.install("pptx")
+    from pptx import Presentation  # type: ignore
+
+    prs = Presentation(str(file_path))
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if hasattr(shape, "text"):
+                yield shape.text + "\n"
+
+
+def _iter_xlsx_rows(file_path: Path) -> Iterator[str]:
+    if not pm.is_installed("openpyxl"):  # type: ignore
+        pm.install("openpyxl")
+    from openpyxl import load_workbook  # type: ignore
+
+    # read_only mode streams rows from the archive instead of building the full sheet model
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        for sheet in wb:
+            yield f"Sheet: {sheet.title}\n"
+            for row in sheet.iter_rows(values_only=True):
+                yield (
+                    "\t".join(str(cell) if cell is not None else "" for cell in row)
+                    + "\n"
+                )
+            yield "\n"
+    finally:
+        wb.close()
+
+
+def extract_document_text(
+    file_path: str, ext: str, loading_engine: str, pdf_password: str | None
+) -> str:
+    """Extract text from a binary document; runs inside a parser worker process"""
+    path = Path(file_path)
+    label = FORMAT_LABELS.get(ext, ext)
+    try:
+        if loading_engine == "DOCLING":
+            pieces = _iter_docling(path)
+        elif ext == ".pdf":
+            pieces = _iter_pdf_pages(path, pdf_password)
+        elif ext == ".docx":
+            pieces = _iter_docx_paragraphs(path)
+        elif ext == ".pptx":
+            pieces = _iter_pptx_shapes(path)
+        elif ext == ".xlsx":
+            pieces = _iter_xlsx_rows(path)
+        else:
+            raise DocumentParseError(
+                f"[File Extraction]Unsupported file type: {ext}",
+                f"File extension {ext} is not supported",
+            )
+        return "".join(pieces)
+    except DocumentParseError:
+        raise
+    except MemoryError:
+        raise DocumentParseError(
+            f"[File Extraction]{label} processing error",
+            f"Failed to extract text from {label}: memory limit exceeded",
+        )
+    except Exception as e:
+        raise DocumentParseError(
+            f"[File Extraction]{label} processing error",
+            f"Failed to extract text from {label}: {str(e)}",
+        )
+
+
+class DocumentParserPool:
+    """Bounded process pool for document text extraction with per-file timeout
+
+    Pending parses can be cancelled before a worker picks them up. A parse that
+    exceeds its timeout cannot be interrupted inside the worker, so the pool is
+    recycled: its processes are terminated and a fresh executor is started.
+    Parses that were running on the recycled pool are retried once.
+    """
+
+    def __init__(self, max_workers: int, timeout: float, memory_limit_mb: int = 0):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._total_parse_ms = 0.0
+        self._last_parse_ms = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn avoids forking the server's event loop and threads into workers
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.memory_limit_mb,),
+            )
+        return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """Kill the workers of an executor stuck on a timed-out parse"""
+        if self._executor is executor:
+            self._executor = None
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_once(self, file_path: Path, ext: str, args: tuple) -> str:
+        # Files wait here rather than in the executor's internal queue, so the
+        # queue depth is observable and a timeout only covers actual parse time
+        self._queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._queued -= 1
+
+        self._active += 1
+        executor = self._get_executor()
+        future = executor.submit(extract_document_text, str(file_path), ext, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout or None
+            )
+        except asyncio.TimeoutError:
+            self._recycle(executor)
+            raise
+        except BrokenProcessPool:
+            # A worker died (recycled or crashed); start a fresh pool on next use
+            if self._executor is executor:
+                self._executor = None
+            raise
+        except asyncio.CancelledError:
+            # A running worker cannot be interrupted; its result is discarded
+            future.cancel()
+            raise
+        finally:
+            self._active -= 1
+            self._slots.release()
+
+    async def parse(
+        self,
+        file_path: Path,
+        ext: str,
+        loading_engine: str,
+        pdf_password: str | None = None,
+    ) -> str:
+        """Extract text from ``file_path`` without blocking the event loop
+
+        Raises:
+            DocumentParseError: On extraction failure or timeout
+        """
+        label = FORMAT_LABELS.get(ext, ext)
+        args = (loading_engine, pdf_password)
+        start = time.perf_counter()
+        try:
+            for attempt in range(2):
+                try:
+                    content = await self._run_once(file_path, ext, args)
+                    break
+                except BrokenProcessPool:
+                    # Pool was recycled because of another file's timeout
+                    if attempt == 1:
+                        raise
+            self._completed += 1
+            return content
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            self._failed += 1
+            raise DocumentParseError(
+                f"[File Extraction]{label} processing timeout",
+                f"Text extraction did not finish within {self.timeout}s",
+            )
+        except DocumentParseError:
+            self._failed += 1
+            raise
+        except BrokenProcessPool as e:
+            self._failed += 1
+            raise DocumentParseError(
+                f"[File Extraction]{label} processing error",
+                f"Document parser worker terminated unexpectedly: {str(e)}",
+            )
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._last_parse_ms = elapsed_ms
+            self._total_parse_ms += elapsed_ms
+
+    def stats(self) -> dict[str, Any]:
+        finished = self._completed + self._failed
+        return {
+            "workers": self.max_workers,
+            "queued": self._queued,
+            "active": self._active,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timeouts": self._timeouts,
+            "last_parse_ms": round(self._last_parse_ms, 2),
+            "avg_parse_ms": round(self._total_parse_ms / finished, 2)
+            if finished
+            else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_parser_pool: DocumentParserPool | None = None
+
+
+def get_document_parser_pool() -> DocumentParserPool:
+    """Return the per-process document parser pool, configured from global_args"""
+    global _parser_pool
+    if _parser_pool is None:
+        from lightrag.api.config import global_args
+
+        _parser_pool = DocumentParserPool(
+            max_workers=global_args.document_parse_workers,
+            timeout=global_args.document_parse_timeout,
+            memory_limit_mb=global_args.document_parse_memory_limit_mb,
+        )
+        logger.info(
+            f"Document parser pool: {_parser_pool.max_workers} workers, "
+            f"timeout {_parser_pool.timeout}s (pid {os.getpid()})"
+        )
+    return _parser_pool
+
+
+def shutdown_document_parser_pool() -> None:
+    global _parser_pool
+    if _parser_pool is not None:
+        _parser_pool.shutdown()
+        _parser_pool = None
@@ -50,6 +50,7 @@ from lightrag.api.routers.document_routes import (
     DocumentManager,
     create_document_routes,
 )
+from lightrag.api.document_parser import shutdown_document_parser_pool
 from lightrag.api.routers.query_routes import create_query_routes
 from lightrag.api.routers.graph_routes import create_graph_routes
 from lightrag.api.routers.ollama_api import OllamaAPI
@@ -345,6 +346,7 @@ def create_app(args):
         finally:
             # Clean up database connections
             await rag.finalize_storages()
+            shutdown_document_parser_pool()
 
             if "LIGHTRAG_GUNICORN_MODE" not in os.environ:
                 # Only perform cleanup in Uvicorn single-process mode
@@ -964,7 +966,11 @@ def create_app(args):
                     "max_async": args.max_async,
                     "embedding_func_max_async": args.embedding_func_max_async,
                     "embedding_batch_num": args.embedding_batch_num,
+                    "embedding_coalesce_wait_ms": rag.embedding_coalesce_wait_ms,
                 },
+                "embedding_coalescing": rag.embedding_func.get_stats()
+                if hasattr(rag.embedding_func, "get_stats")
+                else None,
                 "auth_mode": auth_mode,
                 "pipeline_busy": pipeline_status.get("busy", False),
                 "keyed_locks": keyed_lock_info,
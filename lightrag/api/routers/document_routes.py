@@ -7,7 +7,6 @@ from lightrag.utils import logger, get_pinyin_sort_key
 import aiofiles
 import shutil
 import traceback
-import pipmaster as pm
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Literal
@@ -25,6 +24,7 @@ from lightrag import LightRAG
 from lightrag.base import DeletionResult, DocProcessingStatus, DocStatus
 from lightrag.utils import generate_track_id
 from lightrag.api.utils_api import get_combined_auth_dependency
+from lightrag.api.document_parser import DocumentParseError, get_document_parser_pool
 from ..config import global_args
 
 
@@ -713,6 +713,8 @@ class PipelineStatusResponse(BaseModel):
         latest_message: Latest message from pipeline processing
         history_messages: List of history messages
         update_status: Status of update flags for all namespaces
+        document_parsing: Document parser pool stats of the serving worker
+            (queued, active, completed, failed, timeouts, last_parse_ms, avg_parse_ms)
     """
 
     autoscanned: bool = False
@@ -726,6 +728,7 @@ class PipelineStatusResponse(BaseModel):
     latest_message: str = ""
     history_messages: Optional[List[str]] = None
     update_status: Optional[dict] = None
+    document_parsing: Optional[dict] = None
 
     @field_validator("job_start", mode="before")
     @classmethod
@@ -1070,136 +1073,22 @@ async def pipeline_enqueue_file(
                         )
                         return False, track_id
 
-                case ".pdf":
+                case ".pdf" | ".docx" | ".pptx" | ".xlsx":
+                    # Binary formats are parsed in the document parser process pool
+                    # so that large files do not block the event loop
                     try:
-                        if global_args.document_loading_engine == "DOCLING":
-                            if not pm.is_installed("docling"):  # type: ignore
-                                pm.install("docling")
-                            from docling.document_converter import DocumentConverter  # type: ignore
-
-                            converter = DocumentConverter()
-                            result = converter.convert(file_path)
-                            content = result.document.export_to_markdown()
-                        else:
-                            if not pm.is_installed("pypdf2"):  # type: ignore
-                                pm.install("pypdf2")
-                            if not pm.is_installed("pycryptodome"):  # type: ignore
-                                pm.install("pycryptodome")
-                            from PyPDF2 import PdfReader  # type: ignore
-                            from io import BytesIO
-
-                            pdf_file = BytesIO(file)
-                            reader = PdfReader(pdf_file)
-
-                            # Check if PDF is encrypted
-                            if reader.is_encrypted:
-                                pdf_password = global_args.pdf_decrypt_password
-                                if not pdf_password:
-                                    # PDF is encrypted but no password provided
-                                    error_files = [
-                                        {
-                                            "file_path": str(file_path.name),
-                                            "error_description": "[File Extraction]PDF is encrypted but no password provided",
-                                            "original_error": "Please set PDF_DECRYPT_PASSWORD environment variable to decrypt this PDF file",
-                                            "file_size": file_size,
-                                        }
-                                    ]
-                                    await rag.apipeline_enqueue_error_documents(
-                                        error_files, track_id
-                                    )
-                                    logger.error(
-                                        f"[File Extraction]PDF is encrypted but no password provided: {file_path.name}"
-                                    )
-                                    return False, track_id
-
-                                # Try to decrypt with password
-                                try:
-                                    decrypt_result = reader.decrypt(pdf_password)
-                                    if decrypt_result == 0:
-                                        # Password is incorrect
-                                        error_files = [
-                                            {
-                                                "file_path": str(file_path.name),
-                                                "error_description": "[File Extraction]Failed to decrypt PDF - incorrect password",
-                                                "original_error": "The provided PDF_DECRYPT_PASSWORD is incorrect for this file",
-                                                "file_size": file_size,
-                                            }
-                                        ]
-                                        await rag.apipeline_enqueue_error_documents(
-                                            error_files, track_id
-                                        )
-                                        logger.error(
-                                            f"[File Extraction]Incorrect PDF password: {file_path.name}"
-                                        )
-                                        return False, track_id
-                                except Exception as decrypt_error:
-                                    # Decryption process error
-                                    error_files = [
-                                        {
-                                            "file_path": str(file_path.name),
-                                            "error_description": "[File Extraction]PDF decryption failed",
-                                            "original_error": f"Error during PDF decryption: {str(decrypt_error)}",
-                                            "file_size": file_size,
-                                        }
-                                    ]
-                                    await rag.apipeline_enqueue_error_documents(
-                                        error_files, track_id
-                                    )
-                                    logger.error(
-                                        f"[File Extraction]PDF decryption error for {file_path.name}: {str(decrypt_error)}"
-                                    )
-                                    return False, track_id
-
-                            # Extract text from PDF (encrypted PDFs are now decrypted, unencrypted PDFs proceed directly)
-                            for page in reader.pages:
-                                content += page.extract_text() + "\n"
-                    except Exception as e:
-                        error_files = [
-                            {
-                                "file_path": str(file_path.name),
-                                "error_description": "[File Extraction]PDF processing error",
-                                "original_error": f"Failed to extract text from PDF: {str(e)}",
-                                "file_size": file_size,
-                            }
-                        ]
-                        await rag.apipeline_enqueue_error_documents(
-                            error_files, track_id
+                        content = await get_document_parser_pool().parse(
+                            file_path,
+                            ext,
+                            loading_engine=global_args.document_loading_engine,
+                            pdf_password=global_args.pdf_decrypt_password,
                         )
-                        logger.error(
-                            f"[File Extraction]Error processing PDF {file_path.name}: {str(e)}"
-                        )
-                        return False, track_id
-
-                case ".docx":
-                    try:
-                        if global_args.document_loading_engine == "DOCLING":
-                            if not pm.is_installed("docling"):  # type: ignore
-                                pm.install("docling")
-                            from docling.document_converter import DocumentConverter  # type: ignore
-
-                            converter = DocumentConverter()
-                            result = converter.convert(file_path)
-                            content = result.document.export_to_markdown()
-                        else:
-                            if not pm.is_installed("python-docx"):  # type: ignore
-                                try:
-                                    pm.install("python-docx")
-                                except Exception:
-                                    pm.install("docx")
-                            from docx import Document  # type: ignore
-                            from io import BytesIO
-
-                            docx_file = BytesIO(file)
-                            doc = Document(docx_file)
-                            content = "\n".join(
-                                [paragraph.text for paragraph in doc.paragraphs]
-                            )
-                    except Exception as e:
+                    except DocumentParseError as e:
                         error_files = [
                             {
                                 "file_path": str(file_path.name),
-                                "error_description": "[File Extraction]DOCX processing error",
-                                "original_error": f"Failed to extract text from DOCX: {str(e)}",
+                                "error_description": e.description,
+                                "original_error": e.original_error,
                                 "file_size": file_size,
                             }
                         ]
@@ -1207,92 +1096,7 @@ async def pipeline_enqueue_file(
                             error_files, track_id
                         )
                         logger.error(
-                            f"[File Extraction]Error processing DOCX {file_path.name}: {str(e)}"
-                        )
-                        return False, track_id
-
-                case ".pptx":
-                    try:
-                        if global_args.document_loading_engine == "DOCLING":
-                            if not pm.is_installed("docling"):  # type: ignore
-                                pm.install("docling")
-                            from docling.document_converter import DocumentConverter  # type: ignore
-
-                            converter = DocumentConverter()
-                            result = converter.convert(file_path)
-                            content = result.document.export_to_markdown()
-                        else:
-                            if not pm.is_installed("python-pptx"):  # type: ignore
-                                pm.install("pptx")
-                            from pptx import Presentation  # type: ignore
-                            from io import BytesIO
-
-                            pptx_file = BytesIO(file)
-                            prs = Presentation(pptx_file)
-                            for slide in prs.slides:
-                                for shape in slide.shapes:
-                                    if hasattr(shape, "text"):
-                                        content += shape.text + "\n"
-                    except Exception as e:
-                        error_files = [
-                            {
-                                "file_path": str(file_path.name),
-                                "error_description": "[File Extraction]PPTX processing error",
-                                "original_error": f"Failed to extract text from PPTX: {str(e)}",
-                                "file_size": file_size,
-                            }
-                        ]
-                        await rag.apipeline_enqueue_error_documents(
-                            error_files, track_id
-                        )
-                        logger.error(
-                            f"[File Extraction]Error processing PPTX {file_path.name}: {str(e)}"
-                        )
-                        return False, track_id
-
-                case ".xlsx":
-                    try:
-                        if global_args.document_loading_engine == "DOCLING":
-                            if not pm.is_installed("docling"):  # type: ignore
-                                pm.install("docling")
-                            from docling.document_converter import DocumentConverter  # type: ignore
-
-                            converter = DocumentConverter()
-                            result = converter.convert(file_path)
-                            content = result.document.export_to_markdown()
-                        else:
-                            if not pm.is_installed("openpyxl"):  # type: ignore
-                                pm.install("openpyxl")
-                            from openpyxl import load_workbook  # type: ignore
-                            from io import BytesIO
-
-                            xlsx_file = BytesIO(file)
-                            wb = load_workbook(xlsx_file)
-                            for sheet in wb:
-                                content += f"Sheet: {sheet.title}\n"
-                                for row in sheet.iter_rows(values_only=True):
-                                    content += (
-                                        "\t".join(
-                                            str(cell) if cell is not None else ""
-                                            for cell in row
-                                        )
-                                        + "\n"
-                                    )
-                                content += "\n"
-                    except Exception as e:
-                        error_files = [
-                            {
-                                "file_path": str(file_path.name),
-                                "error_description": "[File Extraction]XLSX processing error",
-                                "original_error": f"Failed to extract text from XLSX: {str(e)}",
-                                "file_size": file_size,
-                            }
-                        ]
-                        await rag.apipeline_enqueue_error_documents(
-                            error_files, track_id
-                        )
-                        logger.error(
-                            f"[File Extraction]Error processing XLSX {file_path.name}: {str(e)}"
+                            f"[File Extraction]Error processing {file_path.name}: {e.original_error}"
                         )
                         return False, track_id
 
@@ -1588,6 +1392,8 @@ async def background_delete_documents(
     pipeline_status_lock = get_pipeline_status_lock()
 
     total_docs = len(doc_ids)
+    batch_size = max(1, global_args.delete_batch_size)
+    total_batches = (total_docs + batch_size - 1) // batch_size
     successful_deletions = []
     failed_deletions = []
 
@@ -1604,7 +1410,7 @@ async def background_delete_documents(
                 "job_name": f"Deleting {total_docs} Documents",
                 "job_start": datetime.now().isoformat(),
                 "docs": total_docs,
-                "batchs": total_docs,
+                "batchs": total_batches,
                 "cur_batch": 0,
                 "latest_message": "Starting document deletion process",
             }
@@ -1617,172 +1423,199 @@ async def background_delete_documents(
             )
 
     try:
-        # Loop through each document ID and delete them one by one
-        for i, doc_id in enumerate(doc_ids, 1):
-            # Check for cancellation at the start of each document deletion
+        for batch_index, start in enumerate(range(0, total_docs, batch_size), 1):
+            batch_doc_ids = doc_ids[start : start + batch_size]
+
+            # Check for cancellation before each batch
             async with pipeline_status_lock:
                 if pipeline_status.get("cancellation_requested", False):
-                    cancel_msg = f"Deletion cancelled by user at document {i}/{total_docs}. {len(successful_deletions)} deleted, {total_docs - i + 1} remaining."
+                    cancel_msg = f"Deletion cancelled by user at batch {batch_index}/{total_batches}. {len(successful_deletions)} deleted, {total_docs - start} remaining."
                     logger.info(cancel_msg)
                     pipeline_status["latest_message"] = cancel_msg
                     pipeline_status["history_messages"].append(cancel_msg)
                     # Add remaining documents to failed list with cancellation reason
-                    failed_deletions.extend(
-                        doc_ids[i - 1 :]
-                    )  # i-1 because enumerate starts at 1
+                    failed_deletions.extend(doc_ids[start:])
                     break  # Exit the loop, remaining documents unchanged
 
-                start_msg = f"Deleting document {i}/{total_docs}: {doc_id}"
+                start_msg = f"Deleting batch {batch_index}/{total_batches}: documents {start + 1}-{start + len(batch_doc_ids)} of {total_docs}"
                 logger.info(start_msg)
-                pipeline_status["cur_batch"] = i
+                pipeline_status["cur_batch"] = batch_index
                 pipeline_status["latest_message"] = start_msg
                 pipeline_status["history_messages"].append(start_msg)
 
-            file_path = "#"
+            # Delete the documents of a batch in one pass so that entities and
+            # relations shared between them are rebuilt and persisted only once
             try:
-                result = await rag.adelete_by_doc_id(
-                    doc_id, delete_llm_cache=delete_llm_cache
+                results = await rag.adelete_by_doc_ids(
+                    batch_doc_ids, delete_llm_cache=delete_llm_cache
                 )
-                file_path = (
-                    getattr(result, "file_path", "-") if "result" in locals() else "-"
+            except Exception as e:
+                failed_deletions.extend(batch_doc_ids)
+                error_msg = (
+                    f"Error deleting batch {batch_index}/{total_batches}: {str(e)}"
                 )
-                if result.status == "success":
-                    successful_deletions.append(doc_id)
-                    success_msg = (
-                        f"Document deleted {i}/{total_docs}: {doc_id}[{file_path}]"
-                    )
-                    logger.info(success_msg)
-                    async with pipeline_status_lock:
-                        pipeline_status["history_messages"].append(success_msg)
+                logger.error(error_msg)
+                logger.error(traceback.format_exc())
+                async with pipeline_status_lock:
+                    pipeline_status["latest_message"] = error_msg
+                    pipeline_status["history_messages"].append(error_msg)
+                continue
 
-                    # Handle file deletion if requested and file_path is available
-                    if (
-                        delete_file
-                        and result.file_path
-                        and result.file_path != "unknown_source"
-                    ):
-                        try:
-                            deleted_files = []
-                            # SECURITY FIX: Use secure path validation to prevent arbitrary file deletion
-                            safe_file_path = validate_file_path_security(
-                                result.file_path, doc_manager.input_dir
-                            )
+            # Report the per-document results and delete the input files
+            for i, result in enumerate(results, start + 1):
+                doc_id = result.doc_id
+                file_path = "#"
+                try:
+                    file_path = getattr(result, "file_path", "-")
+                    if result.status == "success":
+                        successful_deletions.append(doc_id)
+                        success_msg = (
+                            f"Document deleted {i}/{total_docs}: {doc_id}[{file_path}]"
+                        )
+                        logger.info(success_msg)
+                        async with pipeline_status_lock:
+                            pipeline_status["history_messages"].append(success_msg)
+
+                        # Handle file deletion if requested and file_path is available
+                        if (
+                            delete_file
+                            and result.file_path
+                            and result.file_path != "unknown_source"
+                        ):
+                            try:
+                                deleted_files = []
+                                # SECURITY FIX: Use secure path validation to prevent arbitrary file deletion
+                                safe_file_path = validate_file_path_security(
+                                    result.file_path, doc_manager.input_dir
+                                )
 
-                            if safe_file_path is None:
-                                # Security violation detected - log and skip file deletion
-                                security_msg = f"Security violation: Unsafe file path detected for deletion - {result.file_path}"
-                                logger.warning(security_msg)
-                                async with pipeline_status_lock:
-                                    pipeline_status["latest_message"] = security_msg
-                                    pipeline_status["history_messages"].append(
-                                        security_msg
-                                    )
-                            else:
-                                # check and delete files from input_dir directory
-                                if safe_file_path.exists():
-                                    try:
-                                        safe_file_path.unlink()
-                                        deleted_files.append(safe_file_path.name)
-                                        file_delete_msg = f"Successfully deleted input_dir file: {result.file_path}"
-                                        logger.info(file_delete_msg)
-                                        async with pipeline_status_lock:
-                                            pipeline_status["latest_message"] = (
-                                                file_delete_msg
-                                            )
-                                            pipeline_status["history_messages"].append(
-                                                file_delete_msg
-                                            )
-                                    except Exception as file_error:
-                                        file_error_msg = f"Failed to delete input_dir file {result.file_path}: {str(file_error)}"
-                                        logger.debug(file_error_msg)
-                                        async with pipeline_status_lock:
-                                            pipeline_status["latest_message"] = (
-                                                file_error_msg
-                                            )
-                                            pipeline_status["history_messages"].append(
-                                                file_error_msg
-                                            )
+                                if safe_file_path is None:
+                                    # Security violation detected - log and skip file deletion
+                                    security_msg = f"Security violation: Unsafe file path detected for deletion - {result.file_path}"
+                                    logger.warning(security_msg)
+                                    async with pipeline_status_lock:
+                                        pipeline_status["latest_message"] = security_msg
+                                        pipeline_status["history_messages"].append(
+                                            security_msg
+                                        )
+                                else:
+                                    # check and delete files from input_dir directory
+                                    if safe_file_path.exists():
+                                        try:
+                                            safe_file_path.unlink()
+                                            deleted_files.append(safe_file_path.name)
+                                            file_delete_msg = f"Successfully deleted input_dir file: {result.file_path}"
+                                            logger.info(file_delete_msg)
+                                            async with pipeline_status_lock:
+                                                pipeline_status["latest_message"] = (
+                                                    file_delete_msg
+                                                )
+                                                pipeline_status[
+                                                    "history_messages"
+                                                ].append(file_delete_msg)
+                                        except Exception as file_error:
+                                            file_error_msg = f"Failed to delete input_dir file {result.file_path}: {str(file_error)}"
+                                            logger.debug(file_error_msg)
+                                            async with pipeline_status_lock:
+                                                pipeline_status["latest_message"] = (
+                                                    file_error_msg
+                                                )
+                                                pipeline_status[
+                                                    "history_messages"
+                                                ].append(file_error_msg)
 
-                                # Also check and delete files from __enqueued__ directory
-                                enqueued_dir = doc_manager.input_dir / "__enqueued__"
-                                if enqueued_dir.exists():
-                                    # SECURITY FIX: Validate that the file path is safe before processing
-                                    # Only proceed if the original path validation passed
-                                    base_name = Path(result.file_path).stem
-                                    extension = Path(result.file_path).suffix
-
-                                    # Search for exact match and files with numeric suffixes
-                                    for enqueued_file in enqueued_dir.glob(
-                                        f"{base_name}*{extension}"
-                                    ):
-                                        # Additional security check: ensure enqueued file is within enqueued directory
-                                        safe_enqueued_path = (
-                                            validate_file_path_security(
-                                                enqueued_file.name, enqueued_dir
+                                    # Also check and delete files from __enqueued__ directory
+                                    enqueued_dir = (
+                                        doc_manager.input_dir / "__enqueued__"
+                                    )
+                                    if enqueued_dir.exists():
+                                        # SECURITY FIX: Validate that the file path is safe before processing
+                                        # Only proceed if the original path validation passed
+                                        base_name = Path(result.file_path).stem
+                                        extension = Path(result.file_path).suffix
+
+                                        # Search for exact match and files with numeric suffixes
+                                        for enqueued_file in enqueued_dir.glob(
+                                            f"{base_name}*{extension}"
+                                        ):
+                                            # Additional security check: ensure enqueued file is within enqueued directory
+                                            safe_enqueued_path = (
+                                                validate_file_path_security(
+                                                    enqueued_file.name, enqueued_dir
+                                                )
                                             )
+                                            if safe_enqueued_path is not None:
+                                                try:
+                                                    enqueued_file.unlink()
+                                                    deleted_files.append(
+                                                        enqueued_file.name
+                                                    )
+                                                    logger.info(
+                                                        f"Successfully deleted enqueued file: {enqueued_file.name}"
+                                                    )
+                                                except Exception as enqueued_error:
+                                                    file_error_msg = f"Failed to delete enqueued file {enqueued_file.name}: {str(enqueued_error)}"
+                                                    logger.debug(file_error_msg)
+                                                    async with pipeline_status_lock:
+                                                        pipeline_status[
+                                                            "latest_message"
+                                                        ] = file_error_msg
+                                                        pipeline_status[
+                                                            "history_messages"
+                                                        ].append(file_error_msg)
+                                            else:
+                                                security_msg = f"Security violation: Unsafe enqueued file path detected - {enqueued_file.name}"
+                                                logger.warning(security_msg)
+
+                                if deleted_files == []:
+                                    file_error_msg = f"File deletion skipped, missing or unsafe file: {result.file_path}"
+                                    logger.warning(file_error_msg)
+                                    async with pipeline_status_lock:
+                                        pipeline_status["latest_message"] = (
+                                            file_error_msg
                                         )
-                                        if safe_enqueued_path is not None:
-                                            try:
-                                                enqueued_file.unlink()
-                                                deleted_files.append(enqueued_file.name)
-                                                logger.info(
-                                                    f"Successfully deleted enqueued file: {enqueued_file.name}"
-                                                )
-                                            except Exception as enqueued_error:
-                                                file_error_msg = f"Failed to delete enqueued file {enqueued_file.name}: {str(enqueued_error)}"
-                                                logger.debug(file_error_msg)
-                                                async with pipeline_status_lock:
-                                                    pipeline_status[
-                                                        "latest_message"
-                                                    ] = file_error_msg
-                                                    pipeline_status[
-                                                        "history_messages"
-                                                    ].append(file_error_msg)
-                                        else:
-                                            security_msg = f"Security violation: Unsafe enqueued file path detected - {enqueued_file.name}"
-                                            logger.warning(security_msg)
-
-                            if deleted_files == []:
-                                file_error_msg = f"File deletion skipped, missing or unsafe file: {result.file_path}"
-                                logger.warning(file_error_msg)
+                                        pipeline_status["history_messages"].append(
+                                            file_error_msg
+                                        )
+
+                            except Exception as file_error:
+                                file_error_msg = f"Failed to delete file {result.file_path}: {str(file_error)}"
+                                logger.error(file_error_msg)
                                 async with pipeline_status_lock:
                                     pipeline_status["latest_message"] = file_error_msg
                                     pipeline_status["history_messages"].append(
                                         file_error_msg
                                     )
-
-                        except Exception as file_error:
-                            file_error_msg = f"Failed to delete file {result.file_path}: {str(file_error)}"
-                            logger.error(file_error_msg)
+                        elif delete_file:
+                            no_file_msg = (
+                                f"File deletion skipped, missing file path: {doc_id}"
+                            )
+                            logger.warning(no_file_msg)
                             async with pipeline_status_lock:
-                                pipeline_status["latest_message"] = file_error_msg
-                                pipeline_status["history_messages"].append(
-                                    file_error_msg
-                                )
-                    elif delete_file:
-                        no_file_msg = (
-                            f"File deletion skipped, missing file path: {doc_id}"
-                        )
-                        logger.warning(no_file_msg)
+                                pipeline_status["latest_message"] = no_file_msg
+                                pipeline_status["history_messages"].append(no_file_msg)
+                    else:
+                        failed_deletions.append(doc_id)
+                        error_msg = f"Failed to delete {i}/{total_docs}: {doc_id}[{file_path}] - {result.message}"
+                        logger.error(error_msg)
                         async with pipeline_status_lock:
-                            pipeline_status["latest_message"] = no_file_msg
-                            pipeline_status["history_messages"].append(no_file_msg)
-                else:
+                            pipeline_status["latest_message"] = error_msg
+                            pipeline_status["history_messages"].append(error_msg)
+
+                except Exception as e:
                     failed_deletions.append(doc_id)
-                    error_msg = f"Failed to delete {i}/{total_docs}: {doc_id}[{file_path}] - {result.message}"
+                    error_msg = f"Error deleting document {i}/{total_docs}: {doc_id}[{file_path}] - {str(e)}"
                     logger.error(error_msg)
+                    logger.error(traceback.format_exc())
                     async with pipeline_status_lock:
                         pipeline_status["latest_message"] = error_msg
                         pipeline_status["history_messages"].append(error_msg)
 
-            except Exception as e:
-                failed_deletions.append(doc_id)
-                error_msg = f"Error deleting document {i}/{total_docs}: {doc_id}[{file_path}] - {str(e)}"
-                logger.error(error_msg)
-                logger.error(traceback.format_exc())
-                async with pipeline_status_lock:
-                    pipeline_status["latest_message"] = error_msg
-                    pipeline_status["history_messages"].append(error_msg)
+            progress_msg = f"Deletion batch {batch_index}/{total_batches} completed: {len(successful_deletions)} deleted, {len(failed_deletions)} failed, {total_docs - start - len(batch_doc_ids)} remaining"
+            logger.info(progress_msg)
+            async with pipeline_status_lock:
+                pipeline_status["latest_message"] = progress_msg
+                pipeline_status["history_messages"].append(progress_msg)
 
     except Exception as e:
         error_msg = f"Critical error during batch deletion: {str(e)}"
@@ -2117,6 +1950,7 @@ def create_document_routes(
                 rag.full_relations,
                 rag.entity_chunks,
                 rag.relation_chunks,
+                rag.chunk_extractions,
                 rag.entities_vdb,
                 rag.relationships_vdb,
                 rag.chunks_vdb,
@@ -2263,6 +2097,7 @@ def create_document_routes(
                 - latest_message (str): Latest message from pipeline processing
                 - history_messages (List[str], optional): List of history messages (limited to latest 1000 entries,
                   with truncation message if more than 1000 messages exist)
+                - document_parsing (dict, optional): Document parser queue depth and parse times
 
         Raises:
             HTTPException: If an error occurs while retrieving pipeline status (500)
@@ -2296,6 +2131,9 @@ def create_document_routes(
             # Add processed update_status to the status dictionary
             status_dict["update_status"] = processed_update_status
 
+            # Parser queue depth and timings are tracked per server process
+            status_dict["document_parsing"] = get_document_parser_pool().stats()
+
             # Convert history_messages to a regular list if it's a Manager.list
             # and limit to latest 1000 entries with truncation message if needed
             if "history_messages" in status_dict:
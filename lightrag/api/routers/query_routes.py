@@ -108,6 +108,18 @@ class QueryRequest(BaseModel):
         description="If True, includes actual chunk text content in references. Only applies when include_references=True. Useful for evaluation and debugging.",
     )
 
+    nprobe: Optional[int] = Field(
+        ge=1,
+        default=None,
+        description="Number of inverted lists probed by IVF vector indexes (e.g. Faiss IVF, pgvector ivfflat). Uses the storage default if not set.",
+    )
+
+    ef_search: Optional[int] = Field(
+        ge=1,
+        default=None,
+        description="Candidate list size for HNSW vector indexes (e.g. Faiss HNSW, pgvector hnsw). Uses the storage default if not set.",
+    )
+
     stream: Optional[bool] = Field(
         default=True,
         description="If True, enables streaming output for real-time responses. Only affects /query/stream endpoint.",
@@ -5,6 +5,7 @@ from enum import Enum
 import os
 from dotenv import load_dotenv
 from dataclasses import dataclass, field
+import numpy as np
 from typing import (
     Any,
     Literal,
@@ -16,7 +17,7 @@ from typing import (
     List,
     AsyncIterator,
 )
-from .utils import EmbeddingFunc
+from .utils import EmbeddingFunc, cosine_top_k
 from .types import KnowledgeGraph
 from .constants import (
     DEFAULT_TOP_K,
@@ -168,6 +169,16 @@ class QueryParam:
     containing citation information for the retrieved content.
     """
 
+    nprobe: int | None = None
+    """Number of inverted lists probed by IVF vector indexes. None uses the storage default.
+    Higher values improve recall at the cost of query latency.
+    """
+
+    ef_search: int | None = None
+    """Size of the candidate list searched by HNSW vector indexes. None uses the storage default.
+    Higher values improve recall at the cost of query latency.
+    """
+
 
 @dataclass
 class StorageNameSpace(ABC):
@@ -222,7 +233,11 @@ class BaseVectorStorage(StorageNameSpace, ABC):
 
     @abstractmethod
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        search_params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Query the vector storage and retrieve top_k results.
 
@@ -231,6 +246,9 @@ class BaseVectorStorage(StorageNameSpace, ABC):
             top_k: Number of top results to return
             query_embedding: Optional pre-computed embedding for the query.
                            If provided, skips embedding computation for better performance.
+            search_params: Optional approximate-search tuning for this query
+                           (``nprobe``, ``ef_search``). Storages without such
+                           indexes ignore it.
         """
 
     @abstractmethod
@@ -313,6 +331,45 @@ class BaseVectorStorage(StorageNameSpace, ABC):
         """
         pass
 
+    async def get_vectors_array_by_ids(
+        self, ids: list[str]
+    ) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs as one contiguous float32 array
+
+        The default implementation goes through get_vectors_by_ids; local
+        storages override it to slice their vector matrix directly.
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            The IDs that have a vector, and an array holding their vectors in that order
+        """
+        vectors = await self.get_vectors_by_ids(ids)
+        found = [id for id in ids if id in vectors]
+        matrix = np.array([vectors[id] for id in found], dtype=np.float32)
+        return found, matrix.reshape(len(found), self.embedding_func.embedding_dim)
+
+    async def top_k_by_ids(
+        self, query_embedding, ids: list[str], top_k: int
+    ) -> list[tuple[str, float]]:
+        """Rank the given IDs by cosine similarity of their vectors to query_embedding
+
+        The default implementation scores the vectors from get_vectors_array_by_ids
+        with one matrix product; storages that can rank inside the database override it.
+
+        Args:
+            query_embedding: The query vector
+            ids: List of unique identifiers to rank, IDs without a vector are skipped
+            top_k: Maximum number of results
+
+        Returns:
+            Up to top_k (id, similarity) pairs, highest similarity first
+        """
+        found, matrix = await self.get_vectors_array_by_ids(ids)
+        rows, scores = cosine_top_k(query_embedding, matrix, top_k)
+        return [(found[row], float(score)) for row, score in zip(rows, scores)]
+
 
 @dataclass
 class BaseKVStorage(StorageNameSpace, ABC):
@@ -558,6 +615,35 @@ class BaseGraphStorage(StorageNameSpace, ABC):
             edge_data: A dictionary of edge properties
         """
 
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """Insert or update many nodes at once.
+
+        Default implementation upserts nodes one by one.
+        Override this method for better performance in storage backends
+        that support batch operations.
+
+        Args:
+            nodes: A dictionary mapping node IDs to their properties
+        """
+        for node_id, node_data in nodes.items():
+            await self.upsert_node(node_id, node_data)
+
+    async def upsert_edges_batch(
+        self, edges: dict[tuple[str, str], dict[str, str]]
+    ) -> None:
+        """Insert or update many edges at once.
+
+        Default implementation upserts edges one by one.
+        Override this method for better performance in storage backends
+        that support batch operations. Both endpoints of every edge are
+        expected to exist already.
+
+        Args:
+            edges: A dictionary mapping (source_id, target_id) pairs to edge properties
+        """
+        for (src_id, tgt_id), edge_data in edges.items():
+            await self.upsert_edge(src_id, tgt_id, edge_data)
+
     @abstractmethod
     async def delete_node(self, node_id: str) -> None:
         """Delete a node from the graph.
@@ -23,6 +23,8 @@ DEFAULT_SUMMARY_MAX_TOKENS = 1200
 DEFAULT_SUMMARY_LENGTH_RECOMMENDED = 600
 # Maximum token size sent to LLM for summary
 DEFAULT_SUMMARY_CONTEXT_SIZE = 12000
+# Maximum concurrent LLM calls per entity/relation in map-reduce summary
+DEFAULT_SUMMARY_MAX_PARALLEL = 4
 # Default entities to extract if ENTITY_TYPES is not specified in .env
 DEFAULT_ENTITY_TYPES = [
     "Person",
@@ -41,6 +43,10 @@ DEFAULT_ENTITY_TYPES = [
 # Separator for: description, source_id and relation-key fields(Can not be changed after data inserted)
 GRAPH_FIELD_SEP = "<SEP>"
 
+# Layout version of the parsed per-chunk extraction records (chunk_extractions storage).
+# Records with another version are ignored and re-parsed from the LLM cache on rebuild.
+CHUNK_EXTRACTION_VERSION = 1
+
 # Query and retrieval configuration defaults
 DEFAULT_TOP_K = 40
 DEFAULT_CHUNK_TOP_K = 20
@@ -51,6 +57,14 @@ DEFAULT_COSINE_THRESHOLD = 0.2
 DEFAULT_RELATED_CHUNK_NUMBER = 5
 DEFAULT_KG_CHUNK_PICK_METHOD = "VECTOR"
 
+# Semantic query cache defaults (see LightRAG.embedding_cache_config)
+DEFAULT_QUERY_CACHE_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_QUERY_CACHE_MAX_ENTRIES = 1000
+DEFAULT_QUERY_CACHE_TTL = 3600  # seconds, 0 disables expiration
+
+# Entries in the Tokenizer token-count LRU cache (about 200 bytes each), 0 disables it
+DEFAULT_TOKEN_COUNT_CACHE_SIZE = 100000
+
 # TODO: Deprated. All conversation_history messages is send to LLM.
 DEFAULT_HISTORY_TURNS = 0
 
@@ -86,6 +100,8 @@ DEFAULT_TEMPERATURE = 1.0
 # Async configuration defaults
 DEFAULT_MAX_ASYNC = 4  # Default maximum async operations
 DEFAULT_MAX_PARALLEL_INSERT = 2  # Default maximum parallel insert operations
+DEFAULT_MERGE_WRITE_BATCH_SIZE = 500  # Buffered writes per storage in merge stage
+DEFAULT_DELETE_BATCH_SIZE = 50  # Documents deleted per pass by the API server
 
 # Embedding configuration defaults
 DEFAULT_EMBEDDING_FUNC_MAX_ASYNC = 8  # Default max async for embedding functions
@@ -98,6 +114,39 @@ DEFAULT_TIMEOUT = 300
 DEFAULT_LLM_TIMEOUT = 180
 DEFAULT_EMBEDDING_TIMEOUT = 30
 
+# Shared HTTP connection pool defaults for LLM, embedding and rerank clients
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+# Document parsing (PDF/DOCX/PPTX/XLSX) process pool defaults for the API server
+DEFAULT_DOCUMENT_PARSE_WORKERS = 2
+DEFAULT_DOCUMENT_PARSE_TIMEOUT = 600  # seconds per file
+DEFAULT_DOCUMENT_PARSE_MEMORY_LIMIT_MB = 0  # 0 means no limit
+
+# JsonKVStorage write-ahead log defaults
+DEFAULT_KV_WAL_ENABLED = True
+DEFAULT_KV_WAL_COMPACT_MIN_BYTES = 64 * 1024 * 1024  # never compact a smaller log
+DEFAULT_KV_WAL_COMPACT_RATIO = 0.5  # compact once log size >= ratio * snapshot size
+
+# NetworkXStorage on-disk format defaults
+DEFAULT_NX_STORAGE_FORMAT = "graphml"  # graphml or binary (opt-in)
+DEFAULT_NX_MAX_DELTA_SEGMENTS = 16  # rewrite the base segment after this many deltas
+DEFAULT_NX_DELTA_COMPACT_RATIO = 0.5  # or once deltas reach this fraction of the base
+
+# FaissVectorDBStorage: compact once deleted rows reach this fraction of the index
+DEFAULT_FAISS_TOMBSTONE_COMPACT_RATIO = 0.2
+# FaissVectorDBStorage approximate search (vector_db_storage_cls_kwargs)
+DEFAULT_FAISS_INDEX_TYPE = "flat"  # flat, ivf_flat, ivf_pq or hnsw
+DEFAULT_FAISS_ANN_MIN_VECTORS = 10000  # keep a flat index below this many vectors
+DEFAULT_FAISS_NPROBE = 16
+DEFAULT_FAISS_EF_SEARCH = 64
+DEFAULT_FAISS_HNSW_M = 32
+DEFAULT_FAISS_PQ_NBITS = 8
+
+# MmapVectorDBStorage on-disk vector precision (vector_db_storage_cls_kwargs)
+DEFAULT_MMAP_VECTOR_DTYPE = "float16"  # float16 or float32
+
 # Logging configuration defaults
 DEFAULT_LOG_MAX_BYTES = 10485760  # Default 10MB
 DEFAULT_LOG_BACKUP_COUNT = 5  # Default 5 backups
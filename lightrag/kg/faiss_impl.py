@@ -1,4 +1,5 @@
 import os
+import math
 import time
 import asyncio
 from typing import Any, final
@@ -6,6 +7,15 @@ import json
 import numpy as np
 from dataclasses import dataclass
 
+from lightrag.constants import (
+    DEFAULT_FAISS_ANN_MIN_VECTORS,
+    DEFAULT_FAISS_EF_SEARCH,
+    DEFAULT_FAISS_HNSW_M,
+    DEFAULT_FAISS_INDEX_TYPE,
+    DEFAULT_FAISS_NPROBE,
+    DEFAULT_FAISS_PQ_NBITS,
+    DEFAULT_FAISS_TOMBSTONE_COMPACT_RATIO,
+)
 from lightrag.utils import logger, compute_mdhash_id
 from lightrag.base import BaseVectorStorage
 
@@ -18,6 +28,120 @@ from .shared_storage import (
 # You must manually install faiss-cpu or faiss-gpu before using FAISS vector db
 import faiss  # type: ignore
 
+FAISS_INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+
+def faiss_index_type(index) -> str:
+    """Return the FAISS_INDEX_TYPES name of an index built by create_faiss_index"""
+    if isinstance(index, faiss.IndexHNSW):
+        return "hnsw"
+    if isinstance(index, faiss.IndexIVFPQ):
+        return "ivf_pq"
+    if isinstance(index, faiss.IndexIVF):
+        return "ivf_flat"
+    return "flat"
+
+
+def default_nlist(num_vectors: int) -> int:
+    """IVF list count: ~4*sqrt(n), keeping at least 39 training points per list"""
+    return max(1, min(int(4 * math.sqrt(num_vectors)), num_vectors // 39))
+
+
+def min_training_vectors(
+    index_type: str, nlist: int, pq_nbits: int = DEFAULT_FAISS_PQ_NBITS
+) -> int:
+    """Fewest training vectors faiss accepts: one per IVF list and per PQ centroid"""
+    if index_type == "ivf_flat":
+        return nlist
+    if index_type == "ivf_pq":
+        return max(nlist, 2**pq_nbits)
+    return 0
+
+
+def default_pq_m(dim: int) -> int:
+    """Number of PQ sub-quantizers: the largest divisor of dim up to dim / 8"""
+    for m in range(max(1, dim // 8), 0, -1):
+        if dim % m == 0:
+            return m
+    return 1
+
+
+def create_faiss_index(
+    vectors: np.ndarray,
+    dim: int,
+    index_type: str,
+    nlist: int | None = None,
+    pq_m: int | None = None,
+    pq_nbits: int = DEFAULT_FAISS_PQ_NBITS,
+    hnsw_m: int = DEFAULT_FAISS_HNSW_M,
+    ef_construction: int | None = None,
+):
+    """Create an inner product index of the given type, trained on and filled with vectors
+
+    vectors must be a contiguous float32 array of normalized rows; row i gets faiss id i.
+    """
+    if index_type == "flat":
+        index = faiss.IndexFlatIP(dim)
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        if ef_construction:
+            index.hnsw.efConstruction = ef_construction
+    elif index_type in ("ivf_flat", "ivf_pq"):
+        nlist = nlist or default_nlist(len(vectors))
+        if index_type == "ivf_flat":
+            description = f"IVF{nlist},Flat"
+        else:
+            description = f"IVF{nlist},PQ{pq_m or default_pq_m(dim)}x{pq_nbits}"
+        index = faiss.index_factory(dim, description, faiss.METRIC_INNER_PRODUCT)
+        if index_type == "ivf_pq":
+            # Polysemous codes only speed up Hamming-filtered search, which is never
+            # enabled here, and dominate the training time
+            index.do_polysemous_training = False
+    else:
+        raise ValueError(
+            f"Unsupported Faiss index_type '{index_type}', expected one of {FAISS_INDEX_TYPES}"
+        )
+
+    if not index.is_trained:
+        # Sample enough rows for both the coarse quantizer and the PQ codebooks
+        sample_size = min(len(vectors), max(nlist, 2**pq_nbits) * 64)
+        rows = np.random.default_rng(0).choice(len(vectors), sample_size, replace=False)
+        index.train(vectors[np.sort(rows)])
+    if len(vectors):
+        index.add(vectors)
+    return index
+
+
+def faiss_search_params(
+    index,
+    selector=None,
+    nprobe: int = DEFAULT_FAISS_NPROBE,
+    ef_search: int = DEFAULT_FAISS_EF_SEARCH,
+):
+    """Build per-search parameters for an index, or None when the defaults apply"""
+    index_type = faiss_index_type(index)
+    if index_type == "hnsw":
+        # HNSW returns at most efSearch candidates
+        return faiss.SearchParametersHNSW(sel=selector, efSearch=ef_search)
+    if index_type in ("ivf_flat", "ivf_pq"):
+        return faiss.SearchParametersIVF(sel=selector, nprobe=nprobe)
+    if selector is not None:
+        return faiss.SearchParameters(sel=selector)
+    return None
+
+
+@dataclass
+class _IndexRebuild:
+    """Rows copied under the storage lock for an index rebuilt outside it"""
+
+    base_index: Any  # index the rows were copied from
+    base_ntotal: int  # rows it held at that point
+    keep_fids: list[int]
+    vectors: np.ndarray
+    index_type: str
+    template: Any = None  # trained index to refill instead of retraining
+    index: Any = None
+
 
 @final
 @dataclass
@@ -25,6 +149,19 @@ class FaissVectorDBStorage(BaseVectorStorage):
     """
     A Faiss-based Vector DB Storage for LightRAG.
     Uses cosine similarity by storing normalized vectors in a Faiss index with inner product search.
+
+    Faiss ids are row numbers in a contiguous float32 vector array kept next to the
+    index. Deletes only tombstone a row (the row is excluded from searches through
+    an IDSelector); once tombstones exceed ``tombstone_compact_ratio`` of the rows
+    (vector_db_storage_cls_kwargs) the array and index are compacted in a worker
+    thread during index_done_callback.
+
+    ``index_type`` in vector_db_storage_cls_kwargs selects an approximate index
+    (``ivf_flat``, ``ivf_pq`` or ``hnsw``). The collection stays on a flat index
+    until it holds ``ann_min_vectors`` vectors; the approximate index is then
+    trained from the vector array during index_done_callback, and retrained as
+    the collection grows when ``nlist`` is not fixed. ``nprobe`` and ``ef_search``
+    set the search defaults, which QueryParam can override per query.
     """
 
     def __post_init__(self):
@@ -55,21 +192,56 @@ class FaissVectorDBStorage(BaseVectorStorage):
             workspace_dir, f"faiss_index_{self.namespace}.index"
         )
         self._meta_file = self._faiss_index_file + ".meta.json"
+        self._vectors_file = self._faiss_index_file + ".vectors.npy"
 
         self._max_batch_size = self.global_config["embedding_batch_num"]
         # Embedding dimension (e.g. 768) must match your embedding function
         self._dim = self.embedding_func.embedding_dim
+        self._tombstone_compact_ratio = kwargs.get(
+            "tombstone_compact_ratio", DEFAULT_FAISS_TOMBSTONE_COMPACT_RATIO
+        )
 
-        # Create an empty Faiss index for inner product (useful for normalized vectors = cosine similarity).
-        # If you have a large number of vectors, you might want IVF or other indexes.
-        # For demonstration, we use a simple IndexFlatIP.
-        self._index = faiss.IndexFlatIP(self._dim)
-        # Keep a local store for metadata, IDs, etc.
-        # Maps <int faiss_id> → metadata (including your original ID).
-        self._id_to_meta = {}
+        # Approximate nearest neighbour index settings
+        self._index_type = kwargs.get("index_type", DEFAULT_FAISS_INDEX_TYPE)
+        if self._index_type not in FAISS_INDEX_TYPES:
+            raise ValueError(
+                f"Unsupported Faiss index_type '{self._index_type}', expected one of {FAISS_INDEX_TYPES}"
+            )
+        self._ann_min_vectors = kwargs.get(
+            "ann_min_vectors", DEFAULT_FAISS_ANN_MIN_VECTORS
+        )
+        self._nlist = kwargs.get("nlist")
+        self._index_options = {
+            "nlist": self._nlist,
+            "pq_m": kwargs.get("pq_m"),
+            "pq_nbits": kwargs.get("pq_nbits", DEFAULT_FAISS_PQ_NBITS),
+            "hnsw_m": kwargs.get("hnsw_m", DEFAULT_FAISS_HNSW_M),
+            "ef_construction": kwargs.get("ef_construction"),
+        }
+        self._nprobe = kwargs.get("nprobe", DEFAULT_FAISS_NPROBE)
+        self._ef_search = kwargs.get("ef_search", DEFAULT_FAISS_EF_SEARCH)
 
+        self._reset_index()
         self._load_faiss_index()
 
+    def _reset_index(self):
+        """Reset the index and all in-memory structures to an empty state"""
+        # Inner product over normalized vectors = cosine similarity
+        self._index = faiss.IndexFlatIP(self._dim)
+        # Row i of the buffer holds the vector with faiss id i; capacity grows by doubling
+        self._vector_buffer = np.empty((0, self._dim), dtype=np.float32)
+        # Maps <int faiss_id> → metadata (including your original ID), live rows only
+        self._id_to_meta: dict[int, dict[str, Any]] = {}
+        # Reverse map <custom id> → <int faiss_id>
+        self._custom_id_to_fid: dict[str, int] = {}
+        # Faiss ids of deleted rows still present in the index
+        self._tombstones: set[int] = set()
+        self._tombstone_selector = None
+
+    @property
+    def _vectors(self) -> np.ndarray:
+        return self._vector_buffer[: self._index.ntotal]
+
     async def initialize(self):
         """Initialize storage data"""
         # Get the update flag for cross-process update notification
@@ -87,8 +259,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                     f"[{self.workspace}] Process {os.getpid()} FAISS reloading {self.namespace} due to update by another process"
                 )
                 # Reload data
-                self._index = faiss.IndexFlatIP(self._dim)
-                self._id_to_meta = {}
+                self._reset_index()
                 self._load_faiss_index()
                 self.storage_updated.value = False
             return self._index
@@ -149,30 +320,21 @@ class FaissVectorDBStorage(BaseVectorStorage):
         embeddings = embeddings.astype(np.float32)
         faiss.normalize_L2(embeddings)
 
-        # Upsert logic:
-        # 1. Identify which vectors to remove if they exist
-        # 2. Remove them
-        # 3. Add the new vectors
-        existing_ids_to_remove = []
-        for meta, emb in zip(list_data, embeddings):
-            faiss_internal_id = self._find_faiss_id_by_custom_id(meta["__id__"])
-            if faiss_internal_id is not None:
-                existing_ids_to_remove.append(faiss_internal_id)
-
-        if existing_ids_to_remove:
-            await self._remove_faiss_ids(existing_ids_to_remove)
-
-        # Step 2: Add new vectors
-        index = await self._get_index()
-        start_idx = index.ntotal
-        index.add(embeddings)
-
-        # Step 3: Store metadata + vector for each new ID
-        for i, meta in enumerate(list_data):
-            fid = start_idx + i
-            # Store the raw vector so we can rebuild if something is removed
-            meta["__vector__"] = embeddings[i].tolist()
-            self._id_to_meta.update({fid: meta})
+        # Upsert logic: tombstone existing rows for these IDs, then append the new vectors
+        await self._get_index()
+        async with self._storage_lock:
+            existing_fids = [
+                self._custom_id_to_fid[meta["__id__"]]
+                for meta in list_data
+                if meta["__id__"] in self._custom_id_to_fid
+            ]
+            self._mark_deleted(existing_fids)
+
+            start_idx = self._append_vectors(embeddings)
+            for i, meta in enumerate(list_data):
+                fid = start_idx + i
+                self._id_to_meta[fid] = meta
+                self._custom_id_to_fid[meta["__id__"]] = fid
 
         logger.debug(
             f"[{self.workspace}] Upserted {len(list_data)} vectors into Faiss index."
@@ -180,7 +342,11 @@ class FaissVectorDBStorage(BaseVectorStorage):
         return [m["__id__"] for m in list_data]
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        search_params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search by a textual query; returns top_k results with their metadata + similarity distance.
@@ -196,9 +362,16 @@ class FaissVectorDBStorage(BaseVectorStorage):
 
         faiss.normalize_L2(embedding)  # we do in-place normalization
 
-        # Perform the similarity search
+        # Perform the similarity search, skipping tombstoned rows
         index = await self._get_index()
-        distances, indices = index.search(embedding, top_k)
+        search_params = search_params or {}
+        params = faiss_search_params(
+            index,
+            selector=self._get_tombstone_selector(),
+            nprobe=search_params.get("nprobe") or self._nprobe,
+            ef_search=max(search_params.get("ef_search") or self._ef_search, top_k),
+        )
+        distances, indices = index.search(embedding, top_k, params=params)
 
         distances = distances[0]
         indices = indices[0]
@@ -213,12 +386,12 @@ class FaissVectorDBStorage(BaseVectorStorage):
             if dist < self.cosine_better_than_threshold:
                 continue
 
-            meta = self._id_to_meta.get(idx, {})
-            # Filter out __vector__ from query results to avoid returning large vector data
-            filtered_meta = {k: v for k, v in meta.items() if k != "__vector__"}
+            meta = self._id_to_meta.get(int(idx))
+            if meta is None:
+                continue
             results.append(
                 {
-                    **filtered_meta,
+                    **meta,
                     "id": meta.get("__id__"),
                     "distance": float(dist),
                     "created_at": meta.get("__created_at__"),
@@ -244,11 +417,9 @@ class FaissVectorDBStorage(BaseVectorStorage):
         logger.debug(
             f"[{self.workspace}] Deleting {len(ids)} vectors from {self.namespace}"
         )
-        to_remove = []
-        for cid in ids:
-            fid = self._find_faiss_id_by_custom_id(cid)
-            if fid is not None:
-                to_remove.append(fid)
+        to_remove = [
+            self._custom_id_to_fid[cid] for cid in ids if cid in self._custom_id_to_fid
+        ]
 
         if to_remove:
             await self._remove_faiss_ids(to_remove)
@@ -299,44 +470,170 @@ class FaissVectorDBStorage(BaseVectorStorage):
         """
         Return the Faiss internal ID for a given custom ID, or None if not found.
         """
-        for fid, meta in self._id_to_meta.items():
-            if meta.get("__id__") == custom_id:
-                return fid
-        return None
+        return self._custom_id_to_fid.get(custom_id)
+
+    def _append_vectors(self, embeddings: np.ndarray) -> int:
+        """Add normalized vectors to the index and vector buffer, returns the first new faiss id"""
+        start_idx = self._index.ntotal
+        needed = start_idx + len(embeddings)
+        if needed > len(self._vector_buffer):
+            capacity = max(needed, 2 * len(self._vector_buffer), 1024)
+            buffer = np.empty((capacity, self._dim), dtype=np.float32)
+            buffer[:start_idx] = self._vector_buffer[:start_idx]
+            self._vector_buffer = buffer
+        self._vector_buffer[start_idx:needed] = embeddings
+        self._index.add(embeddings)
+        return start_idx
+
+    def _mark_deleted(self, fid_list) -> None:
+        """Tombstone rows: drop their metadata and exclude them from searches"""
+        for fid in fid_list:
+            meta = self._id_to_meta.pop(fid, None)
+            if meta is None:
+                continue
+            if self._custom_id_to_fid.get(meta["__id__"]) == fid:
+                del self._custom_id_to_fid[meta["__id__"]]
+            self._tombstones.add(fid)
+            self._tombstone_selector = None
+
+    def _get_tombstone_selector(self):
+        """IDSelector excluding tombstoned rows, cached until the next delete"""
+        if not self._tombstones:
+            return None
+        if self._tombstone_selector is None:
+            deleted = np.fromiter(self._tombstones, dtype=np.int64)
+            # Keep a reference to the inner selector: faiss does not own it
+            self._deleted_selector = faiss.IDSelectorBatch(deleted)
+            self._tombstone_selector = faiss.IDSelectorNot(self._deleted_selector)
+        return self._tombstone_selector
+
+    def _can_train(self, index_type: str, num_vectors: int) -> bool:
+        nlist = self._nlist or default_nlist(num_vectors)
+        return num_vectors >= min_training_vectors(
+            index_type, nlist, self._index_options["pq_nbits"]
+        )
+
+    def _target_index_type(self, num_vectors: int) -> str:
+        if num_vectors >= self._ann_min_vectors and self._can_train(
+            self._index_type, num_vectors
+        ):
+            return self._index_type
+        return "flat"
+
+    def _needs_rebuild(self) -> bool:
+        """Whether tombstones, growth or a config change call for a new index"""
+        num_vectors = len(self._id_to_meta)
+        if self._tombstones and len(
+            self._tombstones
+        ) >= self._tombstone_compact_ratio * max(self._index.ntotal, 1):
+            return True
+
+        current_type = faiss_index_type(self._index)
+        if current_type != self._index_type:
+            # Switch to the configured type, but never fall back to flat on shrink
+            return self._target_index_type(num_vectors) == self._index_type
+        if current_type in ("ivf_flat", "ivf_pq") and not self._nlist:
+            # Retrain once the collection outgrows the lists it was trained with
+            return self._index.nlist * 2 <= default_nlist(num_vectors)
+        return False
+
+    def _snapshot_rows(self) -> _IndexRebuild:
+        """Copy the live rows to rebuild the index from (called under the storage lock)"""
+        keep_fids = sorted(self._id_to_meta)
+        vectors = self._vector_buffer[keep_fids]  # fancy indexing copies contiguously
+        rebuild = _IndexRebuild(
+            base_index=self._index,
+            base_ntotal=self._index.ntotal,
+            keep_fids=keep_fids,
+            vectors=vectors,
+            index_type=self._target_index_type(len(keep_fids)),
+        )
+        if not keep_fids:
+            rebuild.index_type = "flat"  # nothing to train on
+        elif rebuild.index_type != self._index_type:
+            # An approximate index is kept once built, even if deletes shrink it
+            rebuild.index_type = faiss_index_type(self._index)
+            if not self._can_train(rebuild.index_type, len(keep_fids)):
+                # Too few rows left to retrain: reuse the trained quantizer (and PQ
+                # codebooks) of the current index, which only needs the rows re-added
+                rebuild.template = faiss.clone_index(self._index)
+        return rebuild
+
+    def _build_index(self, rebuild: _IndexRebuild) -> None:
+        """Build an index from the copied rows (runs in a worker thread)"""
+        if rebuild.template is not None:
+            index = rebuild.template
+            index.reset()
+            index.add(rebuild.vectors)
+        else:
+            index = create_faiss_index(
+                rebuild.vectors, self._dim, rebuild.index_type, **self._index_options
+            )
+        rebuild.index = index
+
+    def _apply_rebuild(self, rebuild: _IndexRebuild) -> None:
+        """Swap in a rebuilt index, replaying the upserts and deletes made while it
+        was built and renumbering metadata to the new row order"""
+        if self._index is not rebuild.base_index:
+            # Reloaded, dropped or rebuilt by another save in the meantime
+            logger.info(
+                f"[{self.workspace}] FAISS discarded rebuild of {self.namespace}: the index was replaced while rebuilding"
+            )
+            return
+
+        index, vectors = rebuild.index, rebuild.vectors
+        appended_fids = [
+            fid
+            for fid in range(rebuild.base_ntotal, self._index.ntotal)
+            if fid in self._id_to_meta
+        ]
+        if appended_fids:
+            appended = self._vector_buffer[appended_fids]
+            index.add(appended)
+            vectors = np.concatenate([vectors, appended])
+
+        id_to_meta = {}
+        custom_id_to_fid = {}
+        tombstones = set()
+        for new_fid, old_fid in enumerate(rebuild.keep_fids + appended_fids):
+            meta = self._id_to_meta.get(old_fid)
+            if meta is None:
+                # Deleted while the index was being built
+                tombstones.add(new_fid)
+                continue
+            id_to_meta[new_fid] = meta
+            custom_id_to_fid[meta["__id__"]] = new_fid
+
+        logger.info(
+            f"[{self.workspace}] FAISS rebuilt {self.namespace} as {faiss_index_type(index)} index: "
+            f"removed {self._index.ntotal - index.ntotal} deleted vectors, {len(id_to_meta)} remain"
+        )
+        self._index = index
+        self._vector_buffer = vectors
+        self._id_to_meta = id_to_meta
+        self._custom_id_to_fid = custom_id_to_fid
+        self._tombstones = tombstones
+        self._tombstone_selector = None
 
     async def _remove_faiss_ids(self, fid_list):
         """
         Remove a list of internal Faiss IDs from the index.
-        Because IndexFlatIP doesn't support 'removals',
-        we rebuild the index excluding those vectors.
+        Rows are tombstoned in O(1) each; space is reclaimed by compaction
+        during the next index_done_callback once enough rows are deleted.
         """
-        keep_fids = [fid for fid in self._id_to_meta if fid not in fid_list]
-
-        # Rebuild the index
-        vectors_to_keep = []
-        new_id_to_meta = {}
-        for new_fid, old_fid in enumerate(keep_fids):
-            vec_meta = self._id_to_meta[old_fid]
-            vectors_to_keep.append(vec_meta["__vector__"])  # stored as list
-            new_id_to_meta[new_fid] = vec_meta
-
         async with self._storage_lock:
-            # Re-init index
-            self._index = faiss.IndexFlatIP(self._dim)
-            if vectors_to_keep:
-                arr = np.array(vectors_to_keep, dtype=np.float32)
-                self._index.add(arr)
-
-            self._id_to_meta = new_id_to_meta
+            self._mark_deleted(fid_list)
 
     def _save_faiss_index(self):
         """
         Save the current Faiss index + metadata to disk so it can persist across runs.
         """
         faiss.write_index(self._index, self._faiss_index_file)
+        np.save(self._vectors_file, self._vectors)
 
         # Save metadata dict to JSON. Convert all keys to strings for JSON storage.
-        # _id_to_meta is { int: { '__id__': doc_id, '__vector__': [float,...], ... } }
+        # _id_to_meta is { int: { '__id__': doc_id, ... } } and holds live rows only,
+        # so tombstones are the index rows missing from it.
         # We'll keep the int -> dict, but JSON requires string keys.
         serializable_dict = {}
         for fid, meta in self._id_to_meta.items():
@@ -367,7 +664,19 @@ class FaissVectorDBStorage(BaseVectorStorage):
             self._id_to_meta = {}
             for fid_str, meta in stored_dict.items():
                 fid = int(fid_str)
+                # Vectors used to be stored per entry in the metadata
+                meta.pop("__vector__", None)
                 self._id_to_meta[fid] = meta
+            self._custom_id_to_fid = {
+                meta["__id__"]: fid for fid, meta in self._id_to_meta.items()
+            }
+            self._tombstones = set(range(self._index.ntotal)) - set(self._id_to_meta)
+
+            if os.path.exists(self._vectors_file):
+                self._vector_buffer = np.load(self._vectors_file)
+            else:
+                # Index files written before the vector array existed are always flat
+                self._vector_buffer = self._index.reconstruct_n(0, self._index.ntotal)
 
             logger.info(
                 f"[{self.workspace}] Faiss index loaded with {self._index.ntotal} vectors from {self._faiss_index_file}"
@@ -377,10 +686,25 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 f"[{self.workspace}] Failed to load Faiss index or metadata: {e}"
             )
             logger.warning(f"[{self.workspace}] Starting with an empty Faiss index.")
-            self._index = faiss.IndexFlatIP(self._dim)
-            self._id_to_meta = {}
+            self._reset_index()
 
     async def index_done_callback(self) -> None:
+        # Train/fill a new index in a worker thread from a copy of the live rows,
+        # so that the storage lock is not held while it is built
+        rebuild = None
+        async with self._storage_lock:
+            if not self.storage_updated.value and self._needs_rebuild():
+                rebuild = self._snapshot_rows()
+        if rebuild is not None:
+            try:
+                await asyncio.to_thread(self._build_index, rebuild)
+            except Exception as e:
+                # Deletes are still persisted as tombstones, the rebuild is retried on the next save
+                logger.warning(
+                    f"[{self.workspace}] FAISS rebuild of {self.namespace} failed, saving the current index: {e}"
+                )
+                rebuild = None
+
         async with self._storage_lock:
             # Check if storage was updated by another process
             if self.storage_updated.value:
@@ -388,8 +712,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 logger.warning(
                     f"[{self.workspace}] Storage for FAISS {self.namespace} was updated by another process, reloading..."
                 )
-                self._index = faiss.IndexFlatIP(self._dim)
-                self._id_to_meta = {}
+                self._reset_index()
                 self._load_faiss_index()
                 self.storage_updated.value = False
                 return False  # Return error
@@ -397,6 +720,10 @@ class FaissVectorDBStorage(BaseVectorStorage):
         # Acquire lock and perform persistence
         async with self._storage_lock:
             try:
+                if rebuild is not None:
+                    # Swap on the event loop so concurrent queries never see a
+                    # half-updated state
+                    self._apply_rebuild(rebuild)
                 # Save data to disk
                 self._save_faiss_index()
                 # Notify other processes that data has been updated
@@ -430,10 +757,8 @@ class FaissVectorDBStorage(BaseVectorStorage):
         if not metadata:
             return None
 
-        # Filter out __vector__ from metadata to avoid returning large vector data
-        filtered_metadata = {k: v for k, v in metadata.items() if k != "__vector__"}
         return {
-            **filtered_metadata,
+            **metadata,
             "id": metadata.get("__id__"),
             "created_at": metadata.get("__created_at__"),
         }
@@ -457,12 +782,8 @@ class FaissVectorDBStorage(BaseVectorStorage):
             if fid is not None:
                 metadata = self._id_to_meta.get(fid)
                 if metadata:
-                    # Filter out __vector__ from metadata to avoid returning large vector data
-                    filtered_metadata = {
-                        k: v for k, v in metadata.items() if k != "__vector__"
-                    }
                     record = {
-                        **filtered_metadata,
+                        **metadata,
                         "id": metadata.get("__id__"),
                         "created_at": metadata.get("__created_at__"),
                     }
@@ -487,14 +808,26 @@ class FaissVectorDBStorage(BaseVectorStorage):
         for id in ids:
             # Find the Faiss internal ID for the custom ID
             fid = self._find_faiss_id_by_custom_id(id)
-            if fid is not None and fid in self._id_to_meta:
-                metadata = self._id_to_meta[fid]
-                # Get the stored vector from metadata
-                if "__vector__" in metadata:
-                    vectors_dict[id] = metadata["__vector__"]
+            if fid is not None:
+                vectors_dict[id] = self._vector_buffer[fid].tolist()
 
         return vectors_dict
 
+    async def get_vectors_array_by_ids(
+        self, ids: list[str]
+    ) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs as rows of the vector buffer
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            The IDs that have a vector, and an array holding their vectors in that order
+        """
+        found = [id for id in ids if id in self._custom_id_to_fid]
+        fids = [self._custom_id_to_fid[id] for id in found]
+        return found, self._vector_buffer[fids].reshape(len(found), self._dim)
+
     async def drop(self) -> dict[str, str]:
         """Drop all vector data from storage and clean up resources
 
@@ -514,17 +847,16 @@ class FaissVectorDBStorage(BaseVectorStorage):
         try:
             async with self._storage_lock:
                 # Reset the index
-                self._index = faiss.IndexFlatIP(self._dim)
-                self._id_to_meta = {}
+                self._reset_index()
 
                 # Remove storage files if they exist
-                if os.path.exists(self._faiss_index_file):
-                    os.remove(self._faiss_index_file)
-                if os.path.exists(self._meta_file):
-                    os.remove(self._meta_file)
-
-                self._id_to_meta = {}
-                self._load_faiss_index()
+                for file_name in (
+                    self._faiss_index_file,
+                    self._meta_file,
+                    self._vectors_file,
+                ):
+                    if os.path.exists(file_name):
+                        os.remove(file_name)
 
                 # Notify other processes
                 await set_all_update_flags(self.final_namespace)
@@ -1,6 +1,8 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
 from dataclasses import dataclass
 import os
-from typing import Any, Union, final
+from typing import Any, Mapping, Union, final
 
 from lightrag.base import (
     DocProcessingStatus,
@@ -25,6 +27,150 @@ from .shared_storage import (
 )
 
 
+SORT_FIELDS = ("created_at", "updated_at", "id", "file_path")
+
+
+def _to_doc_status(doc_data: dict[str, Any]) -> DocProcessingStatus:
+    """Build a DocProcessingStatus from a stored record, filling in legacy gaps"""
+    # Make a copy of the data to avoid modifying the original
+    data = doc_data.copy()
+    # Remove deprecated content field if it exists
+    data.pop("content", None)
+    # If file_path is not in data, use document id as file path
+    if "file_path" not in data:
+        data["file_path"] = "no-file-path"
+    # Ensure new fields exist with default values
+    if "metadata" not in data:
+        data["metadata"] = {}
+    if "error_msg" not in data:
+        data["error_msg"] = None
+    return DocProcessingStatus(**data)
+
+
+@dataclass(slots=True)
+class _IndexedDoc:
+    """The fields of a record that the secondary indexes are keyed on"""
+
+    status: str | None
+    track_id: str | None
+    file_path: str | None
+    created_at: str
+    updated_at: str
+    file_path_sort_key: str | None = None
+
+
+class _DocStatusIndex:
+    """Secondary indexes over doc status records: status, track_id and file_path
+    lookups plus sorted (sort key, doc id) views for pagination.
+
+    A sorted view is built on first use for each (status filter, sort field) pair
+    and kept up to date by add/remove afterwards.
+    """
+
+    def __init__(self, data: Mapping[str, dict[str, Any]]):
+        self.docs: dict[str, _IndexedDoc] = {}
+        self.by_status: defaultdict[str, set[str]] = defaultdict(set)
+        self.by_track_id: defaultdict[str, set[str]] = defaultdict(set)
+        # file_path -> doc ids in insertion order, the first one is returned
+        self.by_file_path: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._views: dict[tuple[str | None, str], list[tuple[str, str]]] = {}
+        for doc_id, doc_data in data.items():
+            self.add(doc_id, doc_data)
+
+    def _sort_key(self, doc_id: str, doc: _IndexedDoc, sort_field: str) -> str:
+        if sort_field == "id":
+            return doc_id
+        if sort_field == "file_path":
+            if doc.file_path_sort_key is None:
+                # Use pinyin sorting for file_path field to support Chinese characters
+                file_path = doc.file_path
+                doc.file_path_sort_key = get_pinyin_sort_key(
+                    "no-file-path" if file_path is None else file_path
+                )
+            return doc.file_path_sort_key
+        return doc.created_at if sort_field == "created_at" else doc.updated_at
+
+    def add(self, doc_id: str, doc_data: dict[str, Any]) -> None:
+        if doc_id in self.docs:
+            self.remove(doc_id)
+        status = doc_data.get("status")
+        doc = _IndexedDoc(
+            status=status.value if isinstance(status, DocStatus) else status,
+            track_id=doc_data.get("track_id"),
+            file_path=doc_data.get("file_path"),
+            created_at=doc_data.get("created_at") or "",
+            updated_at=doc_data.get("updated_at") or "",
+        )
+        self.docs[doc_id] = doc
+        self.by_status[doc.status].add(doc_id)
+        if doc.track_id is not None:
+            self.by_track_id[doc.track_id].add(doc_id)
+        if doc.file_path is not None:
+            self.by_file_path[doc.file_path][doc_id] = None
+        for (status_filter, sort_field), view in self._views.items():
+            if status_filter is None or status_filter == doc.status:
+                insort(view, (self._sort_key(doc_id, doc, sort_field), doc_id))
+
+    def remove(self, doc_id: str) -> None:
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self._discard(self.by_status, doc.status, doc_id)
+        self._discard(self.by_track_id, doc.track_id, doc_id)
+        self._discard(self.by_file_path, doc.file_path, doc_id)
+        for (status_filter, sort_field), view in self._views.items():
+            if status_filter is None or status_filter == doc.status:
+                entry = (self._sort_key(doc_id, doc, sort_field), doc_id)
+                i = bisect_left(view, entry)
+                if i < len(view) and view[i] == entry:
+                    del view[i]
+
+    @staticmethod
+    def _discard(index: dict, key, doc_id: str) -> None:
+        ids = index.get(key)
+        if ids is None:
+            return
+        if isinstance(ids, dict):
+            ids.pop(doc_id, None)
+        else:
+            ids.discard(doc_id)
+        if not ids:
+            del index[key]
+
+    def first_by_file_path(self, file_path: str) -> str | None:
+        return next(iter(self.by_file_path.get(file_path, ())), None)
+
+    def page(
+        self,
+        status_filter: str | None,
+        sort_field: str,
+        descending: bool,
+        start: int,
+        count: int,
+    ) -> tuple[list[str], int]:
+        """Doc ids of one page in sort order, and the number of docs in the view"""
+        view = self._views.get((status_filter, sort_field))
+        if view is None:
+            doc_ids = (
+                self.docs
+                if status_filter is None
+                else self.by_status.get(status_filter, ())
+            )
+            view = sorted(
+                (self._sort_key(doc_id, self.docs[doc_id], sort_field), doc_id)
+                for doc_id in doc_ids
+            )
+            self._views[(status_filter, sort_field)] = view
+
+        total = len(view)
+        if descending:
+            window = view[max(0, total - start - count) : max(0, total - start)]
+            window.reverse()
+        else:
+            window = view[start : start + count]
+        return [doc_id for _, doc_id in window], total
+
+
 @final
 @dataclass
 class JsonDocStatusStorage(DocStatusStorage):
@@ -47,6 +193,11 @@ class JsonDocStatusStorage(DocStatusStorage):
         self._data = None
         self._storage_lock = None
         self.storage_updated = None
+        # Secondary indexes of this process, rebuilt whenever the shared
+        # generation shows that another process changed the records
+        self._index: _DocStatusIndex | None = None
+        self._index_generation = -1
+        self._index_state = None
 
     async def initialize(self):
         """Initialize storage data"""
@@ -56,10 +207,14 @@ class JsonDocStatusStorage(DocStatusStorage):
             # check need_init must before get_namespace_data
             need_init = await try_initialize_namespace(self.final_namespace)
             self._data = await get_namespace_data(self.final_namespace)
+            self._index_state = await get_namespace_data(
+                f"{self.final_namespace}_index"
+            )
             if need_init:
                 loaded_data = load_json(self._file_name) or {}
                 async with self._storage_lock:
                     self._data.update(loaded_data)
+                    self._bump_index_generation()
                     logger.info(
                         f"[{self.workspace}] Process {os.getpid()} doc status load {self.namespace} with {len(loaded_data)} records"
                     )
@@ -84,73 +239,56 @@ class JsonDocStatusStorage(DocStatusStorage):
                     ordered_results.append(None)
         return ordered_results
 
+    def _get_index(self) -> _DocStatusIndex:
+        """Secondary indexes of the records, call with the storage lock held"""
+        generation = self._index_state.get("generation", 0)
+        if self._index is None or self._index_generation != generation:
+            self._index = _DocStatusIndex(self._data)
+            self._index_generation = generation
+        return self._index
+
+    def _bump_index_generation(self) -> None:
+        """Mark the records as changed so other processes rebuild their indexes"""
+        generation = self._index_state.get("generation", 0) + 1
+        self._index_state["generation"] = generation
+        self._index_generation = generation
+
     async def get_status_counts(self) -> dict[str, int]:
         """Get counts of documents in each status"""
         counts = {status.value: 0 for status in DocStatus}
         if self._storage_lock is None:
             raise StorageNotInitializedError("JsonDocStatusStorage")
         async with self._storage_lock:
-            for doc in self._data.values():
-                counts[doc["status"]] += 1
+            for status, doc_ids in self._get_index().by_status.items():
+                counts[status] = len(doc_ids)
         return counts
 
+    def _collect_doc_status(self, doc_ids) -> dict[str, DocProcessingStatus]:
+        result = {}
+        for doc_id in doc_ids:
+            try:
+                result[doc_id] = _to_doc_status(self._data[doc_id])
+            except KeyError as e:
+                logger.error(
+                    f"[{self.workspace}] Missing required field for document {doc_id}: {e}"
+                )
+        return result
+
     async def get_docs_by_status(
         self, status: DocStatus
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific status"""
-        result = {}
         async with self._storage_lock:
-            for k, v in self._data.items():
-                if v["status"] == status.value:
-                    try:
-                        # Make a copy of the data to avoid modifying the original
-                        data = v.copy()
-                        # Remove deprecated content field if it exists
-                        data.pop("content", None)
-                        # If file_path is not in data, use document id as file path
-                        if "file_path" not in data:
-                            data["file_path"] = "no-file-path"
-                        # Ensure new fields exist with default values
-                        if "metadata" not in data:
-                            data["metadata"] = {}
-                        if "error_msg" not in data:
-                            data["error_msg"] = None
-                        result[k] = DocProcessingStatus(**data)
-                    except KeyError as e:
-                        logger.error(
-                            f"[{self.workspace}] Missing required field for document {k}: {e}"
-                        )
-                        continue
-        return result
+            doc_ids = self._get_index().by_status.get(status.value, ())
+            return self._collect_doc_status(list(doc_ids))
 
     async def get_docs_by_track_id(
         self, track_id: str
     ) -> dict[str, DocProcessingStatus]:
         """Get all documents with a specific track_id"""
-        result = {}
         async with self._storage_lock:
-            for k, v in self._data.items():
-                if v.get("track_id") == track_id:
-                    try:
-                        # Make a copy of the data to avoid modifying the original
-                        data = v.copy()
-                        # Remove deprecated content field if it exists
-                        data.pop("content", None)
-                        # If file_path is not in data, use document id as file path
-                        if "file_path" not in data:
-                            data["file_path"] = "no-file-path"
-                        # Ensure new fields exist with default values
-                        if "metadata" not in data:
-                            data["metadata"] = {}
-                        if "error_msg" not in data:
-                            data["error_msg"] = None
-                        result[k] = DocProcessingStatus(**data)
-                    except KeyError as e:
-                        logger.error(
-                            f"[{self.workspace}] Missing required field for document {k}: {e}"
-                        )
-                        continue
-        return result
+            doc_ids = self._get_index().by_track_id.get(track_id, ())
+            return self._collect_doc_status(list(doc_ids))
 
     async def index_done_callback(self) -> None:
         async with self._storage_lock:
@@ -182,7 +320,11 @@ class JsonDocStatusStorage(DocStatusStorage):
             for doc_id, doc_data in data.items():
                 if "chunks_list" not in doc_data:
                     doc_data["chunks_list"] = []
+            index = self._get_index()
             self._data.update(data)
+            for doc_id, doc_data in data.items():
+                index.add(doc_id, doc_data)
+            self._bump_index_generation()
             await set_all_update_flags(self.final_namespace)
 
         await self.index_done_callback()
@@ -239,66 +381,23 @@ class JsonDocStatusStorage(DocStatusStorage):
         if sort_direction.lower() not in ["asc", "desc"]:
             sort_direction = "desc"
 
-        # For JSON storage, we load all data and sort/filter in memory
-        all_docs = []
-
+        # Read the page from a sorted view of the secondary indexes
         async with self._storage_lock:
-            for doc_id, doc_data in self._data.items():
-                # Apply status filter
-                if (
-                    status_filter is not None
-                    and doc_data.get("status") != status_filter.value
-                ):
-                    continue
-
+            doc_ids, total_count = self._get_index().page(
+                status_filter.value if status_filter is not None else None,
+                sort_field,
+                sort_direction.lower() == "desc",
+                (page - 1) * page_size,
+                page_size,
+            )
+            paginated_docs = []
+            for doc_id in doc_ids:
                 try:
-                    # Prepare document data
-                    data = doc_data.copy()
-                    data.pop("content", None)
-                    if "file_path" not in data:
-                        data["file_path"] = "no-file-path"
-                    if "metadata" not in data:
-                        data["metadata"] = {}
-                    if "error_msg" not in data:
-                        data["error_msg"] = None
-
-                    doc_status = DocProcessingStatus(**data)
-
-                    # Add sort key for sorting
-                    if sort_field == "id":
-                        doc_status._sort_key = doc_id
-                    elif sort_field == "file_path":
-                        # Use pinyin sorting for file_path field to support Chinese characters
-                        file_path_value = getattr(doc_status, sort_field, "")
-                        doc_status._sort_key = get_pinyin_sort_key(file_path_value)
-                    else:
-                        doc_status._sort_key = getattr(doc_status, sort_field, "")
-
-                    all_docs.append((doc_id, doc_status))
-
+                    paginated_docs.append((doc_id, _to_doc_status(self._data[doc_id])))
                 except KeyError as e:
                     logger.error(
                         f"[{self.workspace}] Error processing document {doc_id}: {e}"
                     )
-                    continue
-
-        # Sort documents
-        reverse_sort = sort_direction.lower() == "desc"
-        all_docs.sort(
-            key=lambda x: getattr(x[1], "_sort_key", ""), reverse=reverse_sort
-        )
-
-        # Remove sort key from documents
-        for doc_id, doc in all_docs:
-            if hasattr(doc, "_sort_key"):
-                delattr(doc, "_sort_key")
-
-        total_count = len(all_docs)
-
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_docs = all_docs[start_idx:end_idx]
 
         return paginated_docs, total_count
 
@@ -330,13 +429,16 @@ class JsonDocStatusStorage(DocStatusStorage):
             None
         """
         async with self._storage_lock:
+            index = self._get_index()
             any_deleted = False
             for doc_id in doc_ids:
                 result = self._data.pop(doc_id, None)
                 if result is not None:
+                    index.remove(doc_id)
                     any_deleted = True
 
             if any_deleted:
+                self._bump_index_generation()
                 await set_all_update_flags(self.final_namespace)
 
     async def get_doc_by_file_path(self, file_path: str) -> Union[dict[str, Any], None]:
@@ -353,12 +455,11 @@ class JsonDocStatusStorage(DocStatusStorage):
             raise StorageNotInitializedError("JsonDocStatusStorage")
 
         async with self._storage_lock:
-            for doc_id, doc_data in self._data.items():
-                if doc_data.get("file_path") == file_path:
-                    # Return complete document data, consistent with get_by_ids method
-                    return doc_data
-
-        return None
+            doc_id = self._get_index().first_by_file_path(file_path)
+            if doc_id is None:
+                return None
+            # Return complete document data, consistent with get_by_ids method
+            return self._data.get(doc_id)
 
     async def drop(self) -> dict[str, str]:
         """Drop all document status data from storage and clean up resources
@@ -376,6 +477,8 @@ class JsonDocStatusStorage(DocStatusStorage):
         try:
             async with self._storage_lock:
                 self._data.clear()
+                self._index = _DocStatusIndex({})
+                self._bump_index_generation()
                 await set_all_update_flags(self.final_namespace)
 
             await self.index_done_callback()
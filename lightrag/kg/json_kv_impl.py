@@ -1,3 +1,5 @@
+import asyncio
+import json
 import os
 from dataclasses import dataclass
 from typing import Any, final
@@ -5,15 +7,22 @@ from typing import Any, final
 from lightrag.base import (
     BaseKVStorage,
 )
+from lightrag.constants import (
+    DEFAULT_KV_WAL_ENABLED,
+    DEFAULT_KV_WAL_COMPACT_MIN_BYTES,
+    DEFAULT_KV_WAL_COMPACT_RATIO,
+)
 from lightrag.utils import (
+    get_env_value,
     load_json,
     logger,
-    write_json,
+    write_json_atomic,
 )
 from lightrag.exceptions import StorageNotInitializedError
 from .shared_storage import (
     get_namespace_data,
     get_storage_lock,
+    get_storage_keyed_lock,
     get_data_init_lock,
     get_update_flag,
     set_all_update_flags,
@@ -22,9 +31,27 @@ from .shared_storage import (
 )
 
 
+# Marker in the pending-change set requesting a full snapshot instead of a log append
+_FULL_SNAPSHOT = "\x00full_snapshot"
+
+
 @final
 @dataclass
 class JsonKVStorage(BaseKVStorage):
+    """KV storage kept in memory and persisted as a JSON snapshot plus a write-ahead log
+
+    index_done_callback appends only the records changed since the last flush to
+    ``kv_store_<namespace>.wal`` (one JSON array per line: ``["u", key, value]``
+    or ``["d", key]``). Once the log grows past a fraction of the snapshot size it
+    is compacted in the background into a fresh snapshot written with an atomic
+    rename. On startup the log is replayed on top of the snapshot; replay is
+    idempotent, so a crash at any point during compaction loses no data.
+
+    Compactions are serialized across processes by a keyed lock, and every other
+    snapshot rewrite (full snapshot, drop) bumps a shared generation counter so an
+    in-flight compaction can tell its snapshot went stale and discard it.
+    """
+
     def __post_init__(self):
         working_dir = self.global_config["working_dir"]
         if self.workspace:
@@ -39,10 +66,25 @@ class JsonKVStorage(BaseKVStorage):
 
         os.makedirs(workspace_dir, exist_ok=True)
         self._file_name = os.path.join(workspace_dir, f"kv_store_{self.namespace}.json")
+        self._wal_file_name = os.path.join(
+            workspace_dir, f"kv_store_{self.namespace}.wal"
+        )
+        self._wal_enabled = get_env_value(
+            "KV_WAL_ENABLED", DEFAULT_KV_WAL_ENABLED, bool
+        )
+        self._wal_compact_min_bytes = get_env_value(
+            "KV_WAL_COMPACT_MIN_BYTES", DEFAULT_KV_WAL_COMPACT_MIN_BYTES, int
+        )
+        self._wal_compact_ratio = get_env_value(
+            "KV_WAL_COMPACT_RATIO", DEFAULT_KV_WAL_COMPACT_RATIO, float
+        )
 
         self._data = None
+        self._pending = None
+        self._wal_state = None
         self._storage_lock = None
         self.storage_updated = None
+        self._compaction_task: asyncio.Task | None = None
 
     async def initialize(self):
         """Initialize storage data"""
@@ -52,8 +94,18 @@ class JsonKVStorage(BaseKVStorage):
             # check need_init must before get_namespace_data
             need_init = await try_initialize_namespace(self.final_namespace)
             self._data = await get_namespace_data(self.final_namespace)
+            # Keys changed since the last flush (True: upserted, False: deleted),
+            # shared so that any process can flush changes made by another
+            self._pending = await get_namespace_data(
+                f"{self.final_namespace}_wal_pending"
+            )
+            # Snapshot generation, bumped whenever the snapshot is rewritten outside compaction
+            self._wal_state = await get_namespace_data(
+                f"{self.final_namespace}_wal_state"
+            )
             if need_init:
                 loaded_data = load_json(self._file_name) or {}
+                replayed = self._replay_wal(loaded_data)
                 async with self._storage_lock:
                     # Migrate legacy cache structure if needed
                     if self.namespace.endswith("_cache"):
@@ -66,24 +118,179 @@ class JsonKVStorage(BaseKVStorage):
 
                     logger.info(
                         f"[{self.workspace}] Process {os.getpid()} KV load {self.namespace} with {data_count} records"
+                        + (f" ({replayed} replayed from WAL)" if replayed else "")
+                    )
+
+    def _replay_wal(self, data: dict[str, Any]) -> int:
+        """Apply the write-ahead log on top of snapshot data, returns records replayed"""
+        if not os.path.exists(self._wal_file_name):
+            return 0
+
+        replayed = 0
+        with open(self._wal_file_name, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only a torn final line from a crash mid-append is expected here
+                    logger.warning(
+                        f"[{self.workspace}] Ignoring corrupt WAL record at line {line_no} of {self._wal_file_name}"
+                    )
+                    continue
+                if record[0] == "u":
+                    data[record[1]] = record[2]
+                else:
+                    data.pop(record[1], None)
+                replayed += 1
+        return replayed
+
+    def _append_wal(self, records: list[list[Any]]) -> None:
+        lines = "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in records
+        )
+        with open(self._wal_file_name, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _truncate_wal(self, offset: int = -1) -> None:
+        """Drop the first ``offset`` bytes of the log (all of it when offset is -1)"""
+        if not os.path.exists(self._wal_file_name):
+            return
+        if offset < 0:
+            os.remove(self._wal_file_name)
+            return
+
+        with open(self._wal_file_name, "rb") as f:
+            f.seek(offset)
+            tail = f.read()
+        if not tail:
+            os.remove(self._wal_file_name)
+            return
+        tmp_file_name = f"{self._wal_file_name}.tmp"
+        with open(tmp_file_name, "wb") as f:
+            f.write(tail)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file_name, self._wal_file_name)
+
+    def _wal_size(self) -> int:
+        try:
+            return os.path.getsize(self._wal_file_name)
+        except OSError:
+            return 0
+
+    def _needs_compaction(self) -> bool:
+        wal_size = self._wal_size()
+        if wal_size < self._wal_compact_min_bytes:
+            return False
+        try:
+            snapshot_size = os.path.getsize(self._file_name)
+        except OSError:
+            snapshot_size = 0
+        return wal_size >= snapshot_size * self._wal_compact_ratio
+
+    def _snapshot_generation(self) -> int:
+        return self._wal_state.get("generation", 0)
+
+    def _bump_snapshot_generation(self) -> None:
+        """Mark in-flight compactions stale, must be called under the storage lock"""
+        self._wal_state["generation"] = self._snapshot_generation() + 1
+
+    async def _compact(self) -> None:
+        """Fold the write-ahead log into a fresh snapshot
+
+        Only one compaction per namespace runs at a time across all processes. The
+        snapshot is serialized outside the storage lock into a side file, then
+        installed and the log truncated under the storage lock. Only appends can
+        happen meanwhile, so the captured log offset is still a record boundary, and
+        replaying the records appended after it over the new snapshot is harmless.
+        If the snapshot was rewritten meanwhile (full snapshot or drop), the
+        compacted snapshot is stale and discarded.
+        """
+        async with get_storage_keyed_lock(
+            self.final_namespace, namespace="kv_wal_compaction"
+        ):
+            async with self._storage_lock:
+                snapshot = dict(self._data)
+                wal_offset = self._wal_size()
+                generation = self._snapshot_generation()
+            if wal_offset == 0:
+                return
+
+            compact_file_name = f"{self._file_name}.compact"
+            try:
+                await asyncio.to_thread(write_json_atomic, snapshot, compact_file_name)
+            except Exception as e:
+                logger.warning(
+                    f"[{self.workspace}] WAL compaction of {self.namespace} failed, will retry later: {e}"
+                )
+                return
+
+            async with self._storage_lock:
+                if self._snapshot_generation() != generation:
+                    os.remove(compact_file_name)
+                    logger.debug(
+                        f"[{self.workspace}] Process {os.getpid()} discarded stale compaction of {self.namespace}"
                     )
+                    return
+                os.replace(compact_file_name, self._file_name)
+                self._truncate_wal(wal_offset)
+            logger.debug(
+                f"[{self.workspace}] Process {os.getpid()} KV compacted {len(snapshot)} records of {self.namespace}"
+            )
+
+    def _schedule_compaction(self) -> None:
+        if self._compaction_task is None or self._compaction_task.done():
+            self._compaction_task = asyncio.create_task(self._compact())
 
     async def index_done_callback(self) -> None:
         async with self._storage_lock:
             if self.storage_updated.value:
-                data_dict = (
-                    dict(self._data) if hasattr(self._data, "_getvalue") else self._data
+                pending = dict(self._pending)
+                full_snapshot = (
+                    not self._wal_enabled
+                    or pending.pop(_FULL_SNAPSHOT, False)
+                    or not os.path.exists(self._file_name)
                 )
 
-                # Calculate data count - all data is now flattened
-                data_count = len(data_dict)
+                if full_snapshot:
+                    data_dict = (
+                        dict(self._data)
+                        if hasattr(self._data, "_getvalue")
+                        else self._data
+                    )
 
-                logger.debug(
-                    f"[{self.workspace}] Process {os.getpid()} KV writting {data_count} records to {self.namespace}"
-                )
-                write_json(data_dict, self._file_name)
+                    # Calculate data count - all data is now flattened
+                    data_count = len(data_dict)
+
+                    logger.debug(
+                        f"[{self.workspace}] Process {os.getpid()} KV writting {data_count} records to {self.namespace}"
+                    )
+                    write_json_atomic(data_dict, self._file_name)
+                    self._truncate_wal()
+                    self._bump_snapshot_generation()
+                elif pending:
+                    records = []
+                    for key, upserted in pending.items():
+                        value = self._data.get(key) if upserted else None
+                        records.append(
+                            ["u", key, value] if value is not None else ["d", key]
+                        )
+
+                    logger.debug(
+                        f"[{self.workspace}] Process {os.getpid()} KV appending {len(records)} records to {self.namespace} WAL"
+                    )
+                    self._append_wal(records)
+
+                self._pending.clear()
                 await clear_all_update_flags(self.final_namespace)
 
+        if self._wal_enabled and self._needs_compaction():
+            self._schedule_compaction()
+
     async def get_by_id(self, id: str) -> dict[str, Any] | None:
         async with self._storage_lock:
             result = self._data.get(id)
@@ -155,6 +362,7 @@ class JsonKVStorage(BaseKVStorage):
                 v["_id"] = k
 
             self._data.update(data)
+            self._pending.update(dict.fromkeys(data, True))
             await set_all_update_flags(self.final_namespace)
 
     async def delete(self, ids: list[str]) -> None:
@@ -175,6 +383,7 @@ class JsonKVStorage(BaseKVStorage):
             for doc_id in ids:
                 result = self._data.pop(doc_id, None)
                 if result is not None:
+                    self._pending[doc_id] = False
                     any_deleted = True
 
             if any_deleted:
@@ -206,6 +415,8 @@ class JsonKVStorage(BaseKVStorage):
         try:
             async with self._storage_lock:
                 self._data.clear()
+                self._pending.clear()
+                self._pending[_FULL_SNAPSHOT] = True
                 await set_all_update_flags(self.final_namespace)
 
             await self.index_done_callback()
@@ -261,14 +472,21 @@ class JsonKVStorage(BaseKVStorage):
             logger.info(
                 f"[{self.workspace}] Migrated {migration_count} legacy cache entries to flattened structure"
             )
-            # Persist migrated data immediately
-            write_json(migrated_data, self._file_name)
+            # Persist migrated data immediately; the log was already replayed into it
+            write_json_atomic(migrated_data, self._file_name)
+            self._truncate_wal()
+            self._bump_snapshot_generation()
 
         return migrated_data
 
     async def finalize(self):
         """Finalize storage resources
-        Persistence cache data to disk before exiting
+        Persistence cache data to disk before exiting, and fold any pending
+        write-ahead log into the snapshot so it is self-contained on disk
         """
         if self.namespace.endswith("_cache"):
             await self.index_done_callback()
+        if self._compaction_task is not None:
+            await self._compaction_task
+        if self._wal_size() > 0:
+            await self._compact()
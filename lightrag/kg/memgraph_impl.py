@@ -248,6 +248,58 @@ class MemgraphStorage(BaseGraphStorage):
                 )
                 raise
 
+    async def get_nodes_batch(self, node_ids: list[str]) -> dict[str, dict]:
+        """
+        Retrieve multiple nodes in one query using UNWIND.
+
+        Args:
+            node_ids: List of node entity IDs to fetch.
+
+        Returns:
+            A dictionary mapping each node_id to its node data. Missing nodes are omitted.
+
+        Raises:
+            Exception: If there is an error executing the query
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not node_ids:
+            return {}
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            try:
+                workspace_label = self._get_workspace_label()
+                query = f"""
+                UNWIND $node_ids AS id
+                MATCH (n:`{workspace_label}` {{entity_id: id}})
+                RETURN n.entity_id AS entity_id, n
+                """
+                result = await session.run(query, node_ids=node_ids)
+                nodes = {}
+                try:
+                    async for record in result:
+                        node_dict = dict(record["n"])
+                        # Remove workspace label from labels list if it exists
+                        if "labels" in node_dict:
+                            node_dict["labels"] = [
+                                label
+                                for label in node_dict["labels"]
+                                if label != workspace_label
+                            ]
+                        # Keep the first node when duplicates exist, like get_node
+                        nodes.setdefault(record["entity_id"], node_dict)
+                finally:
+                    await result.consume()  # Ensure result is fully consumed
+                return nodes
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Error getting nodes batch for {len(node_ids)} nodes: {str(e)}"
+                )
+                raise
+
     async def node_degree(self, node_id: str) -> int:
         """Get the degree (number of relationships) of a node with the given label.
         If multiple nodes have the same label, returns the degree of the first node.
@@ -296,6 +348,59 @@ class MemgraphStorage(BaseGraphStorage):
                 )
                 raise
 
+    async def node_degrees_batch(self, node_ids: list[str]) -> dict[str, int]:
+        """
+        Retrieve the degree for multiple nodes in a single query using UNWIND.
+
+        Args:
+            node_ids: List of node labels (entity_id values) to look up.
+
+        Returns:
+            A dictionary mapping each node_id to its degree (number of relationships).
+            If a node is not found, its degree will be set to 0.
+
+        Raises:
+            Exception: If there is an error executing the query
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not node_ids:
+            return {}
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            try:
+                workspace_label = self._get_workspace_label()
+                query = f"""
+                    UNWIND $node_ids AS id
+                    MATCH (n:`{workspace_label}` {{entity_id: id}})
+                    OPTIONAL MATCH (n)-[r]-()
+                    RETURN id AS entity_id, COUNT(r) AS degree
+                """
+                result = await session.run(query, node_ids=node_ids)
+                degrees = {}
+                try:
+                    async for record in result:
+                        degrees.setdefault(record["entity_id"], record["degree"])
+                finally:
+                    await result.consume()  # Ensure result is fully consumed
+
+                # For any node_id that did not return a record, set degree to 0.
+                for nid in node_ids:
+                    if nid not in degrees:
+                        logger.warning(
+                            f"[{self.workspace}] No node found with label '{nid}'"
+                        )
+                        degrees[nid] = 0
+                return degrees
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Error getting node degrees batch for {len(node_ids)} nodes: {str(e)}"
+                )
+                raise
+
     async def get_all_labels(self) -> list[str]:
         """
         Get all existing node labels in the database
@@ -397,6 +502,74 @@ class MemgraphStorage(BaseGraphStorage):
             )
             raise
 
+    async def get_nodes_edges_batch(
+        self, node_ids: list[str]
+    ) -> dict[str, list[tuple[str, str]]]:
+        """
+        Batch retrieve edges for multiple nodes in one query using UNWIND.
+        For each node, returns both outgoing and incoming edges to properly represent
+        the undirected graph nature.
+
+        Args:
+            node_ids: List of node IDs (entity_id) for which to retrieve edges.
+
+        Returns:
+            A dictionary mapping each node ID to its list of edge tuples (source, target).
+            For each node, the list includes both:
+            - Outgoing edges: (queried_node, connected_node)
+            - Incoming edges: (connected_node, queried_node)
+
+        Raises:
+            Exception: If there is an error executing the query
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not node_ids:
+            return {}
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            try:
+                workspace_label = self._get_workspace_label()
+                query = f"""
+                    UNWIND $node_ids AS id
+                    MATCH (n:`{workspace_label}` {{entity_id: id}})
+                    OPTIONAL MATCH (n)-[r]-(connected:`{workspace_label}`)
+                    WHERE connected.entity_id IS NOT NULL
+                    RETURN id AS queried_id, n.entity_id AS node_entity_id,
+                           connected.entity_id AS connected_entity_id,
+                           startNode(r).entity_id AS start_entity_id
+                """
+                result = await session.run(query, node_ids=node_ids)
+
+                # Initialize the dictionary with empty lists for each node ID
+                edges_dict = {node_id: [] for node_id in node_ids}
+                try:
+                    async for record in result:
+                        node_entity_id = record["node_entity_id"]
+                        connected_entity_id = record["connected_entity_id"]
+
+                        # Skip if either node is None
+                        if not node_entity_id or not connected_entity_id:
+                            continue
+
+                        # Keep the stored direction of the edge
+                        if record["start_entity_id"] == node_entity_id:
+                            edge = (node_entity_id, connected_entity_id)
+                        else:
+                            edge = (connected_entity_id, node_entity_id)
+                        edges_dict[record["queried_id"]].append(edge)
+                finally:
+                    await result.consume()  # Ensure results are fully consumed
+                return edges_dict
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Error getting edges batch for {len(node_ids)} nodes: {str(e)}"
+                )
+                raise
+
     async def get_edge(
         self, source_node_id: str, target_node_id: str
     ) -> dict[str, str] | None:
@@ -454,6 +627,67 @@ class MemgraphStorage(BaseGraphStorage):
                 await result.consume()  # Ensure the result is consumed even on error
                 raise
 
+    async def get_edges_batch(
+        self, pairs: list[dict[str, str]]
+    ) -> dict[tuple[str, str], dict]:
+        """
+        Retrieve edge properties for multiple (src, tgt) pairs in one query.
+
+        Args:
+            pairs: List of dictionaries, e.g. [{"src": "node1", "tgt": "node2"}, ...]
+
+        Returns:
+            A dictionary mapping (src, tgt) tuples to their edge properties.
+            Pairs without an edge are omitted.
+
+        Raises:
+            Exception: If there is an error executing the query
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not pairs:
+            return {}
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            try:
+                workspace_label = self._get_workspace_label()
+                query = f"""
+                UNWIND $pairs AS pair
+                MATCH (start:`{workspace_label}` {{entity_id: pair.src}})-[r]-(end:`{workspace_label}` {{entity_id: pair.tgt}})
+                RETURN pair.src AS src_id, pair.tgt AS tgt_id, collect(properties(r)) AS edges
+                """
+                result = await session.run(query, pairs=pairs)
+                edges_dict = {}
+                try:
+                    async for record in result:
+                        edges = record["edges"]
+                        if not edges:
+                            continue
+                        edge_props = dict(
+                            edges[0]
+                        )  # choose the first if multiple exist
+                        # Ensure required keys exist with defaults
+                        for key, default_value in {
+                            "weight": 1.0,
+                            "source_id": None,
+                            "description": None,
+                            "keywords": None,
+                        }.items():
+                            if key not in edge_props:
+                                edge_props[key] = default_value
+                        edges_dict[(record["src_id"], record["tgt_id"])] = edge_props
+                finally:
+                    await result.consume()  # Ensure result is fully consumed
+                return edges_dict
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Error getting edges batch for {len(pairs)} pairs: {str(e)}"
+                )
+                raise
+
     async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
         """
         Upsert a node in the Memgraph database with manual transaction-level retry logic for transient errors.
@@ -645,6 +879,135 @@ class MemgraphStorage(BaseGraphStorage):
                 )
                 raise
 
+    async def _execute_write_with_retry(self, execute_write, operation: str) -> None:
+        """
+        Run a write transaction function with the same transaction-level retry
+        policy for transient errors as upsert_node and upsert_edge.
+
+        Args:
+            execute_write: Transaction function passed to session.execute_write
+            operation: Name of the operation used in log messages
+        """
+        max_retries = 100
+        initial_wait_time = 0.2
+        backoff_factor = 1.1
+        jitter_factor = 0.1
+
+        for attempt in range(max_retries):
+            try:
+                async with self._driver.session(database=self._DATABASE) as session:
+                    await session.execute_write(execute_write)
+                    return
+
+            except (TransientError, ResultFailedError) as e:
+                root_cause = e
+                while hasattr(root_cause, "__cause__") and root_cause.__cause__:
+                    root_cause = root_cause.__cause__
+
+                is_transient = (
+                    isinstance(root_cause, TransientError)
+                    or isinstance(e, TransientError)
+                    or "TransientError" in str(e)
+                    or "Cannot resolve conflicting transactions" in str(e)
+                )
+
+                if is_transient and attempt < max_retries - 1:
+                    jitter = random.uniform(0, jitter_factor) * initial_wait_time
+                    wait_time = initial_wait_time * (backoff_factor**attempt) + jitter
+                    logger.warning(
+                        f"[{self.workspace}] {operation} failed. Attempt #{attempt + 1} retrying in {wait_time:.3f} seconds... Error: {str(e)}"
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(
+                        f"[{self.workspace}] Error during {operation}: {str(e)}"
+                    )
+                    raise
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Unexpected error during {operation}: {str(e)}"
+                )
+                raise
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Upsert many nodes in a single transaction using UNWIND.
+
+        Labels cannot be parameterized in Cypher, so nodes are grouped by
+        entity_type and each group is written with one UNWIND statement.
+
+        Args:
+            nodes: Dictionary mapping node IDs to their properties
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not nodes:
+            return
+
+        workspace_label = self._get_workspace_label()
+        nodes_by_type: dict[str, list[dict]] = {}
+        for node_id, properties in nodes.items():
+            if "entity_id" not in properties:
+                raise ValueError(
+                    "Memgraph: node properties must contain an 'entity_id' field"
+                )
+            nodes_by_type.setdefault(properties["entity_type"], []).append(
+                {"entity_id": node_id, "properties": properties}
+            )
+
+        async def execute_upsert(tx: AsyncManagedTransaction):
+            for entity_type, batch in nodes_by_type.items():
+                query = f"""
+                UNWIND $nodes AS node
+                MERGE (n:`{workspace_label}` {{entity_id: node.entity_id}})
+                SET n += node.properties
+                SET n:`{entity_type}`
+                """
+                result = await tx.run(query, nodes=batch)
+                await result.consume()
+
+        await self._execute_write_with_retry(execute_upsert, "batch node upsert")
+
+    async def upsert_edges_batch(
+        self, edges: dict[tuple[str, str], dict[str, str]]
+    ) -> None:
+        """
+        Upsert many edges in a single transaction using UNWIND.
+
+        Edges whose source or target node does not exist are skipped, as in upsert_edge.
+
+        Args:
+            edges: Dictionary mapping (source_id, target_id) pairs to edge properties
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not edges:
+            return
+
+        workspace_label = self._get_workspace_label()
+        batch = [
+            {"src": src, "tgt": tgt, "properties": properties}
+            for (src, tgt), properties in edges.items()
+        ]
+
+        async def execute_upsert(tx: AsyncManagedTransaction):
+            query = f"""
+            UNWIND $edges AS edge
+            MATCH (source:`{workspace_label}` {{entity_id: edge.src}})
+            WITH source, edge
+            MATCH (target:`{workspace_label}` {{entity_id: edge.tgt}})
+            MERGE (source)-[r:DIRECTED]-(target)
+            SET r += edge.properties
+            """
+            result = await tx.run(query, edges=batch)
+            await result.consume()
+
+        await self._execute_write_with_retry(execute_upsert, "batch edge upsert")
+
     async def delete_node(self, node_id: str) -> None:
         """Delete a node with the specified label
 
@@ -783,6 +1146,32 @@ class MemgraphStorage(BaseGraphStorage):
         degrees = int(src_degree) + int(trg_degree)
         return degrees
 
+    async def edge_degrees_batch(
+        self, edge_pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], int]:
+        """
+        Calculate the combined degree for each edge (sum of the source and target node degrees)
+        in batch using node_degrees_batch.
+
+        Args:
+            edge_pairs: List of (src, tgt) tuples.
+
+        Returns:
+            A dictionary mapping each (src, tgt) tuple to the sum of their degrees.
+        """
+        # Collect unique node IDs from all edge pairs.
+        unique_node_ids = {src for src, _ in edge_pairs}
+        unique_node_ids.update({tgt for _, tgt in edge_pairs})
+
+        # Get degrees for all nodes in one go.
+        degrees = await self.node_degrees_batch(list(unique_node_ids))
+
+        # Sum up degrees for each edge pair.
+        return {
+            (src, tgt): degrees.get(src, 0) + degrees.get(tgt, 0)
+            for src, tgt in edge_pairs
+        }
+
     async def get_knowledge_graph(
         self,
         node_label: str,
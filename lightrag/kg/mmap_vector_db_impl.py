@@ -0,0 +1,655 @@
+import asyncio
+import base64
+import glob
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, final
+
+import numpy as np
+
+from lightrag.base import BaseVectorStorage
+from lightrag.constants import DEFAULT_MMAP_VECTOR_DTYPE
+from lightrag.utils import compute_mdhash_id, logger, write_json_atomic
+
+from .shared_storage import (
+    get_storage_lock,
+    get_update_flag,
+    set_all_update_flags,
+)
+
+MMAP_VECTOR_DTYPES = ("float16", "float32")
+
+# Rows are scored in blocks of about this many elements, so float16 rows are
+# upcast to float32 in cache-sized pieces instead of copying the whole matrix
+_QUERY_BLOCK_ELEMENTS = 1 << 18
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+@final
+@dataclass
+class MmapVectorDBStorage(BaseVectorStorage):
+    """
+    A local vector storage keeping normalized vectors in a memory-mapped ``.npy`` file.
+
+    The matrix file holds one row per vector in ``vector_dtype`` (vector_db_storage_cls_kwargs:
+    float16 by default, float32 doubles the size but scores faster) and is opened read-only with ``mmap_mode="r"``, so
+    all worker processes share the page cache instead of each holding a private copy.
+    Metadata lives in a separate compact JSON file whose ``data`` list is aligned
+    with the matrix rows; the id -> row index is rebuilt from it on load.
+
+    Upserts append rows to an in-memory buffer and deletes only tombstone rows.
+    index_done_callback writes the live rows to a new version of both files and
+    commits them by replacing a small manifest naming the current version, so a
+    crash never leaves a matrix paired with the wrong metadata. Processes holding
+    the old mapping reload on their next access. Files that do not match their
+    manifest raise an error on load instead of being replaced by an empty storage.
+    Queries score every row with blocked matrix products against the query vector.
+
+    An existing NanoVectorDBStorage file (``vdb_<namespace>.json``) is imported on
+    first load and converted on the next save.
+    """
+
+    def __post_init__(self):
+        kwargs = self.global_config.get("vector_db_storage_cls_kwargs", {})
+        cosine_threshold = kwargs.get("cosine_better_than_threshold")
+        if cosine_threshold is None:
+            raise ValueError(
+                "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
+            )
+        self.cosine_better_than_threshold = cosine_threshold
+
+        vector_dtype = kwargs.get("vector_dtype", DEFAULT_MMAP_VECTOR_DTYPE)
+        if vector_dtype not in MMAP_VECTOR_DTYPES:
+            raise ValueError(
+                f"Unsupported vector_dtype '{vector_dtype}', expected one of {MMAP_VECTOR_DTYPES}"
+            )
+        self._dtype = np.dtype(vector_dtype)
+
+        working_dir = self.global_config["working_dir"]
+        if self.workspace:
+            # Include workspace in the file path for data isolation
+            workspace_dir = os.path.join(working_dir, self.workspace)
+            self.final_namespace = f"{self.workspace}_{self.namespace}"
+        else:
+            # Default behavior when workspace is empty
+            self.final_namespace = self.namespace
+            self.workspace = "_"
+            workspace_dir = working_dir
+
+        os.makedirs(workspace_dir, exist_ok=True)
+        self._file_prefix = os.path.join(workspace_dir, f"vdb_{self.namespace}")
+        self._manifest_file = f"{self._file_prefix}.mmap.json"
+        self._nano_file = os.path.join(workspace_dir, f"vdb_{self.namespace}.json")
+
+        self._max_batch_size = self.global_config["embedding_batch_num"]
+        self._dim = self.embedding_func.embedding_dim
+
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        """Reset all in-memory structures to an empty state"""
+        # Rows persisted in the matrix file, memory-mapped read-only
+        self._base = np.empty((0, self._dim), dtype=self._dtype)
+        # Rows appended since the last save; capacity grows by doubling
+        self._extra = np.empty((0, self._dim), dtype=self._dtype)
+        self._extra_count = 0
+        # Row number -> metadata, None for deleted rows
+        self._rows: list[dict[str, Any] | None] = []
+        self._id_to_row: dict[str, int] = {}
+        self._deleted_rows: set[int] = set()
+        self._dirty = False
+        # Version of the files named by the manifest, 0 before the first save
+        self._version = 0
+
+    async def initialize(self):
+        """Initialize storage data"""
+        # Get the update flag for cross-process update notification
+        self.storage_updated = await get_update_flag(self.final_namespace)
+        # Get the storage lock for use in other methods
+        self._storage_lock = get_storage_lock(enable_logging=False)
+
+    async def _check_reload(self):
+        """Reload the files if another process saved them"""
+        async with self._storage_lock:
+            if self.storage_updated.value:
+                logger.info(
+                    f"[{self.workspace}] Process {os.getpid()} reloading {self.namespace} due to update by another process"
+                )
+                self._load()
+                self.storage_updated.value = False
+
+    # --------------------------------------------------------------------------------
+    # Internal helper methods
+    # --------------------------------------------------------------------------------
+
+    def _row_blocks(self):
+        """Yield (first row, block) over the persisted and appended rows"""
+        block_rows = max(1, _QUERY_BLOCK_ELEMENTS // self._dim)
+        for start in range(0, len(self._base), block_rows):
+            yield start, self._base[start : start + block_rows]
+        for start in range(0, self._extra_count, block_rows):
+            end = min(start + block_rows, self._extra_count)
+            yield len(self._base) + start, self._extra[start:end]
+
+    def _row_vector(self, row: int) -> np.ndarray:
+        if row < len(self._base):
+            return self._base[row]
+        return self._extra[row - len(self._base)]
+
+    def _append_rows(self, vectors: np.ndarray) -> int:
+        """Append normalized vectors, returns the row number of the first one"""
+        start = self._extra_count
+        needed = start + len(vectors)
+        if needed > len(self._extra):
+            capacity = max(needed, 2 * len(self._extra), 1024)
+            buffer = np.empty((capacity, self._dim), dtype=self._dtype)
+            buffer[:start] = self._extra[:start]
+            self._extra = buffer
+        self._extra[start:needed] = vectors
+        self._extra_count = needed
+        return len(self._base) + start
+
+    def _mark_deleted(self, rows) -> int:
+        deleted = 0
+        for row in rows:
+            meta = self._rows[row]
+            if meta is None:
+                continue
+            if self._id_to_row.get(meta["__id__"]) == row:
+                del self._id_to_row[meta["__id__"]]
+            self._rows[row] = None
+            self._deleted_rows.add(row)
+            deleted += 1
+        if deleted:
+            self._dirty = True
+        return deleted
+
+    def _record(self, meta: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **meta,
+            "id": meta.get("__id__"),
+            "created_at": meta.get("__created_at__"),
+        }
+
+    def _version_files(self, version: int) -> tuple[str, str]:
+        """Return the matrix and metadata file names of a saved version"""
+        return (
+            f"{self._file_prefix}.vectors.{version}.npy",
+            f"{self._file_prefix}.meta.{version}.json",
+        )
+
+    def _load(self):
+        """Load the files named by the manifest, or import a NanoVectorDB file
+
+        The in-memory state is only replaced once the files are fully read.
+
+        Raises:
+            ValueError: If the files are missing or do not match the manifest
+        """
+        if not os.path.exists(self._manifest_file):
+            self._reset()
+            if os.path.exists(self._nano_file):
+                self._import_nano_file()
+            return
+
+        with open(self._manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        version, count = manifest["version"], manifest["count"]
+        vectors_file, meta_file = self._version_files(version)
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                rows = json.load(f)["data"]
+            if count:
+                base = np.load(vectors_file, mmap_mode="r")
+            else:
+                base = np.empty((0, self._dim), dtype=self._dtype)
+        except (OSError, ValueError, KeyError) as e:
+            raise ValueError(
+                f"[{self.workspace}] Vector storage {self.namespace} version {version} "
+                f"named by {self._manifest_file} is unreadable: {e}"
+            ) from e
+        if manifest["embedding_dim"] != self._dim:
+            raise ValueError(
+                f"[{self.workspace}] Vector storage {self.namespace} has embedding_dim "
+                f"{manifest['embedding_dim']}, expected {self._dim}"
+            )
+        if len(rows) != count or base.shape != (count, self._dim):
+            raise ValueError(
+                f"[{self.workspace}] Vector storage {self.namespace} version {version} "
+                f"does not match its manifest: {len(rows)} metadata rows and matrix "
+                f"shape {base.shape}, expected {count} rows of dimension {self._dim}"
+            )
+
+        self._reset()
+        self._base = base
+        self._rows = rows
+        self._id_to_row = {meta["__id__"]: row for row, meta in enumerate(rows)}
+        self._version = version
+        if base.dtype != self._dtype:
+            # vector_dtype changed: rewrite the matrix on the next save
+            self._dirty = True
+        logger.info(
+            f"[{self.workspace}] Loaded {count} vectors ({base.dtype}) from {vectors_file}"
+        )
+
+    def _import_nano_file(self):
+        """Import the JSON file written by NanoVectorDBStorage"""
+        try:
+            with open(self._nano_file, "r", encoding="utf-8") as f:
+                storage = json.load(f)
+            if storage["embedding_dim"] != self._dim:
+                raise ValueError(
+                    f"embedding_dim {storage['embedding_dim']} does not match {self._dim}"
+                )
+            matrix = np.frombuffer(
+                base64.b64decode(storage["matrix"]), dtype=np.float32
+            ).reshape(-1, self._dim)
+            rows = [
+                {k: v for k, v in dp.items() if k != "vector"} for dp in storage["data"]
+            ]
+            self._append_rows(_normalize_rows(matrix).astype(self._dtype))
+            self._rows = rows
+            self._id_to_row = {meta["__id__"]: row for row, meta in enumerate(rows)}
+            self._dirty = True
+            logger.info(
+                f"[{self.workspace}] Imported {len(rows)} vectors from {self._nano_file}"
+            )
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Failed to import {self._nano_file}: {e}")
+            self._reset()
+            raise
+
+    def _save(self):
+        """Write the live rows as a new version and commit it (runs in a worker thread)
+
+        Replacing the manifest is the single commit point: until then, loads
+        keep reading the previous version, whose files are removed afterwards.
+        """
+        live_rows = [row for row, meta in enumerate(self._rows) if meta is not None]
+        version = self._version + 1
+        vectors_file, meta_file = self._version_files(version)
+
+        if live_rows:
+            # Copy block by block so the matrix never has to fit in memory
+            out = np.lib.format.open_memmap(
+                vectors_file,
+                mode="w+",
+                dtype=self._dtype,
+                shape=(len(live_rows), self._dim),
+            )
+            live = np.asarray(live_rows, dtype=np.int64)
+            written = 0
+            for start, block in self._row_blocks():
+                lo, hi = np.searchsorted(live, [start, start + len(block)])
+                if hi > lo:
+                    out[written : written + hi - lo] = block[live[lo:hi] - start]
+                    written += hi - lo
+            out.flush()
+            del out
+        else:
+            np.save(vectors_file, np.empty((0, self._dim), dtype=self._dtype))
+        with open(vectors_file, "r+b") as f:
+            os.fsync(f.fileno())
+
+        with open(meta_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "embedding_dim": self._dim,
+                    "dtype": self._dtype.name,
+                    "data": [self._rows[row] for row in live_rows],
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            f.flush()
+            os.fsync(f.fileno())
+
+        write_json_atomic(
+            {
+                "version": version,
+                "count": len(live_rows),
+                "embedding_dim": self._dim,
+                "dtype": self._dtype.name,
+            },
+            self._manifest_file,
+        )
+        # Processes still mapping an old file keep reading it until they reload
+        self._remove_version_files(keep=version)
+
+    def _remove_version_files(self, keep: int | None = None):
+        """Remove the files of every version except ``keep``"""
+        kept = set(self._version_files(keep)) if keep is not None else set()
+        prefix = glob.escape(self._file_prefix)
+        for pattern in (f"{prefix}.vectors.*.npy", f"{prefix}.meta.*.json"):
+            for file_name in glob.glob(pattern):
+                if file_name in kept:
+                    continue
+                try:
+                    os.remove(file_name)
+                except OSError as e:
+                    # E.g. still mapped on Windows, retried after the next save
+                    logger.debug(
+                        f"[{self.workspace}] Could not remove old vector file {file_name}: {e}"
+                    )
+
+    # --------------------------------------------------------------------------------
+    # BaseVectorStorage interface
+    # --------------------------------------------------------------------------------
+
+    async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
+        """
+        Importance notes:
+        1. Changes will be persisted to disk during the next index_done_callback
+        2. Only one process should updating the storage at a time before index_done_callback,
+           KG-storage-log should be used to avoid data corruption
+        """
+        if not data:
+            return
+
+        current_time = int(time.time())
+        list_data = [
+            {
+                "__id__": k,
+                "__created_at__": current_time,
+                **{k1: v1 for k1, v1 in v.items() if k1 in self.meta_fields},
+            }
+            for k, v in data.items()
+        ]
+        contents = [v["content"] for v in data.values()]
+        batches = [
+            contents[i : i + self._max_batch_size]
+            for i in range(0, len(contents), self._max_batch_size)
+        ]
+
+        # Execute embedding outside of lock to avoid long lock times
+        embedding_tasks = [self.embedding_func(batch) for batch in batches]
+        embeddings_list = await asyncio.gather(*embedding_tasks)
+
+        embeddings = np.concatenate(embeddings_list)
+        if len(embeddings) != len(list_data):
+            # sometimes the embedding is not returned correctly. just log it.
+            logger.error(
+                f"[{self.workspace}] embedding is not 1-1 with data, {len(embeddings)} != {len(list_data)}"
+            )
+            return
+        vectors = _normalize_rows(embeddings).astype(self._dtype)
+
+        await self._check_reload()
+        async with self._storage_lock:
+            self._mark_deleted(
+                [
+                    self._id_to_row[meta["__id__"]]
+                    for meta in list_data
+                    if meta["__id__"] in self._id_to_row
+                ]
+            )
+            start_row = self._append_rows(vectors)
+            for i, meta in enumerate(list_data):
+                self._rows.append(meta)
+                self._id_to_row[meta["__id__"]] = start_row + i
+            self._dirty = True
+
+    async def query(
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        search_params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        # Use provided embedding or compute it
+        if query_embedding is not None:
+            embedding = query_embedding
+        else:
+            # Execute embedding outside of lock to avoid improve cocurrent
+            embedding = await self.embedding_func(
+                [query], _priority=5
+            )  # higher priority for query
+            embedding = embedding[0]
+
+        await self._check_reload()
+        total = len(self._rows)
+        if total == 0 or top_k <= 0:
+            return []
+
+        query_vector = _normalize_rows(embedding)
+        scores = np.empty(total, dtype=np.float32)
+        for start, block in self._row_blocks():
+            scores[start : start + len(block)] = (
+                block.astype(np.float32, copy=False) @ query_vector
+            )
+        if self._deleted_rows:
+            scores[np.fromiter(self._deleted_rows, dtype=np.int64)] = -np.inf
+
+        if top_k < total:
+            top_rows = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top_rows = np.arange(total)
+        top_rows = top_rows[np.argsort(-scores[top_rows], kind="stable")]
+
+        results = []
+        for row in top_rows:
+            score = float(scores[row])
+            if score < self.cosine_better_than_threshold:
+                break
+            meta = self._rows[row]
+            if meta is None:
+                continue
+            results.append({**self._record(meta), "distance": score})
+        return results
+
+    @property
+    async def client_storage(self):
+        await self._check_reload()
+        return {"data": [meta for meta in self._rows if meta is not None]}
+
+    async def delete(self, ids: list[str]):
+        """Delete vectors with specified IDs
+
+        Importance notes:
+        1. Changes will be persisted to disk during the next index_done_callback
+        2. Only one process should updating the storage at a time before index_done_callback,
+           KG-storage-log should be used to avoid data corruption
+
+        Args:
+            ids: List of vector IDs to be deleted
+        """
+        await self._check_reload()
+        async with self._storage_lock:
+            deleted_count = self._mark_deleted(
+                [self._id_to_row[id] for id in ids if id in self._id_to_row]
+            )
+        logger.debug(
+            f"[{self.workspace}] Successfully deleted {deleted_count} vectors from {self.namespace}"
+        )
+
+    async def delete_entity(self, entity_name: str) -> None:
+        """
+        Importance notes:
+        1. Changes will be persisted to disk during the next index_done_callback
+        2. Only one process should updating the storage at a time before index_done_callback,
+           KG-storage-log should be used to avoid data corruption
+        """
+        entity_id = compute_mdhash_id(entity_name, prefix="ent-")
+        logger.debug(
+            f"[{self.workspace}] Attempting to delete entity {entity_name} with ID {entity_id}"
+        )
+        await self.delete([entity_id])
+
+    async def delete_entity_relation(self, entity_name: str) -> None:
+        """
+        Importance notes:
+        1. Changes will be persisted to disk during the next index_done_callback
+        2. Only one process should updating the storage at a time before index_done_callback,
+           KG-storage-log should be used to avoid data corruption
+        """
+        await self._check_reload()
+        async with self._storage_lock:
+            relations = [
+                row
+                for row, meta in enumerate(self._rows)
+                if meta is not None
+                and (
+                    meta.get("src_id") == entity_name
+                    or meta.get("tgt_id") == entity_name
+                )
+            ]
+            self._mark_deleted(relations)
+        logger.debug(
+            f"[{self.workspace}] Deleted {len(relations)} relations for {entity_name}"
+        )
+
+    async def index_done_callback(self) -> bool:
+        """Save data to disk"""
+        async with self._storage_lock:
+            # Check if storage was updated by another process
+            if self.storage_updated.value:
+                # Storage was updated by another process, reload data instead of saving
+                logger.warning(
+                    f"[{self.workspace}] Storage for {self.namespace} was updated by another process, reloading..."
+                )
+                self._load()
+                self.storage_updated.value = False
+                return False  # Return error
+
+        # Acquire lock and perform persistence
+        async with self._storage_lock:
+            if not self._dirty:
+                return True
+            try:
+                await asyncio.to_thread(self._save)
+                # Swap in the compacted files on the event loop so concurrent
+                # queries never see a half-updated state
+                self._load()
+                # Notify other processes that data has been updated
+                await set_all_update_flags(self.final_namespace)
+                # Reset own update flag to avoid self-reloading
+                self.storage_updated.value = False
+                return True  # Return success
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Error saving data for {self.namespace}: {e}"
+                )
+                return False  # Return error
+
+    async def get_by_id(self, id: str) -> dict[str, Any] | None:
+        """Get vector data by its ID
+
+        Args:
+            id: The unique identifier of the vector
+
+        Returns:
+            The vector data if found, or None if not found
+        """
+        await self._check_reload()
+        row = self._id_to_row.get(id)
+        if row is None:
+            return None
+        return self._record(self._rows[row])
+
+    async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
+        """Get multiple vector data by their IDs
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            List of vector data objects that were found
+        """
+        if not ids:
+            return []
+
+        await self._check_reload()
+        results: list[dict[str, Any] | None] = []
+        for id in ids:
+            row = self._id_to_row.get(id)
+            results.append(None if row is None else self._record(self._rows[row]))
+        return results
+
+    async def get_vectors_by_ids(self, ids: list[str]) -> dict[str, list[float]]:
+        """Get vectors by their IDs, returning only ID and vector data for efficiency
+
+        Vectors are returned normalized, as they are stored.
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            Dictionary mapping IDs to their vector embeddings
+            Format: {id: [vector_values], ...}
+        """
+        if not ids:
+            return {}
+
+        await self._check_reload()
+        vectors_dict = {}
+        for id in ids:
+            row = self._id_to_row.get(id)
+            if row is not None:
+                vectors_dict[id] = self._row_vector(row).astype(np.float32).tolist()
+        return vectors_dict
+
+    async def get_vectors_array_by_ids(
+        self, ids: list[str]
+    ) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs as one contiguous float32 array
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            The IDs that have a vector, and an array holding their vectors in that order
+        """
+        await self._check_reload()
+        found = [id for id in ids if id in self._id_to_row]
+        rows = np.array([self._id_to_row[id] for id in found], dtype=np.int64)
+        matrix = np.empty((len(rows), self._dim), dtype=np.float32)
+        in_base = rows < len(self._base)
+        matrix[in_base] = self._base[rows[in_base]]
+        matrix[~in_base] = self._extra[rows[~in_base] - len(self._base)]
+        return found, matrix
+
+    async def drop(self) -> dict[str, str]:
+        """Drop all vector data from storage and clean up resources
+
+        This method will:
+        1. Remove the manifest, vector and metadata files if they exist
+        2. Reset the in-memory structures
+        3. Update flags to notify other processes
+        4. Changes is persisted to disk immediately
+
+        Returns:
+            dict[str, str]: Operation status and message
+            - On success: {"status": "success", "message": "data dropped"}
+            - On failure: {"status": "error", "message": "<error details>"}
+        """
+        try:
+            async with self._storage_lock:
+                self._reset()
+                # Removing the manifest first leaves no partially dropped version
+                for file_name in (self._manifest_file, self._nano_file):
+                    if os.path.exists(file_name):
+                        os.remove(file_name)
+                self._remove_version_files()
+
+                # Notify other processes that data has been updated
+                await set_all_update_flags(self.final_namespace)
+                # Reset own update flag to avoid self-reloading
+                self.storage_updated.value = False
+
+                logger.info(
+                    f"[{self.workspace}] Process {os.getpid()} drop {self.namespace}(file:{self._manifest_file})"
+                )
+            return {"status": "success", "message": "data dropped"}
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error dropping {self.namespace}: {e}")
+            return {"status": "error", "message": str(e)}
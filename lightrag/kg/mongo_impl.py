@@ -964,36 +964,91 @@ class MongoGraphStorage(BaseGraphStorage):
         return result
 
     async def node_degrees_batch(self, node_ids: list[str]) -> dict[str, int]:
-        # merge the outbound and inbound results with the same "_id" and sum the "degree"
-        merged_results = {}
-
-        # Outbound degrees
-        outbound_pipeline = [
-            {"$match": {"source_node_id": {"$in": node_ids}}},
-            {"$group": {"_id": "$source_node_id", "degree": {"$sum": 1}}},
+        """
+        Count inbound and outbound edges of all nodes in a single grouped pass: every
+        matching edge is unwound into its two endpoints and counted per queried node.
+        Nodes without edges report a degree of 0, like node_degree does.
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {"source_node_id": {"$in": node_ids}},
+                        {"target_node_id": {"$in": node_ids}},
+                    ]
+                }
+            },
+            {"$project": {"_id": 0, "node": ["$source_node_id", "$target_node_id"]}},
+            {"$unwind": "$node"},
+            {"$match": {"node": {"$in": node_ids}}},
+            {"$group": {"_id": "$node", "degree": {"$sum": 1}}},
         ]
 
-        cursor = await self.edge_collection.aggregate(
-            outbound_pipeline, allowDiskUse=True
-        )
+        degrees = {node_id: 0 for node_id in node_ids}
+        cursor = await self.edge_collection.aggregate(pipeline, allowDiskUse=True)
         async for doc in cursor:
-            merged_results[doc.get("_id")] = doc.get("degree")
+            degrees[doc["_id"]] = doc["degree"]
+        return degrees
 
-        # Inbound degrees
-        inbound_pipeline = [
-            {"$match": {"target_node_id": {"$in": node_ids}}},
-            {"$group": {"_id": "$target_node_id", "degree": {"$sum": 1}}},
-        ]
+    async def edge_degrees_batch(
+        self, edge_pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], int]:
+        """
+        Calculate the combined degree for each edge (sum of the source and target node degrees)
+        in batch using node_degrees_batch.
 
-        cursor = await self.edge_collection.aggregate(
-            inbound_pipeline, allowDiskUse=True
-        )
-        async for doc in cursor:
-            merged_results[doc.get("_id")] = merged_results.get(
-                doc.get("_id"), 0
-            ) + doc.get("degree")
+        Args:
+            edge_pairs: List of (src, tgt) tuples.
+
+        Returns:
+            A dictionary mapping each (src, tgt) tuple to the sum of their degrees.
+        """
+        unique_node_ids = {src for src, _ in edge_pairs}
+        unique_node_ids.update({tgt for _, tgt in edge_pairs})
+
+        degrees = await self.node_degrees_batch(list(unique_node_ids))
+
+        return {
+            (src, tgt): degrees.get(src, 0) + degrees.get(tgt, 0)
+            for src, tgt in edge_pairs
+        }
+
+    async def get_edges_batch(
+        self, pairs: list[dict[str, str]]
+    ) -> dict[tuple[str, str], dict]:
+        """
+        Retrieve edge documents for multiple (src, tgt) pairs with a single find.
+        Edges are undirected: an edge stored as (tgt, src) also matches, the stored
+        direction is preferred when both exist.
+
+        Args:
+            pairs: List of dictionaries, e.g. [{"src": "node1", "tgt": "node2"}, ...]
 
-        return merged_results
+        Returns:
+            A dictionary mapping (src, tgt) tuples to their edge documents, pairs
+            without an edge are left out.
+        """
+        if not pairs:
+            return {}
+
+        wanted = {(pair["src"], pair["tgt"]) for pair in pairs}
+        clauses = []
+        for src, tgt in wanted:
+            clauses.append({"source_node_id": src, "target_node_id": tgt})
+            if src != tgt:
+                clauses.append({"source_node_id": tgt, "target_node_id": src})
+
+        found: dict[tuple[str, str], dict] = {}
+        async for edge in self.edge_collection.find({"$or": clauses}):
+            key = (edge["source_node_id"], edge["target_node_id"])
+            found.setdefault(key, edge)
+
+        result = {}
+        for src, tgt in wanted:
+            edge = found.get((src, tgt)) or found.get((tgt, src))
+            if edge is not None:
+                result[(src, tgt)] = edge
+        return result
 
     async def get_nodes_edges_batch(
         self, node_ids: list[str]
@@ -1090,6 +1145,75 @@ class MongoGraphStorage(BaseGraphStorage):
             upsert=True,
         )
 
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Insert or update many node documents with a single bulk write.
+        """
+        if not nodes:
+            return
+        operations = []
+        for node_id, node_data in nodes.items():
+            update_doc = {"$set": {**node_data}}
+            if node_data.get("source_id", ""):
+                update_doc["$set"]["source_ids"] = node_data["source_id"].split(
+                    GRAPH_FIELD_SEP
+                )
+            operations.append(UpdateOne({"_id": node_id}, update_doc, upsert=True))
+
+        await self.collection.bulk_write(operations, ordered=False)
+
+    async def upsert_edges_batch(
+        self, edges: dict[tuple[str, str], dict[str, str]]
+    ) -> None:
+        """
+        Upsert many edges with a single bulk write, after making sure every
+        source node document exists as upsert_edge does.
+        """
+        if not edges:
+            return
+        source_ids = {source_node_id for source_node_id, _ in edges}
+        await self.collection.bulk_write(
+            [
+                UpdateOne({"_id": node_id}, {"$set": {}}, upsert=True)
+                for node_id in source_ids
+            ],
+            ordered=False,
+        )
+
+        operations = []
+        for (source_node_id, target_node_id), edge_data in edges.items():
+            update_doc = {
+                "$set": {
+                    **edge_data,
+                    "source_node_id": source_node_id,
+                    "target_node_id": target_node_id,
+                }
+            }
+            if edge_data.get("source_id", ""):
+                update_doc["$set"]["source_ids"] = edge_data["source_id"].split(
+                    GRAPH_FIELD_SEP
+                )
+            operations.append(
+                UpdateOne(
+                    {
+                        "$or": [
+                            {
+                                "source_node_id": source_node_id,
+                                "target_node_id": target_node_id,
+                            },
+                            {
+                                "source_node_id": target_node_id,
+                                "target_node_id": source_node_id,
+                            },
+                        ]
+                    },
+                    update_doc,
+                    upsert=True,
+                )
+            )
+
+        await self.edge_collection.bulk_write(operations, ordered=False)
+
     #
     # -------------------------------------------------------------------------
     # DELETION
@@ -2208,7 +2332,11 @@ class MongoVectorDBStorage(BaseVectorStorage):
         return list_data
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        search_params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Queries the vector database using Atlas Vector Search."""
         if query_embedding is not None:
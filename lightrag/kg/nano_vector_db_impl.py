@@ -137,7 +137,11 @@ class NanoVectorDBStorage(BaseVectorStorage):
             )
 
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        search_params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         # Use provided embedding or compute it
         if query_embedding is not None:
@@ -382,6 +386,34 @@ class NanoVectorDBStorage(BaseVectorStorage):
 
         return vectors_dict
 
+    async def get_vectors_array_by_ids(
+        self, ids: list[str]
+    ) -> tuple[list[str], np.ndarray]:
+        """Get vectors by their IDs as rows of the client matrix, without decompressing
+
+        Args:
+            ids: List of unique identifiers
+
+        Returns:
+            The IDs that have a vector, and an array holding their vectors in that order
+        """
+        client = await self._get_client()
+        storage = getattr(client, "_NanoVectorDB__storage", None)
+        if storage is None:
+            # The client matrix is private to nano-vectordb, go through the public API
+            return await super().get_vectors_array_by_ids(ids)
+        wanted = set(ids)
+        rows = {
+            dp["__id__"]: i
+            for i, dp in enumerate(storage["data"])
+            if dp["__id__"] in wanted
+        }
+        found = [id for id in ids if id in rows]
+        matrix = storage["matrix"][[rows[id] for id in found]]
+        return found, np.ascontiguousarray(matrix, dtype=np.float32).reshape(
+            len(found), self.embedding_func.embedding_dim
+        )
+
     async def drop(self) -> dict[str, str]:
         """Drop all vector data from storage and clean up resources
 
@@ -1012,6 +1012,117 @@ class Neo4JStorage(BaseGraphStorage):
             logger.error(f"[{self.workspace}] Error during edge upsert: {str(e)}")
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type(
+            (
+                neo4jExceptions.ServiceUnavailable,
+                neo4jExceptions.TransientError,
+                neo4jExceptions.WriteServiceUnavailable,
+                neo4jExceptions.ClientError,
+                neo4jExceptions.SessionExpired,
+                ConnectionResetError,
+                OSError,
+            )
+        ),
+    )
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Upsert many nodes in a single transaction using UNWIND.
+
+        Labels cannot be parameterized in Cypher, so nodes are grouped by
+        entity_type and each group is written with one UNWIND statement.
+
+        Args:
+            nodes: Dictionary mapping node IDs to their properties
+        """
+        if not nodes:
+            return
+        workspace_label = self._get_workspace_label()
+        nodes_by_type: dict[str, list[dict]] = {}
+        for node_id, properties in nodes.items():
+            if "entity_id" not in properties:
+                raise ValueError(
+                    "Neo4j: node properties must contain an 'entity_id' field"
+                )
+            nodes_by_type.setdefault(properties["entity_type"], []).append(
+                {"entity_id": node_id, "properties": properties}
+            )
+
+        try:
+            async with self._driver.session(database=self._DATABASE) as session:
+
+                async def execute_upsert(tx: AsyncManagedTransaction):
+                    for entity_type, batch in nodes_by_type.items():
+                        query = f"""
+                        UNWIND $nodes AS node
+                        MERGE (n:`{workspace_label}` {{entity_id: node.entity_id}})
+                        SET n += node.properties
+                        SET n:`{entity_type}`
+                        """
+                        result = await tx.run(query, nodes=batch)
+                        await result.consume()
+
+                await session.execute_write(execute_upsert)
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error during batch upsert: {str(e)}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type(
+            (
+                neo4jExceptions.ServiceUnavailable,
+                neo4jExceptions.TransientError,
+                neo4jExceptions.WriteServiceUnavailable,
+                neo4jExceptions.ClientError,
+                neo4jExceptions.SessionExpired,
+                ConnectionResetError,
+                OSError,
+            )
+        ),
+    )
+    async def upsert_edges_batch(
+        self, edges: dict[tuple[str, str], dict[str, str]]
+    ) -> None:
+        """
+        Upsert many edges in a single transaction using UNWIND.
+
+        Edges whose source or target node does not exist are skipped, as in upsert_edge.
+
+        Args:
+            edges: Dictionary mapping (source_id, target_id) pairs to edge properties
+        """
+        if not edges:
+            return
+        batch = [
+            {"src": src, "tgt": tgt, "properties": properties}
+            for (src, tgt), properties in edges.items()
+        ]
+
+        try:
+            async with self._driver.session(database=self._DATABASE) as session:
+
+                async def execute_upsert(tx: AsyncManagedTransaction):
+                    workspace_label = self._get_workspace_label()
+                    query = f"""
+                    UNWIND $edges AS edge
+                    MATCH (source:`{workspace_label}` {{entity_id: edge.src}})
+                    WITH source, edge
+                    MATCH (target:`{workspace_label}` {{entity_id: edge.tgt}})
+                    MERGE (source)-[r:DIRECTED]-(target)
+                    SET r += edge.properties
+                    """
+                    result = await tx.run(query, edges=batch)
+                    await result.consume()
+
+                await session.execute_write(execute_upsert)
+        except Exception as e:
+            logger.error(f"[{self.workspace}] Error during batch edge upsert: {str(e)}")
+            raise
+
     async def get_knowledge_graph(
         self,
         node_label: str,
@@ -1,10 +1,19 @@
+import heapq
 import os
+from bisect import bisect_left, insort
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import final
+from typing import Iterable, final
 
 from lightrag.types import KnowledgeGraph, KnowledgeGraphNode, KnowledgeGraphEdge
-from lightrag.utils import logger
+from lightrag.constants import (
+    DEFAULT_NX_STORAGE_FORMAT,
+    DEFAULT_NX_MAX_DELTA_SEGMENTS,
+    DEFAULT_NX_DELTA_COMPACT_RATIO,
+)
+from lightrag.utils import get_env_value, logger
 from lightrag.base import BaseGraphStorage
+from .nx_binary_format import BinaryGraphStore
 import networkx as nx
 from .shared_storage import (
     get_storage_lock,
@@ -19,10 +28,171 @@ from dotenv import load_dotenv
 # the OS environment variables take precedence over the .env file
 load_dotenv(dotenv_path=".env", override=False)
 
+# Upper bound for any string starting with a given prefix, used for prefix range lookups
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class _LabelIndex:
+    """Node label index for search_labels, get_popular_labels and the "*" graph query
+
+    Lowercased labels are indexed by their trigrams for substring search and kept in a
+    sorted list for prefix search. Nodes are bucketed by degree, within a bucket ordered
+    by when they were added to the graph, which reproduces the stable sort by degree of
+    graph.degree(). refresh() is called for every node whose existence or degree may
+    have changed, so neither lookup needs to visit all nodes.
+    """
+
+    def __init__(self, graph: nx.Graph):
+        self._lower: dict[str, str] = {}
+        self._by_lower: defaultdict[str, set[str]] = defaultdict(set)
+        self._trigrams: defaultdict[str, set[str]] = defaultdict(set)
+        # Labels too short to have a trigram, only reachable by a short query
+        self._short: set[str] = set()
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+        self._degree: dict[str, int] = {}
+        self._by_degree: defaultdict[int, set[str]] = defaultdict(set)
+        self._ranking: list[str] | None = None
+        for node, degree in graph.degree():
+            self._index_label(node)
+            self._degree[node] = degree
+            self._by_degree[degree].add(node)
+        self._sorted = sorted((lower, node) for node, lower in self._lower.items())
+
+    def _index_label(self, node: str) -> str:
+        lower = str(node).lower()
+        self._lower[node] = lower
+        self._by_lower[lower].add(node)
+        if len(lower) < 3:
+            self._short.add(node)
+        for i in range(len(lower) - 2):
+            self._trigrams[lower[i : i + 3]].add(node)
+        self._seq[node] = self._next_seq
+        self._next_seq += 1
+        return lower
+
+    def _remove(self, node: str) -> None:
+        lower = self._lower.pop(node)
+        self._by_lower[lower].discard(node)
+        if not self._by_lower[lower]:
+            del self._by_lower[lower]
+        self._short.discard(node)
+        for i in range(len(lower) - 2):
+            trigram = lower[i : i + 3]
+            self._trigrams[trigram].discard(node)
+            if not self._trigrams[trigram]:
+                del self._trigrams[trigram]
+        del self._sorted[bisect_left(self._sorted, (lower, node))]
+        del self._seq[node]
+        self._set_degree(node, None)
+
+    def _set_degree(self, node: str, degree: int | None) -> None:
+        old_degree = self._degree.get(node)
+        if old_degree == degree:
+            return
+        if old_degree is not None:
+            self._by_degree[old_degree].discard(node)
+            if not self._by_degree[old_degree]:
+                del self._by_degree[old_degree]
+        if degree is None:
+            del self._degree[node]
+        else:
+            self._degree[node] = degree
+            self._by_degree[degree].add(node)
+        self._ranking = None
+
+    def refresh(self, graph: nx.Graph, node: str) -> None:
+        """Bring the index in line with the current state of node in graph"""
+        if not graph.has_node(node):
+            if node in self._lower:
+                self._remove(node)
+            return
+        if node not in self._lower:
+            insort(self._sorted, (self._index_label(node), node))
+        self._set_degree(node, graph.degree(node))
+
+    def search(self, query: str, limit: int) -> list[str]:
+        """Labels containing the lowercased query ranked like NetworkXStorage.search_labels:
+        exact matches, then prefix matches, then other substring matches by length
+        and word boundary bonus, ties broken alphabetically."""
+        # Exact match gets highest score
+        results = sorted(self._by_lower.get(query, ()))[:limit]
+
+        # Prefix match gets high score
+        if len(results) < limit:
+            start = bisect_left(self._sorted, (query,))
+            end = bisect_left(self._sorted, (query + _MAX_CHAR,), start)
+            prefix_matches = [
+                node for lower, node in self._sorted[start:end] if lower != query
+            ]
+            results.extend(heapq.nsmallest(limit - len(results), prefix_matches))
+
+        # Contains match gets base score, with bonus for shorter strings and word boundaries
+        if len(results) < limit:
+            scored = []
+            for node in self._substring_candidates(query):
+                lower = self._lower[node]
+                if query not in lower or lower.startswith(query):
+                    continue
+                score = 100 - len(str(node))
+                if f" {query}" in lower or f"_{query}" in lower:
+                    score += 50
+                scored.append((-score, str(node)))
+            results.extend(
+                node for _, node in heapq.nsmallest(limit - len(results), scored)
+            )
+        return [str(node) for node in results]
+
+    def _substring_candidates(self, query: str) -> Iterable[str]:
+        if len(query) >= 3:
+            postings = []
+            for i in range(len(query) - 2):
+                posting = self._trigrams.get(query[i : i + 3])
+                if not posting:
+                    return ()
+                postings.append(posting)
+            postings.sort(key=len)
+            return postings[0].intersection(*postings[1:])
+
+        candidates = {node for node in self._short if query in self._lower[node]}
+        for trigram, posting in self._trigrams.items():
+            if query in trigram:
+                candidates.update(posting)
+        return candidates
+
+    def popular(self, limit: int) -> list[str]:
+        """Up to limit node ids by degree (highest first), the ranking is cached until a degree changes"""
+        if self._ranking is None or (
+            len(self._ranking) < limit and len(self._ranking) < len(self._degree)
+        ):
+            ranking = []
+            for degree in sorted(self._by_degree, reverse=True):
+                needed = limit - len(ranking)
+                if needed <= 0:
+                    break
+                ranking.extend(
+                    heapq.nsmallest(needed, self._by_degree[degree], key=self._seq.get)
+                )
+            self._ranking = ranking
+        return self._ranking[:limit]
+
+    def __len__(self) -> int:
+        return len(self._lower)
+
 
 @final
 @dataclass
 class NetworkXStorage(BaseGraphStorage):
+    """In-memory NetworkX graph persisted to the working directory
+
+    By default the whole graph is rewritten to ``graph_<namespace>.graphml`` on
+    every save. The opt-in ``binary`` format (NETWORKX_STORAGE_FORMAT=binary)
+    saves it as a columnar base segment plus delta segments holding only the
+    nodes and edges changed since the previous save (see nx_binary_format). An
+    existing GraphML file is then imported once on first start, and
+    export_graphml writes the current graph back to GraphML on demand.
+    """
+
     @staticmethod
     def load_nx_graph(file_name) -> nx.Graph:
         if os.path.exists(file_name):
@@ -56,17 +226,139 @@ class NetworkXStorage(BaseGraphStorage):
         self.storage_updated = None
         self._graph = None
 
+        self._storage_format = get_env_value(
+            "NETWORKX_STORAGE_FORMAT", DEFAULT_NX_STORAGE_FORMAT
+        ).lower()
+        self._max_delta_segments = get_env_value(
+            "NETWORKX_MAX_DELTA_SEGMENTS", DEFAULT_NX_MAX_DELTA_SEGMENTS, int
+        )
+        self._delta_compact_ratio = get_env_value(
+            "NETWORKX_DELTA_COMPACT_RATIO", DEFAULT_NX_DELTA_COMPACT_RATIO, float
+        )
+        self._binary_store = BinaryGraphStore(workspace_dir, f"graph_{self.namespace}")
+        self._manifest = None
+        self._reset_changes()
+        # Built on first label lookup, dropped whenever the graph is replaced
+        self._label_index: _LabelIndex | None = None
+
         # Load initial graph
-        preloaded_graph = NetworkXStorage.load_nx_graph(self._graphml_xml_file)
+        preloaded_graph = self._load_graph()
         if preloaded_graph is not None:
             logger.info(
-                f"[{self.workspace}] Loaded graph from {self._graphml_xml_file} with {preloaded_graph.number_of_nodes()} nodes, {preloaded_graph.number_of_edges()} edges"
+                f"[{self.workspace}] Loaded graph {self.namespace} with {preloaded_graph.number_of_nodes()} nodes, {preloaded_graph.number_of_edges()} edges"
             )
         else:
+            logger.info(f"[{self.workspace}] Created new empty graph {self.namespace}")
+        self._graph = preloaded_graph or nx.Graph()
+
+    def _use_binary(self) -> bool:
+        return self._storage_format == "binary"
+
+    def _has_unsaved_changes(self) -> bool:
+        return bool(
+            self._upserted_nodes
+            or self._deleted_nodes
+            or self._upserted_edges
+            or self._deleted_edges
+        )
+
+    def _reset_changes(self) -> None:
+        """Forget node/edge changes tracked since the last save"""
+        self._upserted_nodes: set[str] = set()
+        self._deleted_nodes: set[str] = set()
+        self._upserted_edges: set[tuple[str, str]] = set()
+        self._deleted_edges: set[tuple[str, str]] = set()
+
+    @staticmethod
+    def _edge_key(source: str, target: str) -> tuple[str, str]:
+        # Undirected graph: track each edge under a single orientation
+        return (source, target) if source <= target else (target, source)
+
+    def _load_graph(self) -> nx.Graph | None:
+        """Load the persisted graph, applying only new delta segments when possible"""
+        if not self._use_binary():
+            return NetworkXStorage.load_nx_graph(self._graphml_xml_file)
+
+        if self._binary_store.exists():
+            # Catching up on new deltas in place is only valid while the live graph
+            # still matches the persisted state, unsaved local changes are discarded
+            if self._graph is None or self._has_unsaved_changes():
+                graph, self._manifest = self._binary_store.load()
+            else:
+                graph, self._manifest = self._binary_store.load(
+                    self._graph, self._manifest
+                )
+            return graph
+
+        # One-shot import of a graph written by the GraphML storage format
+        graph = NetworkXStorage.load_nx_graph(self._graphml_xml_file)
+        if graph is not None:
+            imported_file = f"{self._graphml_xml_file}.imported"
             logger.info(
-                f"[{self.workspace}] Created new empty graph file: {self._graphml_xml_file}"
+                f"[{self.workspace}] Importing {self._graphml_xml_file} into binary graph storage, "
+                f"renaming it to {imported_file}; use export_graphml() to produce GraphML for external tools"
             )
-        self._graph = preloaded_graph or nx.Graph()
+            self._manifest = self._binary_store.write_base(graph, None)
+            # The GraphML file is no longer updated, keep it from being read as current
+            os.replace(self._graphml_xml_file, imported_file)
+        return graph
+
+    def _save_graph(self) -> None:
+        if not self._use_binary():
+            NetworkXStorage.write_nx_graph(
+                self._graph, self._graphml_xml_file, self.workspace
+            )
+            return
+
+        graph = self._graph
+        manifest = self._manifest
+        needs_base = manifest is None or not self._binary_store.exists()
+        if not needs_base:
+            base_size, delta_size = self._binary_store.segment_bytes(manifest)
+            needs_base = (
+                len(manifest["deltas"]) >= self._max_delta_segments
+                or delta_size >= base_size * self._delta_compact_ratio
+            )
+
+        if needs_base:
+            logger.info(
+                f"[{self.workspace}] Writing graph with {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges"
+            )
+            self._manifest = self._binary_store.write_base(graph, manifest)
+        else:
+            upserted_nodes = [n for n in self._upserted_nodes if graph.has_node(n)]
+            upserted_edges = [e for e in self._upserted_edges if graph.has_edge(*e)]
+            deleted_edges = self._deleted_edges | {
+                e for e in self._upserted_edges if not graph.has_edge(*e)
+            }
+            logger.debug(
+                f"[{self.workspace}] Writing graph delta: {len(upserted_nodes)} nodes, {len(upserted_edges)} edges upserted, "
+                f"{len(self._deleted_nodes)} nodes, {len(deleted_edges)} edges deleted"
+            )
+            self._manifest = self._binary_store.append_delta(
+                graph,
+                manifest,
+                upserted_nodes,
+                upserted_edges,
+                self._deleted_nodes,
+                deleted_edges,
+            )
+        self._reset_changes()
+
+    async def export_graphml(self, file_name: str | None = None) -> str:
+        """Write the current graph to GraphML for use by external tools
+
+        Args:
+            file_name: Target path, defaults to graph_<namespace>.graphml in the workspace
+
+        Returns:
+            str: The path written
+        """
+        file_name = file_name or self._graphml_xml_file
+        graph = await self._get_graph()
+        async with self._storage_lock:
+            NetworkXStorage.write_nx_graph(graph, file_name, self.workspace)
+        return file_name
 
     async def initialize(self):
         """Initialize storage data"""
@@ -82,17 +374,29 @@ class NetworkXStorage(BaseGraphStorage):
             # Check if data needs to be reloaded
             if self.storage_updated.value:
                 logger.info(
-                    f"[{self.workspace}] Process {os.getpid()} reloading graph {self._graphml_xml_file} due to modifications by another process"
+                    f"[{self.workspace}] Process {os.getpid()} reloading graph {self.namespace} due to modifications by another process"
                 )
                 # Reload data
-                self._graph = (
-                    NetworkXStorage.load_nx_graph(self._graphml_xml_file) or nx.Graph()
-                )
+                self._graph = self._load_graph() or nx.Graph()
+                self._reset_changes()
+                self._label_index = None
                 # Reset update flag
                 self.storage_updated.value = False
 
             return self._graph
 
+    async def _get_label_index(self) -> _LabelIndex:
+        graph = await self._get_graph()
+        if self._label_index is None:
+            self._label_index = _LabelIndex(graph)
+        return self._label_index
+
+    def _refresh_labels(self, graph: nx.Graph, nodes: Iterable[str]) -> None:
+        """Update the label index for nodes that were added, removed or changed degree"""
+        if self._label_index is not None:
+            for node in nodes:
+                self._label_index.refresh(graph, node)
+
     async def has_node(self, node_id: str) -> bool:
         graph = await self._get_graph()
         return graph.has_node(node_id)
@@ -107,7 +411,7 @@ class NetworkXStorage(BaseGraphStorage):
 
     async def node_degree(self, node_id: str) -> int:
         graph = await self._get_graph()
-        return graph.degree(node_id)
+        return graph.degree(node_id) if graph.has_node(node_id) else 0
 
     async def edge_degree(self, src_id: str, tgt_id: str) -> int:
         graph = await self._get_graph()
@@ -136,6 +440,8 @@ class NetworkXStorage(BaseGraphStorage):
         """
         graph = await self._get_graph()
         graph.add_node(node_id, **node_data)
+        self._upserted_nodes.add(node_id)
+        self._refresh_labels(graph, (node_id,))
 
     async def upsert_edge(
         self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
@@ -148,6 +454,22 @@ class NetworkXStorage(BaseGraphStorage):
         """
         graph = await self._get_graph()
         graph.add_edge(source_node_id, target_node_id, **edge_data)
+        self._upserted_edges.add(self._edge_key(source_node_id, target_node_id))
+        self._refresh_labels(graph, (source_node_id, target_node_id))
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        graph = await self._get_graph()
+        graph.add_nodes_from(nodes.items())
+        self._upserted_nodes.update(nodes)
+        self._refresh_labels(graph, nodes)
+
+    async def upsert_edges_batch(
+        self, edges: dict[tuple[str, str], dict[str, str]]
+    ) -> None:
+        graph = await self._get_graph()
+        graph.add_edges_from((src, tgt, data) for (src, tgt), data in edges.items())
+        self._upserted_edges.update(self._edge_key(src, tgt) for src, tgt in edges)
+        self._refresh_labels(graph, {node for edge in edges for node in edge})
 
     async def delete_node(self, node_id: str) -> None:
         """
@@ -158,7 +480,11 @@ class NetworkXStorage(BaseGraphStorage):
         """
         graph = await self._get_graph()
         if graph.has_node(node_id):
+            neighbors = list(graph.neighbors(node_id))
             graph.remove_node(node_id)
+            self._deleted_nodes.add(node_id)
+            self._upserted_nodes.discard(node_id)
+            self._refresh_labels(graph, [node_id, *neighbors])
             logger.debug(f"[{self.workspace}] Node {node_id} deleted from the graph")
         else:
             logger.warning(
@@ -177,9 +503,15 @@ class NetworkXStorage(BaseGraphStorage):
             nodes: List of node IDs to be deleted
         """
         graph = await self._get_graph()
+        affected = set()
         for node in nodes:
             if graph.has_node(node):
+                affected.update(graph.neighbors(node))
+                affected.add(node)
                 graph.remove_node(node)
+                self._deleted_nodes.add(node)
+                self._upserted_nodes.discard(node)
+        self._refresh_labels(graph, affected)
 
     async def remove_edges(self, edges: list[tuple[str, str]]):
         """Delete multiple edges
@@ -196,6 +528,10 @@ class NetworkXStorage(BaseGraphStorage):
         for source, target in edges:
             if graph.has_edge(source, target):
                 graph.remove_edge(source, target)
+                edge_key = self._edge_key(source, target)
+                self._deleted_edges.add(edge_key)
+                self._upserted_edges.discard(edge_key)
+                self._refresh_labels(graph, edge_key)
 
     async def get_all_labels(self) -> list[str]:
         """
@@ -221,14 +557,10 @@ class NetworkXStorage(BaseGraphStorage):
         Returns:
             List of labels sorted by degree (highest first)
         """
-        graph = await self._get_graph()
+        label_index = await self._get_label_index()
 
-        # Get degrees of all nodes and sort by degree descending
-        degrees = dict(graph.degree())
-        sorted_nodes = sorted(degrees.items(), key=lambda x: x[1], reverse=True)
-
-        # Return top labels limited by the specified limit
-        popular_labels = [str(node) for node, _ in sorted_nodes[:limit]]
+        # Top labels by degree from the maintained degree ranking
+        popular_labels = [str(node) for node in label_index.popular(limit)]
 
         logger.debug(
             f"[{self.workspace}] Retrieved {len(popular_labels)} popular labels (limit: {limit})"
@@ -247,44 +579,14 @@ class NetworkXStorage(BaseGraphStorage):
         Returns:
             List of matching labels sorted by relevance
         """
-        graph = await self._get_graph()
         query_lower = query.lower().strip()
 
         if not query_lower:
             return []
 
-        # Collect matching nodes with relevance scores
-        matches = []
-        for node in graph.nodes():
-            node_str = str(node)
-            node_lower = node_str.lower()
-
-            # Skip if no match
-            if query_lower not in node_lower:
-                continue
-
-            # Calculate relevance score
-            # Exact match gets highest score
-            if node_lower == query_lower:
-                score = 1000
-            # Prefix match gets high score
-            elif node_lower.startswith(query_lower):
-                score = 500
-            # Contains match gets base score, with bonus for shorter strings
-            else:
-                # Shorter strings with matches are more relevant
-                score = 100 - len(node_str)
-                # Bonus for word boundary matches
-                if f" {query_lower}" in node_lower or f"_{query_lower}" in node_lower:
-                    score += 50
-
-            matches.append((node_str, score))
-
-        # Sort by relevance score (desc) then alphabetically
-        matches.sort(key=lambda x: (-x[1], x[0]))
-
-        # Return top matches limited by the specified limit
-        search_results = [match[0] for match in matches[:limit]]
+        # Exact, prefix and substring matches ranked by the label index
+        label_index = await self._get_label_index()
+        search_results = label_index.search(query_lower, limit)
 
         logger.debug(
             f"[{self.workspace}] Search query '{query}' returned {len(search_results)} results (limit: {limit})"
@@ -323,19 +625,17 @@ class NetworkXStorage(BaseGraphStorage):
 
         # Handle special case for "*" label
         if node_label == "*":
-            # Get degrees of all nodes
-            degrees = dict(graph.degree())
-            # Sort nodes by degree in descending order and take top max_nodes
-            sorted_nodes = sorted(degrees.items(), key=lambda x: x[1], reverse=True)
+            # Take the top max_nodes nodes by degree from the label index
+            label_index = await self._get_label_index()
 
             # Check if graph is truncated
-            if len(sorted_nodes) > max_nodes:
+            if len(label_index) > max_nodes:
                 result.is_truncated = True
                 logger.info(
-                    f"[{self.workspace}] Graph truncated: {len(sorted_nodes)} nodes found, limited to {max_nodes}"
+                    f"[{self.workspace}] Graph truncated: {len(label_index)} nodes found, limited to {max_nodes}"
                 )
 
-            limited_nodes = [node for node, _ in sorted_nodes[:max_nodes]]
+            limited_nodes = label_index.popular(max_nodes)
             # Create subgraph with the highest degree nodes
             subgraph = graph.subgraph(limited_nodes)
         else:
@@ -507,9 +807,9 @@ class NetworkXStorage(BaseGraphStorage):
                 logger.info(
                     f"[{self.workspace}] Graph was updated by another process, reloading..."
                 )
-                self._graph = (
-                    NetworkXStorage.load_nx_graph(self._graphml_xml_file) or nx.Graph()
-                )
+                self._graph = self._load_graph() or nx.Graph()
+                self._reset_changes()
+                self._label_index = None
                 # Reset update flag
                 self.storage_updated.value = False
                 return False  # Return error
@@ -518,9 +818,7 @@ class NetworkXStorage(BaseGraphStorage):
         async with self._storage_lock:
             try:
                 # Save data to disk
-                NetworkXStorage.write_nx_graph(
-                    self._graph, self._graphml_xml_file, self.workspace
-                )
+                self._save_graph()
                 # Notify other processes that data has been updated
                 await set_all_update_flags(self.final_namespace)
                 # Reset own update flag to avoid self-reloading
@@ -551,7 +849,11 @@ class NetworkXStorage(BaseGraphStorage):
                 # delete _client_file_name
                 if os.path.exists(self._graphml_xml_file):
                     os.remove(self._graphml_xml_file)
+                self._binary_store.remove()
+                self._manifest = None
+                self._reset_changes()
                 self._graph = nx.Graph()
+                self._label_index = None
                 # Notify other processes that data has been updated
                 await set_all_update_flags(self.final_namespace)
                 # Reset own update flag to avoid self-reloading
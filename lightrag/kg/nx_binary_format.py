@@ -0,0 +1,339 @@
+"""
+Compact binary on-disk format for NetworkXStorage graphs.
+
+A graph is stored as one base segment plus an ordered list of delta segments,
+tied together by a small JSON manifest that is replaced atomically on every
+save. Each segment is an uncompressed ``.npz`` archive (no pickling) holding:
+
+* an interned string table (node ids, attribute names and string values),
+  encoded as one UTF-8 blob plus character offsets;
+* node ids and edge endpoints as int32 indexes into the string table;
+* one column per node/edge attribute, typed as str (string index, -1 missing),
+  int, float or bool (with a presence mask).
+
+Delta segments additionally carry deleted node ids and deleted edges. Loading
+applies the base and then every delta in order: deletions first, then upserts,
+where an upserted node or edge record replaces the element's attributes.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from typing import Any, Iterable
+
+import networkx as nx
+import numpy as np
+
+from lightrag.utils import load_json, write_json_atomic
+
+FORMAT_NAME = "lightrag-nx-binary"
+FORMAT_VERSION = 1
+
+_KIND_STR, _KIND_INT, _KIND_FLOAT, _KIND_BOOL = 0, 1, 2, 3
+
+
+class _StringTable:
+    """Interns strings and records them in insertion order"""
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def add(self, value: str) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            idx = len(self.strings)
+            self.index[value] = idx
+            self.strings.append(value)
+        return idx
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        lengths = np.fromiter(
+            (len(s) for s in self.strings), dtype=np.int64, count=len(self.strings)
+        )
+        offsets = np.zeros(len(self.strings) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        blob = np.frombuffer("".join(self.strings).encode("utf-8"), dtype=np.uint8)
+        return {"strings_blob": blob, "strings_offsets": offsets}
+
+
+def _decode_strings(arrays) -> list[str]:
+    text = arrays["strings_blob"].tobytes().decode("utf-8")
+    offsets = arrays["strings_offsets"].tolist()
+    return [text[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def _column_kind(values: Iterable[Any]) -> int:
+    kind = None
+    for value in values:
+        if isinstance(value, bool):
+            value_kind = _KIND_BOOL
+        elif isinstance(value, (int, np.integer)):
+            value_kind = _KIND_INT
+        elif isinstance(value, (float, np.floating)):
+            value_kind = _KIND_FLOAT
+        else:
+            return _KIND_STR
+        if kind is None or kind == value_kind:
+            kind = value_kind
+        elif {kind, value_kind} == {_KIND_INT, _KIND_FLOAT}:
+            kind = _KIND_FLOAT
+        else:
+            return _KIND_STR
+    return _KIND_STR if kind is None else kind
+
+
+def _encode_columns(
+    prefix: str, records: list[dict[str, Any]], table: _StringTable
+) -> dict[str, np.ndarray]:
+    names: list[str] = []
+    seen: set[str] = set()
+    for record in records:
+        for name in record:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+
+    arrays: dict[str, np.ndarray] = {}
+    kinds = []
+    for j, name in enumerate(names):
+        present = [record.get(name) for record in records]
+        kind = _column_kind(v for v in present if v is not None)
+        kinds.append(kind)
+        mask = np.fromiter((v is not None for v in present), dtype=bool)
+        if kind == _KIND_STR:
+            col = np.fromiter(
+                (table.add(str(v)) if v is not None else -1 for v in present),
+                dtype=np.int32,
+                count=len(present),
+            )
+        elif kind == _KIND_INT:
+            col = np.array([v if v is not None else 0 for v in present], np.int64)
+        elif kind == _KIND_FLOAT:
+            col = np.array([v if v is not None else 0.0 for v in present], np.float64)
+        else:
+            col = np.array([bool(v) for v in present], dtype=bool)
+        arrays[f"{prefix}_col_{j}"] = col
+        if kind != _KIND_STR:
+            arrays[f"{prefix}_mask_{j}"] = mask
+
+    arrays[f"{prefix}_attr_names"] = np.array(
+        [table.add(name) for name in names], dtype=np.int32
+    )
+    arrays[f"{prefix}_attr_kinds"] = np.array(kinds, dtype=np.int8)
+    return arrays
+
+
+def _decode_columns(prefix: str, arrays, strings: list[str], count: int):
+    """Return per-row attribute dicts for a node or edge block"""
+    rows: list[dict[str, Any]] = [{} for _ in range(count)]
+    names = arrays[f"{prefix}_attr_names"].tolist()
+    kinds = arrays[f"{prefix}_attr_kinds"].tolist()
+    for j, (name_idx, kind) in enumerate(zip(names, kinds)):
+        name = strings[name_idx]
+        col = arrays[f"{prefix}_col_{j}"]
+        if kind == _KIND_STR:
+            for row, idx in zip(rows, col.tolist()):
+                if idx >= 0:
+                    row[name] = strings[idx]
+        else:
+            mask = arrays[f"{prefix}_mask_{j}"].tolist()
+            for row, value, present in zip(rows, col.tolist(), mask):
+                if present:
+                    row[name] = value
+    return rows
+
+
+def encode_segment(
+    nodes: list[tuple[str, dict[str, Any]]],
+    edges: list[tuple[str, str, dict[str, Any]]],
+    deleted_nodes: Iterable[str] = (),
+    deleted_edges: Iterable[tuple[str, str]] = (),
+) -> bytes:
+    """Serialize nodes, edges and deletions into the bytes of one segment"""
+    table = _StringTable()
+    arrays: dict[str, np.ndarray] = {
+        "node_ids": np.array([table.add(n) for n, _ in nodes], dtype=np.int32),
+        "edge_src": np.array([table.add(u) for u, _, _ in edges], dtype=np.int32),
+        "edge_tgt": np.array([table.add(v) for _, v, _ in edges], dtype=np.int32),
+        "deleted_nodes": np.array([table.add(n) for n in deleted_nodes], np.int32),
+    }
+    deleted_edges = list(deleted_edges)
+    arrays["deleted_edge_src"] = np.array(
+        [table.add(u) for u, _ in deleted_edges], dtype=np.int32
+    )
+    arrays["deleted_edge_tgt"] = np.array(
+        [table.add(v) for _, v in deleted_edges], dtype=np.int32
+    )
+    arrays.update(_encode_columns("node", [data for _, data in nodes], table))
+    arrays.update(_encode_columns("edge", [data for _, _, data in edges], table))
+    arrays.update(table.to_arrays())
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def apply_segment(graph: nx.Graph, file_name: str) -> None:
+    """Apply a base or delta segment file to graph in place"""
+    with np.load(file_name, allow_pickle=False) as arrays:
+        strings = _decode_strings(arrays)
+
+        for idx in arrays["deleted_nodes"].tolist():
+            node_id = strings[idx]
+            if graph.has_node(node_id):
+                graph.remove_node(node_id)
+        for src, tgt in zip(
+            arrays["deleted_edge_src"].tolist(), arrays["deleted_edge_tgt"].tolist()
+        ):
+            if graph.has_edge(strings[src], strings[tgt]):
+                graph.remove_edge(strings[src], strings[tgt])
+
+        node_ids = [strings[i] for i in arrays["node_ids"].tolist()]
+        node_attrs = _decode_columns("node", arrays, strings, len(node_ids))
+        if graph.number_of_nodes() == 0:
+            graph.add_nodes_from(zip(node_ids, node_attrs))
+        else:
+            for node_id, attrs in zip(node_ids, node_attrs):
+                if graph.has_node(node_id):
+                    graph.nodes[node_id].clear()
+                graph.add_node(node_id, **attrs)
+
+        edge_src = arrays["edge_src"].tolist()
+        edge_tgt = arrays["edge_tgt"].tolist()
+        edge_attrs = _decode_columns("edge", arrays, strings, len(edge_src))
+        for src, tgt, attrs in zip(edge_src, edge_tgt, edge_attrs):
+            u, v = strings[src], strings[tgt]
+            if graph.has_edge(u, v):
+                graph.edges[u, v].clear()
+            graph.add_edge(u, v, **attrs)
+
+
+def _write_bytes_atomic(data: bytes, file_name: str) -> None:
+    tmp_file_name = f"{file_name}.tmp"
+    with open(tmp_file_name, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file_name, file_name)
+
+
+class BinaryGraphStore:
+    """Manifest, base and delta segment files of one graph namespace"""
+
+    def __init__(self, directory: str, prefix: str):
+        self.directory = directory
+        self.prefix = prefix
+        self.manifest_file = os.path.join(directory, f"{prefix}.manifest.json")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def read_manifest(self) -> dict[str, Any] | None:
+        manifest = load_json(self.manifest_file)
+        if manifest is None:
+            return None
+        if manifest.get("format") != FORMAT_NAME:
+            raise ValueError(f"{self.manifest_file} is not a {FORMAT_NAME} manifest")
+        return manifest
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_file)
+
+    def load(
+        self, graph: nx.Graph | None = None, manifest: dict[str, Any] | None = None
+    ) -> tuple[nx.Graph | None, dict[str, Any] | None]:
+        """Load the graph described by the manifest
+
+        If ``graph`` was loaded from an earlier state of the same base segment,
+        only the delta segments it has not seen yet are applied to it.
+        """
+        current = self.read_manifest()
+        if current is None:
+            return None, None
+
+        if (
+            graph is not None
+            and manifest is not None
+            and manifest["base"] == current["base"]
+            and current["deltas"][: len(manifest["deltas"])] == manifest["deltas"]
+        ):
+            pending = current["deltas"][len(manifest["deltas"]) :]
+        else:
+            graph = nx.Graph()
+            apply_segment(graph, self._path(current["base"]))
+            pending = current["deltas"]
+
+        for delta in pending:
+            apply_segment(graph, self._path(delta))
+        return graph, current
+
+    def segment_bytes(self, manifest: dict[str, Any]) -> tuple[int, int]:
+        """Return (base size, total delta size) in bytes"""
+        base = os.path.getsize(self._path(manifest["base"]))
+        deltas = sum(os.path.getsize(self._path(d)) for d in manifest["deltas"])
+        return base, deltas
+
+    def _commit(self, manifest: dict[str, Any], obsolete: list[str]) -> None:
+        write_json_atomic(manifest, self.manifest_file)
+        for name in obsolete:
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+
+    def write_base(
+        self, graph: nx.Graph, manifest: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Write the full graph as a new base segment and drop all deltas"""
+        generation = manifest["generation"] + 1 if manifest else 1
+        name = f"{self.prefix}.g{generation}.base.npz"
+        data = encode_segment(
+            list(graph.nodes(data=True)), list(graph.edges(data=True))
+        )
+        _write_bytes_atomic(data, self._path(name))
+
+        new_manifest = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "generation": generation,
+            "base": name,
+            "deltas": [],
+        }
+        obsolete = [manifest["base"], *manifest["deltas"]] if manifest else []
+        self._commit(new_manifest, obsolete)
+        return new_manifest
+
+    def append_delta(
+        self,
+        graph: nx.Graph,
+        manifest: dict[str, Any],
+        upserted_nodes: Iterable[str],
+        upserted_edges: Iterable[tuple[str, str]],
+        deleted_nodes: Iterable[str],
+        deleted_edges: Iterable[tuple[str, str]],
+    ) -> dict[str, Any]:
+        """Write the current state of changed elements as a new delta segment"""
+        nodes = [(n, graph.nodes[n]) for n in upserted_nodes]
+        edges = [(u, v, graph.edges[u, v]) for u, v in upserted_edges]
+        index = len(manifest["deltas"]) + 1
+        name = f"{self.prefix}.g{manifest['generation']}.delta{index}.npz"
+        data = encode_segment(nodes, edges, deleted_nodes, deleted_edges)
+        _write_bytes_atomic(data, self._path(name))
+
+        new_manifest = dict(manifest, deltas=[*manifest["deltas"], name])
+        self._commit(new_manifest, [])
+        return new_manifest
+
+    def remove(self) -> None:
+        """Delete the manifest and every segment it references"""
+        manifest = load_json(self.manifest_file)
+        names = [manifest["base"], *manifest["deltas"]] if manifest else []
+        if os.path.exists(self.manifest_file):
+            os.remove(self.manifest_file)
+        for name in names:
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
@@ -9,6 +9,7 @@ from typing import Any, Awaitable, Callable, TypeVar, Union, final
 import numpy as np
 import configparser
 import ssl
+import struct
 import itertools
 
 from lightrag.types import KnowledgeGraph, KnowledgeGraphNode, KnowledgeGraphEdge
@@ -53,6 +54,20 @@ load_dotenv(dotenv_path=".env", override=False)
 T = TypeVar("T")
 
 
+def _encode_vector(value: Any) -> bytes:
+    """Encode a vector in pgvector's binary format: dim, unused, big-endian float32s"""
+    if isinstance(value, str):
+        value = json.loads(value)
+    vector = np.asarray(value, dtype=">f4")
+    return struct.pack(">HH", vector.shape[0], 0) + vector.tobytes()
+
+
+def _decode_vector(data: bytes) -> list[float]:
+    """Decode pgvector's binary format into a list of floats"""
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=4).tolist()
+
+
 class PostgreSQLDB:
     def __init__(self, config: dict[str, Any], **kwargs: Any):
         self.host = config["host"]
@@ -84,6 +99,9 @@ class PostgreSQLDB:
         # Statement LRU cache size (keep as-is, allow None for optional configuration)
         self.statement_cache_size = config.get("statement_cache_size")
 
+        # Rows sent per executemany round trip by bulk upserts
+        self.write_batch_size = max(1, int(config.get("write_batch_size", 1000)))
+
         if self.user is None or self.password is None or self.database is None:
             raise ValueError("Missing database user, password, or database")
 
@@ -199,6 +217,7 @@ class PostgreSQLDB:
             "port": self.port,
             "min_size": 1,
             "max_size": self.max,
+            "init": self.register_vector_codec,
         }
 
         # Only add statement_cache_size if it's configured
@@ -254,6 +273,9 @@ class PostgreSQLDB:
             try:
                 async with pool.acquire() as connection:
                     await self.configure_vector_extension(connection)
+                    # The extension may have just been created after this
+                    # connection's init ran
+                    await self.register_vector_codec(connection)
             except Exception:
                 await pool.close()
                 raise
@@ -375,6 +397,26 @@ class PostgreSQLDB:
             logger.warning(f"Could not create VECTOR extension: {e}")
             # Don't raise - let the system continue without vector extension
 
+    @staticmethod
+    async def register_vector_codec(connection: asyncpg.Connection) -> None:
+        """Exchange pgvector values in binary format instead of decimal text.
+
+        Vector parameters accept numpy arrays or lists, vector columns decode to lists of floats.
+        """
+        schema = await connection.fetchval(  # type: ignore
+            "SELECT n.nspname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace WHERE t.typname = 'vector'"
+        )
+        if schema is None:
+            # VECTOR extension not installed yet
+            return
+        await connection.set_type_codec(  # type: ignore
+            "vector",
+            schema=schema,
+            encoder=_encode_vector,
+            decoder=_decode_vector,
+            format="binary",
+        )
+
     @staticmethod
     async def configure_age_extension(connection: asyncpg.Connection) -> None:
         """Create AGE extension if it doesn't exist for graph operations."""
@@ -1449,13 +1491,30 @@ class PostgreSQLDB:
         multirows: bool = False,
         with_age: bool = False,
         graph_name: str | None = None,
+        settings: dict[str, Any] | None = None,
     ) -> dict[str, Any] | None | list[dict[str, Any]]:
-        async def _operation(connection: asyncpg.Connection) -> Any:
+        """Run a query and return its rows as dicts.
+
+        ``settings`` are configuration parameters (e.g. ``hnsw.ef_search``) applied
+        with ``SET LOCAL`` semantics, i.e. only for the duration of this query.
+        """
+
+        async def _fetch(connection: asyncpg.Connection) -> list[asyncpg.Record]:
             prepared_params = tuple(params) if params else ()
             if prepared_params:
-                rows = await connection.fetch(sql, *prepared_params)
+                return await connection.fetch(sql, *prepared_params)
+            return await connection.fetch(sql)
+
+        async def _operation(connection: asyncpg.Connection) -> Any:
+            if settings:
+                async with connection.transaction():
+                    for name, value in settings.items():
+                        await connection.execute(
+                            "SELECT set_config($1, $2, true)", name, str(value)
+                        )
+                    rows = await _fetch(connection)
             else:
-                rows = await connection.fetch(sql)
+                rows = await _fetch(connection)
 
             if multirows:
                 if rows:
@@ -1516,6 +1575,41 @@ class PostgreSQLDB:
             logger.error(f"PostgreSQL database,\nsql:{sql},\ndata:{data},\nerror:{e}")
             raise
 
+    async def executemany(
+        self,
+        sql: str,
+        data: list[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> None:
+        """Execute a statement for many parameter sets with one prepared statement.
+
+        Rows are sent in batches of ``batch_size`` (default ``write_batch_size``);
+        each batch is pipelined in a single round trip and applied in its own
+        transaction, so a retried batch never leaves a partial write behind.
+        """
+        if not data:
+            return
+        batch_size = batch_size or self.write_batch_size
+
+        for start in range(0, len(data), batch_size):
+            records = [
+                tuple(item.values()) for item in data[start : start + batch_size]
+            ]
+
+            async def _operation(
+                connection: asyncpg.Connection, records: list[tuple] = records
+            ) -> None:
+                async with connection.transaction():
+                    await connection.executemany(sql, records)
+
+            try:
+                await self._run_with_retry(_operation)
+            except Exception as e:
+                logger.error(
+                    f"PostgreSQL database,\nsql:{sql},\nrows:{len(records)},\nerror:{e}"
+                )
+                raise
+
 
 class ClientManager:
     _instances: dict[str, Any] = {"db": None, "ref_count": 0}
@@ -1648,6 +1742,12 @@ class ClientManager:
                     )
                 ),
             ),
+            "write_batch_size": int(
+                os.environ.get(
+                    "POSTGRES_WRITE_BATCH_SIZE",
+                    config.get("postgres", "write_batch_size", fallback="1000"),
+                )
+            ),
         }
 
     @classmethod
@@ -1815,6 +1915,24 @@ class PGKVStorage(BaseKVStorage):
             response["create_time"] = create_time
             response["update_time"] = create_time if update_time == 0 else update_time
 
+        # Special handling for CHUNK_EXTRACTIONS namespace
+        if response and is_namespace(
+            self.namespace, NameSpace.KV_STORE_CHUNK_EXTRACTIONS
+        ):
+            # Parse entities/relations JSON strings back to dict/list
+            for field, default in (("entities", {}), ("relations", [])):
+                value = response.get(field, default)
+                if isinstance(value, str):
+                    try:
+                        value = json.loads(value)
+                    except json.JSONDecodeError:
+                        value = default
+                response[field] = value
+            create_time = response.get("create_time", 0)
+            update_time = response.get("update_time", 0)
+            response["create_time"] = create_time
+            response["update_time"] = create_time if update_time == 0 else update_time
+
         return response if response else None
 
     # Query by id
@@ -1955,6 +2073,25 @@ class PGKVStorage(BaseKVStorage):
                 result["create_time"] = create_time
                 result["update_time"] = create_time if update_time == 0 else update_time
 
+        # Special handling for CHUNK_EXTRACTIONS namespace
+        if results and is_namespace(
+            self.namespace, NameSpace.KV_STORE_CHUNK_EXTRACTIONS
+        ):
+            for result in results:
+                # Parse entities/relations JSON strings back to dict/list
+                for field, default in (("entities", {}), ("relations", [])):
+                    value = result.get(field, default)
+                    if isinstance(value, str):
+                        try:
+                            value = json.loads(value)
+                        except json.JSONDecodeError:
+                            value = default
+                    result[field] = value
+                create_time = result.get("create_time", 0)
+                update_time = result.get("update_time", 0)
+                result["create_time"] = create_time
+                result["update_time"] = create_time if update_time == 0 else update_time
+
         return _order_results(results)
 
     async def filter_keys(self, keys: set[str]) -> set[str]:
@@ -1985,11 +2122,13 @@ class PGKVStorage(BaseKVStorage):
         if not data:
             return
 
+        # Rows are collected and written with executemany in batches
+        records: list[dict[str, Any]] = []
         if is_namespace(self.namespace, NameSpace.KV_STORE_TEXT_CHUNKS):
             # Get current UTC time and convert to naive datetime for database storage
             current_time = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
+            upsert_sql = SQL_TEMPLATES["upsert_text_chunk"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_text_chunk"]
                 _data = {
                     "workspace": self.workspace,
                     "id": k,
@@ -2002,20 +2141,20 @@ class PGKVStorage(BaseKVStorage):
                     "create_time": current_time,
                     "update_time": current_time,
                 }
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_FULL_DOCS):
+            upsert_sql = SQL_TEMPLATES["upsert_doc_full"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_doc_full"]
                 _data = {
                     "id": k,
                     "content": v["content"],
                     "doc_name": v.get("file_path", ""),  # Map file_path to doc_name
                     "workspace": self.workspace,
                 }
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_LLM_RESPONSE_CACHE):
+            upsert_sql = SQL_TEMPLATES["upsert_llm_response_cache"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_llm_response_cache"]
                 _data = {
                     "workspace": self.workspace,
                     "id": k,  # Use flattened key as id
@@ -2030,12 +2169,12 @@ class PGKVStorage(BaseKVStorage):
                     else None,
                 }
 
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_FULL_ENTITIES):
             # Get current UTC time and convert to naive datetime for database storage
             current_time = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
+            upsert_sql = SQL_TEMPLATES["upsert_full_entities"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_full_entities"]
                 _data = {
                     "workspace": self.workspace,
                     "id": k,
@@ -2044,12 +2183,12 @@ class PGKVStorage(BaseKVStorage):
                     "create_time": current_time,
                     "update_time": current_time,
                 }
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_FULL_RELATIONS):
             # Get current UTC time and convert to naive datetime for database storage
             current_time = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
+            upsert_sql = SQL_TEMPLATES["upsert_full_relations"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_full_relations"]
                 _data = {
                     "workspace": self.workspace,
                     "id": k,
@@ -2058,12 +2197,12 @@ class PGKVStorage(BaseKVStorage):
                     "create_time": current_time,
                     "update_time": current_time,
                 }
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_ENTITY_CHUNKS):
             # Get current UTC time and convert to naive datetime for database storage
             current_time = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
+            upsert_sql = SQL_TEMPLATES["upsert_entity_chunks"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_entity_chunks"]
                 _data = {
                     "workspace": self.workspace,
                     "id": k,
@@ -2072,12 +2211,12 @@ class PGKVStorage(BaseKVStorage):
                     "create_time": current_time,
                     "update_time": current_time,
                 }
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_RELATION_CHUNKS):
             # Get current UTC time and convert to naive datetime for database storage
             current_time = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
+            upsert_sql = SQL_TEMPLATES["upsert_relation_chunks"]
             for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_relation_chunks"]
                 _data = {
                     "workspace": self.workspace,
                     "id": k,
@@ -2086,7 +2225,26 @@ class PGKVStorage(BaseKVStorage):
                     "create_time": current_time,
                     "update_time": current_time,
                 }
-                await self.db.execute(upsert_sql, _data)
+                records.append(_data)
+        elif is_namespace(self.namespace, NameSpace.KV_STORE_CHUNK_EXTRACTIONS):
+            # Get current UTC time and convert to naive datetime for database storage
+            current_time = datetime.datetime.now(timezone.utc).replace(tzinfo=None)
+            upsert_sql = SQL_TEMPLATES["upsert_chunk_extractions"]
+            for k, v in data.items():
+                _data = {
+                    "workspace": self.workspace,
+                    "id": k,
+                    "version": v["version"],
+                    "file_path": v.get("file_path"),
+                    "entities": json.dumps(v["entities"]),
+                    "relations": json.dumps(v["relations"]),
+                    "create_time": current_time,
+                    "update_time": current_time,
+                }
+                records.append(_data)
+
+        if records:
+            await self.db.executemany(upsert_sql, records)
 
     async def index_done_callback(self) -> None:
         # PG handles persistence automatically
@@ -2214,7 +2372,7 @@ class PGVectorStorage(BaseVectorStorage):
                 "chunk_order_index": item["chunk_order_index"],
                 "full_doc_id": item["full_doc_id"],
                 "content": item["content"],
-                "content_vector": json.dumps(item["__vector__"].tolist()),
+                "content_vector": item["__vector__"],
                 "file_path": item["file_path"],
                 "create_time": current_time,
                 "update_time": current_time,
@@ -2242,7 +2400,7 @@ class PGVectorStorage(BaseVectorStorage):
             "id": item["__id__"],
             "entity_name": item["entity_name"],
             "content": item["content"],
-            "content_vector": json.dumps(item["__vector__"].tolist()),
+            "content_vector": item["__vector__"],
             "chunk_ids": chunk_ids,
             "file_path": item.get("file_path", None),
             "create_time": current_time,
@@ -2266,7 +2424,7 @@ class PGVectorStorage(BaseVectorStorage):
             "source_id": item["src_id"],
             "target_id": item["tgt_id"],
             "content": item["content"],
-            "content_vector": json.dumps(item["__vector__"].tolist()),
+            "content_vector": item["__vector__"],
             "chunk_ids": chunk_ids,
             "file_path": item.get("file_path", None),
             "create_time": current_time,
@@ -2297,9 +2455,11 @@ class PGVectorStorage(BaseVectorStorage):
         embedding_tasks = [self.embedding_func(batch) for batch in batches]
         embeddings_list = await asyncio.gather(*embedding_tasks)
 
-        embeddings = np.concatenate(embeddings_list)
+        # Vectors are sent as float32 through the binary pgvector codec
+        embeddings = np.concatenate(embeddings_list).astype(np.float32, copy=False)
         for i, d in enumerate(list_data):
             d["__vector__"] = embeddings[i]
+        records: list[dict[str, Any]] = []
         for item in list_data:
             if is_namespace(self.namespace, NameSpace.VECTOR_STORE_CHUNKS):
                 upsert_sql, data = self._upsert_chunks(item, current_time)
@@ -2309,12 +2469,17 @@ class PGVectorStorage(BaseVectorStorage):
                 upsert_sql, data = self._upsert_relationships(item, current_time)
             else:
                 raise ValueError(f"{self.namespace} is not supported")
+            records.append(data)
 
-            await self.db.execute(upsert_sql, data)
+        await self.db.executemany(upsert_sql, records)
 
     #################### query method ###############
     async def query(
-        self, query: str, top_k: int, query_embedding: list[float] = None
+        self,
+        query: str,
+        top_k: int,
+        query_embedding: list[float] = None,
+        search_params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         if query_embedding is not None:
             embedding = query_embedding
@@ -2324,17 +2489,36 @@ class PGVectorStorage(BaseVectorStorage):
             )  # higher priority for query
             embedding = embeddings[0]
 
-        embedding_string = ",".join(map(str, embedding))
-
-        sql = SQL_TEMPLATES[self.namespace].format(embedding_string=embedding_string)
+        # The vector is a bound parameter sent through the binary pgvector codec, so
+        # the SQL text is constant per namespace and asyncpg reuses the prepared
+        # statement cached on each pooled connection
+        sql = SQL_TEMPLATES[self.namespace]
         params = {
             "workspace": self.workspace,
             "closer_than_threshold": 1 - self.cosine_better_than_threshold,
             "top_k": top_k,
+            "embedding": np.asarray(embedding, dtype=np.float32),
         }
-        results = await self.db.query(sql, params=list(params.values()), multirows=True)
+        results = await self.db.query(
+            sql,
+            params=list(params.values()),
+            multirows=True,
+            settings=self._search_settings(search_params),
+        )
         return results
 
+    @staticmethod
+    def _search_settings(search_params: dict[str, Any] | None) -> dict[str, int]:
+        """Map per-query search options to pgvector configuration parameters"""
+        if not search_params:
+            return {}
+        settings = {}
+        if search_params.get("ef_search"):
+            settings["hnsw.ef_search"] = int(search_params["ef_search"])
+        if search_params.get("nprobe"):
+            settings["ivfflat.probes"] = int(search_params["nprobe"])
+        return settings
+
     async def index_done_callback(self) -> None:
         # PG handles persistence automatically
         pass
@@ -2518,8 +2702,10 @@ class PGVectorStorage(BaseVectorStorage):
             for result in results:
                 if result and "content_vector" in result and "id" in result:
                     try:
-                        # Parse JSON string to get vector as list of floats
-                        vector_data = json.loads(result["content_vector"])
+                        # Decoded by the pgvector codec; parse the text form otherwise
+                        vector_data = result["content_vector"]
+                        if isinstance(vector_data, str):
+                            vector_data = json.loads(vector_data)
                         if isinstance(vector_data, list):
                             vectors_dict[result["id"]] = vector_data
                     except (json.JSONDecodeError, TypeError) as e:
@@ -2534,6 +2720,55 @@ class PGVectorStorage(BaseVectorStorage):
             )
             return {}
 
+    async def top_k_by_ids(
+        self, query_embedding, ids: list[str], top_k: int
+    ) -> list[tuple[str, float]]:
+        """Rank the given IDs by cosine similarity with pgvector, inside the database
+
+        Args:
+            query_embedding: The query vector
+            ids: List of unique identifiers to rank, IDs without a vector are skipped
+            top_k: Maximum number of results
+
+        Returns:
+            Up to top_k (id, similarity) pairs, highest similarity first
+        """
+        if not ids or top_k <= 0:
+            return []
+
+        table_name = namespace_to_table_name(self.namespace)
+        if not table_name:
+            logger.error(
+                f"[{self.workspace}] Unknown namespace for vector ranking: {self.namespace}"
+            )
+            return []
+
+        # Materialize the candidates first so the planner cannot answer the ORDER BY
+        # from an approximate vector index, which may drop candidates
+        sql = f"""WITH candidates AS MATERIALIZED (
+                    SELECT id, content_vector <=> $3::vector AS distance
+                    FROM {table_name}
+                    WHERE workspace = $1 AND id = ANY($2)
+                  )
+                  SELECT id, 1 - distance AS similarity
+                  FROM candidates
+                  ORDER BY distance
+                  LIMIT $4"""
+        params = {
+            "workspace": self.workspace,
+            "ids": ids,
+            "embedding": np.asarray(query_embedding, dtype=np.float32),
+            "top_k": top_k,
+        }
+        try:
+            results = await self.db.query(sql, list(params.values()), multirows=True)
+        except Exception as e:
+            logger.warning(
+                f"[{self.workspace}] Ranking by IDs in {self.namespace} failed, scoring client side: {e}"
+            )
+            return await super().top_k_by_ids(query_embedding, ids, top_k)
+        return [(row["id"], float(row["similarity"])) for row in results or []]
+
     async def drop(self) -> dict[str, str]:
         """Drop the storage"""
         async with get_storage_lock():
@@ -3706,6 +3941,94 @@ class PGGraphStorage(BaseGraphStorage):
             )
             raise
 
+    async def _execute_cypher_batch(self, queries: list[str]) -> None:
+        """Run write cypher statements in chunks of ``write_batch_size``.
+
+        AGE cannot bind parameters inside a cypher call, so the statements of a
+        chunk are sent together as one multi-statement query: a single round
+        trip, applied atomically in an implicit transaction.
+        """
+        batch_size = self.db.write_batch_size
+        for start in range(0, len(queries), batch_size):
+            await self._query(
+                ";\n".join(queries[start : start + batch_size]), readonly=False
+            )
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Upsert many nodes with one round trip per chunk of nodes.
+
+        Args:
+            nodes: Dictionary mapping node IDs to their properties
+        """
+        queries = []
+        for node_id, node_data in nodes.items():
+            if "entity_id" not in node_data:
+                raise ValueError(
+                    "PostgreSQL: node properties must contain an 'entity_id' field"
+                )
+            queries.append(
+                """SELECT * FROM cypher('%s', $$
+                     MERGE (n:base {entity_id: "%s"})
+                     SET n += %s
+                     RETURN n
+                   $$) AS (n agtype)"""
+                % (
+                    self.graph_name,
+                    self._normalize_node_id(node_id),
+                    self._format_properties(node_data),
+                )
+            )
+
+        try:
+            await self._execute_cypher_batch(queries)
+        except PGGraphQueryException as e:
+            # A concurrent MERGE may violate uniqueness and abort the whole chunk;
+            # upsert_node treats that case as success, so replay node by node.
+            logger.warning(
+                f"[{self.workspace}] POSTGRES, batch node upsert failed, retrying one by one: {e.__cause__!r}"
+            )
+            await super().upsert_nodes_batch(nodes)
+
+    async def upsert_edges_batch(
+        self, edges: dict[tuple[str, str], dict[str, str]]
+    ) -> None:
+        """
+        Upsert many edges with one round trip per chunk of edges.
+
+        Args:
+            edges: Dictionary mapping (source_id, target_id) pairs to edge properties
+        """
+        queries = []
+        for (source_node_id, target_node_id), edge_data in edges.items():
+            edge_properties = self._format_properties(edge_data)
+            queries.append(
+                """SELECT * FROM cypher('%s', $$
+                     MATCH (source:base {entity_id: "%s"})
+                     WITH source
+                     MATCH (target:base {entity_id: "%s"})
+                     MERGE (source)-[r:DIRECTED]-(target)
+                     SET r += %s
+                     SET r += %s
+                     RETURN r
+                   $$) AS (r agtype)"""
+                % (
+                    self.graph_name,
+                    self._normalize_node_id(source_node_id),
+                    self._normalize_node_id(target_node_id),
+                    edge_properties,
+                    edge_properties,  # see upsert_edge
+                )
+            )
+
+        try:
+            await self._execute_cypher_batch(queries)
+        except PGGraphQueryException as e:
+            logger.warning(
+                f"[{self.workspace}] POSTGRES, batch edge upsert failed, retrying one by one: {e.__cause__!r}"
+            )
+            await super().upsert_edges_batch(edges)
+
     async def delete_node(self, node_id: str) -> None:
         """
         Delete a node from the graph.
@@ -4740,6 +5063,7 @@ NAMESPACE_TABLE_MAP = {
     NameSpace.KV_STORE_FULL_RELATIONS: "LIGHTRAG_FULL_RELATIONS",
     NameSpace.KV_STORE_ENTITY_CHUNKS: "LIGHTRAG_ENTITY_CHUNKS",
     NameSpace.KV_STORE_RELATION_CHUNKS: "LIGHTRAG_RELATION_CHUNKS",
+    NameSpace.KV_STORE_CHUNK_EXTRACTIONS: "LIGHTRAG_CHUNK_EXTRACTIONS",
     NameSpace.KV_STORE_LLM_RESPONSE_CACHE: "LIGHTRAG_LLM_CACHE",
     NameSpace.VECTOR_STORE_CHUNKS: "LIGHTRAG_VDB_CHUNKS",
     NameSpace.VECTOR_STORE_ENTITIES: "LIGHTRAG_VDB_ENTITY",
@@ -4902,6 +5226,19 @@ TABLES = {
                     CONSTRAINT LIGHTRAG_RELATION_CHUNKS_PK PRIMARY KEY (workspace, id)
                     )"""
     },
+    "LIGHTRAG_CHUNK_EXTRACTIONS": {
+        "ddl": """CREATE TABLE LIGHTRAG_CHUNK_EXTRACTIONS (
+                    id VARCHAR(255),
+                    workspace VARCHAR(255),
+                    version INTEGER,
+                    file_path TEXT NULL,
+                    entities JSONB,
+                    relations JSONB,
+                    create_time TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
+                    update_time TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
+                    CONSTRAINT LIGHTRAG_CHUNK_EXTRACTIONS_PK PRIMARY KEY (workspace, id)
+                    )"""
+    },
 }
 
 
@@ -4979,6 +5316,16 @@ SQL_TEMPLATES = {
                                  EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
                                  FROM LIGHTRAG_RELATION_CHUNKS WHERE workspace=$1 AND id = ANY($2)
                                 """,
+    "get_by_id_chunk_extractions": """SELECT id, version, file_path, entities, relations,
+                                EXTRACT(EPOCH FROM create_time)::BIGINT as create_time,
+                                EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
+                                FROM LIGHTRAG_CHUNK_EXTRACTIONS WHERE workspace=$1 AND id=$2
+                               """,
+    "get_by_ids_chunk_extractions": """SELECT id, version, file_path, entities, relations,
+                                 EXTRACT(EPOCH FROM create_time)::BIGINT as create_time,
+                                 EXTRACT(EPOCH FROM update_time)::BIGINT as update_time
+                                 FROM LIGHTRAG_CHUNK_EXTRACTIONS WHERE workspace=$1 AND id = ANY($2)
+                                """,
     "filter_keys": "SELECT id FROM {table_name} WHERE workspace=$1 AND id IN ({ids})",
     "upsert_doc_full": """INSERT INTO LIGHTRAG_DOC_FULL (id, content, doc_name, workspace)
                         VALUES ($1, $2, $3, $4)
@@ -5042,6 +5389,16 @@ SQL_TEMPLATES = {
                       count=EXCLUDED.count,
                       update_time = EXCLUDED.update_time
                      """,
+    "upsert_chunk_extractions": """INSERT INTO LIGHTRAG_CHUNK_EXTRACTIONS (workspace, id, version, file_path,
+                      entities, relations, create_time, update_time)
+                      VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                      ON CONFLICT (workspace,id) DO UPDATE
+                      SET version=EXCLUDED.version,
+                      file_path=EXCLUDED.file_path,
+                      entities=EXCLUDED.entities,
+                      relations=EXCLUDED.relations,
+                      update_time = EXCLUDED.update_time
+                     """,
     # SQL for VectorStorage
     "upsert_chunk": """INSERT INTO LIGHTRAG_VDB_CHUNKS (workspace, id, tokens,
                       chunk_order_index, full_doc_id, content, content_vector, file_path,
@@ -5085,8 +5442,8 @@ SQL_TEMPLATES = {
                             EXTRACT(EPOCH FROM r.create_time)::BIGINT AS created_at
                      FROM LIGHTRAG_VDB_RELATION r
                      WHERE r.workspace = $1
-                       AND r.content_vector <=> '[{embedding_string}]'::vector < $2
-                     ORDER BY r.content_vector <=> '[{embedding_string}]'::vector
+                       AND r.content_vector <=> $4::vector < $2
+                     ORDER BY r.content_vector <=> $4::vector
                      LIMIT $3;
                      """,
     "entities": """
@@ -5094,8 +5451,8 @@ SQL_TEMPLATES = {
                        EXTRACT(EPOCH FROM e.create_time)::BIGINT AS created_at
                 FROM LIGHTRAG_VDB_ENTITY e
                 WHERE e.workspace = $1
-                  AND e.content_vector <=> '[{embedding_string}]'::vector < $2
-                ORDER BY e.content_vector <=> '[{embedding_string}]'::vector
+                  AND e.content_vector <=> $4::vector < $2
+                ORDER BY e.content_vector <=> $4::vector
                 LIMIT $3;
                 """,
     "chunks": """
@@ -5105,8 +5462,8 @@ SQL_TEMPLATES = {
                      EXTRACT(EPOCH FROM c.create_time)::BIGINT AS created_at
               FROM LIGHTRAG_VDB_CHUNKS c
               WHERE c.workspace = $1
-                AND c.content_vector <=> '[{embedding_string}]'::vector < $2
-              ORDER BY c.content_vector <=> '[{embedding_string}]'::vector
+                AND c.content_vector <=> $4::vector < $2
+              ORDER BY c.content_vector <=> $4::vector
               LIMIT $3;
               """,
     # DROP tables
@@ -13,12 +13,12 @@ from typing import (
     Any,
     AsyncIterator,
     Callable,
+    Iterable,
     Iterator,
     cast,
     final,
     Literal,
     Optional,
-    List,
     Dict,
 )
 from lightrag.prompt import PROMPTS
@@ -38,8 +38,10 @@ from lightrag.constants import (
     DEFAULT_SUMMARY_MAX_TOKENS,
     DEFAULT_SUMMARY_CONTEXT_SIZE,
     DEFAULT_SUMMARY_LENGTH_RECOMMENDED,
+    DEFAULT_SUMMARY_MAX_PARALLEL,
     DEFAULT_MAX_ASYNC,
     DEFAULT_MAX_PARALLEL_INSERT,
+    DEFAULT_MERGE_WRITE_BATCH_SIZE,
     DEFAULT_MAX_GRAPH_NODES,
     DEFAULT_MAX_SOURCE_IDS_PER_ENTITY,
     DEFAULT_MAX_SOURCE_IDS_PER_RELATION,
@@ -64,6 +66,8 @@ from lightrag.kg.shared_storage import (
     get_pipeline_status_lock,
     get_graph_db_lock,
     get_data_init_lock,
+    get_update_flag,
+    set_all_update_flags,
 )
 
 from lightrag.base import (
@@ -82,7 +86,7 @@ from lightrag.base import (
 )
 from lightrag.namespace import NameSpace
 from lightrag.operate import (
-    chunking_by_token_size,
+    iter_chunks_by_token_size,
     extract_entities,
     merge_nodes_and_edges,
     kg_query,
@@ -98,6 +102,8 @@ from lightrag.utils import (
     compute_mdhash_id,
     lazy_external_import,
     priority_limit_async_func_call,
+    coalesce_async_embedding_calls,
+    close_shared_clients,
     get_content_summary,
     sanitize_text_for_encoding,
     check_storage_env_vars,
@@ -107,6 +113,7 @@ from lightrag.utils import (
     subtract_source_ids,
     make_relation_chunk_key,
     normalize_source_ids_limit_method,
+    SemanticQueryCache,
 )
 from lightrag.types import KnowledgeGraph
 from dotenv import load_dotenv
@@ -243,8 +250,8 @@ class LightRAG:
             int,
             int,
         ],
-        List[Dict[str, Any]],
-    ] = field(default_factory=lambda: chunking_by_token_size)
+        Iterable[Dict[str, Any]],
+    ] = field(default_factory=lambda: iter_chunks_by_token_size)
     """
     Custom chunking function for splitting text into chunks before processing.
 
@@ -257,11 +264,11 @@ class LightRAG:
         - `chunk_token_size`: The maximum number of tokens per chunk.
         - `chunk_overlap_token_size`: The number of overlapping tokens between consecutive chunks.
 
-    The function should return a list of dictionaries, where each dictionary contains the following keys:
+    The function should return a list of dictionaries (or a generator yielding them), where each dictionary contains the following keys:
         - `tokens`: The number of tokens in the chunk.
         - `content`: The text content of the chunk.
 
-    Defaults to `chunking_by_token_size` if not specified.
+    Defaults to `iter_chunks_by_token_size` if not specified, which also records the character span of each chunk as `char_start`/`char_end`.
     """
 
     # Embedding
@@ -278,6 +285,11 @@ class LightRAG:
     )
     """Maximum number of concurrent embedding function calls."""
 
+    embedding_coalesce_wait_ms: float = field(
+        default=get_env_value("EMBEDDING_COALESCE_WAIT_MS", 0, float)
+    )
+    """Time window (ms) for coalescing concurrent embedding calls into one batch of up to embedding_batch_num texts. 0 disables coalescing."""
+
     embedding_cache_config: dict[str, Any] = field(
         default_factory=lambda: {
             "enabled": False,
@@ -285,10 +297,12 @@ class LightRAG:
             "use_llm_check": False,
         }
     )
-    """Configuration for embedding cache.
-    - enabled: If True, enables caching to avoid redundant computations.
-    - similarity_threshold: Minimum similarity score to use cached embeddings.
-    - use_llm_check: If True, validates cached embeddings using an LLM.
+    """Configuration for the semantic query cache.
+    - enabled: If True, keywords, context and answers of near-duplicate queries are reused.
+    - similarity_threshold: Minimum cosine similarity between query embeddings for a cache hit.
+    - use_llm_check: If True, validates cache hits using an LLM.
+    - max_entries: Optional maximum number of cached queries (LRU eviction).
+    - ttl: Optional lifetime of cached queries in seconds, 0 disables expiration.
     """
 
     default_embedding_timeout: int = field(
@@ -321,6 +335,11 @@ class LightRAG:
     )
     """Recommended length of LLM summary output."""
 
+    summary_max_parallel: int = field(
+        default=get_env_value("SUMMARY_MAX_PARALLEL", DEFAULT_SUMMARY_MAX_PARALLEL, int)
+    )
+    """Maximum concurrent LLM calls when summarizing description groups of a single entity/relation."""
+
     llm_model_max_async: int = field(
         default=int(os.getenv("MAX_ASYNC", DEFAULT_MAX_ASYNC))
     )
@@ -364,6 +383,13 @@ class LightRAG:
     )
     """Maximum number of parallel insert operations."""
 
+    merge_write_batch_size: int = field(
+        default=get_env_value(
+            "MERGE_WRITE_BATCH_SIZE", DEFAULT_MERGE_WRITE_BATCH_SIZE, int
+        )
+    )
+    """Maximum number of graph, chunk-list and vector writes buffered per storage during the merge stage. Writes of concurrent merges are written in one batch before their keyed locks are released."""
+
     max_graph_nodes: int = field(
         default=get_env_value("MAX_GRAPH_NODES", DEFAULT_MAX_GRAPH_NODES, int)
     )
@@ -519,6 +545,21 @@ class LightRAG:
             queue_name="Embedding func",
         )(self.embedding_func)
 
+        # Coalesce small concurrent embedding calls (e.g. query keywords) into shared batches
+        if self.embedding_coalesce_wait_ms > 0:
+            self.embedding_func = coalesce_async_embedding_calls(
+                max_batch_size=self.embedding_batch_num,
+                max_wait_ms=self.embedding_coalesce_wait_ms,
+                queue_name="Embedding func",
+            )(self.embedding_func)
+
+        # Init semantic query cache (None when disabled)
+        self.query_cache: SemanticQueryCache | None = SemanticQueryCache.from_config(
+            self.embedding_cache_config, self.embedding_func
+        )
+        # Set by any worker that changed the knowledge base, registered in initialize_storages
+        self._query_cache_updated = None
+
         # Initialize all storages
         self.key_string_value_json_storage_cls: type[BaseKVStorage] = (
             self._get_storage_class(self.kv_storage)
@@ -585,6 +626,12 @@ class LightRAG:
             embedding_func=self.embedding_func,
         )
 
+        self.chunk_extractions: BaseKVStorage = self.key_string_value_json_storage_cls(  # type: ignore
+            namespace=NameSpace.KV_STORE_CHUNK_EXTRACTIONS,
+            workspace=self.workspace,
+            embedding_func=self.embedding_func,
+        )
+
         self.chunk_entity_relation_graph: BaseGraphStorage = self.graph_storage_cls(  # type: ignore
             namespace=NameSpace.GRAPH_STORE_CHUNK_ENTITY_RELATION,
             workspace=self.workspace,
@@ -646,6 +693,7 @@ class LightRAG:
                 self.full_relations,
                 self.entity_chunks,
                 self.relation_chunks,
+                self.chunk_extractions,
                 self.entities_vdb,
                 self.relationships_vdb,
                 self.chunks_vdb,
@@ -657,6 +705,11 @@ class LightRAG:
                     # logger.debug(f"Initializing storage: {storage}")
                     await storage.initialize()
 
+            if self.query_cache is not None:
+                self._query_cache_updated = await get_update_flag(
+                    self._query_cache_namespace
+                )
+
             self._storages_status = StoragesStatus.INITIALIZED
             logger.debug("All storage types initialized")
 
@@ -670,6 +723,7 @@ class LightRAG:
                 ("full_relations", self.full_relations),
                 ("entity_chunks", self.entity_chunks),
                 ("relation_chunks", self.relation_chunks),
+                ("chunk_extractions", self.chunk_extractions),
                 ("entities_vdb", self.entities_vdb),
                 ("relationships_vdb", self.relationships_vdb),
                 ("chunks_vdb", self.chunks_vdb),
@@ -708,6 +762,9 @@ class LightRAG:
 
             self._storages_status = StoragesStatus.FINALIZED
 
+        # Release pooled HTTP connections held by LLM, embedding and rerank clients
+        await close_shared_clients()
+
     async def check_and_migrate_data(self):
         """Check if data migration is needed and perform migration if necessary"""
         async with get_data_init_lock():
@@ -1175,9 +1232,11 @@ class LightRAG:
             logger.info(f"Inserting {len(new_docs)} docs")
 
             inserting_chunks: dict[str, Any] = {}
-            for index, chunk_text in enumerate(text_chunks):
+            chunk_tokens = self.tokenizer.count_tokens_many(text_chunks)
+            for index, (chunk_text, tokens) in enumerate(
+                zip(text_chunks, chunk_tokens)
+            ):
                 chunk_key = compute_mdhash_id(chunk_text, prefix="chunk-")
-                tokens = len(self.tokenizer.encode(chunk_text))
                 inserting_chunks[chunk_key] = {
                     "content": chunk_text,
                     "full_doc_id": doc_key,
@@ -2111,6 +2170,7 @@ class LightRAG:
                 pipeline_status_lock=pipeline_status_lock,
                 llm_response_cache=self.llm_response_cache,
                 text_chunks_storage=self.text_chunks,
+                chunk_extractions_storage=self.chunk_extractions,
             )
             return chunk_results
         except Exception as e:
@@ -2134,6 +2194,7 @@ class LightRAG:
                 self.full_relations,
                 self.entity_chunks,
                 self.relation_chunks,
+                self.chunk_extractions,
                 self.llm_response_cache,
                 self.entities_vdb,
                 self.relationships_vdb,
@@ -2144,6 +2205,9 @@ class LightRAG:
         ]
         await asyncio.gather(*tasks)
 
+        # Cached query results may be stale once the knowledge base changed
+        await self._invalidate_query_cache()
+
         log_message = "In memory DB persist to disk"
         logger.info(log_message)
 
@@ -2172,7 +2236,7 @@ class LightRAG:
                 chunk_content = sanitize_text_for_encoding(chunk_data["content"])
                 source_id = chunk_data["source_id"]
                 file_path = chunk_data.get("file_path", "custom_kg")
-                tokens = len(self.tokenizer.encode(chunk_content))
+                tokens = self.tokenizer.count_tokens(chunk_content)
                 chunk_order_index = (
                     0
                     if "chunk_order_index" not in chunk_data.keys()
@@ -2485,6 +2549,16 @@ class LightRAG:
                         "relations_after_truncation": int,  # Relations after token truncation
                         "merged_chunks_count": int,          # Chunks before final processing
                         "final_chunks_count": int            # Final chunks in result
+                    },
+                    "timing_ms": {                      # Wall-clock duration per stage (KG modes only)
+                        "query_embedding": float,           # One batched embedding call for keywords and query
+                        "local_search": float,              # Entity VDB lookup + graph fetches (incl. embedding wait)
+                        "global_search": float,             # Relationship VDB lookup + graph fetches (incl. embedding wait)
+                        "vector_search": float,             # Chunk VDB lookup in mix mode (incl. embedding wait)
+                        "search_total": float,              # Whole concurrent search stage
+                        "truncation": float,
+                        "chunk_merge": float,
+                        "context_build": float
                     }
                 }
             }
@@ -2521,6 +2595,7 @@ class LightRAG:
             fields at the top level.
         """
         global_config = asdict(self)
+        self._sync_query_cache()
 
         # Create a copy of param to avoid modifying the original
         data_param = QueryParam(
@@ -2541,6 +2616,8 @@ class LightRAG:
             model_func=param.model_func,
             user_prompt=param.user_prompt,
             enable_rerank=param.enable_rerank,
+            nprobe=param.nprobe,
+            ef_search=param.ef_search,
         )
 
         query_result = None
@@ -2558,6 +2635,7 @@ class LightRAG:
                 hashing_kv=self.llm_response_cache,
                 system_prompt=None,
                 chunks_vdb=self.chunks_vdb,
+                query_cache=self.query_cache,
             )
         elif data_param.mode == "naive":
             logger.debug(f"[aquery_data] Using naive_query for mode: {data_param.mode}")
@@ -2568,6 +2646,7 @@ class LightRAG:
                 global_config,
                 hashing_kv=self.llm_response_cache,
                 system_prompt=None,
+                query_cache=self.query_cache,
             )
         elif data_param.mode == "bypass":
             logger.debug("[aquery_data] Using bypass mode")
@@ -2639,6 +2718,7 @@ class LightRAG:
         logger.debug(f"[aquery_llm] Query param: {param}")
 
         global_config = asdict(self)
+        self._sync_query_cache()
 
         try:
             query_result = None
@@ -2655,6 +2735,7 @@ class LightRAG:
                     hashing_kv=self.llm_response_cache,
                     system_prompt=system_prompt,
                     chunks_vdb=self.chunks_vdb,
+                    query_cache=self.query_cache,
                 )
             elif param.mode == "naive":
                 query_result = await naive_query(
@@ -2664,6 +2745,7 @@ class LightRAG:
                     global_config,
                     hashing_kv=self.llm_response_cache,
                     system_prompt=system_prompt,
+                    query_cache=self.query_cache,
                 )
             elif param.mode == "bypass":
                 # Bypass mode: directly use LLM without knowledge retrieval
@@ -2803,9 +2885,34 @@ class LightRAG:
 
             await self.llm_response_cache.index_done_callback()
 
+            await self._invalidate_query_cache()
+
         except Exception as e:
             logger.error(f"Error while clearing cache: {e}")
 
+    @property
+    def _query_cache_namespace(self) -> str:
+        return f"{self.workspace}_query_cache" if self.workspace else "query_cache"
+
+    async def _invalidate_query_cache(self) -> None:
+        """Drop cached query results in this and all other worker processes
+
+        The query cache is kept per process, so the other workers are notified through
+        the shared update flags and clear their cache before their next query.
+        """
+        if self.query_cache is None:
+            return
+        self.query_cache.clear()
+        if self._query_cache_updated is not None:
+            # Our own flag is set as well, clearing once more on the next query is harmless
+            await set_all_update_flags(self._query_cache_namespace)
+
+    def _sync_query_cache(self) -> None:
+        """Clear the query cache when another worker changed the knowledge base"""
+        if self._query_cache_updated is not None and self._query_cache_updated.value:
+            self._query_cache_updated.value = False
+            self.query_cache.clear()
+
     def clear_cache(self) -> None:
         """Synchronous version of aclear_cache."""
         return always_get_an_event_loop().run_until_complete(self.aclear_cache())
@@ -2907,158 +3014,198 @@ class LightRAG:
                 - `status_code` (int): HTTP status code (e.g., 200, 404, 500).
                 - `file_path` (str | None): The file path of the deleted document, if available.
         """
+        results = await self.adelete_by_doc_ids(
+            [doc_id], delete_llm_cache=delete_llm_cache
+        )
+        return results[0]
+
+    async def adelete_by_doc_ids(
+        self, doc_ids: list[str], delete_llm_cache: bool = False
+    ) -> list[DeletionResult]:
+        """Delete multiple documents and all their related data in one pass.
+
+        Affected chunks, entities and relations are collected for all documents together,
+        so storages receive one batched delete each, every surviving entity or relation
+        shared by the deleted documents is rebuilt exactly once, and changes are persisted
+        once at the end. Deleting one document is the special case of a single-item list.
+
+        Args:
+            doc_ids (list[str]): The unique identifiers of the documents to be deleted.
+            delete_llm_cache (bool): Whether to delete cached LLM extraction results
+                associated with the documents. Defaults to False.
+
+        Returns:
+            list[DeletionResult]: One result per unique document ID, in request order
+                (see adelete_by_doc_id). If a shared deletion step fails, every document
+                whose data was being deleted reports the failure.
+        """
+        doc_ids = list(dict.fromkeys(doc_ids))
+        if not doc_ids:
+            return []
+
+        results: dict[str, DeletionResult] = {}
+        file_paths: dict[str, str | None] = {}
+        doc_chunk_ids: dict[str, set[str]] = {}  # documents with chunks to delete
+        doc_llm_cache_ids: dict[str, list[str]] = {}
         deletion_operations_started = False
         original_exception = None
-        doc_llm_cache_ids: list[str] = []
+        doc_label = (
+            f"document {doc_ids[0]}"
+            if len(doc_ids) == 1
+            else f"{len(doc_ids)} documents"
+        )
 
         # Get pipeline status shared data and lock for status updates
         pipeline_status = await get_namespace_data("pipeline_status")
         pipeline_status_lock = get_pipeline_status_lock()
 
         async with pipeline_status_lock:
-            log_message = f"Starting deletion process for document {doc_id}"
+            log_message = f"Starting deletion process for {doc_label}"
             logger.info(log_message)
             pipeline_status["latest_message"] = log_message
             pipeline_status["history_messages"].append(log_message)
 
         try:
             # 1. Get the document status and related data
-            doc_status_data = await self.doc_status.get_by_id(doc_id)
-            file_path = doc_status_data.get("file_path") if doc_status_data else None
-            if not doc_status_data:
-                logger.warning(f"Document {doc_id} not found")
-                return DeletionResult(
-                    status="not_found",
-                    doc_id=doc_id,
-                    message=f"Document {doc_id} not found.",
-                    status_code=404,
-                    file_path="",
-                )
+            doc_status_by_id = dict(
+                zip(doc_ids, await self.doc_status.get_by_ids(doc_ids))
+            )
+            docs_without_chunks = []
+            for doc_id in doc_ids:
+                doc_status_data = doc_status_by_id.get(doc_id)
+                if not doc_status_data:
+                    logger.warning(f"Document {doc_id} not found")
+                    results[doc_id] = DeletionResult(
+                        status="not_found",
+                        doc_id=doc_id,
+                        message=f"Document {doc_id} not found.",
+                        status_code=404,
+                        file_path="",
+                    )
+                    continue
 
-            # Check document status and log warning for non-completed documents
-            raw_status = doc_status_data.get("status")
-            try:
-                doc_status = DocStatus(raw_status)
-            except ValueError:
-                doc_status = raw_status
+                file_path = doc_status_data.get("file_path")
+                file_paths[doc_id] = file_path
 
-            if doc_status != DocStatus.PROCESSED:
-                if doc_status == DocStatus.PENDING:
-                    warning_msg = (
-                        f"Deleting {doc_id} {file_path}(previous status: PENDING)"
-                    )
-                elif doc_status == DocStatus.PROCESSING:
-                    warning_msg = (
-                        f"Deleting {doc_id} {file_path}(previous status: PROCESSING)"
-                    )
-                elif doc_status == DocStatus.PREPROCESSED:
-                    warning_msg = (
-                        f"Deleting {doc_id} {file_path}(previous status: PREPROCESSED)"
-                    )
-                elif doc_status == DocStatus.FAILED:
-                    warning_msg = (
-                        f"Deleting {doc_id} {file_path}(previous status: FAILED)"
-                    )
-                else:
+                # Check document status and log warning for non-completed documents
+                raw_status = doc_status_data.get("status")
+                try:
+                    doc_status = DocStatus(raw_status)
+                except ValueError:
+                    doc_status = raw_status
+
+                if doc_status != DocStatus.PROCESSED:
                     status_text = (
-                        doc_status.value
+                        doc_status.name
                         if isinstance(doc_status, DocStatus)
                         else str(doc_status)
                     )
                     warning_msg = (
                         f"Deleting {doc_id} {file_path}(previous status: {status_text})"
                     )
-                logger.info(warning_msg)
-                # Update pipeline status for monitoring
-                async with pipeline_status_lock:
-                    pipeline_status["latest_message"] = warning_msg
-                    pipeline_status["history_messages"].append(warning_msg)
+                    logger.info(warning_msg)
+                    # Update pipeline status for monitoring
+                    async with pipeline_status_lock:
+                        pipeline_status["latest_message"] = warning_msg
+                        pipeline_status["history_messages"].append(warning_msg)
 
-            # 2. Get chunk IDs from document status
-            chunk_ids = set(doc_status_data.get("chunks_list", []))
+                # 2. Get chunk IDs from document status
+                chunk_ids = set(doc_status_data.get("chunks_list", []))
+                if chunk_ids:
+                    doc_chunk_ids[doc_id] = chunk_ids
+                else:
+                    logger.warning(f"No chunks found for document {doc_id}")
+                    docs_without_chunks.append(doc_id)
 
-            if not chunk_ids:
-                logger.warning(f"No chunks found for document {doc_id}")
+            if docs_without_chunks:
                 # Mark that deletion operations have started
                 deletion_operations_started = True
                 try:
                     # Still need to delete the doc status and full doc
-                    await self.full_docs.delete([doc_id])
-                    await self.doc_status.delete([doc_id])
+                    await self.full_docs.delete(docs_without_chunks)
+                    await self.doc_status.delete(docs_without_chunks)
                 except Exception as e:
                     logger.error(
-                        f"Failed to delete document {doc_id} with no chunks: {e}"
+                        f"Failed to delete documents {docs_without_chunks} with no chunks: {e}"
                     )
                     raise Exception(f"Failed to delete document entry: {e}") from e
 
-                async with pipeline_status_lock:
-                    log_message = (
-                        f"Document deleted without associated chunks: {doc_id}"
+                for doc_id in docs_without_chunks:
+                    async with pipeline_status_lock:
+                        log_message = (
+                            f"Document deleted without associated chunks: {doc_id}"
+                        )
+                        logger.info(log_message)
+                        pipeline_status["latest_message"] = log_message
+                        pipeline_status["history_messages"].append(log_message)
+
+                    results[doc_id] = DeletionResult(
+                        status="success",
+                        doc_id=doc_id,
+                        message=log_message,
+                        status_code=200,
+                        file_path=file_paths[doc_id],
                     )
-                    logger.info(log_message)
-                    pipeline_status["latest_message"] = log_message
-                    pipeline_status["history_messages"].append(log_message)
 
-                return DeletionResult(
-                    status="success",
-                    doc_id=doc_id,
-                    message=log_message,
-                    status_code=200,
-                    file_path=file_path,
-                )
+            if not doc_chunk_ids:
+                return [results[doc_id] for doc_id in doc_ids]
 
             # Mark that deletion operations have started
             deletion_operations_started = True
+            chunk_ids = set().union(*doc_chunk_ids.values())
+            deleting_doc_ids = list(doc_chunk_ids)
 
-            if delete_llm_cache and chunk_ids:
+            if delete_llm_cache:
                 if not self.llm_response_cache:
                     logger.info(
-                        "Skipping LLM cache collection for document %s because cache storage is unavailable",
-                        doc_id,
+                        "Skipping LLM cache collection for %s because cache storage is unavailable",
+                        doc_label,
                     )
                 elif not self.text_chunks:
                     logger.info(
-                        "Skipping LLM cache collection for document %s because text chunk storage is unavailable",
-                        doc_id,
+                        "Skipping LLM cache collection for %s because text chunk storage is unavailable",
+                        doc_label,
                     )
                 else:
                     try:
-                        chunk_data_list = await self.text_chunks.get_by_ids(
-                            list(chunk_ids)
-                        )
-                        seen_cache_ids: set[str] = set()
-                        for chunk_data in chunk_data_list:
-                            if not chunk_data or not isinstance(chunk_data, dict):
-                                continue
-                            cache_ids = chunk_data.get("llm_cache_list", [])
-                            if not isinstance(cache_ids, list):
-                                continue
-                            for cache_id in cache_ids:
-                                if (
-                                    isinstance(cache_id, str)
-                                    and cache_id
-                                    and cache_id not in seen_cache_ids
-                                ):
-                                    doc_llm_cache_ids.append(cache_id)
-                                    seen_cache_ids.add(cache_id)
-                        if doc_llm_cache_ids:
-                            logger.info(
-                                "Collected %d LLM cache entries for document %s",
-                                len(doc_llm_cache_ids),
-                                doc_id,
-                            )
-                        else:
-                            logger.info(
-                                "No LLM cache entries found for document %s", doc_id
+                        chunk_id_list = list(chunk_ids)
+                        chunk_data_by_id = dict(
+                            zip(
+                                chunk_id_list,
+                                await self.text_chunks.get_by_ids(chunk_id_list),
                             )
+                        )
+                        for doc_id, doc_chunks in doc_chunk_ids.items():
+                            cache_ids_of_doc: dict[str, None] = {}
+                            for chunk_id in doc_chunks:
+                                chunk_data = chunk_data_by_id.get(chunk_id)
+                                if not chunk_data or not isinstance(chunk_data, dict):
+                                    continue
+                                cache_ids = chunk_data.get("llm_cache_list", [])
+                                if not isinstance(cache_ids, list):
+                                    continue
+                                for cache_id in cache_ids:
+                                    if isinstance(cache_id, str) and cache_id:
+                                        cache_ids_of_doc[cache_id] = None
+                            if cache_ids_of_doc:
+                                doc_llm_cache_ids[doc_id] = list(cache_ids_of_doc)
+                                logger.info(
+                                    "Collected %d LLM cache entries for document %s",
+                                    len(cache_ids_of_doc),
+                                    doc_id,
+                                )
+                            else:
+                                logger.info(
+                                    "No LLM cache entries found for document %s", doc_id
+                                )
                     except Exception as cache_collect_error:
                         logger.error(
-                            "Failed to collect LLM cache ids for document %s: %s",
-                            doc_id,
+                            "Failed to collect LLM cache ids for %s: %s",
+                            doc_label,
                             cache_collect_error,
                         )
                         raise Exception(
-                            f"Failed to collect LLM cache ids for document {doc_id}: {cache_collect_error}"
+                            f"Failed to collect LLM cache ids for {doc_label}: {cache_collect_error}"
                         ) from cache_collect_error
 
             # 4. Analyze entities and relationships that will be affected
@@ -3070,16 +3217,36 @@ class LightRAG:
             relation_chunk_updates: dict[tuple[str, str], list[str]] = {}
 
             try:
-                # Get affected entities and relations from full_entities and full_relations storage
-                doc_entities_data = await self.full_entities.get_by_id(doc_id)
-                doc_relations_data = await self.full_relations.get_by_id(doc_id)
+                # Get affected entities and relations of all documents from full_entities and full_relations storage
+                doc_entities_list = await self.full_entities.get_by_ids(
+                    deleting_doc_ids
+                )
+                doc_relations_list = await self.full_relations.get_by_ids(
+                    deleting_doc_ids
+                )
+
+                entity_names = list(
+                    dict.fromkeys(
+                        entity_name
+                        for doc_entities_data in doc_entities_list
+                        if doc_entities_data and "entity_names" in doc_entities_data
+                        for entity_name in doc_entities_data["entity_names"]
+                    )
+                )
+                relation_pairs = list(
+                    dict.fromkeys(
+                        (pair[0], pair[1])
+                        for doc_relations_data in doc_relations_list
+                        if doc_relations_data and "relation_pairs" in doc_relations_data
+                        for pair in doc_relations_data["relation_pairs"]
+                    )
+                )
 
                 affected_nodes = []
                 affected_edges = []
 
                 # Get entity data from graph storage using entity names from full_entities
-                if doc_entities_data and "entity_names" in doc_entities_data:
-                    entity_names = doc_entities_data["entity_names"]
+                if entity_names:
                     # get_nodes_batch returns dict[str, dict], need to convert to list[dict]
                     nodes_dict = await self.chunk_entity_relation_graph.get_nodes_batch(
                         entity_names
@@ -3093,18 +3260,16 @@ class LightRAG:
                             affected_nodes.append(node_data)
 
                 # Get relation data from graph storage using relation pairs from full_relations
-                if doc_relations_data and "relation_pairs" in doc_relations_data:
-                    relation_pairs = doc_relations_data["relation_pairs"]
+                if relation_pairs:
                     edge_pairs_dicts = [
-                        {"src": pair[0], "tgt": pair[1]} for pair in relation_pairs
+                        {"src": src, "tgt": tgt} for src, tgt in relation_pairs
                     ]
                     # get_edges_batch returns dict[tuple[str, str], dict], need to convert to list[dict]
                     edges_dict = await self.chunk_entity_relation_graph.get_edges_batch(
                         edge_pairs_dicts
                     )
 
-                    for pair in relation_pairs:
-                        src, tgt = pair[0], pair[1]
+                    for src, tgt in relation_pairs:
                         edge_key = (src, tgt)
                         edge_data = edges_dict.get(edge_key)
                         if edge_data:
@@ -3115,6 +3280,38 @@ class LightRAG:
                                 edge_data["target"] = tgt
                             affected_edges.append(edge_data)
 
+                # Batch get the tracked chunk lists of all affected entities and relations
+                stored_entity_chunks: dict[str, Any] = {}
+                if self.entity_chunks and affected_nodes:
+                    node_labels = [
+                        node_data["entity_id"]
+                        for node_data in affected_nodes
+                        if node_data.get("entity_id")
+                    ]
+                    stored_entity_chunks = dict(
+                        zip(
+                            node_labels,
+                            await self.entity_chunks.get_by_ids(node_labels),
+                        )
+                    )
+                stored_relation_chunks: dict[str, Any] = {}
+                if self.relation_chunks and affected_edges:
+                    storage_keys = list(
+                        dict.fromkeys(
+                            make_relation_chunk_key(
+                                edge_data["source"], edge_data["target"]
+                            )
+                            for edge_data in affected_edges
+                            if edge_data.get("source") and edge_data.get("target")
+                        )
+                    )
+                    stored_relation_chunks = dict(
+                        zip(
+                            storage_keys,
+                            await self.relation_chunks.get_by_ids(storage_keys),
+                        )
+                    )
+
             except Exception as e:
                 logger.error(f"Failed to analyze affected graph elements: {e}")
                 raise Exception(f"Failed to analyze graph dependencies: {e}") from e
@@ -3127,14 +3324,13 @@ class LightRAG:
                         continue
 
                     existing_sources: list[str] = []
-                    if self.entity_chunks:
-                        stored_chunks = await self.entity_chunks.get_by_id(node_label)
-                        if stored_chunks and isinstance(stored_chunks, dict):
-                            existing_sources = [
-                                chunk_id
-                                for chunk_id in stored_chunks.get("chunk_ids", [])
-                                if chunk_id
-                            ]
+                    stored_chunks = stored_entity_chunks.get(node_label)
+                    if stored_chunks and isinstance(stored_chunks, dict):
+                        existing_sources = [
+                            chunk_id
+                            for chunk_id in stored_chunks.get("chunk_ids", [])
+                            if chunk_id
+                        ]
 
                     if not existing_sources and node_data.get("source_id"):
                         existing_sources = [
@@ -3185,17 +3381,15 @@ class LightRAG:
                         continue
 
                     existing_sources: list[str] = []
-                    if self.relation_chunks:
-                        storage_key = make_relation_chunk_key(src, tgt)
-                        stored_chunks = await self.relation_chunks.get_by_id(
-                            storage_key
-                        )
-                        if stored_chunks and isinstance(stored_chunks, dict):
-                            existing_sources = [
-                                chunk_id
-                                for chunk_id in stored_chunks.get("chunk_ids", [])
-                                if chunk_id
-                            ]
+                    stored_chunks = stored_relation_chunks.get(
+                        make_relation_chunk_key(src, tgt)
+                    )
+                    if stored_chunks and isinstance(stored_chunks, dict):
+                        existing_sources = [
+                            chunk_id
+                            for chunk_id in stored_chunks.get("chunk_ids", [])
+                            if chunk_id
+                        ]
 
                     if not existing_sources:
                         existing_sources = [
@@ -3271,20 +3465,23 @@ class LightRAG:
             graph_db_lock = get_graph_db_lock(enable_logging=False)
             async with graph_db_lock:
                 # 5. Delete chunks from storage
-                if chunk_ids:
-                    try:
-                        await self.chunks_vdb.delete(chunk_ids)
-                        await self.text_chunks.delete(chunk_ids)
+                chunk_id_list = list(chunk_ids)
+                try:
+                    await self.chunks_vdb.delete(chunk_id_list)
+                    await self.text_chunks.delete(chunk_id_list)
+                    await self.chunk_extractions.delete(chunk_id_list)
 
-                        async with pipeline_status_lock:
-                            log_message = f"Successfully deleted {len(chunk_ids)} chunks from storage"
-                            logger.info(log_message)
-                            pipeline_status["latest_message"] = log_message
-                            pipeline_status["history_messages"].append(log_message)
+                    async with pipeline_status_lock:
+                        log_message = (
+                            f"Successfully deleted {len(chunk_ids)} chunks from storage"
+                        )
+                        logger.info(log_message)
+                        pipeline_status["latest_message"] = log_message
+                        pipeline_status["history_messages"].append(log_message)
 
-                    except Exception as e:
-                        logger.error(f"Failed to delete chunks: {e}")
-                        raise Exception(f"Failed to delete document chunks: {e}") from e
+                except Exception as e:
+                    logger.error(f"Failed to delete chunks: {e}")
+                    raise Exception(f"Failed to delete document chunks: {e}") from e
 
                 # 6. Delete relationships that have no remaining sources
                 if relationships_to_delete:
@@ -3434,6 +3631,7 @@ class LightRAG:
                         pipeline_status_lock=pipeline_status_lock,
                         entity_chunks_storage=self.entity_chunks,
                         relation_chunks_storage=self.relation_chunks,
+                        chunk_extractions_storage=self.chunk_extractions,
                     )
 
                 except Exception as e:
@@ -3442,59 +3640,78 @@ class LightRAG:
 
             # 9. Delete from full_entities and full_relations storage
             try:
-                await self.full_entities.delete([doc_id])
-                await self.full_relations.delete([doc_id])
+                await self.full_entities.delete(deleting_doc_ids)
+                await self.full_relations.delete(deleting_doc_ids)
             except Exception as e:
                 logger.error(f"Failed to delete from full_entities/full_relations: {e}")
                 raise Exception(
                     f"Failed to delete from full_entities/full_relations: {e}"
                 ) from e
 
-            # 10. Delete original document and status
+            # 10. Delete original documents and status
             try:
-                await self.full_docs.delete([doc_id])
-                await self.doc_status.delete([doc_id])
+                await self.full_docs.delete(deleting_doc_ids)
+                await self.doc_status.delete(deleting_doc_ids)
             except Exception as e:
-                logger.error(f"Failed to delete document and status: {e}")
+                logger.error(f"Failed to delete documents and status: {e}")
                 raise Exception(f"Failed to delete document and status: {e}") from e
 
+            log_messages = {
+                doc_id: f"Successfully deleted document {doc_id} ({len(doc_chunk_ids[doc_id])} chunks)"
+                for doc_id in deleting_doc_ids
+            }
             if delete_llm_cache and doc_llm_cache_ids and self.llm_response_cache:
                 try:
-                    await self.llm_response_cache.delete(doc_llm_cache_ids)
-                    cache_log_message = f"Successfully deleted {len(doc_llm_cache_ids)} LLM cache entries for document {doc_id}"
+                    await self.llm_response_cache.delete(
+                        [
+                            cache_id
+                            for cache_ids in doc_llm_cache_ids.values()
+                            for cache_id in cache_ids
+                        ]
+                    )
+                    for doc_id, cache_ids in doc_llm_cache_ids.items():
+                        log_messages[doc_id] = (
+                            f"Successfully deleted {len(cache_ids)} LLM cache entries for document {doc_id}"
+                        )
+                    cache_log_message = f"Successfully deleted LLM cache entries for {len(doc_llm_cache_ids)} documents"
                     logger.info(cache_log_message)
                     async with pipeline_status_lock:
                         pipeline_status["latest_message"] = cache_log_message
                         pipeline_status["history_messages"].append(cache_log_message)
-                    log_message = cache_log_message
                 except Exception as cache_delete_error:
-                    log_message = f"Failed to delete LLM cache for document {doc_id}: {cache_delete_error}"
+                    for doc_id in doc_llm_cache_ids:
+                        log_messages[doc_id] = (
+                            f"Failed to delete LLM cache for document {doc_id}: {cache_delete_error}"
+                        )
+                    log_message = f"Failed to delete LLM cache for {doc_label}: {cache_delete_error}"
                     logger.error(log_message)
                     logger.error(traceback.format_exc())
                     async with pipeline_status_lock:
                         pipeline_status["latest_message"] = log_message
                         pipeline_status["history_messages"].append(log_message)
 
-            return DeletionResult(
-                status="success",
-                doc_id=doc_id,
-                message=log_message,
-                status_code=200,
-                file_path=file_path,
-            )
+            for doc_id in deleting_doc_ids:
+                results[doc_id] = DeletionResult(
+                    status="success",
+                    doc_id=doc_id,
+                    message=log_messages[doc_id],
+                    status_code=200,
+                    file_path=file_paths[doc_id],
+                )
 
         except Exception as e:
             original_exception = e
-            error_message = f"Error while deleting document {doc_id}: {e}"
-            logger.error(error_message)
+            logger.error(f"Error while deleting {doc_label}: {e}")
             logger.error(traceback.format_exc())
-            return DeletionResult(
-                status="fail",
-                doc_id=doc_id,
-                message=error_message,
-                status_code=500,
-                file_path=file_path,
-            )
+            for doc_id in doc_ids:
+                if doc_id not in results:
+                    results[doc_id] = DeletionResult(
+                        status="fail",
+                        doc_id=doc_id,
+                        message=f"Error while deleting document {doc_id}: {e}",
+                        status_code=500,
+                        file_path=file_paths.get(doc_id),
+                    )
 
         finally:
             # ALWAYS ensure persistence if any deletion operations were started
@@ -3502,26 +3719,29 @@ class LightRAG:
                 try:
                     await self._insert_done()
                 except Exception as persistence_error:
-                    persistence_error_msg = f"Failed to persist data after deletion attempt for {doc_id}: {persistence_error}"
+                    persistence_error_msg = f"Failed to persist data after deletion attempt for {doc_label}: {persistence_error}"
                     logger.error(persistence_error_msg)
                     logger.error(traceback.format_exc())
 
                     # If there was no original exception, this persistence error becomes the main error
+                    # If there was one, its results are kept and the persistence error is only logged
                     if original_exception is None:
-                        return DeletionResult(
-                            status="fail",
-                            doc_id=doc_id,
-                            message=f"Deletion completed but failed to persist changes: {persistence_error}",
-                            status_code=500,
-                            file_path=file_path,
-                        )
-                    # If there was an original exception, log the persistence error but don't override the original error
-                    # The original error result was already returned in the except block
+                        for doc_id, result in results.items():
+                            if result.status == "success":
+                                results[doc_id] = DeletionResult(
+                                    status="fail",
+                                    doc_id=doc_id,
+                                    message=f"Deletion completed but failed to persist changes: {persistence_error}",
+                                    status_code=500,
+                                    file_path=result.file_path,
+                                )
             else:
                 logger.debug(
-                    f"No deletion operations were started for document {doc_id}, skipping persistence"
+                    f"No deletion operations were started for {doc_label}, skipping persistence"
                 )
 
+        return [results[doc_id] for doc_id in doc_ids]
+
     async def adelete_by_entity(self, entity_name: str) -> DeletionResult:
         """Asynchronously delete an entity and all its relationships.
 
@@ -3533,12 +3753,15 @@ class LightRAG:
         """
         from lightrag.utils_graph import adelete_by_entity
 
-        return await adelete_by_entity(
-            self.chunk_entity_relation_graph,
-            self.entities_vdb,
-            self.relationships_vdb,
-            entity_name,
-        )
+        try:
+            return await adelete_by_entity(
+                self.chunk_entity_relation_graph,
+                self.entities_vdb,
+                self.relationships_vdb,
+                entity_name,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def delete_by_entity(self, entity_name: str) -> DeletionResult:
         """Synchronously delete an entity and all its relationships.
@@ -3566,12 +3789,15 @@ class LightRAG:
         """
         from lightrag.utils_graph import adelete_by_relation
 
-        return await adelete_by_relation(
-            self.chunk_entity_relation_graph,
-            self.relationships_vdb,
-            source_entity,
-            target_entity,
-        )
+        try:
+            return await adelete_by_relation(
+                self.chunk_entity_relation_graph,
+                self.relationships_vdb,
+                source_entity,
+                target_entity,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def delete_by_relation(
         self, source_entity: str, target_entity: str
@@ -3661,17 +3887,20 @@ class LightRAG:
         """
         from lightrag.utils_graph import aedit_entity
 
-        return await aedit_entity(
-            self.chunk_entity_relation_graph,
-            self.entities_vdb,
-            self.relationships_vdb,
-            entity_name,
-            updated_data,
-            allow_rename,
-            allow_merge,
-            self.entity_chunks,
-            self.relation_chunks,
-        )
+        try:
+            return await aedit_entity(
+                self.chunk_entity_relation_graph,
+                self.entities_vdb,
+                self.relationships_vdb,
+                entity_name,
+                updated_data,
+                allow_rename,
+                allow_merge,
+                self.entity_chunks,
+                self.relation_chunks,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def edit_entity(
         self,
@@ -3703,15 +3932,18 @@ class LightRAG:
         """
         from lightrag.utils_graph import aedit_relation
 
-        return await aedit_relation(
-            self.chunk_entity_relation_graph,
-            self.entities_vdb,
-            self.relationships_vdb,
-            source_entity,
-            target_entity,
-            updated_data,
-            self.relation_chunks,
-        )
+        try:
+            return await aedit_relation(
+                self.chunk_entity_relation_graph,
+                self.entities_vdb,
+                self.relationships_vdb,
+                source_entity,
+                target_entity,
+                updated_data,
+                self.relation_chunks,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def edit_relation(
         self, source_entity: str, target_entity: str, updated_data: dict[str, Any]
@@ -3737,13 +3969,16 @@ class LightRAG:
         """
         from lightrag.utils_graph import acreate_entity
 
-        return await acreate_entity(
-            self.chunk_entity_relation_graph,
-            self.entities_vdb,
-            self.relationships_vdb,
-            entity_name,
-            entity_data,
-        )
+        try:
+            return await acreate_entity(
+                self.chunk_entity_relation_graph,
+                self.entities_vdb,
+                self.relationships_vdb,
+                entity_name,
+                entity_data,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def create_entity(
         self, entity_name: str, entity_data: dict[str, Any]
@@ -3768,14 +4003,17 @@ class LightRAG:
         """
         from lightrag.utils_graph import acreate_relation
 
-        return await acreate_relation(
-            self.chunk_entity_relation_graph,
-            self.entities_vdb,
-            self.relationships_vdb,
-            source_entity,
-            target_entity,
-            relation_data,
-        )
+        try:
+            return await acreate_relation(
+                self.chunk_entity_relation_graph,
+                self.entities_vdb,
+                self.relationships_vdb,
+                source_entity,
+                target_entity,
+                relation_data,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def create_relation(
         self, source_entity: str, target_entity: str, relation_data: dict[str, Any]
@@ -3814,17 +4052,20 @@ class LightRAG:
         """
         from lightrag.utils_graph import amerge_entities
 
-        return await amerge_entities(
-            self.chunk_entity_relation_graph,
-            self.entities_vdb,
-            self.relationships_vdb,
-            source_entities,
-            target_entity,
-            merge_strategy,
-            target_entity_data,
-            self.entity_chunks,
-            self.relation_chunks,
-        )
+        try:
+            return await amerge_entities(
+                self.chunk_entity_relation_graph,
+                self.entities_vdb,
+                self.relationships_vdb,
+                source_entities,
+                target_entity,
+                merge_strategy,
+                target_entity_data,
+                self.entity_chunks,
+                self.relation_chunks,
+            )
+        finally:
+            await self._invalidate_query_cache()
 
     def merge_entities(
         self,
@@ -14,6 +14,7 @@ from openai import (
     APIConnectionError,
     RateLimitError,
     APITimeoutError,
+    DefaultAsyncHttpxClient,
 )
 from tenacity import (
     retry,
@@ -25,11 +26,16 @@ from lightrag.utils import (
     wrap_embedding_func_with_attrs,
     safe_unicode_decode,
     logger,
+    get_shared_client,
+    get_http_pool_limits,
 )
 
 from lightrag.types import GPTKeywordExtractionFormat
 from lightrag.api import __api_version__
 
+import httpx
+import importlib.util
+import json
 import numpy as np
 import base64
 from typing import Any, Union
@@ -62,6 +68,9 @@ except ImportError:
 
     logger.debug("Langfuse not available, using standard OpenAI client")
 
+# HTTP/2 multiplexing for pooled clients requires the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
@@ -119,6 +128,46 @@ def create_openai_async_client(
     return AsyncOpenAI(**merged_configs)
 
 
+def get_openai_async_client(
+    api_key: str | None = None,
+    base_url: str | None = None,
+    client_configs: dict[str, Any] | None = None,
+) -> AsyncOpenAI:
+    """Return a pooled AsyncOpenAI client shared by all calls with the same configuration.
+
+    Unlike `create_openai_async_client`, the returned client must not be closed by
+    the caller; it keeps its connections alive between requests and is released by
+    `close_shared_clients` (called from `LightRAG.finalize_storages`). HTTP/2 is
+    enabled when the optional `h2` package is installed. A caller-provided
+    `http_client` in client_configs is used as-is.
+    """
+    api_key = api_key or os.environ["OPENAI_API_KEY"]
+    base_url = base_url or os.environ.get(
+        "OPENAI_API_BASE", "https://api.openai.com/v1"
+    )
+    client_configs = client_configs or {}
+
+    key = (
+        "openai",
+        base_url,
+        api_key,
+        json.dumps(client_configs, sort_keys=True, default=repr),
+    )
+
+    def factory() -> AsyncOpenAI:
+        configs = dict(client_configs)
+        if "http_client" not in configs:
+            configs["http_client"] = DefaultAsyncHttpxClient(
+                limits=httpx.Limits(**get_http_pool_limits()),
+                http2=HTTP2_AVAILABLE,
+            )
+        return create_openai_async_client(
+            api_key=api_key, base_url=base_url, client_configs=configs
+        )
+
+    return get_shared_client(key, factory)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -203,8 +252,8 @@ async def openai_complete_if_cache(
     # Extract client configuration options
     client_configs = kwargs.pop("openai_client_configs", {})
 
-    # Create the OpenAI client
-    openai_async_client = create_openai_async_client(
+    # Reuse the pooled OpenAI client for this configuration
+    openai_async_client = get_openai_async_client(
         api_key=api_key,
         base_url=base_url,
         client_configs=client_configs,
@@ -240,21 +289,17 @@ async def openai_complete_if_cache(
             )
     except APIConnectionError as e:
         logger.error(f"OpenAI API Connection Error: {e}")
-        await openai_async_client.close()  # Ensure client is closed
         raise
     except RateLimitError as e:
         logger.error(f"OpenAI API Rate Limit Error: {e}")
-        await openai_async_client.close()  # Ensure client is closed
         raise
     except APITimeoutError as e:
         logger.error(f"OpenAI API Timeout Error: {e}")
-        await openai_async_client.close()  # Ensure client is closed
         raise
     except Exception as e:
         logger.error(
             f"OpenAI API Call Failed,\nModel: {model},\nParams: {kwargs}, Got: {e}"
         )
-        await openai_async_client.close()  # Ensure client is closed
         raise
 
     if hasattr(response, "__aiter__"):
@@ -385,8 +430,6 @@ async def openai_complete_if_cache(
                         logger.warning(
                             f"Failed to close stream response: {close_error}"
                         )
-                # Ensure client is closed in case of exception
-                await openai_async_client.close()
                 raise
             finally:
                 # Final safety check for unclosed COT tags
@@ -418,93 +461,72 @@ async def openai_complete_if_cache(
                                 f"Unexpected error during stream response cleanup: {close_error}"
                             )
 
-                # This prevents resource leaks since the caller doesn't handle closing
-                try:
-                    await openai_async_client.close()
-                    logger.debug(
-                        "Successfully closed OpenAI client for streaming response"
-                    )
-                except Exception as client_close_error:
-                    logger.warning(
-                        f"Failed to close OpenAI client in streaming finally block: {client_close_error}"
-                    )
-
         return inner()
 
     else:
-        try:
-            if (
-                not response
-                or not response.choices
-                or not hasattr(response.choices[0], "message")
-            ):
-                logger.error("Invalid response from OpenAI API")
-                await openai_async_client.close()  # Ensure client is closed
-                raise InvalidResponseError("Invalid response from OpenAI API")
-
-            message = response.choices[0].message
-            content = getattr(message, "content", None)
-            reasoning_content = getattr(message, "reasoning_content", "")
-
-            # Handle COT logic for non-streaming responses (only if enabled)
-            final_content = ""
-
-            if enable_cot:
-                # Check if we should include reasoning content
-                should_include_reasoning = False
-                if reasoning_content and reasoning_content.strip():
-                    if not content or content.strip() == "":
-                        # Case 1: Only reasoning content, should include COT
-                        should_include_reasoning = True
-                        final_content = (
-                            content or ""
-                        )  # Use empty string if content is None
-                    else:
-                        # Case 3: Both content and reasoning_content present, ignore reasoning
-                        should_include_reasoning = False
-                        final_content = content
+        if (
+            not response
+            or not response.choices
+            or not hasattr(response.choices[0], "message")
+        ):
+            logger.error("Invalid response from OpenAI API")
+            raise InvalidResponseError("Invalid response from OpenAI API")
+
+        message = response.choices[0].message
+        content = getattr(message, "content", None)
+        reasoning_content = getattr(message, "reasoning_content", "")
+
+        # Handle COT logic for non-streaming responses (only if enabled)
+        final_content = ""
+
+        if enable_cot:
+            # Check if we should include reasoning content
+            should_include_reasoning = False
+            if reasoning_content and reasoning_content.strip():
+                if not content or content.strip() == "":
+                    # Case 1: Only reasoning content, should include COT
+                    should_include_reasoning = True
+                    final_content = content or ""  # Use empty string if content is None
                 else:
-                    # No reasoning content, use regular content
-                    final_content = content or ""
-
-                # Apply COT wrapping if needed
-                if should_include_reasoning:
-                    if r"\u" in reasoning_content:
-                        reasoning_content = safe_unicode_decode(
-                            reasoning_content.encode("utf-8")
-                        )
-                    final_content = f"<think>{reasoning_content}</think>{final_content}"
+                    # Case 3: Both content and reasoning_content present, ignore reasoning
+                    should_include_reasoning = False
+                    final_content = content
             else:
-                # COT disabled, only use regular content
+                # No reasoning content, use regular content
                 final_content = content or ""
 
-            # Validate final content
-            if not final_content or final_content.strip() == "":
-                logger.error("Received empty content from OpenAI API")
-                await openai_async_client.close()  # Ensure client is closed
-                raise InvalidResponseError("Received empty content from OpenAI API")
+            # Apply COT wrapping if needed
+            if should_include_reasoning:
+                if r"\u" in reasoning_content:
+                    reasoning_content = safe_unicode_decode(
+                        reasoning_content.encode("utf-8")
+                    )
+                final_content = f"<think>{reasoning_content}</think>{final_content}"
+        else:
+            # COT disabled, only use regular content
+            final_content = content or ""
+
+        # Validate final content
+        if not final_content or final_content.strip() == "":
+            logger.error("Received empty content from OpenAI API")
+            raise InvalidResponseError("Received empty content from OpenAI API")
 
-            # Apply Unicode decoding to final content if needed
-            if r"\u" in final_content:
-                final_content = safe_unicode_decode(final_content.encode("utf-8"))
+        # Apply Unicode decoding to final content if needed
+        if r"\u" in final_content:
+            final_content = safe_unicode_decode(final_content.encode("utf-8"))
 
-            if token_tracker and hasattr(response, "usage"):
-                token_counts = {
-                    "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
-                    "completion_tokens": getattr(
-                        response.usage, "completion_tokens", 0
-                    ),
-                    "total_tokens": getattr(response.usage, "total_tokens", 0),
-                }
-                token_tracker.add_usage(token_counts)
+        if token_tracker and hasattr(response, "usage"):
+            token_counts = {
+                "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
+                "completion_tokens": getattr(response.usage, "completion_tokens", 0),
+                "total_tokens": getattr(response.usage, "total_tokens", 0),
+            }
+            token_tracker.add_usage(token_counts)
 
-            logger.debug(f"Response content len: {len(final_content)}")
-            verbose_debug(f"Response: {response}")
+        logger.debug(f"Response content len: {len(final_content)}")
+        verbose_debug(f"Response: {response}")
 
-            return final_content
-        finally:
-            # Ensure client is closed in all cases for non-streaming responses
-            await openai_async_client.close()
+        return final_content
 
 
 async def openai_complete(
@@ -636,28 +658,27 @@ async def openai_embed(
         RateLimitError: If the OpenAI API rate limit is exceeded.
         APITimeoutError: If the OpenAI API request times out.
     """
-    # Create the OpenAI client
-    openai_async_client = create_openai_async_client(
+    # Reuse the pooled OpenAI client for this configuration
+    openai_async_client = get_openai_async_client(
         api_key=api_key, base_url=base_url, client_configs=client_configs
     )
 
-    async with openai_async_client:
-        response = await openai_async_client.embeddings.create(
-            model=model, input=texts, encoding_format="base64"
-        )
-
-        if token_tracker and hasattr(response, "usage"):
-            token_counts = {
-                "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
-                "total_tokens": getattr(response.usage, "total_tokens", 0),
-            }
-            token_tracker.add_usage(token_counts)
+    response = await openai_async_client.embeddings.create(
+        model=model, input=texts, encoding_format="base64"
+    )
 
-        return np.array(
-            [
-                np.array(dp.embedding, dtype=np.float32)
-                if isinstance(dp.embedding, list)
-                else np.frombuffer(base64.b64decode(dp.embedding), dtype=np.float32)
-                for dp in response.data
-            ]
-        )
+    if token_tracker and hasattr(response, "usage"):
+        token_counts = {
+            "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
+            "total_tokens": getattr(response.usage, "total_tokens", 0),
+        }
+        token_tracker.add_usage(token_counts)
+
+    return np.array(
+        [
+            np.array(dp.embedding, dtype=np.float32)
+            if isinstance(dp.embedding, list)
+            else np.frombuffer(base64.b64decode(dp.embedding), dtype=np.float32)
+            for dp in response.data
+        ]
+    )
@@ -1,11 +1,14 @@
 from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from functools import partial
 from pathlib import Path
 
 import asyncio
+import copy
 import json
 import json_repair
-from typing import Any, AsyncIterator, overload, Literal
+from typing import Any, AsyncIterator, Collection, Iterator, overload, Literal
 from collections import Counter, defaultdict
 
 from lightrag.exceptions import PipelineCancelledException
@@ -36,6 +39,7 @@ from lightrag.utils import (
     apply_source_ids_limit,
     merge_source_ids,
     make_relation_chunk_key,
+    SemanticQueryCache,
 )
 from lightrag.base import (
     BaseGraphStorage,
@@ -49,6 +53,7 @@ from lightrag.base import (
 from lightrag.prompt import PROMPTS
 from lightrag.constants import (
     GRAPH_FIELD_SEP,
+    CHUNK_EXTRACTION_VERSION,
     DEFAULT_MAX_ENTITY_TOKENS,
     DEFAULT_MAX_RELATION_TOKENS,
     DEFAULT_MAX_TOTAL_TOKENS,
@@ -56,13 +61,15 @@ from lightrag.constants import (
     DEFAULT_KG_CHUNK_PICK_METHOD,
     DEFAULT_ENTITY_TYPES,
     DEFAULT_SUMMARY_LANGUAGE,
+    DEFAULT_SUMMARY_MAX_PARALLEL,
     SOURCE_IDS_LIMIT_METHOD_KEEP,
     SOURCE_IDS_LIMIT_METHOD_FIFO,
     DEFAULT_FILE_PATH_MORE_PLACEHOLDER,
     DEFAULT_MAX_FILE_PATHS,
     DEFAULT_ENTITY_NAME_MAX_LENGTH,
+    DEFAULT_MERGE_WRITE_BATCH_SIZE,
 )
-from lightrag.kg.shared_storage import get_storage_keyed_lock
+from lightrag.kg.shared_storage import get_namespace_data, get_storage_keyed_lock
 import time
 from dotenv import load_dotenv
 
@@ -93,59 +100,117 @@ def _truncate_entity_identifier(
     return display_value
 
 
-def chunking_by_token_size(
+def _token_windows(
+    tokenizer: Tokenizer,
+    content: str,
+    tokens: list[int],
+    overlap_token_size: int,
+    max_token_size: int,
+) -> Iterator[tuple[int, str, int | None]]:
+    """Yield (token count, text, char start) for each overlapping token window of content."""
+    starts = range(0, len(tokens), max_token_size - overlap_token_size)
+    ends = [min(start + max_token_size, len(tokens)) for start in starts]
+    positions = sorted(set(starts).union(ends))
+    offsets = tokenizer.char_offsets(content, tokens, positions)
+    if offsets is not None:
+        char_at = dict(zip(positions, offsets))
+        for start, end in zip(starts, ends):
+            yield end - start, content[char_at[start] : char_at[end]], char_at[start]
+        return
+
+    # The tokenizer cannot map tokens to characters: decode each window instead
+    search_from = 0
+    for start, end in zip(starts, ends):
+        text = tokenizer.decode(tokens[start:end])
+        char_start = content.find(text, search_from)
+        if char_start >= 0:
+            search_from = char_start + 1
+        yield end - start, text, char_start if char_start >= 0 else None
+
+
+def _chunk_record(
+    index: int, token_count: int, text: str, char_start: int | None
+) -> dict[str, Any]:
+    chunk: dict[str, Any] = {
+        "tokens": token_count,
+        "content": text.strip(),
+        "chunk_order_index": index,
+    }
+    if char_start is not None:
+        chunk["char_start"] = char_start + len(text) - len(text.lstrip())
+        chunk["char_end"] = chunk["char_start"] + len(chunk["content"])
+    return chunk
+
+
+def iter_chunks_by_token_size(
     tokenizer: Tokenizer,
     content: str,
     split_by_character: str | None = None,
     split_by_character_only: bool = False,
     overlap_token_size: int = 128,
     max_token_size: int = 1024,
-) -> list[dict[str, Any]]:
-    tokens = tokenizer.encode(content)
-    results: list[dict[str, Any]] = []
-    if split_by_character:
-        raw_chunks = content.split(split_by_character)
-        new_chunks = []
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily split content into chunks of at most max_token_size tokens.
+
+    Every piece of content is tokenized once, and token windows are sliced from
+    the text through Tokenizer.char_offsets rather than decoded. Besides tokens,
+    content and chunk_order_index, each chunk records its character span in the
+    original content as char_start/char_end (end exclusive, whitespace stripped),
+    unless the tokenizer cannot map that window back to the text.
+    """
+    index = 0
+    if not split_by_character:
+        tokens = tokenizer.encode(content)
+        for window in _token_windows(
+            tokenizer, content, tokens, overlap_token_size, max_token_size
+        ):
+            yield _chunk_record(index, *window)
+            index += 1
+        return
+
+    pieces = content.split(split_by_character)
+    if split_by_character_only:
+        piece_tokens = tokenizer.count_tokens_many(pieces)
+    piece_start = 0
+    for i, piece in enumerate(pieces):
         if split_by_character_only:
-            for chunk in raw_chunks:
-                _tokens = tokenizer.encode(chunk)
-                new_chunks.append((len(_tokens), chunk))
+            windows = [(piece_tokens[i], piece, 0)]
         else:
-            for chunk in raw_chunks:
-                _tokens = tokenizer.encode(chunk)
-                if len(_tokens) > max_token_size:
-                    for start in range(
-                        0, len(_tokens), max_token_size - overlap_token_size
-                    ):
-                        chunk_content = tokenizer.decode(
-                            _tokens[start : start + max_token_size]
-                        )
-                        new_chunks.append(
-                            (min(max_token_size, len(_tokens) - start), chunk_content)
-                        )
-                else:
-                    new_chunks.append((len(_tokens), chunk))
-        for index, (_len, chunk) in enumerate(new_chunks):
-            results.append(
-                {
-                    "tokens": _len,
-                    "content": chunk.strip(),
-                    "chunk_order_index": index,
-                }
-            )
-    else:
-        for index, start in enumerate(
-            range(0, len(tokens), max_token_size - overlap_token_size)
-        ):
-            chunk_content = tokenizer.decode(tokens[start : start + max_token_size])
-            results.append(
-                {
-                    "tokens": min(max_token_size, len(tokens) - start),
-                    "content": chunk_content.strip(),
-                    "chunk_order_index": index,
-                }
-            )
-    return results
+            tokens = tokenizer.encode(piece)
+            if len(tokens) > max_token_size:
+                windows = _token_windows(
+                    tokenizer, piece, tokens, overlap_token_size, max_token_size
+                )
+            else:
+                windows = [(len(tokens), piece, 0)]
+        for token_count, text, char_start in windows:
+            if char_start is not None:
+                char_start += piece_start
+            yield _chunk_record(index, token_count, text, char_start)
+            index += 1
+        piece_start += len(piece) + len(split_by_character)
+
+
+def chunking_by_token_size(
+    tokenizer: Tokenizer,
+    content: str,
+    split_by_character: str | None = None,
+    split_by_character_only: bool = False,
+    overlap_token_size: int = 128,
+    max_token_size: int = 1024,
+) -> list[dict[str, Any]]:
+    """List form of iter_chunks_by_token_size."""
+    return list(
+        iter_chunks_by_token_size(
+            tokenizer,
+            content,
+            split_by_character,
+            split_by_character_only,
+            overlap_token_size,
+            max_token_size,
+        )
+    )
 
 
 async def _handle_entity_relation_summary(
@@ -162,9 +227,12 @@ async def _handle_entity_relation_summary(
     1. If total tokens < summary_context_size and len(description_list) < force_llm_summary_on_merge, no need to summarize
     2. If total tokens < summary_max_tokens, summarize with LLM directly
     3. Otherwise, split descriptions into chunks that fit within token limits
-    4. Summarize each chunk, then recursively process the summaries
+    4. Summarize the chunks concurrently (at most summary_max_parallel LLM calls at a time),
+       then recursively process the summaries
     5. Continue until we get a final summary within token limits or num of descriptions is less than force_llm_summary_on_merge
 
+    Each description is tokenized once; token counts are carried through the iterations.
+
     Args:
         entity_or_relation_name: Name of the entity or relation being summarized
         description_list: List of description strings to summarize
@@ -187,14 +255,18 @@ async def _handle_entity_relation_summary(
     summary_context_size = global_config["summary_context_size"]
     summary_max_tokens = global_config["summary_max_tokens"]
     force_llm_summary_on_merge = global_config["force_llm_summary_on_merge"]
+    summary_max_parallel = max(
+        1, global_config.get("summary_max_parallel", DEFAULT_SUMMARY_MAX_PARALLEL)
+    )
 
     current_list = description_list[:]  # Copy the list to avoid modifying original
+    current_tokens_list = tokenizer.count_tokens_many(current_list)
     llm_was_used = False  # Track whether LLM was used during the entire process
 
     # Iterative map-reduce process
     while True:
         # Calculate total tokens in current list
-        total_tokens = sum(len(tokenizer.encode(desc)) for desc in current_list)
+        total_tokens = sum(current_tokens_list)
 
         # If total length is within limits, perform final summarization
         if total_tokens <= summary_context_size or len(current_list) <= 2:
@@ -223,13 +295,12 @@ async def _handle_entity_relation_summary(
         # Need to split into chunks - Map phase
         # Ensure each chunk has minimum 2 descriptions to guarantee progress
         chunks = []
+        chunks_tokens = []
         current_chunk = []
         current_tokens = 0
 
         # Currently least 3 descriptions in current_list
-        for i, desc in enumerate(current_list):
-            desc_tokens = len(tokenizer.encode(desc))
-
+        for desc, desc_tokens in zip(current_list, current_tokens_list):
             # If adding current description would exceed limit, finalize current chunk
             if current_tokens + desc_tokens > summary_context_size and current_chunk:
                 # Ensure we have at least 2 descriptions in the chunk (when possible)
@@ -237,6 +308,7 @@ async def _handle_entity_relation_summary(
                     # Force add one more description to ensure minimum 2 per chunk
                     current_chunk.append(desc)
                     chunks.append(current_chunk)
+                    chunks_tokens.append(current_tokens + desc_tokens)
                     logger.warning(
                         f"Summarizing {entity_or_relation_name}: Oversize descpriton found"
                     )
@@ -244,6 +316,7 @@ async def _handle_entity_relation_summary(
                     current_tokens = 0
                 else:  # curren_chunk is ready for summary in reduce phase
                     chunks.append(current_chunk)
+                    chunks_tokens.append(current_tokens)
                     current_chunk = [desc]  # leave it for next group
                     current_tokens = desc_tokens
             else:
@@ -253,31 +326,54 @@ async def _handle_entity_relation_summary(
         # Add the last chunk if it exists
         if current_chunk:
             chunks.append(current_chunk)
+            chunks_tokens.append(current_tokens)
 
         logger.info(
             f"   Summarizing {entity_or_relation_name}: Map {len(current_list)} descriptions into {len(chunks)} groups"
         )
 
-        # Reduce phase: summarize each group from chunks
-        new_summaries = []
-        for chunk in chunks:
-            if len(chunk) == 1:
-                # Optimization: single description chunks don't need LLM summarization
-                new_summaries.append(chunk[0])
-            else:
-                # Multiple descriptions need LLM summarization
-                summary = await _summarize_descriptions(
+        # Reduce phase: summarize the groups concurrently, bounded per entity/relation
+        semaphore = asyncio.Semaphore(summary_max_parallel)
+
+        async def _summarize_chunk(chunk: list[str]) -> str:
+            async with semaphore:
+                return await _summarize_descriptions(
                     description_type,
                     entity_or_relation_name,
                     chunk,
                     global_config,
                     llm_response_cache,
                 )
-                new_summaries.append(summary)
-                llm_was_used = True  # Mark that LLM was used in reduce phase
 
-        # Update current list with new summaries for next iteration
+        # Optimization: single description chunks don't need LLM summarization
+        summary_tasks = {
+            i: asyncio.create_task(_summarize_chunk(chunk))
+            for i, chunk in enumerate(chunks)
+            if len(chunk) > 1
+        }
+        try:
+            await asyncio.gather(*summary_tasks.values())
+        except BaseException:
+            for task in summary_tasks.values():
+                task.cancel()
+            raise
+        if summary_tasks:
+            llm_was_used = True  # Mark that LLM was used in reduce phase
+
+        # Update current list with new summaries for next iteration; only new
+        # summaries need tokenizing, counts of passed-through descriptions are kept
+        new_summaries = []
+        new_tokens_list = []
+        for i, chunk in enumerate(chunks):
+            if i in summary_tasks:
+                summary = summary_tasks[i].result()
+                new_summaries.append(summary)
+                new_tokens_list.append(tokenizer.count_tokens(summary))
+            else:
+                new_summaries.append(chunk[0])
+                new_tokens_list.append(chunks_tokens[i])
         current_list = new_summaries
+        current_tokens_list = new_tokens_list
 
 
 async def _summarize_descriptions(
@@ -332,6 +428,7 @@ async def _summarize_descriptions(
     context_base = dict(
         description_type=description_type,
         description_name=description_name,
+        entity_name=description_name,
         description_list=joined_descriptions,
         summary_length=summary_length_recommended,
         language=language,
@@ -515,6 +612,7 @@ async def rebuild_knowledge_from_chunks(
     pipeline_status_lock=None,
     entity_chunks_storage: BaseKVStorage | None = None,
     relation_chunks_storage: BaseKVStorage | None = None,
+    chunk_extractions_storage: BaseKVStorage | None = None,
 ) -> None:
     """Rebuild entity and relationship descriptions from cached extraction results with parallel processing
 
@@ -535,6 +633,8 @@ async def rebuild_knowledge_from_chunks(
         pipeline_status_lock: Lock for pipeline status
         entity_chunks_storage: KV storage maintaining full chunk IDs per entity
         relation_chunks_storage: KV storage maintaining full chunk IDs per relation
+        chunk_extractions_storage: KV storage with the parsed extraction result per chunk,
+            chunks without a current record are parsed from the LLM cache and backfilled
     """
     if not entities_to_rebuild and not relationships_to_rebuild:
         return
@@ -553,15 +653,36 @@ async def rebuild_knowledge_from_chunks(
             pipeline_status["latest_message"] = status_message
             pipeline_status["history_messages"].append(status_message)
 
-    # Get cached extraction results for these chunks using storage
+    chunk_entities = {}  # chunk_id -> {entity_name: [entity_data]}
+    chunk_relationships = {}  # chunk_id -> {(src, tgt): [relationship_data]}
+
+    # Read already parsed extraction results, keeping only the entities and relations being rebuilt
+    unparsed_chunk_ids = set(all_referenced_chunk_ids)
+    if chunk_extractions_storage is not None:
+        chunk_id_list = list(all_referenced_chunk_ids)
+        records = await chunk_extractions_storage.get_by_ids(chunk_id_list)
+        for chunk_id, record in zip(chunk_id_list, records):
+            stored = _unpack_chunk_extraction(
+                chunk_id, record, entities_to_rebuild, relationships_to_rebuild
+            )
+            if stored is not None:
+                chunk_entities[chunk_id], chunk_relationships[chunk_id] = stored
+                unparsed_chunk_ids.discard(chunk_id)
+        logger.info(
+            f"Found {len(chunk_entities)} stored chunk extractions, {len(unparsed_chunk_ids)} chunks left to parse from LLM cache"
+        )
+
+    # Get cached extraction results for the remaining chunks using storage
     # cached_results： chunk_id -> [list of (extraction_result, create_time) from LLM cache sorted by create_time of the first extraction_result]
-    cached_results = await _get_cached_extraction_results(
-        llm_response_cache,
-        all_referenced_chunk_ids,
-        text_chunks_storage=text_chunks_storage,
-    )
+    cached_results = {}
+    if unparsed_chunk_ids:
+        cached_results = await _get_cached_extraction_results(
+            llm_response_cache,
+            unparsed_chunk_ids,
+            text_chunks_storage=text_chunks_storage,
+        )
 
-    if not cached_results:
+    if not cached_results and not chunk_entities:
         status_message = "No cached extraction results found, cannot rebuild"
         logger.warning(status_message)
         if pipeline_status is not None and pipeline_status_lock is not None:
@@ -571,9 +692,7 @@ async def rebuild_knowledge_from_chunks(
         return
 
     # Process cached results to get entities and relationships for each chunk
-    chunk_entities = {}  # chunk_id -> {entity_name: [entity_data]}
-    chunk_relationships = {}  # chunk_id -> {(src, tgt): [relationship_data]}
-
+    parsed_chunk_ids = []
     for chunk_id, results in cached_results.items():
         try:
             # Handle multiple extraction results per chunk
@@ -636,6 +755,8 @@ async def rebuild_knowledge_from_chunks(
                             chunk_relationships[chunk_id][rel_key] = list(rel_list)
                         # Otherwise keep existing version
 
+            parsed_chunk_ids.append(chunk_id)
+
         except Exception as e:
             status_message = (
                 f"Failed to parse cached extraction result for chunk {chunk_id}: {e}"
@@ -647,6 +768,27 @@ async def rebuild_knowledge_from_chunks(
                     pipeline_status["history_messages"].append(status_message)
             continue
 
+    # Backfill the store so later rebuilds of these chunks skip parsing
+    if chunk_extractions_storage is not None and parsed_chunk_ids:
+        backfill = {}
+        for chunk_id in parsed_chunk_ids:
+            entities, relationships = (
+                chunk_entities[chunk_id],
+                chunk_relationships[chunk_id],
+            )
+            file_path = next(
+                (
+                    data.get("file_path", "unknown_source")
+                    for data_list in (*entities.values(), *relationships.values())
+                    for data in data_list
+                ),
+                "unknown_source",
+            )
+            backfill[chunk_id] = _pack_chunk_extraction(
+                entities, relationships, file_path
+            )
+        await chunk_extractions_storage.upsert(backfill)
+
     # Get max async tasks limit from global_config for semaphore control
     graph_max_async = global_config.get("llm_model_max_async", 4) * 2
     semaphore = asyncio.Semaphore(graph_max_async)
@@ -789,6 +931,79 @@ async def rebuild_knowledge_from_chunks(
             pipeline_status["history_messages"].append(status_message)
 
 
+_ENTITY_CONTEXT_FIELDS = ("entity_name", "source_id", "file_path")
+_RELATION_CONTEXT_FIELDS = ("src_id", "tgt_id", "source_id", "file_path")
+
+
+def _pack_chunk_extraction(
+    maybe_nodes: dict[str, list[dict]],
+    maybe_edges: dict[tuple[str, str], list[dict]],
+    file_path: str,
+) -> dict[str, Any]:
+    """Build the chunk_extractions record for the parsed extraction result of one chunk
+
+    Fields implied by the record (entity/relation key, source chunk and file path) are
+    left out of the individual entries and restored by _unpack_chunk_extraction.
+    Relations are stored as [src, tgt, entries] since JSON objects cannot have tuple keys.
+    """
+    return {
+        "version": CHUNK_EXTRACTION_VERSION,
+        "file_path": file_path,
+        "entities": {
+            entity_name: [
+                {k: v for k, v in data.items() if k not in _ENTITY_CONTEXT_FIELDS}
+                for data in data_list
+            ]
+            for entity_name, data_list in maybe_nodes.items()
+        },
+        "relations": [
+            [
+                src,
+                tgt,
+                [
+                    {k: v for k, v in data.items() if k not in _RELATION_CONTEXT_FIELDS}
+                    for data in data_list
+                ],
+            ]
+            for (src, tgt), data_list in maybe_edges.items()
+        ],
+    }
+
+
+def _unpack_chunk_extraction(
+    chunk_id: str,
+    record: dict[str, Any] | None,
+    entity_names: Collection[str],
+    relation_keys: Collection[tuple[str, str]],
+) -> tuple[dict, dict] | None:
+    """Restore the entities and relations of a chunk_extractions record
+
+    Only entries for the given entity names and relation keys (in either direction) are
+    restored. Returns None when the record is missing or has an outdated version.
+    """
+    if not record or record.get("version") != CHUNK_EXTRACTION_VERSION:
+        return None
+
+    file_path = record.get("file_path", "unknown_source")
+    context = {"source_id": chunk_id, "file_path": file_path}
+
+    entities = {
+        entity_name: [
+            {**data, "entity_name": entity_name, **context} for data in data_list
+        ]
+        for entity_name, data_list in record.get("entities", {}).items()
+        if entity_name in entity_names
+    }
+    relationships = {
+        (src, tgt): [
+            {**data, "src_id": src, "tgt_id": tgt, **context} for data in data_list
+        ]
+        for src, tgt, data_list in record.get("relations", [])
+        if (src, tgt) in relation_keys or (tgt, src) in relation_keys
+    }
+    return entities, relationships
+
+
 async def _get_cached_extraction_results(
     llm_response_cache: BaseKVStorage,
     chunk_ids: set[str],
@@ -2367,6 +2582,391 @@ async def _merge_edges_then_upsert(
     return edge_data
 
 
+def _undirected_key(src_id: str, tgt_id: str) -> tuple[str, str]:
+    return (src_id, tgt_id) if src_id <= tgt_id else (tgt_id, src_id)
+
+
+class _SharedMergeWrites:
+    """State shared by the buffers of all documents merging into one storage.
+
+    Flushes and prefetches of the buffers run under one lock, and a flush drops
+    the written records from every buffer's prefetched state, so no document
+    keeps reading a record another document has changed since.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.flush_lock = asyncio.Lock()
+        # Per-document buffers of the storage currently in use
+        self.buffers: set[_MergeWriteBuffer] = set()
+
+
+class _MergeWriteBuffer(ABC):
+    """Base of the write buffers standing in for storages during the merge stage.
+
+    Writes are collected per kind (e.g. nodes and edges) and written with one
+    batch call per kind. Reads are served from the pending writes, then the
+    batch being flushed, then records prefetched with one batch read, and only
+    then from the storage itself. Only the reads and writes used by the merge
+    stage are provided, nothing is forwarded to the storage behind the buffer's
+    back.
+
+    Each document merges through its own buffer, and every merge flushes its
+    writes before releasing its keyed lock (see ``_MergeCommitGroup``).
+    """
+
+    _kinds: tuple[str, ...] = ()
+
+    def __init__(self, storage, batch_size: int, shared: _SharedMergeWrites):
+        self.storage = storage
+        self.batch_size = max(1, batch_size)
+        self._shared = shared
+        self._pending = self._empty()
+        # Writes of the batch currently being flushed, still served to readers
+        self._flushing = self._empty()
+        # Prefetched storage state, None marks a record known to be missing
+        self._prefetched = self._empty()
+        shared.buffers.add(self)
+
+    def _empty(self) -> dict[str, dict]:
+        return {kind: {} for kind in self._kinds}
+
+    def _lookup(self, kind: str, key) -> tuple[bool, Any]:
+        for layer in (self._pending, self._flushing, self._prefetched):
+            if key in layer[kind]:
+                return True, layer[kind][key]
+        return False, None
+
+    def has_pending(self) -> bool:
+        return any(self._pending.values())
+
+    def is_full(self) -> bool:
+        return sum(len(writes) for writes in self._pending.values()) >= self.batch_size
+
+    def discard_prefetched(self) -> None:
+        self._prefetched = self._empty()
+
+    async def _record(self, kind: str, key, value) -> None:
+        self._pending[kind][key] = value
+
+    async def _prefetch(self, kind: str, keys, fetch) -> None:
+        """Load the records of keys not known yet with one batch read.
+
+        Runs under the flush lock, so a concurrent flush cannot leave a stale
+        prefetched record behind.
+        """
+        async with self._shared.flush_lock:
+            missing = [
+                key for key in dict.fromkeys(keys) if not self._lookup(kind, key)[0]
+            ]
+            if missing:
+                self._prefetched[kind].update(await fetch(missing))
+
+    @abstractmethod
+    async def _write(self, batch: dict[str, dict]) -> None:
+        """Write one batch of buffered records to the storage"""
+
+    async def flush(self) -> None:
+        """Write all buffered records to the storage.
+
+        A failed batch is not kept for a retry: the merges that wrote it are
+        failed with the error before they release their keyed locks.
+        """
+        shared = self._shared
+        async with shared.flush_lock:
+            if not self.has_pending():
+                return
+            self._flushing, self._pending = self._pending, self._empty()
+            try:
+                await self._write(self._flushing)
+            finally:
+                # Written (or possibly partly written) records are read back
+                # from the storage when needed
+                for buffer in shared.buffers:
+                    for kind, writes in self._flushing.items():
+                        for key in writes:
+                            buffer._prefetched[kind].pop(key, None)
+                self._flushing = self._empty()
+
+
+class _GraphWriteBuffer(_MergeWriteBuffer):
+    """Graph storage buffer: nodes are written before the edges that reference them"""
+
+    _kinds = ("nodes", "edges")
+
+    async def get_node(self, node_id: str) -> dict[str, str] | None:
+        found, node = self._lookup("nodes", node_id)
+        if not found:
+            return await self.storage.get_node(node_id)
+        return dict(node) if node is not None else None
+
+    async def has_edge(self, source_node_id: str, target_node_id: str) -> bool:
+        found, edge = self._lookup(
+            "edges", _undirected_key(source_node_id, target_node_id)
+        )
+        if not found:
+            return await self.storage.has_edge(source_node_id, target_node_id)
+        return edge is not None
+
+    async def get_edge(
+        self, source_node_id: str, target_node_id: str
+    ) -> dict[str, str] | None:
+        found, edge = self._lookup(
+            "edges", _undirected_key(source_node_id, target_node_id)
+        )
+        if not found:
+            return await self.storage.get_edge(source_node_id, target_node_id)
+        return dict(edge) if edge is not None else None
+
+    async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
+        # Merge like the storages' property update, so a later partial upsert
+        # of the same node keeps the earlier properties
+        pending = self._pending["nodes"].get(node_id, {})
+        await self._record("nodes", node_id, {**pending, **node_data})
+
+    async def upsert_edge(
+        self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
+    ) -> None:
+        key = _undirected_key(source_node_id, target_node_id)
+        pending = self._pending["edges"].get(key, {})
+        await self._record("edges", key, {**pending, **edge_data})
+
+    async def prefetch_nodes(self, node_ids: list[str]) -> None:
+        async def fetch(keys: list[str]) -> dict:
+            nodes = await self.storage.get_nodes_batch(keys)
+            return {key: nodes.get(key) for key in keys}
+
+        await self._prefetch("nodes", node_ids, fetch)
+
+    async def prefetch_edges(self, edge_pairs: list[tuple[str, str]]) -> None:
+        async def fetch(keys: list[tuple[str, str]]) -> dict:
+            edges = await self.storage.get_edges_batch(
+                [{"src": src, "tgt": tgt} for src, tgt in keys]
+            )
+            return {key: edges.get(key) for key in keys}
+
+        await self._prefetch(
+            "edges", [_undirected_key(src, tgt) for src, tgt in edge_pairs], fetch
+        )
+
+    async def _write(self, batch: dict[str, dict]) -> None:
+        if batch["nodes"]:
+            await self.storage.upsert_nodes_batch(batch["nodes"])
+        if batch["edges"]:
+            await self.storage.upsert_edges_batch(batch["edges"])
+
+
+class _KVWriteBuffer(_MergeWriteBuffer):
+    """KV storage buffer for the entity and relation chunk lists"""
+
+    _kinds = ("records",)
+
+    async def get_by_id(self, id: str) -> dict[str, Any] | None:
+        found, record = self._lookup("records", id)
+        if not found:
+            return await self.storage.get_by_id(id)
+        return record
+
+    async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
+        for key, record in data.items():
+            await self._record("records", key, record)
+
+    async def prefetch(self, ids: list[str]) -> None:
+        async def fetch(keys: list[str]) -> dict:
+            return dict(zip(keys, await self.storage.get_by_ids(keys)))
+
+        await self._prefetch("records", ids, fetch)
+
+    async def _write(self, batch: dict[str, dict]) -> None:
+        await self.storage.upsert(batch["records"])
+
+
+class _VectorWriteBuffer(_MergeWriteBuffer):
+    """Vector storage buffer: all changed records are embedded in one upsert call"""
+
+    _kinds = ("deletes", "upserts")
+
+    async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
+        for key, record in data.items():
+            await self._record("upserts", key, record)
+
+    async def delete(self, ids: list[str]) -> None:
+        for id in ids:
+            self._pending["upserts"].pop(id, None)
+            await self._record("deletes", id, None)
+
+    async def _write(self, batch: dict[str, dict]) -> None:
+        # Deletes go first: a record deleted and then upserted again is kept
+        if batch["deletes"]:
+            try:
+                await self.storage.delete(list(batch["deletes"]))
+            except Exception as e:
+                logger.debug(
+                    f"Could not delete {len(batch['deletes'])} old vector records: {e}"
+                )
+        if batch["upserts"]:
+            await safe_vdb_operation_with_exception(
+                operation=lambda: self.storage.upsert(batch["upserts"]),
+                operation_name="merge_upsert",
+                entity_name=f"{len(batch['upserts'])} records",
+                max_retries=3,
+                retry_delay=0.2,
+            )
+
+
+# Merge-stage state in use, keyed by id() of the storage it is shared for
+_shared_merge_writes: dict[int, _SharedMergeWrites] = {}
+
+
+def _acquire_merge_write_buffer(buffer_cls, storage, batch_size: int):
+    """Create a document's buffer for the storage"""
+    if storage is None:
+        return None
+    shared = _shared_merge_writes.get(id(storage))
+    if shared is None or shared.storage is not storage:
+        shared = _SharedMergeWrites(storage)
+        _shared_merge_writes[id(storage)] = shared
+    return buffer_cls(storage, batch_size, shared)
+
+
+async def _release_merge_write_buffers(
+    buffers: list, raise_errors: bool = True
+) -> None:
+    """Flush the buffers of a document and drop them.
+
+    With ``raise_errors`` disabled, flush failures are logged instead of raised,
+    so that they do not replace the exception a failed merge is raising.
+    """
+    first_exception = None
+    for buffer in buffers:
+        if buffer is None:
+            continue
+        shared = buffer._shared
+        try:
+            await buffer.flush()
+        except Exception as e:
+            if raise_errors:
+                if first_exception is None:
+                    first_exception = e
+            else:
+                logger.error(
+                    f"Failed to flush merge writes to {type(buffer.storage).__name__}: {e}"
+                )
+        except BaseException as e:
+            if first_exception is None:
+                first_exception = e
+        finally:
+            shared.buffers.discard(buffer)
+            if not shared.buffers:
+                if _shared_merge_writes.get(id(buffer.storage)) is shared:
+                    del _shared_merge_writes[id(buffer.storage)]
+    if first_exception is not None:
+        raise first_exception
+
+
+class _MergeCommitGroup:
+    """Group commit of the merge writes of one document.
+
+    Each entity or relation merge runs in ``merge()`` while holding its keyed
+    lock, and does not return before its buffered writes are flushed. So
+    edits and deletions taking the same lock never see, or get overwritten by,
+    a merge that is not written yet. A flush starts once no other merge of the
+    group is running or a buffer holds ``batch_size`` writes, and covers the
+    writes of every merge waiting for it.
+
+    Graph edits made outside the merge stage (see utils_graph) bump a shared
+    counter per lock namespace. When it changed since the buffers were
+    prefetched, the prefetched records are dropped and read again.
+    """
+
+    def __init__(self, buffers: list, graph_edits, lock_namespace: str):
+        self._buffers = [buffer for buffer in buffers if buffer is not None]
+        self._graph_edits = graph_edits
+        self._lock_namespace = lock_namespace
+        self._edit_generation = None
+        self._running = 0
+        self._waiters: list[asyncio.Future] = []
+        self._flush_task: asyncio.Task | None = None
+
+    def start_prefetch(self) -> None:
+        """Remember the graph edit generation the next prefetch reads"""
+        self._edit_generation = self._graph_edits.get(self._lock_namespace, 0)
+
+    def _check_graph_edits(self) -> None:
+        generation = self._graph_edits.get(self._lock_namespace, 0)
+        if generation != self._edit_generation:
+            for buffer in self._buffers:
+                buffer.discard_prefetched()
+            self._edit_generation = generation
+
+    @asynccontextmanager
+    async def merge(self):
+        """Run one merge, entered and left while its keyed lock is held"""
+        self._check_graph_edits()
+        self._running += 1
+        try:
+            yield
+        except BaseException:
+            # Write what the merge got to before failing, as direct storage
+            # writes would have, without replacing its error
+            self._running -= 1
+            try:
+                await self._commit()
+            except Exception as e:
+                logger.error(f"Failed to flush merge writes: {e}")
+            raise
+        self._running -= 1
+        await self._commit()
+
+    async def _commit(self) -> None:
+        if not any(buffer.has_pending() for buffer in self._buffers):
+            self._start_flush()
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._start_flush()
+        await waiter
+
+    def _flush_due(self) -> bool:
+        return bool(self._waiters) and (
+            self._running == 0 or any(buffer.is_full() for buffer in self._buffers)
+        )
+
+    def _start_flush(self) -> None:
+        # The flush runs in its own task, so a cancelled waiter cannot abort it
+        if self._flush_task is None and self._flush_due():
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        waiters = []
+        try:
+            while self._flush_due():
+                waiters, self._waiters = self._waiters, []
+                error = None
+                # Graph first, so nodes and edges exist before their vectors
+                for buffer in self._buffers:
+                    try:
+                        await buffer.flush()
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                for waiter in waiters:
+                    if waiter.done():
+                        continue
+                    if error is None:
+                        waiter.set_result(None)
+                    else:
+                        waiter.set_exception(error)
+                waiters = []
+        except BaseException as e:
+            for waiter in waiters + self._waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            raise
+        finally:
+            self._flush_task = None
+
+
 async def merge_nodes_and_edges(
     chunk_results: list,
     knowledge_graph_inst: BaseGraphStorage,
@@ -2440,230 +3040,302 @@ async def merge_nodes_and_edges(
         pipeline_status["latest_message"] = log_message
         pipeline_status["history_messages"].append(log_message)
 
-    # Get max async tasks limit from global_config for semaphore control
-    graph_max_async = global_config.get("llm_model_max_async", 4) * 2
-    semaphore = asyncio.Semaphore(graph_max_async)
-
-    # ===== Phase 1: Process all entities concurrently =====
-    log_message = f"Phase 1: Processing {total_entities_count} entities from {doc_id} (async: {graph_max_async})"
-    logger.info(log_message)
-    async with pipeline_status_lock:
-        pipeline_status["latest_message"] = log_message
-        pipeline_status["history_messages"].append(log_message)
-
-    async def _locked_process_entity_name(entity_name, entities):
-        async with semaphore:
-            # Check for cancellation before processing entity
-            if pipeline_status is not None and pipeline_status_lock is not None:
-                async with pipeline_status_lock:
-                    if pipeline_status.get("cancellation_requested", False):
-                        raise PipelineCancelledException(
-                            "User cancelled during entity merge"
-                        )
+    # Reads of both phases are prefetched with batch calls and the writes of
+    # concurrent merges are group committed, so storages are hit in bulk
+    # instead of once per entity
+    batch_size = global_config.get(
+        "merge_write_batch_size", DEFAULT_MERGE_WRITE_BATCH_SIZE
+    )
+    graph_writer = _acquire_merge_write_buffer(
+        _GraphWriteBuffer, knowledge_graph_inst, batch_size
+    )
+    entity_chunks_writer = _acquire_merge_write_buffer(
+        _KVWriteBuffer, entity_chunks_storage, batch_size
+    )
+    relation_chunks_writer = _acquire_merge_write_buffer(
+        _KVWriteBuffer, relation_chunks_storage, batch_size
+    )
+    entity_vdb_writer = _acquire_merge_write_buffer(
+        _VectorWriteBuffer, entity_vdb, batch_size
+    )
+    relationships_vdb_writer = _acquire_merge_write_buffer(
+        _VectorWriteBuffer, relationships_vdb, batch_size
+    )
+    merge_writers = [
+        graph_writer,
+        entity_chunks_writer,
+        relation_chunks_writer,
+        entity_vdb_writer,
+        relationships_vdb_writer,
+    ]
+    workspace = global_config.get("workspace", "")
+    lock_namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
+    commit_group = _MergeCommitGroup(
+        merge_writers, await get_namespace_data("graph_edits"), lock_namespace
+    )
+    try:
+        # Get max async tasks limit from global_config for semaphore control
+        graph_max_async = global_config.get("llm_model_max_async", 4) * 2
+        semaphore = asyncio.Semaphore(graph_max_async)
 
-            workspace = global_config.get("workspace", "")
-            namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-            async with get_storage_keyed_lock(
-                [entity_name], namespace=namespace, enable_logging=False
-            ):
-                try:
-                    logger.debug(f"Processing entity {entity_name}")
-                    entity_data = await _merge_nodes_then_upsert(
-                        entity_name,
-                        entities,
-                        knowledge_graph_inst,
-                        entity_vdb,
-                        global_config,
-                        pipeline_status,
-                        pipeline_status_lock,
-                        llm_response_cache,
-                        entity_chunks_storage,
-                    )
+        # ===== Phase 1: Process all entities concurrently =====
+        log_message = f"Phase 1: Processing {total_entities_count} entities from {doc_id} (async: {graph_max_async})"
+        logger.info(log_message)
+        async with pipeline_status_lock:
+            pipeline_status["latest_message"] = log_message
+            pipeline_status["history_messages"].append(log_message)
+
+        # Prefetch existing nodes and chunk lists of all entities in batch reads
+        entity_names = list(all_nodes)
+        commit_group.start_prefetch()
+        prefetches = [graph_writer.prefetch_nodes(entity_names)]
+        if entity_chunks_writer is not None:
+            prefetches.append(entity_chunks_writer.prefetch(entity_names))
+        await asyncio.gather(*prefetches)
+
+        async def _locked_process_entity_name(entity_name, entities):
+            async with semaphore:
+                # Check for cancellation before processing entity
+                if pipeline_status is not None and pipeline_status_lock is not None:
+                    async with pipeline_status_lock:
+                        if pipeline_status.get("cancellation_requested", False):
+                            raise PipelineCancelledException(
+                                "User cancelled during entity merge"
+                            )
 
-                    return entity_data
+                async with get_storage_keyed_lock(
+                    [entity_name], namespace=lock_namespace, enable_logging=False
+                ):
+                    try:
+                        logger.debug(f"Processing entity {entity_name}")
+                        async with commit_group.merge():
+                            entity_data = await _merge_nodes_then_upsert(
+                                entity_name,
+                                entities,
+                                graph_writer,
+                                entity_vdb_writer,
+                                global_config,
+                                pipeline_status,
+                                pipeline_status_lock,
+                                llm_response_cache,
+                                entity_chunks_writer,
+                            )
 
-                except Exception as e:
-                    error_msg = f"Error processing entity `{entity_name}`: {e}"
-                    logger.error(error_msg)
+                        return entity_data
+
+                    except Exception as e:
+                        error_msg = f"Error processing entity `{entity_name}`: {e}"
+                        logger.error(error_msg)
+
+                        # Try to update pipeline status, but don't let status update failure affect main exception
+                        try:
+                            if (
+                                pipeline_status is not None
+                                and pipeline_status_lock is not None
+                            ):
+                                async with pipeline_status_lock:
+                                    pipeline_status["latest_message"] = error_msg
+                                    pipeline_status["history_messages"].append(
+                                        error_msg
+                                    )
+                        except Exception as status_error:
+                            logger.error(
+                                f"Failed to update pipeline status: {status_error}"
+                            )
 
-                    # Try to update pipeline status, but don't let status update failure affect main exception
-                    try:
-                        if (
-                            pipeline_status is not None
-                            and pipeline_status_lock is not None
-                        ):
-                            async with pipeline_status_lock:
-                                pipeline_status["latest_message"] = error_msg
-                                pipeline_status["history_messages"].append(error_msg)
-                    except Exception as status_error:
-                        logger.error(
-                            f"Failed to update pipeline status: {status_error}"
+                        # Re-raise the original exception with a prefix
+                        prefixed_exception = create_prefixed_exception(
+                            e, f"`{entity_name}`"
                         )
+                        raise prefixed_exception from e
 
-                    # Re-raise the original exception with a prefix
-                    prefixed_exception = create_prefixed_exception(
-                        e, f"`{entity_name}`"
-                    )
-                    raise prefixed_exception from e
-
-    # Create entity processing tasks
-    entity_tasks = []
-    for entity_name, entities in all_nodes.items():
-        task = asyncio.create_task(_locked_process_entity_name(entity_name, entities))
-        entity_tasks.append(task)
-
-    # Execute entity tasks with error handling
-    processed_entities = []
-    if entity_tasks:
-        done, pending = await asyncio.wait(
-            entity_tasks, return_when=asyncio.FIRST_EXCEPTION
-        )
+        # Create entity processing tasks
+        entity_tasks = []
+        for entity_name, entities in all_nodes.items():
+            task = asyncio.create_task(
+                _locked_process_entity_name(entity_name, entities)
+            )
+            entity_tasks.append(task)
 
-        first_exception = None
+        # Execute entity tasks with error handling
         processed_entities = []
+        if entity_tasks:
+            done, pending = await asyncio.wait(
+                entity_tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
 
-        for task in done:
-            try:
-                result = task.result()
-            except BaseException as e:
-                if first_exception is None:
-                    first_exception = e
-            else:
-                processed_entities.append(result)
+            first_exception = None
+            processed_entities = []
 
-        if pending:
-            for task in pending:
-                task.cancel()
-            pending_results = await asyncio.gather(*pending, return_exceptions=True)
-            for result in pending_results:
-                if isinstance(result, BaseException):
+            for task in done:
+                try:
+                    result = task.result()
+                except BaseException as e:
                     if first_exception is None:
-                        first_exception = result
+                        first_exception = e
                 else:
                     processed_entities.append(result)
 
-        if first_exception is not None:
-            raise first_exception
+            if pending:
+                for task in pending:
+                    task.cancel()
+                pending_results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in pending_results:
+                    if isinstance(result, BaseException):
+                        if first_exception is None:
+                            first_exception = result
+                    else:
+                        processed_entities.append(result)
 
-    # ===== Phase 2: Process all relationships concurrently =====
-    log_message = f"Phase 2: Processing {total_relations_count} relations from {doc_id} (async: {graph_max_async})"
-    logger.info(log_message)
-    async with pipeline_status_lock:
-        pipeline_status["latest_message"] = log_message
-        pipeline_status["history_messages"].append(log_message)
+            if first_exception is not None:
+                raise first_exception
 
-    async def _locked_process_edges(edge_key, edges):
-        async with semaphore:
-            # Check for cancellation before processing edges
-            if pipeline_status is not None and pipeline_status_lock is not None:
-                async with pipeline_status_lock:
-                    if pipeline_status.get("cancellation_requested", False):
-                        raise PipelineCancelledException(
-                            "User cancelled during relation merge"
-                        )
+        # ===== Phase 2: Process all relationships concurrently =====
+        log_message = f"Phase 2: Processing {total_relations_count} relations from {doc_id} (async: {graph_max_async})"
+        logger.info(log_message)
+        async with pipeline_status_lock:
+            pipeline_status["latest_message"] = log_message
+            pipeline_status["history_messages"].append(log_message)
+
+        # Prefetch existing edges, their endpoints and chunk lists in batch reads
+        edge_pairs = [edge_key for edge_key in all_edges if edge_key[0] != edge_key[1]]
+        endpoint_names = list({name for edge_key in edge_pairs for name in edge_key})
+        commit_group.start_prefetch()
+        prefetches = [
+            graph_writer.prefetch_edges(edge_pairs),
+            graph_writer.prefetch_nodes(endpoint_names),
+        ]
+        if relation_chunks_writer is not None:
+            prefetches.append(
+                relation_chunks_writer.prefetch(
+                    [make_relation_chunk_key(src, tgt) for src, tgt in edge_pairs]
+                )
+            )
+        if entity_chunks_writer is not None:
+            prefetches.append(entity_chunks_writer.prefetch(endpoint_names))
+        await asyncio.gather(*prefetches)
 
-            workspace = global_config.get("workspace", "")
-            namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-            sorted_edge_key = sorted([edge_key[0], edge_key[1]])
+        async def _locked_process_edges(edge_key, edges):
+            async with semaphore:
+                # Check for cancellation before processing edges
+                if pipeline_status is not None and pipeline_status_lock is not None:
+                    async with pipeline_status_lock:
+                        if pipeline_status.get("cancellation_requested", False):
+                            raise PipelineCancelledException(
+                                "User cancelled during relation merge"
+                            )
 
-            async with get_storage_keyed_lock(
-                sorted_edge_key,
-                namespace=namespace,
-                enable_logging=False,
-            ):
-                try:
-                    added_entities = []  # Track entities added during edge processing
-
-                    logger.debug(f"Processing relation {sorted_edge_key}")
-                    edge_data = await _merge_edges_then_upsert(
-                        edge_key[0],
-                        edge_key[1],
-                        edges,
-                        knowledge_graph_inst,
-                        relationships_vdb,
-                        entity_vdb,
-                        global_config,
-                        pipeline_status,
-                        pipeline_status_lock,
-                        llm_response_cache,
-                        added_entities,  # Pass list to collect added entities
-                        relation_chunks_storage,
-                        entity_chunks_storage,  # Add entity_chunks_storage parameter
-                    )
+                sorted_edge_key = sorted([edge_key[0], edge_key[1]])
 
-                    if edge_data is None:
-                        return None, []
+                async with get_storage_keyed_lock(
+                    sorted_edge_key,
+                    namespace=lock_namespace,
+                    enable_logging=False,
+                ):
+                    try:
+                        added_entities = []  # Track entities added during edge processing
+
+                        logger.debug(f"Processing relation {sorted_edge_key}")
+                        async with commit_group.merge():
+                            edge_data = await _merge_edges_then_upsert(
+                                edge_key[0],
+                                edge_key[1],
+                                edges,
+                                graph_writer,
+                                relationships_vdb_writer,
+                                entity_vdb_writer,
+                                global_config,
+                                pipeline_status,
+                                pipeline_status_lock,
+                                llm_response_cache,
+                                added_entities,  # Pass list to collect added entities
+                                relation_chunks_writer,
+                                entity_chunks_writer,  # Add entity_chunks_storage parameter
+                            )
 
-                    return edge_data, added_entities
+                        if edge_data is None:
+                            return None, []
 
-                except Exception as e:
-                    error_msg = f"Error processing relation `{sorted_edge_key}`: {e}"
-                    logger.error(error_msg)
+                        return edge_data, added_entities
 
-                    # Try to update pipeline status, but don't let status update failure affect main exception
-                    try:
-                        if (
-                            pipeline_status is not None
-                            and pipeline_status_lock is not None
-                        ):
-                            async with pipeline_status_lock:
-                                pipeline_status["latest_message"] = error_msg
-                                pipeline_status["history_messages"].append(error_msg)
-                    except Exception as status_error:
-                        logger.error(
-                            f"Failed to update pipeline status: {status_error}"
+                    except Exception as e:
+                        error_msg = (
+                            f"Error processing relation `{sorted_edge_key}`: {e}"
                         )
+                        logger.error(error_msg)
+
+                        # Try to update pipeline status, but don't let status update failure affect main exception
+                        try:
+                            if (
+                                pipeline_status is not None
+                                and pipeline_status_lock is not None
+                            ):
+                                async with pipeline_status_lock:
+                                    pipeline_status["latest_message"] = error_msg
+                                    pipeline_status["history_messages"].append(
+                                        error_msg
+                                    )
+                        except Exception as status_error:
+                            logger.error(
+                                f"Failed to update pipeline status: {status_error}"
+                            )
 
-                    # Re-raise the original exception with a prefix
-                    prefixed_exception = create_prefixed_exception(
-                        e, f"{sorted_edge_key}"
-                    )
-                    raise prefixed_exception from e
-
-    # Create relationship processing tasks
-    edge_tasks = []
-    for edge_key, edges in all_edges.items():
-        task = asyncio.create_task(_locked_process_edges(edge_key, edges))
-        edge_tasks.append(task)
+                        # Re-raise the original exception with a prefix
+                        prefixed_exception = create_prefixed_exception(
+                            e, f"{sorted_edge_key}"
+                        )
+                        raise prefixed_exception from e
 
-    # Execute relationship tasks with error handling
-    processed_edges = []
-    all_added_entities = []
+        # Create relationship processing tasks
+        edge_tasks = []
+        for edge_key, edges in all_edges.items():
+            task = asyncio.create_task(_locked_process_edges(edge_key, edges))
+            edge_tasks.append(task)
 
-    if edge_tasks:
-        done, pending = await asyncio.wait(
-            edge_tasks, return_when=asyncio.FIRST_EXCEPTION
-        )
+        # Execute relationship tasks with error handling
+        processed_edges = []
+        all_added_entities = []
 
-        first_exception = None
+        if edge_tasks:
+            done, pending = await asyncio.wait(
+                edge_tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
 
-        for task in done:
-            try:
-                edge_data, added_entities = task.result()
-            except BaseException as e:
-                if first_exception is None:
-                    first_exception = e
-            else:
-                if edge_data is not None:
-                    processed_edges.append(edge_data)
-                all_added_entities.extend(added_entities)
+            first_exception = None
 
-        if pending:
-            for task in pending:
-                task.cancel()
-            pending_results = await asyncio.gather(*pending, return_exceptions=True)
-            for result in pending_results:
-                if isinstance(result, BaseException):
+            for task in done:
+                try:
+                    edge_data, added_entities = task.result()
+                except BaseException as e:
                     if first_exception is None:
-                        first_exception = result
+                        first_exception = e
                 else:
-                    edge_data, added_entities = result
                     if edge_data is not None:
                         processed_edges.append(edge_data)
                     all_added_entities.extend(added_entities)
 
-        if first_exception is not None:
-            raise first_exception
+            if pending:
+                for task in pending:
+                    task.cancel()
+                pending_results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in pending_results:
+                    if isinstance(result, BaseException):
+                        if first_exception is None:
+                            first_exception = result
+                    else:
+                        edge_data, added_entities = result
+                        if edge_data is not None:
+                            processed_edges.append(edge_data)
+                        all_added_entities.extend(added_entities)
+
+            if first_exception is not None:
+                raise first_exception
+    except BaseException:
+        # Merges flush their own writes, this only drops the buffers without
+        # letting a flush failure replace the merge error
+        await _release_merge_write_buffers(merge_writers, raise_errors=False)
+        raise
+    await _release_merge_write_buffers(merge_writers)
 
     # ===== Phase 3: Update full_entities and full_relations storage =====
     if full_entities_storage and full_relations_storage and doc_id:
@@ -2744,6 +3416,7 @@ async def extract_entities(
     pipeline_status_lock=None,
     llm_response_cache: BaseKVStorage | None = None,
     text_chunks_storage: BaseKVStorage | None = None,
+    chunk_extractions_storage: BaseKVStorage | None = None,
 ) -> list:
     # Check for cancellation at the start of entity extraction
     if pipeline_status is not None and pipeline_status_lock is not None:
@@ -2892,6 +3565,12 @@ async def extract_entities(
                     # New edge from gleaning stage
                     maybe_edges[edge_key] = list(glean_edges)
 
+        # Store the parsed result so rebuilds after deletion don't parse the LLM output again
+        if chunk_extractions_storage is not None:
+            await chunk_extractions_storage.upsert(
+                {chunk_key: _pack_chunk_extraction(maybe_nodes, maybe_edges, file_path)}
+            )
+
         # Batch update chunk's llm_cache_list with all collected cache keys
         if cache_keys_collector and text_chunks_storage:
             await update_chunk_cache_list(
@@ -2982,6 +3661,65 @@ async def extract_entities(
     return chunk_results
 
 
+async def _lookup_query_cache(
+    query: str,
+    query_param: QueryParam,
+    system_prompt: str | None,
+    query_cache: SemanticQueryCache | None,
+    use_model_func,
+    global_config: dict[str, Any],
+) -> tuple[str | None, dict[str, Any] | None, Any]:
+    """
+    Look up a semantically similar query in the query cache.
+
+    Queries with conversation history are never cached, because the answer depends
+    on the dialogue rather than on the query alone.
+
+    Returns:
+        tuple: (cache scope or None when caching is not applicable,
+                cached payload or None on miss,
+                query embedding computed for the lookup, reusable for retrieval)
+    """
+    if query_cache is None or query_param.conversation_history:
+        return None, None, None
+
+    # Identify the model function itself, not the per-call partial wrapping it
+    model_func = use_model_func
+    while isinstance(model_func, partial):
+        model_func = model_func.func
+    model_scope = (
+        f"{getattr(model_func, '__module__', '')}."
+        f"{getattr(model_func, '__qualname__', type(model_func).__name__)}:"
+        f"{id(model_func)}:{global_config.get('llm_model_name', '')}"
+    )
+
+    cache_scope = compute_args_hash(
+        query_param.mode,
+        query_param.response_type,
+        query_param.top_k,
+        query_param.chunk_top_k,
+        query_param.max_entity_tokens,
+        query_param.max_relation_tokens,
+        query_param.max_total_tokens,
+        query_param.hl_keywords,
+        query_param.ll_keywords,
+        query_param.user_prompt or "",
+        query_param.enable_rerank,
+        query_param.nprobe,
+        query_param.ef_search,
+        model_scope,
+        system_prompt or "",
+    )
+    try:
+        cached_payload, query_embedding = await query_cache.lookup(
+            query, cache_scope, llm_func=use_model_func
+        )
+    except Exception as e:
+        logger.warning(f"Query cache lookup failed: {e}")
+        return None, None, None
+    return cache_scope, cached_payload, query_embedding
+
+
 async def kg_query(
     query: str,
     knowledge_graph_inst: BaseGraphStorage,
@@ -2993,6 +3731,7 @@ async def kg_query(
     hashing_kv: BaseKVStorage | None = None,
     system_prompt: str | None = None,
     chunks_vdb: BaseVectorStorage = None,
+    query_cache: SemanticQueryCache | None = None,
 ) -> QueryResult | None:
     """
     Execute knowledge graph query and return unified QueryResult object.
@@ -3008,6 +3747,7 @@ async def kg_query(
         hashing_kv: Cache storage
         system_prompt: System prompt
         chunks_vdb: Document chunks vector database
+        query_cache: Optional semantic cache reusing keywords, context and answers of similar queries
 
     Returns:
         QueryResult | None: Unified query result object containing:
@@ -3034,44 +3774,73 @@ async def kg_query(
         # Apply higher priority (5) to query relation LLM function
         use_model_func = partial(use_model_func, _priority=5)
 
-    hl_keywords, ll_keywords = await get_keywords_from_query(
-        query, query_param, global_config, hashing_kv
+    # Look up semantically similar queries answered before
+    cache_scope, cached_payload, query_embedding = await _lookup_query_cache(
+        query, query_param, system_prompt, query_cache, use_model_func, global_config
     )
 
-    logger.debug(f"High-level keywords: {hl_keywords}")
-    logger.debug(f"Low-level  keywords: {ll_keywords}")
-
-    # Handle empty keywords
-    if ll_keywords == [] and query_param.mode in ["local", "hybrid", "mix"]:
-        logger.warning("low_level_keywords is empty")
-    if hl_keywords == [] and query_param.mode in ["global", "hybrid", "mix"]:
-        logger.warning("high_level_keywords is empty")
-    if hl_keywords == [] and ll_keywords == []:
-        if len(query) < 50:
-            logger.warning(f"Forced low_level_keywords to origin query: {query}")
-            ll_keywords = [query]
-        else:
-            return QueryResult(content=PROMPTS["fail_response"])
+    if cached_payload is not None and "context" in cached_payload:
+        hl_keywords_str = cached_payload["hl_keywords"]
+        ll_keywords_str = cached_payload["ll_keywords"]
+        context_result = QueryContextResult(
+            context=cached_payload["context"],
+            raw_data=copy.deepcopy(cached_payload["raw_data"]),
+        )
+    else:
+        hl_keywords, ll_keywords = await get_keywords_from_query(
+            query, query_param, global_config, hashing_kv
+        )
 
-    ll_keywords_str = ", ".join(ll_keywords) if ll_keywords else ""
-    hl_keywords_str = ", ".join(hl_keywords) if hl_keywords else ""
+        logger.debug(f"High-level keywords: {hl_keywords}")
+        logger.debug(f"Low-level  keywords: {ll_keywords}")
+
+        # Handle empty keywords
+        if ll_keywords == [] and query_param.mode in ["local", "hybrid", "mix"]:
+            logger.warning("low_level_keywords is empty")
+        if hl_keywords == [] and query_param.mode in ["global", "hybrid", "mix"]:
+            logger.warning("high_level_keywords is empty")
+        if hl_keywords == [] and ll_keywords == []:
+            if len(query) < 50:
+                logger.warning(f"Forced low_level_keywords to origin query: {query}")
+                ll_keywords = [query]
+            else:
+                return QueryResult(content=PROMPTS["fail_response"])
 
-    # Build query context (unified interface)
-    context_result = await _build_query_context(
-        query,
-        ll_keywords_str,
-        hl_keywords_str,
-        knowledge_graph_inst,
-        entities_vdb,
-        relationships_vdb,
-        text_chunks_db,
-        query_param,
-        chunks_vdb,
-    )
+        ll_keywords_str = ", ".join(ll_keywords) if ll_keywords else ""
+        hl_keywords_str = ", ".join(hl_keywords) if hl_keywords else ""
 
-    if context_result is None:
-        logger.info("[kg_query] No query context could be built; returning no-result.")
-        return None
+        # Build query context (unified interface)
+        context_result = await _build_query_context(
+            query,
+            ll_keywords_str,
+            hl_keywords_str,
+            knowledge_graph_inst,
+            entities_vdb,
+            relationships_vdb,
+            text_chunks_db,
+            query_param,
+            chunks_vdb,
+            query_embedding=query_embedding,
+        )
+
+        if context_result is None:
+            logger.info(
+                "[kg_query] No query context could be built; returning no-result."
+            )
+            return None
+
+        if cache_scope is not None:
+            query_cache.store(
+                query,
+                cache_scope,
+                query_embedding,
+                {
+                    "hl_keywords": hl_keywords_str,
+                    "ll_keywords": ll_keywords_str,
+                    "context": context_result.context,
+                    "raw_data": copy.deepcopy(context_result.raw_data),
+                },
+            )
 
     # Return different content based on query parameters
     if query_param.only_need_context and not query_param.only_need_prompt:
@@ -3102,9 +3871,9 @@ async def kg_query(
 
     # Call LLM
     tokenizer: Tokenizer = global_config["tokenizer"]
-    len_of_prompts = len(tokenizer.encode(query + sys_prompt))
+    len_of_prompts = tokenizer.count_tokens(query + sys_prompt)
     logger.debug(
-        f"[kg_query] Sending to LLM: {len_of_prompts:,} tokens (Query: {len(tokenizer.encode(query))}, System: {len(tokenizer.encode(sys_prompt))})"
+        f"[kg_query] Sending to LLM: {len_of_prompts:,} tokens (Query: {tokenizer.count_tokens(query)}, System: {tokenizer.count_tokens(sys_prompt)})"
     )
 
     # Handle cache
@@ -3123,9 +3892,12 @@ async def kg_query(
         query_param.enable_rerank,
     )
 
-    cached_result = await handle_cache(
-        hashing_kv, args_hash, user_query, query_param.mode, cache_type="query"
-    )
+    if cached_payload is not None and "response" in cached_payload:
+        cached_result = (cached_payload["response"], 0)
+    else:
+        cached_result = await handle_cache(
+            hashing_kv, args_hash, user_query, query_param.mode, cache_type="query"
+        )
 
     if cached_result is not None:
         cached_response, _ = cached_result  # Extract content, ignore timestamp
@@ -3182,6 +3954,20 @@ async def kg_query(
                 .strip()
             )
 
+        if cache_scope is not None:
+            query_cache.store(
+                query,
+                cache_scope,
+                query_embedding,
+                {
+                    "hl_keywords": hl_keywords_str,
+                    "ll_keywords": ll_keywords_str,
+                    "context": context_result.context,
+                    "raw_data": copy.deepcopy(context_result.raw_data),
+                    "response": response,
+                },
+            )
+
         return QueryResult(content=response, raw_data=context_result.raw_data)
     else:
         # Streaming response (AsyncIterator)
@@ -3269,7 +4055,7 @@ async def extract_keywords_only(
     )
 
     tokenizer: Tokenizer = global_config["tokenizer"]
-    len_of_prompts = len(tokenizer.encode(kw_prompt))
+    len_of_prompts = tokenizer.count_tokens(kw_prompt)
     logger.debug(
         f"[extract_keywords] Sending to LLM: {len_of_prompts:,} tokens (Prompt: {len_of_prompts})"
     )
@@ -3333,6 +4119,16 @@ async def extract_keywords_only(
     return hl_keywords, ll_keywords
 
 
+def _vector_search_params(query_param: QueryParam) -> dict[str, Any] | None:
+    """Collect the per-query approximate-search options set on query_param"""
+    params = {
+        "nprobe": query_param.nprobe,
+        "ef_search": query_param.ef_search,
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+    return params or None
+
+
 async def _get_vector_context(
     query: str,
     chunks_vdb: BaseVectorStorage,
@@ -3360,7 +4156,10 @@ async def _get_vector_context(
         cosine_threshold = chunks_vdb.cosine_better_than_threshold
 
         results = await chunks_vdb.query(
-            query, top_k=search_top_k, query_embedding=query_embedding
+            query,
+            top_k=search_top_k,
+            query_embedding=query_embedding,
+            search_params=_vector_search_params(query_param),
         )
         if not results:
             logger.info(
@@ -3390,6 +4189,35 @@ async def _get_vector_context(
         return []
 
 
+async def _timed_stage(stage_timings: dict[str, float], stage: str, coro):
+    """Await a coroutine and record its wall-clock duration in milliseconds"""
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        stage_timings[stage] = round((time.perf_counter() - start) * 1000, 2)
+
+
+async def _batch_query_embeddings(texts: list[str], embedding_func) -> dict[str, Any]:
+    """
+    Embed all distinct texts needed by a query with a single embedding call.
+
+    Returns:
+        Mapping from text to its embedding. Empty on failure, in which case each
+        vector storage falls back to embedding its own query text.
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    try:
+        embeddings = await embedding_func(unique_texts, _priority=5)
+    except Exception as e:
+        logger.warning(f"Failed to pre-compute query embeddings: {e}")
+        return {}
+    logger.debug(
+        f"Pre-computed {len(unique_texts)} query embeddings in one embedding call"
+    )
+    return dict(zip(unique_texts, embeddings))
+
+
 async def _perform_kg_search(
     query: str,
     ll_keywords: str,
@@ -3400,6 +4228,7 @@ async def _perform_kg_search(
     text_chunks_db: BaseKVStorage,
     query_param: QueryParam,
     chunks_vdb: BaseVectorStorage = None,
+    query_embedding: list[float] = None,
 ) -> dict[str, Any]:
     """
     Pure search logic that retrieves raw entities, relations, and vector chunks.
@@ -3412,83 +4241,115 @@ async def _perform_kg_search(
     global_entities = []
     global_relations = []
     vector_chunks = []
-    chunk_tracking = {}
-
-    # Handle different query modes
 
     # Track chunk sources and metadata for final logging
     chunk_tracking = {}  # chunk_id -> {source, frequency, order}
 
-    # Pre-compute query embedding once for all vector operations
+    # Wall-clock duration of each search stage in milliseconds
+    stage_timings: dict[str, float] = {}
+
     kg_chunk_pick_method = text_chunks_db.global_config.get(
         "kg_chunk_pick_method", DEFAULT_KG_CHUNK_PICK_METHOD
     )
-    query_embedding = None
-    if query and (kg_chunk_pick_method == "VECTOR" or chunks_vdb):
-        embedding_func_config = text_chunks_db.embedding_func
-        if embedding_func_config and embedding_func_config.func:
-            try:
-                query_embedding = await embedding_func_config.func([query])
-                query_embedding = query_embedding[
-                    0
-                ]  # Extract first embedding from batch result
-                logger.debug("Pre-computed query embedding for all vector operations")
-            except Exception as e:
-                logger.warning(f"Failed to pre-compute query embedding: {e}")
-                query_embedding = None
 
-    # Handle local and global modes
-    if query_param.mode == "local" and len(ll_keywords) > 0:
-        local_entities, local_relations = await _get_node_data(
+    # Decide which retrieval paths run.
+    # local/global mode fall back to the other path when their own keywords are empty
+    run_local = len(ll_keywords) > 0 and (
+        query_param.mode != "global" or len(hl_keywords) == 0
+    )
+    run_global = len(hl_keywords) > 0 and (
+        query_param.mode != "local" or len(ll_keywords) == 0
+    )
+    run_vector = query_param.mode == "mix" and chunks_vdb
+
+    # Collect every text this query needs an embedding for and embed them in a
+    # single call: keywords for the entity/relationship VDBs, and the query itself
+    # for the chunk VDB and vector-based chunk picking.
+    texts_to_embed = []
+    if run_local:
+        texts_to_embed.append(ll_keywords)
+    if run_global:
+        texts_to_embed.append(hl_keywords)
+    if query_embedding is None and (
+        query and (kg_chunk_pick_method == "VECTOR" or chunks_vdb)
+    ):
+        texts_to_embed.append(query)
+
+    embedding_task = None
+    embedding_func = text_chunks_db.embedding_func
+    if texts_to_embed and embedding_func:
+        embedding_task = asyncio.ensure_future(
+            _timed_stage(
+                stage_timings,
+                "query_embedding",
+                _batch_query_embeddings(texts_to_embed, embedding_func),
+            )
+        )
+
+    async def _get_embedding(text: str):
+        if embedding_task is None:
+            return None
+        return (await embedding_task).get(text)
+
+    async def _local_search():
+        return await _get_node_data(
             ll_keywords,
             knowledge_graph_inst,
             entities_vdb,
             query_param,
+            query_embedding=await _get_embedding(ll_keywords),
         )
 
-    elif query_param.mode == "global" and len(hl_keywords) > 0:
-        global_relations, global_entities = await _get_edge_data(
+    async def _global_search():
+        return await _get_edge_data(
             hl_keywords,
             knowledge_graph_inst,
             relationships_vdb,
             query_param,
+            query_embedding=await _get_embedding(hl_keywords),
         )
 
-    else:  # hybrid or mix mode
-        if len(ll_keywords) > 0:
-            local_entities, local_relations = await _get_node_data(
-                ll_keywords,
-                knowledge_graph_inst,
-                entities_vdb,
-                query_param,
-            )
-        if len(hl_keywords) > 0:
-            global_relations, global_entities = await _get_edge_data(
-                hl_keywords,
-                knowledge_graph_inst,
-                relationships_vdb,
-                query_param,
-            )
-
-        # Get vector chunks for mix mode
-        if query_param.mode == "mix" and chunks_vdb:
-            vector_chunks = await _get_vector_context(
-                query,
-                chunks_vdb,
-                query_param,
-                query_embedding,
-            )
-            # Track vector chunks with source metadata
-            for i, chunk in enumerate(vector_chunks):
-                chunk_id = chunk.get("chunk_id") or chunk.get("id")
-                if chunk_id:
-                    chunk_tracking[chunk_id] = {
-                        "source": "C",
-                        "frequency": 1,  # Vector chunks always have frequency 1
-                        "order": i + 1,  # 1-based order in vector search results
-                    }
-                else:
-                    logger.warning(f"Vector chunk missing chunk_id: {chunk}")
+    async def _vector_search():
+        embedding = query_embedding
+        if embedding is None:
+            embedding = await _get_embedding(query)
+        return await _get_vector_context(query, chunks_vdb, query_param, embedding)
+
+    # Run VDB lookups of all retrieval paths as one concurrent stage behind the
+    # shared embedding call. Graph batch fetches of each path are pipelined
+    # behind its own VDB lookup.
+    searches = {}
+    if run_local:
+        searches["local_search"] = _local_search()
+    if run_global:
+        searches["global_search"] = _global_search()
+    if run_vector:
+        searches["vector_search"] = _vector_search()
+
+    search_results = await asyncio.gather(
+        *(_timed_stage(stage_timings, stage, coro) for stage, coro in searches.items())
+    )
+    search_results = dict(zip(searches, search_results))
+    if query_embedding is None and query:
+        query_embedding = await _get_embedding(query)
+
+    if "local_search" in search_results:
+        local_entities, local_relations = search_results["local_search"]
+    if "global_search" in search_results:
+        global_relations, global_entities = search_results["global_search"]
+    if "vector_search" in search_results:
+        vector_chunks = search_results["vector_search"]
+        # Track vector chunks with source metadata
+        for i, chunk in enumerate(vector_chunks):
+            chunk_id = chunk.get("chunk_id") or chunk.get("id")
+            if chunk_id:
+                chunk_tracking[chunk_id] = {
+                    "source": "C",
+                    "frequency": 1,  # Vector chunks always have frequency 1
+                    "order": i + 1,  # 1-based order in vector search results
+                }
+            else:
+                logger.warning(f"Vector chunk missing chunk_id: {chunk}")
 
     # Round-robin merge entities
     final_entities = []
@@ -3556,6 +4417,7 @@ async def _perform_kg_search(
         "vector_chunks": vector_chunks,
         "chunk_tracking": chunk_tracking,
         "query_embedding": query_embedding,
+        "stage_timings": stage_timings,
     }
 
 
@@ -3896,7 +4758,7 @@ async def _build_context_str(
         text_chunks_str="",
         reference_list_str="",
     )
-    kg_context_tokens = len(tokenizer.encode(pre_kg_context))
+    kg_context_tokens = tokenizer.count_tokens(pre_kg_context)
 
     # Calculate preliminary system prompt tokens
     pre_sys_prompt = sys_prompt_template.format(
@@ -3904,10 +4766,10 @@ async def _build_context_str(
         response_type=response_type,
         user_prompt=user_prompt,
     )
-    sys_prompt_tokens = len(tokenizer.encode(pre_sys_prompt))
+    sys_prompt_tokens = tokenizer.count_tokens(pre_sys_prompt)
 
     # Calculate available tokens for text chunks
-    query_tokens = len(tokenizer.encode(query))
+    query_tokens = tokenizer.count_tokens(query)
     buffer_tokens = 200  # reserved for reference list and safety buffer
     available_chunk_tokens = max_total_tokens - (
         sys_prompt_tokens + kg_context_tokens + query_tokens + buffer_tokens
@@ -4025,6 +4887,7 @@ async def _build_query_context(
     text_chunks_db: BaseKVStorage,
     query_param: QueryParam,
     chunks_vdb: BaseVectorStorage = None,
+    query_embedding: list[float] = None,
 ) -> QueryContextResult | None:
     """
     Main query context building function using the new 4-stage architecture:
@@ -4038,6 +4901,7 @@ async def _build_query_context(
         return None
 
     # Stage 1: Pure search
+    search_start = time.perf_counter()
     search_result = await _perform_kg_search(
         query,
         ll_keywords,
@@ -4048,6 +4912,7 @@ async def _build_query_context(
         text_chunks_db,
         query_param,
         chunks_vdb,
+        query_embedding,
     )
 
     if not search_result["final_entities"] and not search_result["final_relations"]:
@@ -4057,25 +4922,38 @@ async def _build_query_context(
             if not search_result["chunk_tracking"]:
                 return None
 
+    stage_timings = search_result["stage_timings"]
+    stage_timings["search_total"] = round(
+        (time.perf_counter() - search_start) * 1000, 2
+    )
+
     # Stage 2: Apply token truncation for LLM efficiency
-    truncation_result = await _apply_token_truncation(
-        search_result,
-        query_param,
-        text_chunks_db.global_config,
+    truncation_result = await _timed_stage(
+        stage_timings,
+        "truncation",
+        _apply_token_truncation(
+            search_result,
+            query_param,
+            text_chunks_db.global_config,
+        ),
     )
 
     # Stage 3: Merge chunks using filtered entities/relations
-    merged_chunks = await _merge_all_chunks(
-        filtered_entities=truncation_result["filtered_entities"],
-        filtered_relations=truncation_result["filtered_relations"],
-        vector_chunks=search_result["vector_chunks"],
-        query=query,
-        knowledge_graph_inst=knowledge_graph_inst,
-        text_chunks_db=text_chunks_db,
-        query_param=query_param,
-        chunks_vdb=chunks_vdb,
-        chunk_tracking=search_result["chunk_tracking"],
-        query_embedding=search_result["query_embedding"],
+    merged_chunks = await _timed_stage(
+        stage_timings,
+        "chunk_merge",
+        _merge_all_chunks(
+            filtered_entities=truncation_result["filtered_entities"],
+            filtered_relations=truncation_result["filtered_relations"],
+            vector_chunks=search_result["vector_chunks"],
+            query=query,
+            knowledge_graph_inst=knowledge_graph_inst,
+            text_chunks_db=text_chunks_db,
+            query_param=query_param,
+            chunks_vdb=chunks_vdb,
+            chunk_tracking=search_result["chunk_tracking"],
+            query_embedding=search_result["query_embedding"],
+        ),
     )
 
     if (
@@ -4087,16 +4965,20 @@ async def _build_query_context(
 
     # Stage 4: Build final LLM context with dynamic token processing
     # _build_context_str now always returns tuple[str, dict]
-    context, raw_data = await _build_context_str(
-        entities_context=truncation_result["entities_context"],
-        relations_context=truncation_result["relations_context"],
-        merged_chunks=merged_chunks,
-        query=query,
-        query_param=query_param,
-        global_config=text_chunks_db.global_config,
-        chunk_tracking=search_result["chunk_tracking"],
-        entity_id_to_original=truncation_result["entity_id_to_original"],
-        relation_id_to_original=truncation_result["relation_id_to_original"],
+    context, raw_data = await _timed_stage(
+        stage_timings,
+        "context_build",
+        _build_context_str(
+            entities_context=truncation_result["entities_context"],
+            relations_context=truncation_result["relations_context"],
+            merged_chunks=merged_chunks,
+            query=query,
+            query_param=query_param,
+            global_config=text_chunks_db.global_config,
+            chunk_tracking=search_result["chunk_tracking"],
+            entity_id_to_original=truncation_result["entity_id_to_original"],
+            relation_id_to_original=truncation_result["relation_id_to_original"],
+        ),
     )
 
     # Convert keywords strings to lists and add complete metadata to raw_data
@@ -4124,6 +5006,7 @@ async def _build_query_context(
         "merged_chunks_count": len(merged_chunks),
         "final_chunks_count": len(raw_data.get("data", {}).get("chunks", [])),
     }
+    raw_data["metadata"]["timing_ms"] = stage_timings
 
     logger.debug(
         f"[_build_query_context] Context length: {len(context) if context else 0}"
@@ -4140,13 +5023,19 @@ async def _get_node_data(
     knowledge_graph_inst: BaseGraphStorage,
     entities_vdb: BaseVectorStorage,
     query_param: QueryParam,
+    query_embedding=None,
 ):
     # get similar entities
     logger.info(
         f"Query nodes: {query} (top_k:{query_param.top_k}, cosine:{entities_vdb.cosine_better_than_threshold})"
     )
 
-    results = await entities_vdb.query(query, top_k=query_param.top_k)
+    results = await entities_vdb.query(
+        query,
+        top_k=query_param.top_k,
+        query_embedding=query_embedding,
+        search_params=_vector_search_params(query_param),
+    )
 
     if not len(results):
         return [], []
@@ -4417,12 +5306,18 @@ async def _get_edge_data(
     knowledge_graph_inst: BaseGraphStorage,
     relationships_vdb: BaseVectorStorage,
     query_param: QueryParam,
+    query_embedding=None,
 ):
     logger.info(
         f"Query edges: {keywords} (top_k:{query_param.top_k}, cosine:{relationships_vdb.cosine_better_than_threshold})"
     )
 
-    results = await relationships_vdb.query(keywords, top_k=query_param.top_k)
+    results = await relationships_vdb.query(
+        keywords,
+        top_k=query_param.top_k,
+        query_embedding=query_embedding,
+        search_params=_vector_search_params(query_param),
+    )
 
     if not len(results):
         return [], []
@@ -4738,6 +5633,7 @@ async def naive_query(
     global_config: dict[str, str],
     hashing_kv: BaseKVStorage | None = None,
     system_prompt: str | None = None,
+    query_cache: SemanticQueryCache | None = None,
 ) -> QueryResult | None:
     """
     Execute naive query and return unified QueryResult object.
@@ -4749,6 +5645,7 @@ async def naive_query(
         global_config: Global configuration
         hashing_kv: Cache storage
         system_prompt: System prompt
+        query_cache: Optional semantic cache reusing context and answers of similar queries
 
     Returns:
         QueryResult | None: Unified query result object containing:
@@ -4775,115 +5672,135 @@ async def naive_query(
         logger.error("Tokenizer not found in global configuration.")
         return QueryResult(content=PROMPTS["fail_response"])
 
-    chunks = await _get_vector_context(query, chunks_vdb, query_param, None)
-
-    if chunks is None or len(chunks) == 0:
-        logger.info(
-            "[naive_query] No relevant document chunks found; returning no-result."
-        )
-        return None
-
-    # Calculate dynamic token limit for chunks
-    max_total_tokens = getattr(
-        query_param,
-        "max_total_tokens",
-        global_config.get("max_total_tokens", DEFAULT_MAX_TOTAL_TOKENS),
+    # Look up semantically similar queries answered before
+    cache_scope, cached_payload, query_embedding = await _lookup_query_cache(
+        query, query_param, system_prompt, query_cache, use_model_func, global_config
     )
 
-    # Calculate system prompt template tokens (excluding content_data)
     user_prompt = f"\n\n{query_param.user_prompt}" if query_param.user_prompt else "n/a"
-    response_type = (
-        query_param.response_type
-        if query_param.response_type
-        else "Multiple Paragraphs"
-    )
-
     # Use the provided system prompt or default
     sys_prompt_template = (
         system_prompt if system_prompt else PROMPTS["naive_rag_response"]
     )
 
-    # Create a preliminary system prompt with empty content_data to calculate overhead
-    pre_sys_prompt = sys_prompt_template.format(
-        response_type=response_type,
-        user_prompt=user_prompt,
-        content_data="",  # Empty for overhead calculation
-    )
+    if cached_payload is not None and "context" in cached_payload:
+        context_content = cached_payload["context"]
+        raw_data = copy.deepcopy(cached_payload["raw_data"])
+    else:
+        chunks = await _get_vector_context(
+            query, chunks_vdb, query_param, query_embedding
+        )
 
-    # Calculate available tokens for chunks
-    sys_prompt_tokens = len(tokenizer.encode(pre_sys_prompt))
-    query_tokens = len(tokenizer.encode(query))
-    buffer_tokens = 200  # reserved for reference list and safety buffer
-    available_chunk_tokens = max_total_tokens - (
-        sys_prompt_tokens + query_tokens + buffer_tokens
-    )
+        if chunks is None or len(chunks) == 0:
+            logger.info(
+                "[naive_query] No relevant document chunks found; returning no-result."
+            )
+            return None
 
-    logger.debug(
-        f"Naive query token allocation - Total: {max_total_tokens}, SysPrompt: {sys_prompt_tokens}, Query: {query_tokens}, Buffer: {buffer_tokens}, Available for chunks: {available_chunk_tokens}"
-    )
+        # Calculate dynamic token limit for chunks
+        max_total_tokens = getattr(
+            query_param,
+            "max_total_tokens",
+            global_config.get("max_total_tokens", DEFAULT_MAX_TOTAL_TOKENS),
+        )
 
-    # Process chunks using unified processing with dynamic token limit
-    processed_chunks = await process_chunks_unified(
-        query=query,
-        unique_chunks=chunks,
-        query_param=query_param,
-        global_config=global_config,
-        source_type="vector",
-        chunk_token_limit=available_chunk_tokens,  # Pass dynamic limit
-    )
+        # Calculate system prompt template tokens (excluding content_data)
+        response_type = (
+            query_param.response_type
+            if query_param.response_type
+            else "Multiple Paragraphs"
+        )
 
-    # Generate reference list from processed chunks using the new common function
-    reference_list, processed_chunks_with_ref_ids = generate_reference_list_from_chunks(
-        processed_chunks
-    )
+        # Create a preliminary system prompt with empty content_data to calculate overhead
+        pre_sys_prompt = sys_prompt_template.format(
+            response_type=response_type,
+            user_prompt=user_prompt,
+            content_data="",  # Empty for overhead calculation
+        )
 
-    logger.info(f"Final context: {len(processed_chunks_with_ref_ids)} chunks")
+        # Calculate available tokens for chunks
+        sys_prompt_tokens = tokenizer.count_tokens(pre_sys_prompt)
+        query_tokens = tokenizer.count_tokens(query)
+        buffer_tokens = 200  # reserved for reference list and safety buffer
+        available_chunk_tokens = max_total_tokens - (
+            sys_prompt_tokens + query_tokens + buffer_tokens
+        )
 
-    # Build raw data structure for naive mode using processed chunks with reference IDs
-    raw_data = convert_to_user_format(
-        [],  # naive mode has no entities
-        [],  # naive mode has no relationships
-        processed_chunks_with_ref_ids,
-        reference_list,
-        "naive",
-    )
+        logger.debug(
+            f"Naive query token allocation - Total: {max_total_tokens}, SysPrompt: {sys_prompt_tokens}, Query: {query_tokens}, Buffer: {buffer_tokens}, Available for chunks: {available_chunk_tokens}"
+        )
 
-    # Add complete metadata for naive mode
-    if "metadata" not in raw_data:
-        raw_data["metadata"] = {}
-    raw_data["metadata"]["keywords"] = {
-        "high_level": [],  # naive mode has no keyword extraction
-        "low_level": [],  # naive mode has no keyword extraction
-    }
-    raw_data["metadata"]["processing_info"] = {
-        "total_chunks_found": len(chunks),
-        "final_chunks_count": len(processed_chunks_with_ref_ids),
-    }
+        # Process chunks using unified processing with dynamic token limit
+        processed_chunks = await process_chunks_unified(
+            query=query,
+            unique_chunks=chunks,
+            query_param=query_param,
+            global_config=global_config,
+            source_type="vector",
+            chunk_token_limit=available_chunk_tokens,  # Pass dynamic limit
+        )
 
-    # Build chunks_context from processed chunks with reference IDs
-    chunks_context = []
-    for i, chunk in enumerate(processed_chunks_with_ref_ids):
-        chunks_context.append(
-            {
-                "reference_id": chunk["reference_id"],
-                "content": chunk["content"],
-            }
+        # Generate reference list from processed chunks using the new common function
+        (
+            reference_list,
+            processed_chunks_with_ref_ids,
+        ) = generate_reference_list_from_chunks(processed_chunks)
+
+        logger.info(f"Final context: {len(processed_chunks_with_ref_ids)} chunks")
+
+        # Build raw data structure for naive mode using processed chunks with reference IDs
+        raw_data = convert_to_user_format(
+            [],  # naive mode has no entities
+            [],  # naive mode has no relationships
+            processed_chunks_with_ref_ids,
+            reference_list,
+            "naive",
         )
 
-    text_units_str = "\n".join(
-        json.dumps(text_unit, ensure_ascii=False) for text_unit in chunks_context
-    )
-    reference_list_str = "\n".join(
-        f"[{ref['reference_id']}] {ref['file_path']}"
-        for ref in reference_list
-        if ref["reference_id"]
-    )
+        # Add complete metadata for naive mode
+        if "metadata" not in raw_data:
+            raw_data["metadata"] = {}
+        raw_data["metadata"]["keywords"] = {
+            "high_level": [],  # naive mode has no keyword extraction
+            "low_level": [],  # naive mode has no keyword extraction
+        }
+        raw_data["metadata"]["processing_info"] = {
+            "total_chunks_found": len(chunks),
+            "final_chunks_count": len(processed_chunks_with_ref_ids),
+        }
 
-    naive_context_template = PROMPTS["naive_query_context"]
-    context_content = naive_context_template.format(
-        text_chunks_str=text_units_str,
-        reference_list_str=reference_list_str,
-    )
+        # Build chunks_context from processed chunks with reference IDs
+        chunks_context = []
+        for i, chunk in enumerate(processed_chunks_with_ref_ids):
+            chunks_context.append(
+                {
+                    "reference_id": chunk["reference_id"],
+                    "content": chunk["content"],
+                }
+            )
+
+        text_units_str = "\n".join(
+            json.dumps(text_unit, ensure_ascii=False) for text_unit in chunks_context
+        )
+        reference_list_str = "\n".join(
+            f"[{ref['reference_id']}] {ref['file_path']}"
+            for ref in reference_list
+            if ref["reference_id"]
+        )
+
+        naive_context_template = PROMPTS["naive_query_context"]
+        context_content = naive_context_template.format(
+            text_chunks_str=text_units_str,
+            reference_list_str=reference_list_str,
+        )
+
+        if cache_scope is not None:
+            query_cache.store(
+                query,
+                cache_scope,
+                query_embedding,
+                {"context": context_content, "raw_data": copy.deepcopy(raw_data)},
+            )
 
     if query_param.only_need_context and not query_param.only_need_prompt:
         return QueryResult(content=context_content, raw_data=raw_data)
@@ -4913,9 +5830,12 @@ async def naive_query(
         query_param.user_prompt or "",
         query_param.enable_rerank,
     )
-    cached_result = await handle_cache(
-        hashing_kv, args_hash, user_query, query_param.mode, cache_type="query"
-    )
+    if cached_payload is not None and "response" in cached_payload:
+        cached_result = (cached_payload["response"], 0)
+    else:
+        cached_result = await handle_cache(
+            hashing_kv, args_hash, user_query, query_param.mode, cache_type="query"
+        )
     if cached_result is not None:
         cached_response, _ = cached_result  # Extract content, ignore timestamp
         logger.info(
@@ -4970,6 +5890,18 @@ async def naive_query(
                 .strip()
             )
 
+        if cache_scope is not None:
+            query_cache.store(
+                query,
+                cache_scope,
+                query_embedding,
+                {
+                    "context": context_content,
+                    "raw_data": copy.deepcopy(raw_data),
+                    "response": response,
+                },
+            )
+
         return QueryResult(content=response, raw_data=raw_data)
     else:
         # Streaming response (AsyncIterator)
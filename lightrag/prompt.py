@@ -208,4 +208,23 @@ Combina los puntos clave de las referencias proporcionadas para generar una resp
 
 ---User Question---
 {question}
-"""
\ No newline at end of file
+"""
+# -----------------------------------------------------------------------------
+# 5. QUERY CACHE
+# -----------------------------------------------------------------------------
+PROMPTS["similarity_check"] = """Please analyze the similarity between these two questions:
+
+Question 1: {original_prompt}
+Question 2: {cached_prompt}
+
+Please evaluate whether these two questions are semantically similar, and whether the answer to Question 2 can be used to answer Question 1, provide a similarity score between 0 and 1 directly.
+
+Similarity score criteria:
+0: Completely unrelated or answer cannot be reused
+0.3: Related but answer needs substantial modification
+0.5: Partially related and answer needs some modification
+0.8: Highly related and answer can be reused with minor modifications
+1: Identical questions and answer can be fully reused
+
+Return only a number between 0-1, without any additional content.
+"""
@@ -0,0 +1,89 @@
+"""
+Benchmark FaissVectorDBStorage index types: recall@k and latency against the flat index.
+
+Generates clustered, normalized vectors (embeddings of related chunks are not
+uniformly spread), uses exact inner product search as ground truth, then builds
+each approximate index with the same code path as FaissVectorDBStorage and sweeps
+its search parameter (nprobe for IVF, efSearch for HNSW).
+
+Usage:
+    python -m lightrag.tools.benchmark_faiss_ann --vectors 200000 --dim 1024
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from lightrag.kg.faiss_impl import create_faiss_index, faiss_search_params
+
+
+def build_vectors(num_vectors: int, dim: int, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    num_clusters = max(1, num_vectors // 500)
+    centers = rng.standard_normal((num_clusters, dim), dtype=np.float32)
+    labels = rng.integers(0, num_clusters, num_vectors)
+    vectors = centers[labels] + 0.5 * rng.standard_normal(
+        (num_vectors, dim), dtype=np.float32
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def search(index, queries: np.ndarray, top_k: int, params=None):
+    start = time.perf_counter()
+    _, indices = index.search(queries, top_k, params=params)
+    latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    return indices, latency_ms
+
+
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / truth.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--vectors", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument(
+        "--index-types", default="ivf_flat,ivf_pq,hnsw", help="Comma separated"
+    )
+    parser.add_argument("--nprobe", default="1,4,16,64", help="IVF sweep")
+    parser.add_argument("--ef-search", default="16,64,256", help="HNSW sweep")
+    args = parser.parse_args()
+
+    print(f"Building {args.vectors} vectors of dimension {args.dim}")
+    vectors = build_vectors(args.vectors, args.dim)
+    queries = build_vectors(args.queries, args.dim, seed=7)
+
+    flat = create_faiss_index(vectors, args.dim, "flat")
+    truth, flat_ms = search(flat, queries, args.top_k)
+    print(f"{'index':<10} {'param':<14} {'build s':>8} {'ms/query':>9} {'recall@k':>9}")
+    print(f"{'flat':<10} {'-':<14} {'-':>8} {flat_ms:9.3f} {1.0:9.3f}")
+
+    for index_type in args.index_types.split(","):
+        start = time.perf_counter()
+        index = create_faiss_index(vectors, args.dim, index_type)
+        build_s = time.perf_counter() - start
+        if index_type == "hnsw":
+            # FaissVectorDBStorage never searches with efSearch below top_k
+            sweep = [
+                ("ef_search", max(int(v), args.top_k))
+                for v in args.ef_search.split(",")
+            ]
+        else:
+            sweep = [("nprobe", int(v)) for v in args.nprobe.split(",")]
+        for name, value in sweep:
+            params = faiss_search_params(index, **{name: value})
+            found, latency_ms = search(index, queries, args.top_k, params)
+            print(
+                f"{index_type:<10} {f'{name}={value}':<14} {build_s:8.2f} "
+                f"{latency_ms:9.3f} {recall_at_k(found, truth):9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark NetworkXStorage persistence: GraphML vs the binary segment format.
+
+Builds a synthetic knowledge graph shaped like LightRAG's (string attributes for
+descriptions, source ids and file paths, numeric weight and created_at), then
+times a full save and load with each format, plus a delta save touching a small
+fraction of the graph.
+
+Usage:
+    python -m lightrag.tools.benchmark_graph_storage --nodes 100000 --edges 200000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import networkx as nx
+
+from lightrag.kg.nx_binary_format import BinaryGraphStore
+
+
+def build_graph(num_nodes: int, num_edges: int, seed: int = 42) -> nx.Graph:
+    rng = random.Random(seed)
+    entity_types = ["person", "organization", "location", "event", "concept"]
+    graph = nx.Graph()
+    for i in range(num_nodes):
+        graph.add_node(
+            f"Entity {i}",
+            entity_id=f"Entity {i}",
+            entity_type=rng.choice(entity_types),
+            description=f"Description of entity {i} " * rng.randint(1, 8),
+            source_id=f"chunk-{rng.randint(0, num_nodes // 4)}",
+            file_path=f"doc_{rng.randint(0, 500)}.pdf",
+            created_at=1700000000 + i,
+        )
+    while graph.number_of_edges() < num_edges:
+        u, v = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        if u == v:
+            continue
+        graph.add_edge(
+            f"Entity {u}",
+            f"Entity {v}",
+            weight=float(rng.randint(1, 10)),
+            description=f"Relation between {u} and {v}",
+            keywords="related,linked",
+            source_id=f"chunk-{rng.randint(0, num_nodes // 4)}",
+            file_path=f"doc_{rng.randint(0, 500)}.pdf",
+            created_at=1700000000 + u,
+        )
+    return graph
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<28} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=50000)
+    parser.add_argument("--edges", type=int, default=100000)
+    parser.add_argument(
+        "--delta-fraction",
+        type=float,
+        default=0.01,
+        help="Fraction of nodes and edges modified before the delta save",
+    )
+    args = parser.parse_args()
+
+    print(f"Building graph: {args.nodes} nodes, {args.edges} edges")
+    graph = build_graph(args.nodes, args.edges)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        graphml_file = os.path.join(work_dir, "graph.graphml")
+        print("GraphML")
+        timed("save", lambda: nx.write_graphml(graph, graphml_file))
+        timed("load", lambda: nx.read_graphml(graphml_file))
+        print(f"  {'size':<28} {os.path.getsize(graphml_file) / 2**20:8.1f}MB")
+
+        store = BinaryGraphStore(work_dir, "graph")
+        print("Binary")
+        manifest = timed("save base", lambda: store.write_base(graph, None))
+        loaded, _ = timed("load", lambda: store.load())
+        base_size, _ = store.segment_bytes(manifest)
+        print(f"  {'size':<28} {base_size / 2**20:8.1f}MB")
+        assert loaded.number_of_nodes() == graph.number_of_nodes()
+        assert loaded.number_of_edges() == graph.number_of_edges()
+
+        rng = random.Random(7)
+        nodes = rng.sample(list(graph.nodes), int(args.nodes * args.delta_fraction))
+        edges = rng.sample(list(graph.edges), int(args.edges * args.delta_fraction))
+        for node in nodes:
+            graph.nodes[node]["description"] += " (updated)"
+        for u, v in edges:
+            graph.edges[u, v]["weight"] += 1.0
+
+        print(f"Binary delta ({len(nodes)} nodes, {len(edges)} edges changed)")
+        manifest = timed(
+            "save delta",
+            lambda: store.append_delta(graph, manifest, nodes, edges, [], []),
+        )
+        timed("load base + delta", lambda: store.load())
+        print("GraphML after the same change")
+        timed("save", lambda: nx.write_graphml(graph, graphml_file))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,14 @@ import logging
 import logging.handlers
 import os
 import re
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import wraps
-from hashlib import md5
+from hashlib import blake2b, md5
 from typing import (
     Any,
     Protocol,
@@ -38,6 +40,13 @@ from lightrag.constants import (
     DEFAULT_SOURCE_IDS_LIMIT_METHOD,
     VALID_SOURCE_IDS_LIMIT_METHODS,
     SOURCE_IDS_LIMIT_METHOD_FIFO,
+    DEFAULT_QUERY_CACHE_SIMILARITY_THRESHOLD,
+    DEFAULT_QUERY_CACHE_MAX_ENTRIES,
+    DEFAULT_QUERY_CACHE_TTL,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_TOKEN_COUNT_CACHE_SIZE,
 )
 
 # Initialize logger with basic configuration
@@ -889,6 +898,253 @@ def priority_limit_async_func_call(
     return final_decro
 
 
+class BucketHistogram:
+    """Fixed-bucket histogram for lightweight runtime metrics"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+        self.sum += value
+
+    def to_dict(self) -> dict[str, Any]:
+        buckets = {
+            f"<={bound:g}": count for bound, count in zip(self.bounds, self.counts)
+        }
+        buckets[f">{self.bounds[-1]:g}"] = self.counts[-1]
+        return {
+            "count": self.total,
+            "avg": round(self.sum / self.total, 3) if self.total else 0.0,
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class PendingEmbeddingRequest:
+    """A caller waiting for its share of a coalesced embedding batch"""
+
+    texts: list[str]
+    future: asyncio.Future
+    enqueue_time: float
+
+
+def coalesce_async_embedding_calls(
+    max_batch_size: int,
+    max_wait_ms: float,
+    queue_name: str = "Embedding func",
+):
+    """
+    Coalesce concurrent embedding calls into shared batches.
+
+    Calls arriving within ``max_wait_ms`` of each other are merged into a single
+    call of the wrapped function until ``max_batch_size`` texts are pending; the
+    resulting embeddings are split back to each caller in order. Only calls with
+    identical keyword arguments (e.g. the same ``_priority``) are merged, and
+    calls that already carry ``max_batch_size`` texts bypass coalescing.
+
+    The decorated function exposes ``get_stats()`` returning request/batch
+    counters plus batch-size and queue-wait histograms.
+
+    Args:
+        max_batch_size: Maximum number of texts sent in one coalesced call
+        max_wait_ms: Maximum time a call waits for others to join its batch
+        queue_name: Name used for logging identification
+
+    Returns:
+        Decorator function
+    """
+
+    def final_decro(func):
+        pending: dict[tuple, list[PendingEmbeddingRequest]] = {}
+        flush_tasks: set[asyncio.Task] = set()
+        batch_size_hist = BucketHistogram([1, 2, 4, 8, 16, 32, 64, 128, 256])
+        queue_wait_hist = BucketHistogram([1, 2, 5, 10, 20, 50, 100, 250, 1000])
+        counters = {"requests": 0, "batches": 0, "bypassed": 0}
+
+        def spawn(coro):
+            task = asyncio.create_task(coro)
+            flush_tasks.add(task)
+            task.add_done_callback(flush_tasks.discard)
+
+        async def flush(batch: list[PendingEmbeddingRequest], kwargs: dict):
+            now = time.perf_counter()
+            texts = []
+            for request in batch:
+                queue_wait_hist.observe((now - request.enqueue_time) * 1000)
+                texts.extend(request.texts)
+            batch_size_hist.observe(len(texts))
+            counters["batches"] += 1
+
+            try:
+                embeddings = await func(texts, **kwargs)
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                return
+
+            offset = 0
+            for request in batch:
+                end = offset + len(request.texts)
+                if not request.future.done():
+                    request.future.set_result(embeddings[offset:end])
+                offset = end
+
+            logger.debug(
+                f"{queue_name}: coalesced {len(batch)} requests into one batch of {len(texts)} texts"
+            )
+
+        def dispatch(key: tuple, kwargs: dict):
+            """Detach the pending group of a key and send it as one batch"""
+            batch = pending.pop(key, None)
+            if batch:
+                spawn(flush(batch, kwargs))
+
+        async def dispatch_after_wait(key: tuple, kwargs: dict, group: list):
+            await asyncio.sleep(max_wait_ms / 1000)
+            # The group may already have been sent because it filled up
+            if pending.get(key) is group:
+                dispatch(key, kwargs)
+
+        @wraps(func)
+        async def wait_func(texts, *args, **kwargs):
+            counters["requests"] += 1
+            try:
+                key = tuple(sorted(kwargs.items()))
+                hash(key)
+            except TypeError:
+                key = None
+
+            if args or key is None or len(texts) >= max_batch_size:
+                counters["bypassed"] += 1
+                return await func(texts, *args, **kwargs)
+
+            group = pending.get(key)
+            if group and sum(len(r.texts) for r in group) + len(texts) > max_batch_size:
+                # Not enough room left in the current group: send it now
+                dispatch(key, kwargs)
+                group = None
+
+            request = PendingEmbeddingRequest(
+                texts=list(texts),
+                future=asyncio.get_running_loop().create_future(),
+                enqueue_time=time.perf_counter(),
+            )
+            if group is None:
+                group = pending[key] = [request]
+                spawn(dispatch_after_wait(key, kwargs, group))
+            else:
+                group.append(request)
+
+            if sum(len(r.texts) for r in group) >= max_batch_size:
+                dispatch(key, kwargs)
+
+            return await request.future
+
+        def get_stats() -> dict[str, Any]:
+            return {
+                **counters,
+                "max_batch_size": max_batch_size,
+                "max_wait_ms": max_wait_ms,
+                "batch_size": batch_size_hist.to_dict(),
+                "queue_wait_ms": queue_wait_hist.to_dict(),
+            }
+
+        wait_func.get_stats = get_stats
+        return wait_func
+
+    return final_decro
+
+
+# Process-wide registry of HTTP clients, keyed by caller-supplied key and the
+# event loop they were created on (async clients cannot be shared across loops)
+_shared_clients: dict[tuple, tuple[asyncio.AbstractEventLoop | None, Any]] = {}
+
+
+def _is_client_closed(client: Any) -> bool:
+    is_closed = getattr(client, "is_closed", None)
+    if callable(is_closed):
+        return is_closed()
+    return bool(getattr(client, "closed", False))
+
+
+def get_http_pool_limits() -> dict[str, Any]:
+    """Connection pool limits shared by all pooled LLM, embedding and rerank clients."""
+    return {
+        "max_connections": get_env_value(
+            "HTTP_MAX_CONNECTIONS", DEFAULT_HTTP_MAX_CONNECTIONS, int
+        ),
+        "max_keepalive_connections": get_env_value(
+            "HTTP_MAX_KEEPALIVE_CONNECTIONS",
+            DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            int,
+        ),
+        "keepalive_expiry": get_env_value(
+            "HTTP_KEEPALIVE_EXPIRY", DEFAULT_HTTP_KEEPALIVE_EXPIRY, float
+        ),
+    }
+
+
+def get_shared_client(key: tuple, factory: Callable[[], Any]) -> Any:
+    """Return the pooled client registered under ``key``, creating it on first use.
+
+    Clients are reused across calls so connections are kept alive between
+    requests. A client is bound to the event loop it was created on; a new one
+    is created transparently if the loop changes or the client was closed.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    entry = _shared_clients.get(key)
+    if entry is not None:
+        client_loop, client = entry
+        if client_loop is loop and not _is_client_closed(client):
+            return client
+
+    client = factory()
+    _shared_clients[key] = (loop, client)
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close every pooled client created on the running event loop.
+
+    Clients bound to other (usually already closed) loops cannot be awaited
+    from here and are simply dropped from the registry.
+    """
+    loop = asyncio.get_running_loop()
+    entries = list(_shared_clients.items())
+    _shared_clients.clear()
+
+    closed = 0
+    for key, (client_loop, client) in entries:
+        if client_loop is not loop or _is_client_closed(client):
+            continue
+        try:
+            close = getattr(client, "close", None) or getattr(client, "aclose")
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+            closed += 1
+        except Exception as e:
+            logger.warning(f"Failed to close shared client {key[0]}: {e}")
+
+    if closed:
+        logger.debug(f"Closed {closed} shared HTTP client(s)")
+
+
 def wrap_embedding_func_with_attrs(**kwargs):
     """Wrap a function with attributes"""
 
@@ -911,6 +1167,19 @@ def write_json(json_obj, file_name):
         json.dump(json_obj, f, indent=2, ensure_ascii=False)
 
 
+def write_json_atomic(json_obj, file_name):
+    """Write JSON to a temporary file and atomically rename it over file_name
+
+    A crash while writing leaves the previous file intact.
+    """
+    tmp_file_name = f"{file_name}.tmp"
+    with open(tmp_file_name, "w", encoding="utf-8") as f:
+        json.dump(json_obj, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file_name, file_name)
+
+
 class TokenizerInterface(Protocol):
     """
     Defines the interface for a tokenizer, requiring encode and decode methods.
@@ -928,18 +1197,45 @@ class TokenizerInterface(Protocol):
 class Tokenizer:
     """
     A wrapper around a tokenizer to provide a consistent interface for encoding and decoding.
+
+    Token counts are memoized in a bounded LRU cache keyed by a hash of the content,
+    so callers that only need a length should use count_tokens/count_tokens_many
+    instead of len(encode(...)). The instance (and its cache) is shared, not copied,
+    when the global config holding it is deep-copied.
     """
 
-    def __init__(self, model_name: str, tokenizer: TokenizerInterface):
+    def __init__(
+        self,
+        model_name: str,
+        tokenizer: TokenizerInterface,
+        cache_size: int = DEFAULT_TOKEN_COUNT_CACHE_SIZE,
+    ):
         """
         Initializes the Tokenizer with a tokenizer model name and a tokenizer instance.
 
         Args:
             model_name: The associated model name for the tokenizer.
             tokenizer: An instance of a class implementing the TokenizerInterface.
+            cache_size: Maximum number of memoized token counts, 0 disables the cache.
         """
         self.model_name: str = model_name
         self.tokenizer: TokenizerInterface = tokenizer
+        self.cache_size: int = cache_size
+        self._count_cache: OrderedDict[bytes, int] = OrderedDict()
+        self._count_cache_lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_count_cache"] = OrderedDict()
+        del state["_count_cache_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._count_cache_lock = threading.Lock()
 
     def encode(self, content: str) -> List[int]:
         """
@@ -965,18 +1261,131 @@ class Tokenizer:
         """
         return self.tokenizer.decode(tokens)
 
+    def count_tokens(self, content: str) -> int:
+        """
+        Returns the number of tokens of a string, memoized by content hash.
+
+        Args:
+            content: The string to count tokens for.
+
+        Returns:
+            The number of tokens.
+        """
+        if self.cache_size <= 0:
+            return len(self.encode(content))
+        key = self._content_key(content)
+        with self._count_cache_lock:
+            count = self._count_cache.get(key)
+            if count is not None:
+                self._count_cache.move_to_end(key)
+                return count
+        count = len(self.encode(content))
+        self._remember_counts([(key, count)])
+        return count
+
+    def count_tokens_many(self, contents: Sequence[str]) -> list[int]:
+        """
+        Returns the number of tokens of each string. Strings missing from the cache
+        are encoded together in one batch call.
+
+        Args:
+            contents: The strings to count tokens for.
+
+        Returns:
+            A list of token counts in the order of contents.
+        """
+        if self.cache_size <= 0:
+            return [len(tokens) for tokens in self._encode_many(list(contents))]
+
+        counts: list[int] = [0] * len(contents)
+        missing: dict[bytes, list[int]] = {}
+        keys = [self._content_key(content) for content in contents]
+        with self._count_cache_lock:
+            for i, key in enumerate(keys):
+                count = self._count_cache.get(key)
+                if count is None:
+                    missing.setdefault(key, []).append(i)
+                else:
+                    self._count_cache.move_to_end(key)
+                    counts[i] = count
+
+        if missing:
+            encoded = self._encode_many(
+                [contents[indices[0]] for indices in missing.values()]
+            )
+            new_counts = []
+            for (key, indices), tokens in zip(missing.items(), encoded):
+                for i in indices:
+                    counts[i] = len(tokens)
+                new_counts.append((key, len(tokens)))
+            self._remember_counts(new_counts)
+        return counts
+
+    def char_offsets(
+        self, content: str, tokens: List[int], positions: Sequence[int]
+    ) -> list[int] | None:
+        """
+        Maps token positions of an encoded string back to character offsets, so a
+        token window can be sliced from content instead of being decoded.
+
+        Args:
+            content: The string that was encoded.
+            tokens: The tokens of content.
+            positions: Ascending token positions in [0, len(tokens)].
+
+        Returns:
+            The character offset of each position, or None if the tokens do not
+            decode back to content piecewise (e.g. a boundary splits a character).
+        """
+        offsets = []
+        prev_pos = char_pos = 0
+        for pos in positions:
+            piece = self.decode(tokens[prev_pos:pos])
+            if not content.startswith(piece, char_pos):
+                return None
+            char_pos += len(piece)
+            prev_pos = pos
+            offsets.append(char_pos)
+        return offsets
+
+    def _encode_many(self, contents: list[str]) -> list[List[int]]:
+        return [self.encode(content) for content in contents]
+
+    @staticmethod
+    def _content_key(content: str) -> bytes:
+        return blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def _remember_counts(self, counts: list[tuple[bytes, int]]) -> None:
+        with self._count_cache_lock:
+            for key, count in counts:
+                self._count_cache[key] = count
+                self._count_cache.move_to_end(key)
+            while len(self._count_cache) > self.cache_size:
+                self._count_cache.popitem(last=False)
+
+
+# UTF-8 continuation bytes, stripped to count the characters in a byte range
+_UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
 
 class TiktokenTokenizer(Tokenizer):
     """
     A Tokenizer implementation using the tiktoken library.
     """
 
-    def __init__(self, model_name: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        cache_size: int = DEFAULT_TOKEN_COUNT_CACHE_SIZE,
+    ):
         """
         Initializes the TiktokenTokenizer with a specified model name.
 
         Args:
             model_name: The model name for the tiktoken tokenizer to use.  Defaults to "gpt-4o-mini".
+            cache_size: Maximum number of memoized token counts, 0 disables the cache.
 
         Raises:
             ImportError: If tiktoken is not installed.
@@ -991,10 +1400,40 @@ class TiktokenTokenizer(Tokenizer):
 
         try:
             tokenizer = tiktoken.encoding_for_model(model_name)
-            super().__init__(model_name=model_name, tokenizer=tokenizer)
+            super().__init__(
+                model_name=model_name, tokenizer=tokenizer, cache_size=cache_size
+            )
         except KeyError:
             raise ValueError(f"Invalid model_name: {model_name}.")
 
+    def _encode_many(self, contents: list[str]) -> list[List[int]]:
+        # tiktoken encodes a batch in parallel threads with a single call
+        return self.tokenizer.encode_batch(contents)
+
+    def char_offsets(
+        self, content: str, tokens: List[int], positions: Sequence[int]
+    ) -> list[int] | None:
+        # Work on UTF-8 bytes so no window has to be decoded to text: the bytes
+        # between consecutive positions are decoded once and checked against
+        # content. A position inside a multi-byte character maps to its start.
+        try:
+            data = content.encode("utf-8")
+        except UnicodeEncodeError:
+            return None
+
+        offsets = []
+        prev_pos = prev_byte = char_pos = 0
+        for pos in positions:
+            piece = self.tokenizer.decode_bytes(tokens[prev_pos:pos])
+            byte_pos = prev_byte + len(piece)
+            if data[prev_byte:byte_pos] != piece:
+                return None
+            char_pos += len(piece.translate(None, _UTF8_CONTINUATION))
+            inside_char = byte_pos < len(data) and 0x80 <= data[byte_pos] < 0xC0
+            offsets.append(char_pos - inside_char)
+            prev_pos, prev_byte = pos, byte_pos
+        return offsets
+
 
 def pack_user_ass_to_openai_messages(*args: str):
     roles = ["user", "assistant"]
@@ -1027,7 +1466,7 @@ def truncate_list_by_token_size(
         return []
     tokens = 0
     for i, data in enumerate(list_data):
-        tokens += len(tokenizer.encode(key(data)))
+        tokens += tokenizer.count_tokens(key(data))
         if tokens > max_token_size:
             return list_data[:i]
     return list_data
@@ -1041,6 +1480,29 @@ def cosine_similarity(v1, v2):
     return dot_product / (norm1 * norm2)
 
 
+def cosine_top_k(
+    query_embedding, vectors: np.ndarray, top_k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the top_k rows of vectors by cosine similarity to query_embedding
+
+    Scores all rows with one matrix product and selects with argpartition.
+
+    Returns:
+        The row indices and their similarities, highest similarity first
+    """
+    if top_k <= 0 or len(vectors) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    query = np.asarray(query_embedding, dtype=np.float32).ravel()
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+    scores = (vectors @ query) / np.maximum(norms, np.finfo(np.float32).tiny)
+    if top_k < len(scores):
+        rows = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        rows = np.arange(len(scores))
+    rows = rows[np.argsort(-scores[rows], kind="stable")]
+    return rows, scores[rows]
+
+
 async def handle_cache(
     hashing_kv,
     args_hash,
@@ -1135,6 +1597,220 @@ async def save_to_cache(hashing_kv, cache_data: CacheData):
     await hashing_kv.upsert({flattened_key: cache_entry})
 
 
+@dataclass
+class SemanticCacheEntry:
+    """A cached query together with its normalized embedding and payload"""
+
+    query: str
+    scope: str
+    embedding: np.ndarray
+    payload: dict[str, Any]
+    created_at: float
+
+
+class SemanticQueryCache:
+    """In-process semantic cache for query keywords, context and answers.
+
+    Query embeddings are kept in a small in-memory vector index grouped by scope
+    (query mode plus the retrieval parameters that influence the result). A new
+    query is a hit when its cosine similarity to a cached query of the same scope
+    reaches ``similarity_threshold``. Entries are evicted in LRU order once
+    ``max_entries`` is reached and expire after ``ttl`` seconds (0 disables TTL).
+    """
+
+    def __init__(
+        self,
+        embedding_func: Callable[..., Any],
+        similarity_threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl: float = 3600,
+        use_llm_check: bool = False,
+    ):
+        self.embedding_func = embedding_func
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.use_llm_check = use_llm_check
+
+        # key -> entry, ordered from least to most recently used
+        self._entries: OrderedDict[str, SemanticCacheEntry] = OrderedDict()
+        # scope -> (keys, stacked embeddings), rebuilt lazily after mutations
+        self._scope_index: dict[str, tuple[list[str], np.ndarray]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(
+        cls, config: dict[str, Any], embedding_func: Callable[..., Any]
+    ) -> SemanticQueryCache | None:
+        """Create a cache from LightRAG.embedding_cache_config, None if disabled"""
+        if not config or not config.get("enabled"):
+            return None
+        return cls(
+            embedding_func=embedding_func,
+            similarity_threshold=float(
+                config.get(
+                    "similarity_threshold", DEFAULT_QUERY_CACHE_SIMILARITY_THRESHOLD
+                )
+            ),
+            max_entries=int(config.get("max_entries", DEFAULT_QUERY_CACHE_MAX_ENTRIES)),
+            ttl=float(config.get("ttl", DEFAULT_QUERY_CACHE_TTL)),
+            use_llm_check=bool(config.get("use_llm_check", False)),
+        )
+
+    async def embed(self, query: str) -> np.ndarray:
+        """Compute the query embedding used for lookup (and reusable for retrieval)"""
+        embeddings = await self.embedding_func([query])
+        return np.asarray(embeddings[0], dtype=np.float32)
+
+    def _is_expired(self, entry: SemanticCacheEntry, now: float) -> bool:
+        return self.ttl > 0 and now - entry.created_at > self.ttl
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._scope_index.pop(entry.scope, None)
+
+    def _get_scope_index(self, scope: str) -> tuple[list[str], np.ndarray] | None:
+        index = self._scope_index.get(scope)
+        if index is None:
+            keys = [k for k, e in self._entries.items() if e.scope == scope]
+            if not keys:
+                return None
+            matrix = np.vstack([self._entries[k].embedding for k in keys])
+            index = (keys, matrix)
+            self._scope_index[scope] = index
+        return index
+
+    async def lookup(
+        self,
+        query: str,
+        scope: str,
+        query_embedding: np.ndarray | None = None,
+        llm_func: Callable[..., Any] | None = None,
+    ) -> tuple[dict[str, Any] | None, np.ndarray]:
+        """Find the cached payload of the most similar query in the same scope
+
+        Args:
+            query: The user query
+            scope: Hash of the parameters the cached result depends on
+            query_embedding: Optional pre-computed embedding of the query
+            llm_func: LLM function used for the secondary check when use_llm_check is enabled
+
+        Returns:
+            tuple: (payload or None on miss, query embedding)
+        """
+        if query_embedding is None:
+            query_embedding = await self.embed(query)
+        else:
+            query_embedding = np.asarray(query_embedding, dtype=np.float32)
+        normalized = _normalize_vector(query_embedding)
+
+        now = time.time()
+        expired = [k for k, e in self._entries.items() if self._is_expired(e, now)]
+        for key in expired:
+            self._remove(key)
+            self.evictions += 1
+
+        index = self._get_scope_index(scope)
+        if index is None:
+            self.misses += 1
+            return None, query_embedding
+
+        keys, matrix = index
+        scores = matrix @ normalized
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+        if best_score < self.similarity_threshold:
+            self.misses += 1
+            return None, query_embedding
+
+        key = keys[best]
+        entry = self._entries[key]
+        if self.use_llm_check and llm_func is not None and entry.query != query:
+            if not await self._llm_confirms(query, entry.query, llm_func):
+                self.misses += 1
+                return None, query_embedding
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.info(
+            f" == Query cache == hit (similarity: {best_score:.4f}, cached query: {entry.query[:60]})"
+        )
+        return entry.payload, query_embedding
+
+    async def _llm_confirms(
+        self, query: str, cached_query: str, llm_func: Callable[..., Any]
+    ) -> bool:
+        from lightrag.prompt import PROMPTS
+
+        # Question 1 is the new query, Question 2 the cached one whose answer is reused
+        prompt = PROMPTS["similarity_check"].format(
+            original_prompt=query, cached_prompt=cached_query
+        )
+        try:
+            result = await llm_func(prompt)
+            score = float(remove_think_tags(str(result)).strip())
+        except Exception as e:
+            logger.warning(f"Query cache LLM similarity check failed: {e}")
+            return False
+        return score >= self.similarity_threshold
+
+    def store(
+        self,
+        query: str,
+        scope: str,
+        query_embedding: np.ndarray,
+        payload: dict[str, Any],
+    ) -> None:
+        """Insert or update the cached payload for a query
+
+        Payload fields of an existing entry for the same query are merged, so a
+        context-only result can later be completed with the LLM answer.
+        """
+        key = compute_args_hash(scope, query)
+        existing = self._entries.get(key)
+        if existing is not None:
+            existing.payload.update(payload)
+            self._entries.move_to_end(key)
+            return
+
+        self._entries[key] = SemanticCacheEntry(
+            query=query,
+            scope=scope,
+            embedding=_normalize_vector(np.asarray(query_embedding, dtype=np.float32)),
+            payload=dict(payload),
+            created_at=time.time(),
+        )
+        self._scope_index.pop(scope, None)
+
+        while len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._scope_index.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and the current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+def _normalize_vector(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
 def safe_unicode_decode(content):
     # Regular expression to find all Unicode escape sequences of the form \uXXXX
     unicode_escape_pattern = re.compile(r"\\u([0-9a-fA-F]{4})")
@@ -2170,46 +2846,17 @@ async def pick_by_vector_similarity(
                 "Using pre-computed query embedding for vector similarity chunk selection"
             )
 
-        # Get chunk embeddings from vector database
-        chunk_vectors = await chunks_vdb.get_vectors_by_ids(all_chunk_ids)
-        logger.debug(
-            f"Vector similarity chunk selection: {len(chunk_vectors)} chunk vectors Retrieved"
+        # Rank candidate chunks in one pass, inside the vector storage when it can
+        similarities = await chunks_vdb.top_k_by_ids(
+            query_embedding, all_chunk_ids, num_of_chunks
         )
-
-        if not chunk_vectors or len(chunk_vectors) != len(all_chunk_ids):
-            if not chunk_vectors:
-                logger.warning(
-                    "Vector similarity chunk selection: no vectors retrieved from chunks_vdb"
-                )
-            else:
-                logger.warning(
-                    f"Vector similarity chunk selection: found {len(chunk_vectors)} but expecting {len(all_chunk_ids)}"
-                )
+        if not similarities:
+            logger.warning(
+                "Vector similarity chunk selection: no vectors retrieved from chunks_vdb"
+            )
             return []
 
-        # Calculate cosine similarities
-        similarities = []
-        valid_vectors = 0
-        for chunk_id in all_chunk_ids:
-            if chunk_id in chunk_vectors:
-                chunk_embedding = chunk_vectors[chunk_id]
-                try:
-                    # Calculate cosine similarity
-                    similarity = cosine_similarity(query_embedding, chunk_embedding)
-                    similarities.append((chunk_id, similarity))
-                    valid_vectors += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Vector similarity chunk selection: failed to calculate similarity for chunk {chunk_id}: {e}"
-                    )
-            else:
-                logger.warning(
-                    f"Vector similarity chunk selection:  no vector found for chunk {chunk_id}"
-                )
-
-        # Sort by similarity (highest first) and select top num_of_chunks
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        selected_chunks = [chunk_id for chunk_id, _ in similarities[:num_of_chunks]]
+        selected_chunks = [chunk_id for chunk_id, _ in similarities]
 
         logger.debug(
             f"Vector similarity chunk selection: {len(selected_chunks)} chunks from {len(all_chunk_ids)} candidates"
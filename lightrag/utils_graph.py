@@ -2,15 +2,31 @@ from __future__ import annotations
 
 import time
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Any, cast
 
 from .base import DeletionResult
-from .kg.shared_storage import get_storage_keyed_lock
+from .kg.shared_storage import get_namespace_data, get_storage_keyed_lock
 from .constants import GRAPH_FIELD_SEP
 from .utils import compute_mdhash_id, logger
 from .base import StorageNameSpace
 
 
+@asynccontextmanager
+async def _graph_edit_lock(keys: list[str], namespace: str):
+    """Hold the graph keyed locks of an edit and count the edit on release
+
+    The merge stage compares the count with the one it saw when prefetching
+    graph records, and reads them again if the graph was edited since.
+    """
+    async with get_storage_keyed_lock(keys, namespace=namespace, enable_logging=False):
+        try:
+            yield
+        finally:
+            graph_edits = await get_namespace_data("graph_edits")
+            graph_edits[namespace] = graph_edits.get(namespace, 0) + 1
+
+
 async def _persist_graph_updates(
     entities_vdb=None,
     relationships_vdb=None,
@@ -77,9 +93,7 @@ async def adelete_by_entity(
     # Use keyed lock for entity to ensure atomic graph and vector db operations
     workspace = entities_vdb.global_config.get("workspace", "")
     namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-    async with get_storage_keyed_lock(
-        [entity_name], namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock([entity_name], namespace):
         try:
             # Check if the entity exists
             if not await chunk_entity_relation_graph.has_node(entity_name):
@@ -178,9 +192,7 @@ async def adelete_by_relation(
     workspace = relationships_vdb.global_config.get("workspace", "")
     namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
     sorted_edge_key = sorted([source_entity, target_entity])
-    async with get_storage_keyed_lock(
-        sorted_edge_key, namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock(sorted_edge_key, namespace):
         try:
             # Check if the relation exists
             edge_exists = await chunk_entity_relation_graph.has_edge(
@@ -585,9 +597,7 @@ async def aedit_entity(
         "final_entity": new_entity_name if is_renaming else entity_name,
         "renamed": is_renaming,
     }
-    async with get_storage_keyed_lock(
-        lock_keys, namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock(lock_keys, namespace):
         try:
             if is_renaming and not allow_rename:
                 raise ValueError(
@@ -745,9 +755,7 @@ async def aedit_relation(
     workspace = relationships_vdb.global_config.get("workspace", "")
     namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
     sorted_edge_key = sorted([source_entity, target_entity])
-    async with get_storage_keyed_lock(
-        sorted_edge_key, namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock(sorted_edge_key, namespace):
         try:
             # 1. Get current relation information
             edge_exists = await chunk_entity_relation_graph.has_edge(
@@ -924,9 +932,7 @@ async def acreate_entity(
     # Use keyed lock for entity to ensure atomic graph and vector db operations
     workspace = entities_vdb.global_config.get("workspace", "")
     namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-    async with get_storage_keyed_lock(
-        [entity_name], namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock([entity_name], namespace):
         try:
             # Check if entity already exists
             existing_node = await chunk_entity_relation_graph.has_node(entity_name)
@@ -1039,9 +1045,7 @@ async def acreate_relation(
     workspace = relationships_vdb.global_config.get("workspace", "")
     namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
     sorted_edge_key = sorted([source_entity, target_entity])
-    async with get_storage_keyed_lock(
-        sorted_edge_key, namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock(sorted_edge_key, namespace):
         try:
             # Check if both entities exist
             source_exists = await chunk_entity_relation_graph.has_node(source_entity)
@@ -1565,9 +1569,7 @@ async def amerge_entities(
 
     workspace = entities_vdb.global_config.get("workspace", "")
     namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-    async with get_storage_keyed_lock(
-        lock_keys, namespace=namespace, enable_logging=False
-    ):
+    async with _graph_edit_lock(lock_keys, namespace):
         try:
             return await _merge_entities_impl(
                 chunk_entity_relation_graph,
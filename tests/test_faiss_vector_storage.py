@@ -0,0 +1,134 @@
+"""
+Tests for FaissVectorDBStorage persistence with approximate indexes.
+
+Deleting most of a collection leaves too few rows to retrain an IVF index. The
+deletes must still be saved and survive a reload. Rebuilds run without the
+storage lock, so writes made while the index is built must carry over to it.
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from lightrag.kg.faiss_impl import FaissVectorDBStorage, faiss_index_type  # noqa: E402
+from lightrag.kg.shared_storage import (  # noqa: E402
+    finalize_share_data,
+    initialize_share_data,
+)
+from lightrag.utils import EmbeddingFunc  # noqa: E402
+
+DIM = 32
+
+
+async def mock_embedding_func(texts, **kwargs):
+    # Deterministic vectors, seeded by the number in "text <n>"
+    return np.stack(
+        [np.random.default_rng(int(t.split()[1])).standard_normal(DIM) for t in texts]
+    )
+
+
+@pytest.fixture
+def shared_data():
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+async def open_storage(working_dir: str, **kwargs) -> FaissVectorDBStorage:
+    storage = FaissVectorDBStorage(
+        namespace="faiss_test",
+        workspace="",
+        global_config={
+            "working_dir": working_dir,
+            "embedding_batch_num": 256,
+            "vector_db_storage_cls_kwargs": {
+                "cosine_better_than_threshold": -1,
+                **kwargs,
+            },
+        },
+        embedding_func=EmbeddingFunc(embedding_dim=DIM, func=mock_embedding_func),
+        meta_fields={"content"},
+    )
+    await storage.initialize()
+    return storage
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index_kwargs",
+    [
+        {"index_type": "ivf_pq", "ann_min_vectors": 300},
+        {"index_type": "ivf_flat", "ann_min_vectors": 300, "nlist": 400},
+    ],
+    ids=["ivf_pq", "ivf_flat_fixed_nlist"],
+)
+async def test_delete_then_save_with_too_few_rows_to_retrain(
+    tmp_path, shared_data, index_kwargs
+):
+    storage = await open_storage(str(tmp_path), **index_kwargs)
+    await storage.upsert({f"id{i}": {"content": f"text {i}"} for i in range(500)})
+    assert await storage.index_done_callback()
+    index_type = faiss_index_type(storage._index)
+    assert index_type == index_kwargs["index_type"]
+
+    # 250 live rows: fewer than the 256 PQ centroids or the 400 fixed IVF lists
+    await storage.delete([f"id{i}" for i in range(250)])
+    assert await storage.index_done_callback()
+
+    reloaded = await open_storage(str(tmp_path), **index_kwargs)
+    assert faiss_index_type(reloaded._index) == index_type
+    assert len(reloaded.client_storage["data"]) == 250
+    assert await reloaded.get_by_id("id3") is None
+    assert (await reloaded.get_by_id("id300"))["content"] == "text 300"
+    results = await reloaded.query("text 400", 5, search_params={"nprobe": 400})
+    assert results[0]["id"] == "id400"
+    assert all(int(r["id"][2:]) >= 250 for r in results)
+
+    # Later saves keep working
+    await reloaded.upsert({"id500": {"content": "text 500"}})
+    assert await reloaded.index_done_callback()
+
+
+@pytest.mark.asyncio
+async def test_writes_during_rebuild_are_replayed(tmp_path, shared_data):
+    index_kwargs = {"index_type": "ivf_flat", "ann_min_vectors": 300}
+    storage = await open_storage(str(tmp_path), **index_kwargs)
+    await storage.upsert({f"id{i}": {"content": f"text {i}"} for i in range(400)})
+
+    # Hold the rebuild in its worker thread until the writes below are done
+    build_started, build_release = threading.Event(), threading.Event()
+    build_index = storage._build_index
+
+    def gated_build_index(rebuild):
+        build_started.set()
+        build_release.wait(10)
+        build_index(rebuild)
+
+    storage._build_index = gated_build_index
+    save = asyncio.create_task(storage.index_done_callback())
+    try:
+        assert await asyncio.to_thread(build_started.wait, 10)
+        await storage.delete([f"id{i}" for i in range(10)])
+        await storage.upsert(
+            {
+                "id10": {"content": "text 1010"},
+                **{f"id{i}": {"content": f"text {i}"} for i in range(400, 420)},
+            }
+        )
+        await storage.delete(["id419"])
+    finally:
+        build_release.set()
+    assert await save
+    assert faiss_index_type(storage._index) == "ivf_flat"
+
+    reloaded = await open_storage(str(tmp_path), **index_kwargs)
+    assert len(reloaded.client_storage["data"]) == 409
+    assert await reloaded.get_by_id("id0") is None
+    assert await reloaded.get_by_id("id419") is None
+    assert (await reloaded.get_by_id("id10"))["content"] == "text 1010"
+    results = await reloaded.query("text 405", 1, search_params={"nprobe": 64})
+    assert results[0]["id"] == "id405"
@@ -11,11 +11,16 @@ Supported graph storage types include:
 - MongoDBStorage
 - PGGraphStorage
 - MemgraphStorage
+
+The batch conformance test compares each storage's batch read methods with the
+per-item BaseGraphStorage defaults and reports query round trips for Bolt storages.
 """
 
 import asyncio
+import contextlib
 import os
 import sys
+import time
 import importlib
 import numpy as np
 from dotenv import load_dotenv
@@ -24,6 +29,7 @@ from ascii_colors import ASCIIColors
 # Add the project root directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from lightrag.base import BaseGraphStorage
 from lightrag.types import KnowledgeGraph
 from lightrag.kg import (
     STORAGE_IMPLEMENTATIONS,
@@ -828,6 +834,240 @@ async def test_graph_batch_operations(storage):
         return False
 
 
+class _CountingSession:
+    """Async context manager around a driver session that counts session.run and execute_write calls"""
+
+    def __init__(self, session_ctx, counter):
+        self._session_ctx = session_ctx
+        self._counter = counter
+
+    async def __aenter__(self):
+        session = await self._session_ctx.__aenter__()
+        original_run = session.run
+
+        def run(*args, **kwargs):
+            self._counter["queries"] += 1
+            return original_run(*args, **kwargs)
+
+        session.run = run
+
+        original_execute_write = session.execute_write
+
+        async def execute_write(*args, **kwargs):
+            self._counter["queries"] += 1
+            return await original_execute_write(*args, **kwargs)
+
+        session.execute_write = execute_write
+        return session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self._session_ctx.__aexit__(exc_type, exc, tb)
+
+
+class _CountingCollection:
+    """Proxy around a MongoDB collection that counts every operation sent through it"""
+
+    def __init__(self, collection, counter):
+        self._collection = collection
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            self._counter["queries"] += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+@contextlib.contextmanager
+def count_mongo_round_trips(storage):
+    """Count the operations MongoGraphStorage sends to its node and edge collections"""
+    counter = {"queries": 0}
+    collections = {
+        name: getattr(storage, name) for name in ("collection", "edge_collection")
+    }
+    for name, collection in collections.items():
+        setattr(storage, name, _CountingCollection(collection, counter))
+    try:
+        yield counter
+    finally:
+        for name, collection in collections.items():
+            setattr(storage, name, collection)
+
+
+@contextlib.contextmanager
+def count_round_trips(storage):
+    """
+    Count the queries a Bolt-based storage (Neo4j/Memgraph) or MongoDB sends to the server.
+    Yields None for other storages, in which case only timings are compared.
+    """
+    if getattr(storage, "edge_collection", None) is not None:
+        with count_mongo_round_trips(storage) as counter:
+            yield counter
+        return
+
+    driver = getattr(storage, "_driver", None)
+    if driver is None:
+        yield None
+        return
+
+    counter = {"queries": 0}
+    original_session = driver.session
+    driver.session = lambda *args, **kwargs: _CountingSession(
+        original_session(*args, **kwargs), counter
+    )
+    try:
+        yield counter
+    finally:
+        driver.session = original_session
+
+
+async def test_graph_batch_conformance(storage):
+    """
+    Compare each batch read method of the storage with the BaseGraphStorage default,
+    which issues one query per item:
+    1. Both paths must return the same data (edges compared regardless of direction).
+    2. Report query round trips (Bolt storages and MongoDB) and elapsed time of both paths.
+    3. An overridden batch method must not need more round trips than the default.
+    4. Nodes and edges written with upsert_nodes_batch/upsert_edges_batch read back as upserted.
+    """
+    try:
+        node_ids = [f"Batch Node {i}" for i in range(30)]
+        for i, node_id in enumerate(node_ids):
+            await storage.upsert_node(
+                node_id,
+                {
+                    "entity_id": node_id,
+                    "description": f"Batch conformance node {i}",
+                    "entity_type": "Test",
+                    "source_id": str(i),
+                },
+            )
+        edge_pairs = [(node_ids[0], node_id) for node_id in node_ids[1:]]
+        edge_pairs += [(node_ids[i], node_ids[i + 1]) for i in range(1, 29)]
+        for src, tgt in edge_pairs:
+            await storage.upsert_edge(
+                src,
+                tgt,
+                {
+                    "weight": 1.0,
+                    "description": f"{src} relates to {tgt}",
+                    "keywords": "batch",
+                    "source_id": "1",
+                },
+            )
+
+        # Include an unknown node and an unknown edge in the lookups
+        lookup_nodes = node_ids + ["Batch Missing Node"]
+        lookup_pairs = edge_pairs + [(node_ids[5], node_ids[20])]
+
+        def undirected(edges_by_node):
+            return {
+                node_id: {frozenset(edge) for edge in edges}
+                for node_id, edges in edges_by_node.items()
+            }
+
+        def edge_core(edges_by_pair):
+            return {
+                pair: (edge.get("description"), float(edge.get("weight", 1.0)))
+                for pair, edge in edges_by_pair.items()
+            }
+
+        cases = [
+            ("get_nodes_batch", (lookup_nodes,), None),
+            ("node_degrees_batch", (lookup_nodes,), None),
+            ("edge_degrees_batch", (lookup_pairs,), None),
+            (
+                "get_edges_batch",
+                ([{"src": src, "tgt": tgt} for src, tgt in lookup_pairs],),
+                edge_core,
+            ),
+            ("get_nodes_edges_batch", (lookup_nodes,), undirected),
+        ]
+
+        for method_name, args, normalize in cases:
+            default_method = getattr(BaseGraphStorage, method_name)
+            overridden = getattr(type(storage), method_name) is not default_method
+
+            with count_round_trips(storage) as default_counter:
+                start = time.perf_counter()
+                expected = await default_method(storage, *args)
+                default_ms = (time.perf_counter() - start) * 1000
+            with count_round_trips(storage) as batch_counter:
+                start = time.perf_counter()
+                actual = await getattr(storage, method_name)(*args)
+                batch_ms = (time.perf_counter() - start) * 1000
+
+            if normalize:
+                expected, actual = normalize(expected), normalize(actual)
+            assert (
+                actual == expected
+            ), f"{method_name} result differs from the per-item default implementation"
+
+            report = f"{method_name}: default {default_ms:.1f}ms, {'overridden' if overridden else 'inherited'} {batch_ms:.1f}ms"
+            if default_counter is not None:
+                report += f", round trips {default_counter['queries']} -> {batch_counter['queries']}"
+                if overridden:
+                    assert (
+                        batch_counter["queries"] <= default_counter["queries"]
+                    ), f"{method_name} needs more round trips than the default implementation"
+            print(report)
+
+        # Batch writes must leave the same data as per-item upserts would
+        updated_nodes = {
+            node_id: {
+                "entity_id": node_id,
+                "description": f"Batch updated node {i}",
+                "entity_type": "Test",
+                "source_id": str(i),
+            }
+            for i, node_id in enumerate(node_ids)
+        }
+        new_edges = {
+            (node_ids[i], node_ids[i + 2]): {
+                "weight": 2.0,
+                "description": f"{node_ids[i]} batch relates to {node_ids[i + 2]}",
+                "keywords": "batch",
+                "source_id": "2",
+            }
+            for i in range(1, 28, 3)
+        }
+        with count_round_trips(storage) as write_counter:
+            start = time.perf_counter()
+            await storage.upsert_nodes_batch(updated_nodes)
+            await storage.upsert_edges_batch(new_edges)
+            write_ms = (time.perf_counter() - start) * 1000
+
+        nodes = await storage.get_nodes_batch(node_ids)
+        for node_id, node_data in updated_nodes.items():
+            assert (
+                nodes.get(node_id, {}).get("description") == node_data["description"]
+            ), f"upsert_nodes_batch did not update node {node_id}"
+        edges = await storage.get_edges_batch(
+            [{"src": src, "tgt": tgt} for src, tgt in new_edges]
+        )
+        assert edge_core(edges) == {
+            pair: (edge["description"], edge["weight"])
+            for pair, edge in new_edges.items()
+        }, "upsert_edges_batch result differs from the upserted edges"
+
+        report = f"upsert_nodes_batch + upsert_edges_batch: {write_ms:.1f}ms"
+        if write_counter is not None:
+            report += f", round trips {write_counter['queries']} for {len(updated_nodes) + len(new_edges)} upserts"
+        print(report)
+
+        print("\nBatch conformance tests completed.")
+        return True
+
+    except Exception as e:
+        ASCIIColors.red(f"An error occurred during the test: {str(e)}")
+        return False
+
+
 async def test_graph_special_characters(storage):
     """
     Test the graph database's handling of special characters:
@@ -1244,12 +1484,15 @@ async def main():
         ASCIIColors.white(
             "5. Special Characters Test (Verify handling of single/double quotes, backslashes, etc.)"
         )
-        ASCIIColors.white("6. All Tests")
+        ASCIIColors.white(
+            "6. Batch Conformance Test (Batch methods vs per-item defaults, round trips)"
+        )
+        ASCIIColors.white("7. All Tests")
 
-        choice = input("\nEnter your choice (1/2/3/4/5/6): ")
+        choice = input("\nEnter your choice (1/2/3/4/5/6/7): ")
 
         # Clean data before running tests
-        if choice in ["1", "2", "3", "4", "5", "6"]:
+        if choice in ["1", "2", "3", "4", "5", "6", "7"]:
             ASCIIColors.yellow("\nCleaning data before running tests...")
             await storage.drop()
             ASCIIColors.green("Data cleanup complete\n")
@@ -1265,6 +1508,8 @@ async def main():
         elif choice == "5":
             await test_graph_special_characters(storage)
         elif choice == "6":
+            await test_graph_batch_conformance(storage)
+        elif choice == "7":
             ASCIIColors.cyan("\n=== Starting Basic Test ===")
             basic_result = await test_graph_basic(storage)
 
@@ -1286,7 +1531,15 @@ async def main():
                             ASCIIColors.cyan(
                                 "\n=== Starting Special Characters Test ==="
                             )
-                            await test_graph_special_characters(storage)
+                            special_result = await test_graph_special_characters(
+                                storage
+                            )
+
+                            if special_result:
+                                ASCIIColors.cyan(
+                                    "\n=== Starting Batch Conformance Test ==="
+                                )
+                                await test_graph_batch_conformance(storage)
         else:
             ASCIIColors.red("Invalid choice")
 
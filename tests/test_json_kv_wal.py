@@ -0,0 +1,182 @@
+"""
+Tests for the JsonKVStorage write-ahead log: replay on startup and compaction.
+
+Each test runs against a temporary working directory. A process restart is
+simulated by resetting the shared data and loading a new storage instance.
+"""
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from lightrag.kg import json_kv_impl
+from lightrag.kg.json_kv_impl import JsonKVStorage
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+
+
+@pytest.fixture
+def shared_data():
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+@pytest.fixture
+def working_dir(tmp_path, monkeypatch, shared_data):
+    monkeypatch.setenv("KV_WAL_ENABLED", "true")
+    # Never compact on its own, tests trigger compaction explicitly
+    monkeypatch.setenv("KV_WAL_COMPACT_MIN_BYTES", str(1 << 40))
+    return str(tmp_path)
+
+
+async def open_storage(working_dir: str) -> JsonKVStorage:
+    storage = JsonKVStorage(
+        namespace="wal_test",
+        workspace="",
+        global_config={"working_dir": working_dir},
+        embedding_func=None,
+    )
+    await storage.initialize()
+    return storage
+
+
+async def reopen_storage(working_dir: str) -> JsonKVStorage:
+    """Load the storage from disk as a freshly started process would"""
+    finalize_share_data()
+    initialize_share_data()
+    return await open_storage(working_dir)
+
+
+def records(storage: JsonKVStorage) -> dict[str, str]:
+    return {key: value["content"] for key, value in storage._data.items()}
+
+
+def wal_lines(storage: JsonKVStorage) -> list[list]:
+    if not os.path.exists(storage._wal_file_name):
+        return []
+    with open(storage._wal_file_name, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_wal_replay(working_dir):
+    storage = await open_storage(working_dir)
+    await storage.upsert({"a": {"content": "1"}, "b": {"content": "2"}})
+    # No snapshot yet, the first flush writes a full snapshot
+    await storage.index_done_callback()
+    assert wal_lines(storage) == []
+
+    await storage.upsert({"a": {"content": "1'"}, "c": {"content": "3"}})
+    await storage.delete(["b"])
+    await storage.index_done_callback()
+    assert sorted((r[0], r[1]) for r in wal_lines(storage)) == [
+        ("d", "b"),
+        ("u", "a"),
+        ("u", "c"),
+    ]
+
+    reloaded = await reopen_storage(working_dir)
+    assert records(reloaded) == {"a": "1'", "c": "3"}
+
+
+@pytest.mark.asyncio
+async def test_wal_replay_ignores_torn_final_record(working_dir):
+    storage = await open_storage(working_dir)
+    await storage.upsert({"a": {"content": "1"}})
+    await storage.index_done_callback()
+    await storage.upsert({"b": {"content": "2"}})
+    await storage.index_done_callback()
+    with open(storage._wal_file_name, "a", encoding="utf-8") as f:
+        f.write('["u", "c", {"cont')
+
+    reloaded = await reopen_storage(working_dir)
+    assert records(reloaded) == {"a": "1", "b": "2"}
+
+
+@pytest.mark.asyncio
+async def test_compaction_folds_wal_into_snapshot(working_dir):
+    storage = await open_storage(working_dir)
+    await storage.upsert({"a": {"content": "1"}})
+    await storage.index_done_callback()
+    await storage.upsert({"b": {"content": "2"}})
+    await storage.delete(["a"])
+    await storage.index_done_callback()
+
+    await storage._compact()
+
+    assert not os.path.exists(storage._wal_file_name)
+    with open(storage._file_name, encoding="utf-8") as f:
+        assert {k: v["content"] for k, v in json.load(f).items()} == {"b": "2"}
+    reloaded = await reopen_storage(working_dir)
+    assert records(reloaded) == {"b": "2"}
+
+
+@pytest.mark.asyncio
+async def test_overlapping_compactions_keep_newer_records(working_dir, monkeypatch):
+    storage = await open_storage(working_dir)
+    await storage.upsert({"a": {"content": "1"}})
+    await storage.index_done_callback()
+    await storage.upsert({"b": {"content": "2"}})
+    await storage.index_done_callback()
+
+    entered, release = threading.Event(), threading.Event()
+    write_json_atomic = json_kv_impl.write_json_atomic
+
+    def write_blocking_first_call(json_obj, file_name):
+        if not entered.is_set():
+            entered.set()
+            release.wait(timeout=10)
+        write_json_atomic(json_obj, file_name)
+
+    monkeypatch.setattr(json_kv_impl, "write_json_atomic", write_blocking_first_call)
+    first = asyncio.create_task(storage._compact())
+    assert await asyncio.to_thread(entered.wait, 10)
+
+    # Appended while the first compaction serializes its snapshot
+    await storage.upsert({"c": {"content": "3"}})
+    await storage.delete(["a"])
+    await storage.index_done_callback()
+
+    # A second compaction (e.g. from another worker) must wait for the first one
+    second = asyncio.create_task(storage._compact())
+    done, _ = await asyncio.wait({second}, timeout=0.5)
+    assert not done
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert all(record[0] in ("u", "d") for record in wal_lines(storage))
+    reloaded = await reopen_storage(working_dir)
+    assert records(reloaded) == {"b": "2", "c": "3"}
+
+
+@pytest.mark.asyncio
+async def test_drop_during_compaction_is_not_undone(working_dir, monkeypatch):
+    storage = await open_storage(working_dir)
+    await storage.upsert({"a": {"content": "1"}})
+    await storage.index_done_callback()
+    await storage.upsert({"b": {"content": "2"}})
+    await storage.index_done_callback()
+
+    entered, release = threading.Event(), threading.Event()
+    write_json_atomic = json_kv_impl.write_json_atomic
+
+    def blocking_write(json_obj, file_name):
+        if file_name.endswith(".compact"):
+            entered.set()
+            release.wait(timeout=10)
+        write_json_atomic(json_obj, file_name)
+
+    monkeypatch.setattr(json_kv_impl, "write_json_atomic", blocking_write)
+    compaction = asyncio.create_task(storage._compact())
+    assert await asyncio.to_thread(entered.wait, 10)
+
+    assert (await storage.drop())["status"] == "success"
+    release.set()
+    await compaction
+
+    assert not os.path.exists(f"{storage._file_name}.compact")
+    reloaded = await reopen_storage(working_dir)
+    assert records(reloaded) == {}
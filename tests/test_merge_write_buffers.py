@@ -0,0 +1,121 @@
+"""
+Tests for the merge-stage write buffers of merge_nodes_and_edges.
+
+Buffered writes of an entity must reach the storages before its keyed lock is
+released, so that graph edits taking the same lock neither miss them nor get
+overwritten by a later flush.
+"""
+
+import asyncio
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from lightrag import LightRAG
+from lightrag.kg.shared_storage import (
+    finalize_share_data,
+    get_namespace_data,
+    get_pipeline_status_lock,
+    initialize_pipeline_status,
+    initialize_share_data,
+)
+from lightrag.operate import merge_nodes_and_edges
+from lightrag.utils import EmbeddingFunc, Tokenizer, compute_mdhash_id
+
+
+class CharTokenizer:
+    def encode(self, content):
+        return [ord(c) for c in content]
+
+    def decode(self, tokens):
+        return "".join(map(chr, tokens))
+
+
+async def mock_embedding_func(texts, **kwargs):
+    return np.array([[len(t) % 7 + 1.0] * 8 for t in texts], dtype=np.float32)
+
+
+def node(name: str, description: str) -> dict:
+    return {
+        "entity_name": name,
+        "entity_type": "person",
+        "description": description,
+        "source_id": "chunk-1",
+        "file_path": "doc.txt",
+        "timestamp": 0,
+    }
+
+
+@pytest_asyncio.fixture
+async def rag(tmp_path):
+    initialize_share_data()
+    llm_started, llm_release = asyncio.Event(), asyncio.Event()
+
+    async def mock_llm_func(*args, **kwargs):
+        llm_started.set()
+        await llm_release.wait()
+        return "summary"
+
+    rag = LightRAG(
+        working_dir=str(tmp_path),
+        llm_model_func=mock_llm_func,
+        embedding_func=EmbeddingFunc(
+            embedding_dim=8, max_token_size=100, func=mock_embedding_func
+        ),
+        tokenizer=Tokenizer("chars", CharTokenizer()),
+    )
+    await rag.initialize_storages()
+    await initialize_pipeline_status()
+    rag.llm_started, rag.llm_release = llm_started, llm_release
+    yield rag
+    await rag.finalize_storages()
+    finalize_share_data()
+
+
+async def merge_document(rag: LightRAG, nodes: dict) -> None:
+    await merge_nodes_and_edges(
+        [(nodes, {})],
+        rag.chunk_entity_relation_graph,
+        rag.entities_vdb,
+        rag.relationships_vdb,
+        asdict(rag),
+        pipeline_status=await get_namespace_data("pipeline_status"),
+        pipeline_status_lock=get_pipeline_status_lock(),
+        doc_id="doc-1",
+        file_path="doc.txt",
+        entity_chunks_storage=rag.entity_chunks,
+        relation_chunks_storage=rag.relation_chunks,
+    )
+
+
+@pytest.mark.asyncio
+async def test_entity_deleted_during_merge_stays_deleted(rag):
+    # "slow" has enough descriptions to need an LLM summary, which is held
+    # back so that the document is still merging while "fast" is deleted
+    merge = asyncio.create_task(
+        merge_document(
+            rag,
+            {
+                "fast": [node("fast", "merged quickly")],
+                "slow": [node("slow", f"description {i}") for i in range(12)],
+            },
+        )
+    )
+    await asyncio.wait_for(rag.llm_started.wait(), 10)
+
+    try:
+        # The deletion waits for the merge of "fast" to be written, not just
+        # buffered
+        deletion = asyncio.create_task(rag.adelete_by_entity("fast"))
+        done, _ = await asyncio.wait({deletion}, timeout=0.2)
+        assert not done
+    finally:
+        rag.llm_release.set()
+        await merge
+    assert (await deletion).status == "success"
+
+    assert await rag.chunk_entity_relation_graph.get_node("fast") is None
+    assert await rag.entities_vdb.get_by_id(compute_mdhash_id("fast", "ent-")) is None
+    assert await rag.chunk_entity_relation_graph.get_node("slow") is not None
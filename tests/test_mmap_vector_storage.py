@@ -0,0 +1,131 @@
+"""
+Tests for MmapVectorDBStorage persistence.
+
+Each save writes a new version of the matrix and metadata files and commits it
+by replacing the manifest. Files that do not match their manifest must fail the
+load instead of starting over with an empty storage.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from lightrag.kg.mmap_vector_db_impl import MmapVectorDBStorage
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+from lightrag.utils import EmbeddingFunc
+
+DIM = 16
+
+
+async def mock_embedding_func(texts, **kwargs):
+    # Deterministic vectors, seeded by the number in "text <n>"
+    return np.stack(
+        [np.random.default_rng(int(t.split()[1])).standard_normal(DIM) for t in texts]
+    )
+
+
+@pytest.fixture
+def shared_data():
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+async def open_storage(working_dir: str) -> MmapVectorDBStorage:
+    storage = MmapVectorDBStorage(
+        namespace="mmap_test",
+        workspace="",
+        global_config={
+            "working_dir": working_dir,
+            "embedding_batch_num": 32,
+            "vector_db_storage_cls_kwargs": {"cosine_better_than_threshold": -1},
+        },
+        embedding_func=EmbeddingFunc(embedding_dim=DIM, func=mock_embedding_func),
+        meta_fields={"content"},
+    )
+    await storage.initialize()
+    return storage
+
+
+def read_manifest(storage: MmapVectorDBStorage) -> dict:
+    with open(storage._manifest_file, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.asyncio
+async def test_save_and_load(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    await storage.upsert({f"id{i}": {"content": f"text {i}"} for i in range(50)})
+    assert await storage.index_done_callback()
+    assert read_manifest(storage)["count"] == 50
+
+    reloaded = await open_storage(str(tmp_path))
+    assert len((await reloaded.client_storage)["data"]) == 50
+    assert (await reloaded.get_by_id("id7"))["content"] == "text 7"
+    results = await reloaded.query("text 12", 3)
+    assert results[0]["id"] == "id12"
+    assert results[0]["distance"] == pytest.approx(1.0, abs=1e-2)
+
+
+@pytest.mark.asyncio
+async def test_delete_is_persisted_and_old_version_removed(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    await storage.upsert({f"id{i}": {"content": f"text {i}"} for i in range(20)})
+    assert await storage.index_done_callback()
+    old_files = storage._version_files(read_manifest(storage)["version"])
+
+    await storage.delete([f"id{i}" for i in range(10)])
+    await storage.upsert({"id3": {"content": "text 33"}})
+    assert await storage.index_done_callback()
+    assert not any(os.path.exists(file_name) for file_name in old_files)
+
+    reloaded = await open_storage(str(tmp_path))
+    assert read_manifest(reloaded)["count"] == 11
+    assert await reloaded.get_by_id("id0") is None
+    assert (await reloaded.get_by_id("id3"))["content"] == "text 33"
+    results = await reloaded.query("text 15", 20)
+    assert results[0]["id"] == "id15"
+    assert {r["id"] for r in results} == {"id3", *(f"id{i}" for i in range(10, 20))}
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_version_is_ignored(tmp_path, shared_data, monkeypatch):
+    storage = await open_storage(str(tmp_path))
+    await storage.upsert({f"id{i}": {"content": f"text {i}"} for i in range(10)})
+    assert await storage.index_done_callback()
+
+    # Crash after writing the new version, before the manifest is replaced
+    def crash(*args, **kwargs):
+        raise OSError("crashed before commit")
+
+    monkeypatch.setattr("lightrag.kg.mmap_vector_db_impl.write_json_atomic", crash)
+    await storage.delete(["id0", "id1"])
+    assert not await storage.index_done_callback()
+    monkeypatch.undo()
+
+    reloaded = await open_storage(str(tmp_path))
+    assert len((await reloaded.client_storage)["data"]) == 10
+    assert (await reloaded.get_by_id("id0"))["content"] == "text 0"
+
+    # The next save commits a version of its own
+    await reloaded.delete(["id0"])
+    assert await reloaded.index_done_callback()
+    assert len((await (await open_storage(str(tmp_path))).client_storage)["data"]) == 9
+
+
+@pytest.mark.asyncio
+async def test_mismatched_files_fail_the_load(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    await storage.upsert({f"id{i}": {"content": f"text {i}"} for i in range(10)})
+    assert await storage.index_done_callback()
+    vectors_file, _ = storage._version_files(read_manifest(storage)["version"])
+
+    np.save(vectors_file, np.zeros((4, DIM), dtype=np.float16))
+    with pytest.raises(ValueError, match="does not match its manifest"):
+        await open_storage(str(tmp_path))
+
+    os.remove(vectors_file)
+    with pytest.raises(ValueError, match="is unreadable"):
+        await open_storage(str(tmp_path))
@@ -0,0 +1,88 @@
+"""
+Tests for the binary format of NetworkXStorage (NETWORKX_STORAGE_FORMAT=binary).
+
+A save after the first one appends a delta segment with only the changed nodes
+and edges. Loading the base plus its deltas must give back the saved graph,
+both in a fresh storage and when an open storage catches up in place.
+"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from lightrag.kg.networkx_impl import NetworkXStorage
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+from lightrag.utils import EmbeddingFunc
+
+
+async def mock_embedding_func(texts, **kwargs):
+    return np.zeros((len(texts), 8), dtype=np.float32)
+
+
+@pytest.fixture
+def shared_data(monkeypatch):
+    monkeypatch.setenv("NETWORKX_STORAGE_FORMAT", "binary")
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+async def open_storage(working_dir: str) -> NetworkXStorage:
+    storage = NetworkXStorage(
+        namespace="chunk_entity_relation",
+        workspace="",
+        global_config={"working_dir": working_dir},
+        embedding_func=EmbeddingFunc(embedding_dim=8, func=mock_embedding_func),
+    )
+    await storage.initialize()
+    return storage
+
+
+def node(description: str, weight: float = 1.0) -> dict:
+    return {"entity_id": description, "description": description, "weight": weight}
+
+
+def assert_same_graph(actual: nx.Graph, expected: nx.Graph) -> None:
+    assert dict(actual.nodes(data=True)) == dict(expected.nodes(data=True))
+    assert {frozenset(e): d for *e, d in actual.edges(data=True)} == {
+        frozenset(e): d for *e, d in expected.edges(data=True)
+    }
+
+
+@pytest.mark.asyncio
+async def test_delta_round_trip(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    for name in ("A", "B", "C", "D"):
+        await storage.upsert_node(name, node(name))
+    await storage.upsert_edge("A", "B", {"weight": 1.0, "keywords": "ab"})
+    await storage.upsert_edge("B", "C", {"weight": 2.0, "keywords": "bc"})
+    await storage.upsert_edge("C", "D", {"weight": 3.0, "keywords": "cd"})
+    assert await storage.index_done_callback()
+    assert storage._manifest["deltas"] == []
+
+    # An open storage that catches up on the delta below
+    reader = await open_storage(str(tmp_path))
+    assert_same_graph(await reader._get_graph(), storage._graph)
+
+    await storage.upsert_node("A", node("A updated", weight=2.5))
+    await storage.upsert_node("E", node("E"))
+    await storage.upsert_edge("D", "E", {"weight": 4.0, "keywords": "de"})
+    await storage.upsert_edge("B", "A", {"weight": 1.5, "keywords": "ab updated"})
+    await storage.remove_edges([("C", "B")])
+    await storage.delete_node("C")
+    assert await storage.index_done_callback()
+    assert len(storage._manifest["deltas"]) == 1
+    assert not (tmp_path / "graph_chunk_entity_relation.graphml").exists()
+
+    assert_same_graph(await reader._get_graph(), storage._graph)
+
+    reloaded = await open_storage(str(tmp_path))
+    graph = await reloaded._get_graph()
+    assert_same_graph(graph, storage._graph)
+    assert not graph.has_node("C")
+    assert graph.nodes["A"]["weight"] == 2.5
+    assert graph.edges["A", "B"]["keywords"] == "ab updated"
+    assert {frozenset(e) for e in graph.edges()} == {
+        frozenset(("A", "B")),
+        frozenset(("D", "E")),
+    }
@@ -0,0 +1,111 @@
+"""
+Tests for ranking chunk candidates by vector similarity.
+
+Candidates without a stored vector are skipped; when none of them has one the
+selection comes back empty, so the caller can fall back to another method.
+"""
+
+import numpy as np
+import pytest
+
+from lightrag.base import BaseVectorStorage
+from lightrag.kg.nano_vector_db_impl import NanoVectorDBStorage
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+from lightrag.utils import EmbeddingFunc, pick_by_vector_similarity
+
+DIM = 16
+
+
+async def mock_embedding_func(texts, **kwargs):
+    # Deterministic vectors, seeded by the number in "text <n>"
+    return np.stack(
+        [np.random.default_rng(int(t.split()[1])).standard_normal(DIM) for t in texts]
+    )
+
+
+@pytest.fixture
+def shared_data():
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+async def open_storage(working_dir: str) -> NanoVectorDBStorage:
+    storage = NanoVectorDBStorage(
+        namespace="chunks",
+        workspace="",
+        global_config={
+            "working_dir": working_dir,
+            "embedding_batch_num": 32,
+            "vector_db_storage_cls_kwargs": {"cosine_better_than_threshold": -1},
+        },
+        embedding_func=EmbeddingFunc(embedding_dim=DIM, func=mock_embedding_func),
+        meta_fields={"content"},
+    )
+    await storage.initialize()
+    await storage.upsert({f"chunk{i}": {"content": f"text {i}"} for i in range(10)})
+    return storage
+
+
+def entity_info(chunk_ids: list[str]) -> list[dict]:
+    return [{"entity_name": "entity", "sorted_chunks": chunk_ids}]
+
+
+@pytest.mark.asyncio
+async def test_candidates_are_ranked(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    selected = await pick_by_vector_similarity(
+        "text 3",
+        None,
+        storage,
+        2,
+        entity_info(["chunk1", "chunk3", "chunk5", "missing"]),
+        mock_embedding_func,
+    )
+    assert len(selected) == 2
+    assert selected[0] == "chunk3"
+
+
+@pytest.mark.asyncio
+async def test_no_candidate_has_a_vector(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    for get_vectors_array_by_ids in (
+        storage.get_vectors_array_by_ids,
+        # The default implementation shared by the other storages
+        lambda ids: BaseVectorStorage.get_vectors_array_by_ids(storage, ids),
+    ):
+        found, matrix = await get_vectors_array_by_ids(["missing1", "missing2"])
+        assert found == []
+        assert matrix.shape == (0, DIM)
+
+    selected = await pick_by_vector_similarity(
+        "text 3",
+        None,
+        storage,
+        2,
+        entity_info(["missing1", "missing2"]),
+        mock_embedding_func,
+    )
+    assert selected == []
+
+
+@pytest.mark.asyncio
+async def test_nano_falls_back_without_client_matrix(tmp_path, shared_data):
+    storage = await open_storage(str(tmp_path))
+    client = await storage._get_client()
+
+    class PublicClient:
+        """A client exposing only the public nano-vectordb API"""
+
+        get = client.get
+
+    async def get_client():
+        return PublicClient()
+
+    storage._get_client = get_client
+    found, matrix = await storage.get_vectors_array_by_ids(["chunk2", "missing"])
+    assert found == ["chunk2"]
+    assert matrix.shape == (1, DIM)
+    expected = (await mock_embedding_func(["text 2"]))[0]
+    cosine = matrix[0] @ expected / np.linalg.norm(matrix[0]) / np.linalg.norm(expected)
+    assert cosine == pytest.approx(1.0, abs=1e-2)